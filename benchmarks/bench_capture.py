@@ -0,0 +1,82 @@
+"""
+Compares the recording of UDS traffic in a binary capture file with the ``DEBUG`` logging of the connections, which writes every payload in hexadecimal.
+The same request/response payloads are written both ways. The capture is then read back with ``CaptureReader``.
+
+Run with : python -m benchmarks.bench_capture
+"""
+import binascii
+import logging
+import os
+import random
+import shutil
+import tempfile
+import time
+
+from udsoncan.capture import CaptureReader, CaptureRecord, CaptureWriter
+
+from typing import List, Tuple
+
+
+def make_traffic(count: int) -> List[Tuple[int, bytes]]:
+    rng = random.Random(1234)
+    traffic = []
+    for i in range(count // 2):
+        did = rng.randrange(0x10000).to_bytes(2, 'big')
+        traffic.append((CaptureRecord.TX, b'\x22' + did))
+        traffic.append((CaptureRecord.RX, b'\x62' + did + bytes(rng.randrange(256) for j in range(rng.randrange(1, 32)))))
+    return traffic
+
+
+def main(count: int = 500000) -> None:
+    traffic = make_traffic(count)
+    tempdir = tempfile.mkdtemp()
+    try:
+        log_filename = os.path.join(tempdir, 'debug.log')
+        logger = logging.getLogger('bench_capture')
+        logger.propagate = False
+        logger.setLevel(logging.DEBUG)
+        handler = logging.FileHandler(log_filename)
+        handler.setFormatter(logging.Formatter('%(asctime)s [%(levelname)s] <%(name)s> %(message)s'))
+        logger.addHandler(handler)
+
+        t1 = time.perf_counter()
+        for direction, payload in traffic:
+            # Same as what BaseConnection logs
+            if direction == CaptureRecord.TX:
+                logger.debug('Sending %d bytes : [%s]' % (len(payload), binascii.hexlify(payload).decode('ascii')))
+            else:
+                logger.debug('Received %d bytes : [%s]' % (len(payload), binascii.hexlify(payload).decode('ascii')))
+        handler.close()
+        results = [('DEBUG log', time.perf_counter() - t1, os.path.getsize(log_filename))]
+
+        for compress in [False, True]:
+            filename = os.path.join(tempdir, 'capture%d.bin' % compress)
+            t1 = time.perf_counter()
+            with CaptureWriter(filename, compress=compress) as writer:
+                for direction, payload in traffic:
+                    writer.write(direction, payload)
+            results.append(('Capture' + (' (zlib)' if compress else ''), time.perf_counter() - t1, os.path.getsize(filename)))
+
+        print('%d payloads' % count)
+        for name, elapsed, size in results:
+            print('%-16s : write %6.3f sec (%5.2f us/payload) - %10d bytes' % (name, elapsed, elapsed / count * 1e6, size))
+
+        for compress in [False, True]:
+            filename = os.path.join(tempdir, 'capture%d.bin' % compress)
+            with CaptureReader(filename) as reader:
+                t1 = time.perf_counter()
+                n = sum(1 for record in reader)
+                elapsed = time.perf_counter() - t1
+                assert n == count
+                last_timestamp = reader[-1].timestamp
+                t1 = time.perf_counter()
+                sum(1 for record in reader.records(start_time=last_timestamp))
+                seek_time = time.perf_counter() - t1
+            print('Read %-15s : %6.3f sec (%5.2f us/record, %6.1f MB/s) - seek to last record %.3f ms' % (
+                'capture' + (' (zlib)' if compress else ''), elapsed, elapsed / count * 1e6, os.path.getsize(filename) / elapsed / 1e6, seek_time * 1e3))
+    finally:
+        shutil.rmtree(tempdir)
+
+
+if __name__ == '__main__':
+    main()
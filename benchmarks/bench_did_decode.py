@@ -0,0 +1,47 @@
+"""
+Measures ``ReadDataByIdentifier.interpret_response`` for a response holding many DIDs, with the DID configuration
+given as a plain dict (codecs made on every call) and as a ``CompiledDidConfig`` (codecs reused).
+
+Run with : python -m benchmarks.bench_did_decode
+"""
+import struct
+import timeit
+
+from udsoncan import Response, DidCodec, CompiledDidConfig
+from udsoncan.services import ReadDataByIdentifier
+
+
+class U16Codec(DidCodec):
+    def decode(self, did_payload):
+        return struct.unpack('>H', did_payload)[0]
+
+    def __len__(self):
+        return 2
+
+
+def make_config(did_count: int):
+    didconfig = {}
+    for i in range(did_count):
+        didconfig[0x1000 + i] = '>H' if i % 2 == 0 else U16Codec
+    return didconfig
+
+
+def main(did_count: int = 200, number: int = 500) -> None:
+    didconfig = make_config(did_count)
+    didlist = list(didconfig.keys())
+    payload = b'\x62' + b''.join(struct.pack('>HH', did, did & 0xFFFF) for did in didlist)
+    compiled = CompiledDidConfig(didconfig)
+
+    def run_dict():
+        ReadDataByIdentifier.interpret_response(Response.from_payload(payload), didlist=didlist, didconfig=didconfig)
+
+    def run_compiled():
+        ReadDataByIdentifier.interpret_response(Response.from_payload(payload), didlist=didlist, didconfig=compiled)
+
+    for name, func in [('dict config', run_dict), ('compiled config', run_compiled)]:
+        elapsed = timeit.timeit(func, number=number)
+        print('%-16s : %8.1f us/response (%d DIDs) - %8.3f us/DID' % (name, elapsed / number * 1e6, did_count, elapsed / number / did_count * 1e6))
+
+
+if __name__ == '__main__':
+    main()
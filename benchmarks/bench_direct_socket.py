@@ -0,0 +1,81 @@
+"""
+Compares a ``SocketConnection`` read by its own thread against one in direct mode, where ``wait_frame`` receives the frame itself.
+Both ends of a local socketpair are used.
+
+- Latency : a thread echoes each frame back. A request is sent and its echo is waited for before sending the next one.
+- Throughput : the peer sends a burst of frames that are read with ``wait_frame``.
+
+Run with : python -m benchmarks.bench_direct_socket
+"""
+import socket
+import statistics
+import threading
+import time
+
+from udsoncan.connections import SocketConnection
+
+from typing import List, Tuple
+
+PAYLOAD = b'\x62\xF1\x90' + bytes(17)
+
+
+def make_socketpair() -> Tuple[socket.socket, socket.socket]:
+    # Datagrams keep the frame boundaries, like an ISO-TP socket
+    if hasattr(socket, 'AF_UNIX') and hasattr(socket, 'SOCK_SEQPACKET'):
+        return socket.socketpair(socket.AF_UNIX, socket.SOCK_SEQPACKET)
+    return socket.socketpair()
+
+
+def echo_task(sock: socket.socket) -> None:
+    while True:
+        data = sock.recv(4095)
+        if not data:
+            break
+        sock.send(data)
+
+
+def bench_latency(direct: bool, count: int) -> List[float]:
+    sock, peer = make_socketpair()
+    echo_thread = threading.Thread(target=echo_task, args=(peer,), daemon=True)
+    echo_thread.start()
+    latencies = []
+    with SocketConnection(sock, direct=direct).open() as conn:
+        for i in range(count):
+            t1 = time.perf_counter()
+            conn.send(PAYLOAD)
+            conn.wait_frame(timeout=5, exception=True)
+            latencies.append(time.perf_counter() - t1)
+    sock.shutdown(socket.SHUT_RDWR)
+    echo_thread.join()
+    sock.close()
+    peer.close()
+    return latencies
+
+
+def bench_throughput(direct: bool, count: int, burst: int = 100) -> float:
+    sock, peer = make_socketpair()
+    elapsed = 0.0
+    with SocketConnection(sock, direct=direct).open() as conn:
+        for i in range(count // burst):
+            t1 = time.perf_counter()
+            for j in range(burst):
+                peer.send(PAYLOAD)
+            for j in range(burst):
+                conn.wait_frame(timeout=5, exception=True)
+            elapsed += time.perf_counter() - t1
+    sock.close()
+    peer.close()
+    return elapsed
+
+
+def main(count: int = 20000) -> None:
+    for name, direct in [('Reading thread', False), ('Direct', True)]:
+        latencies = bench_latency(direct, count)
+        latencies.sort()
+        elapsed = bench_throughput(direct, count)
+        print('%-15s : latency %6.1f us (median) - %6.1f us (99%%) - throughput %8.0f frames/sec' % (
+            name, statistics.median(latencies) * 1e6, latencies[int(len(latencies) * 0.99)] * 1e6, count / elapsed))
+
+
+if __name__ == '__main__':
+    main()
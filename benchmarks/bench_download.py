@@ -0,0 +1,67 @@
+"""
+Measures the throughput of a 1 MB download over a ``QueueConnection`` answered by a server thread.
+The same image is sent once with a loop of ``Client.transfer_data`` calls and once with ``Client.download``.
+The transport is instantaneous, so the measure shows the time spent in Python for each block.
+
+Run with : python -m benchmarks.bench_download
+"""
+import logging
+import threading
+import time
+
+from udsoncan import MemoryLocation
+from udsoncan.client import Client
+from udsoncan.connections import QueueConnection
+
+
+def serve(conn: QueueConnection, max_length: int, stop: threading.Event) -> None:
+    while not stop.is_set():
+        try:
+            request = conn.touserqueue.get(timeout=0.1)
+        except Exception:
+            continue
+        sid = request[0]
+        if sid == 0x34:
+            conn.fromuserqueue.put(b'\x74\x20' + max_length.to_bytes(2, 'big'))
+        elif sid == 0x36:
+            conn.fromuserqueue.put(b'\x76' + request[1:2])
+        elif sid == 0x37:
+            conn.fromuserqueue.put(b'\x77')
+
+
+def main(size: int = 1024 * 1024, max_length: int = 4095, debug_logging: bool = False) -> None:
+    image = bytes(i & 0xFF for i in range(size))
+    block_size = max_length - 2
+    location = MemoryLocation(0, size, 32, 32)
+
+    conn = QueueConnection(name='bench')
+    stop = threading.Event()
+    thread = threading.Thread(target=serve, args=(conn, max_length, stop), daemon=True)
+    thread.start()
+
+    client = Client(conn, request_timeout=2)
+    client.logger.setLevel(logging.DEBUG if debug_logging else logging.INFO)
+    with client:
+        t1 = time.perf_counter()
+        client.request_download(location)
+        sequence_number = 1
+        for offset in range(0, size, block_size):
+            client.transfer_data(sequence_number, image[offset:offset + block_size])
+            sequence_number = (sequence_number + 1) & 0xFF
+        client.request_transfer_exit()
+        loop_time = time.perf_counter() - t1
+
+        t1 = time.perf_counter()
+        client.download(location, image)
+        download_time = time.perf_counter() - t1
+
+    stop.set()
+    thread.join()
+
+    for name, elapsed in [('transfer_data loop', loop_time), ('download()', download_time)]:
+        print('%-20s : %8.3f sec - %8.1f kB/sec' % (name, elapsed, size / elapsed / 1024))
+
+
+if __name__ == '__main__':
+    main()
+    main(debug_logging=True)
@@ -0,0 +1,97 @@
+"""
+Measures the memory used per DTC with tracemalloc. DTCs are parsed from a large ReadDTCInformation response (reportDTCByStatusMask)
+and kept in memory, as a DTC monitor would. The previous layout of ``Dtc`` (an instance dictionary, a ``Status``, a ``Severity``
+and a ``DtcClass`` object with one attribute per flag, and two lists per DTC) is reproduced for comparison.
+
+Run with : python -m benchmarks.bench_dtc_memory
+"""
+import random
+import tracemalloc
+
+from udsoncan import Dtc, Response
+from udsoncan.services import ReadDTCInformation
+
+from typing import Any, Callable, List
+
+
+class LegacyStatus:
+    def __init__(self, byte: int = 0):
+        self.test_failed = byte & 0x01 > 0
+        self.test_failed_this_operation_cycle = byte & 0x02 > 0
+        self.pending = byte & 0x04 > 0
+        self.confirmed = byte & 0x08 > 0
+        self.test_not_completed_since_last_clear = byte & 0x10 > 0
+        self.test_failed_since_last_clear = byte & 0x20 > 0
+        self.test_not_completed_this_operation_cycle = byte & 0x40 > 0
+        self.warning_indicator_requested = byte & 0x80 > 0
+
+
+class LegacySeverity:
+    def __init__(self) -> None:
+        self.maintenance_only = False
+        self.check_at_next_exit = False
+        self.check_immediately = False
+
+
+class LegacyDtcClass:
+    def __init__(self) -> None:
+        self.class0 = False
+        self.class1 = False
+        self.class2 = False
+        self.class3 = False
+        self.class4 = False
+
+
+class LegacyDtc:
+    def __init__(self, dtcid: int, status: int):
+        self.id = dtcid
+        self.status = LegacyStatus(status)
+        self.snapshots: List[Any] = []
+        self.extended_data: List[Any] = []
+        self.severity = LegacySeverity()
+        self.dtc_class = LegacyDtcClass()
+        self.functional_unit = None
+        self.fault_counter = None
+
+
+def make_payload(dtc_count: int) -> bytes:
+    rng = random.Random(1234)
+    records = b''.join(rng.randrange(1, 0xFFFFFF).to_bytes(3, 'big') + bytes([rng.randrange(256)]) for i in range(dtc_count))
+    return b'\x59\x02\xFF' + records
+
+
+def bytes_per_dtc(func: Callable[[], List[Any]]) -> float:
+    tracemalloc.start()
+    dtcs = func()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return size / len(dtcs)
+
+
+def main(dtc_count: int = 100000) -> None:
+    payload = make_payload(dtc_count)
+    records = [(int.from_bytes(payload[i:i + 3], 'big'), payload[i + 3]) for i in range(3, len(payload), 4)]
+    subfunction = ReadDTCInformation.Subfunction.reportDTCByStatusMask
+
+    def legacy() -> List[Any]:
+        return [LegacyDtc(dtcid, status) for dtcid, status in records]
+
+    def parsed() -> List[Any]:
+        return ReadDTCInformation.interpret_response(Response.from_payload(payload), subfunction).service_data.dtcs
+
+    def parsed_and_read() -> List[Any]:
+        dtcs = parsed()
+        for dtc in dtcs:
+            dtc.status.confirmed
+        return dtcs
+
+    def table() -> List[Any]:
+        return ReadDTCInformation.interpret_response(Response.from_payload(payload), subfunction, dtc_table=True).service_data.dtc_table
+
+    print('%d DTCs' % dtc_count)
+    for name, func in [('Previous Dtc layout', legacy), ('Dtc', parsed), ('Dtc, status read', parsed_and_read), ('DtcTable', table)]:
+        print('%-20s : %7.1f bytes/DTC' % (name, bytes_per_dtc(func)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+"""
+Compares the parsing of a large ReadDTCInformation response (reportDTCByStatusMask) into a list of ``Dtc`` objects and into a ``DtcTable``.
+Also measures the memory held by each result and the time to filter the confirmed DTCs.
+
+Run with : python -m benchmarks.bench_dtc_table
+"""
+import random
+import time
+import tracemalloc
+
+from udsoncan import Response
+from udsoncan.services import ReadDTCInformation
+
+from typing import Any, Callable, Tuple
+
+
+def make_payload(dtc_count: int) -> bytes:
+    rng = random.Random(1234)
+    records = b''.join(rng.randrange(1, 0xFFFFFF).to_bytes(3, 'big') + bytes([rng.randrange(256)]) for i in range(dtc_count))
+    return b'\x59\x02\xFF' + records
+
+
+def timed(func: Callable[[], Any], repeat: int) -> float:
+    t1 = time.perf_counter()
+    for i in range(repeat):
+        func()
+    return (time.perf_counter() - t1) / repeat
+
+
+def memory_of(func: Callable[[], Any]) -> Tuple[Any, int]:
+    tracemalloc.start()
+    result = func()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, size
+
+
+def main(dtc_count: int = 5000, repeat: int = 20) -> None:
+    payload = make_payload(dtc_count)
+    subfunction = ReadDTCInformation.Subfunction.reportDTCByStatusMask
+
+    def parse_list() -> Any:
+        return ReadDTCInformation.interpret_response(Response.from_payload(payload), subfunction).service_data.dtcs
+
+    def parse_table() -> Any:
+        return ReadDTCInformation.interpret_response(Response.from_payload(payload), subfunction, dtc_table=True).service_data.dtc_table
+
+    dtcs, list_memory = memory_of(parse_list)
+    table, table_memory = memory_of(parse_table)
+
+    results = [
+        ('Dtc list', timed(parse_list, repeat), list_memory, timed(lambda: [dtc for dtc in dtcs if dtc.status.confirmed], repeat)),
+        ('DtcTable', timed(parse_table, repeat), table_memory, timed(lambda: table.where(confirmed=True), repeat)),
+    ]
+
+    print('%d DTCs per response' % dtc_count)
+    for name, parse_time, memory, filter_time in results:
+        print('%-9s : parse %7.2f ms - %8d bytes - filter confirmed %6.2f ms' % (name, parse_time * 1e3, memory, filter_time * 1e3))
+    print('Parse speedup : %.1fx - Memory ratio : %.1fx' % (results[0][1] / results[1][1], results[0][2] / results[1][2]))
+
+
+if __name__ == '__main__':
+    main()
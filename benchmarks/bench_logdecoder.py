@@ -0,0 +1,72 @@
+"""
+Measures the decoding of a synthetic candump log containing UDS traffic (ReadDataByIdentifier with multi-frame responses, NRC 0x78, unanswered requests)
+with an increasing number of processes. The output of each run is compared with the single process run.
+
+Run with : python -m benchmarks.bench_logdecoder
+"""
+import os
+import random
+import shutil
+import tempfile
+import time
+
+from udsoncan.logdecoder import decode_log
+
+from typing import List
+
+DIDCONFIG = {0xF100 + i: '>' + 'H' * (i + 1) for i in range(16)}
+
+
+def isotp_frames(payload: bytes) -> List[bytes]:
+    if len(payload) <= 7:
+        return [(bytes([len(payload)]) + payload).ljust(8, b'\x00')]
+    frames = [bytes([0x10 | (len(payload) >> 8), len(payload) & 0xFF]) + payload[:6]]
+    sequence = 1
+    for i in range(6, len(payload), 7):
+        frames.append((bytes([0x20 | sequence]) + payload[i:i + 7]).ljust(8, b'\x00'))
+        sequence = (sequence + 1) & 0xF
+    return frames
+
+
+def make_log(filename: str, count: int) -> None:
+    rng = random.Random(1234)
+    t = 1700000000.0
+    with open(filename, 'w') as f:
+        for i in range(count):
+            index = rng.randrange(16)
+            did = (0xF100 + index).to_bytes(2, 'big')
+            exchanges = [(0x7E0, b'\x22' + did)]
+            if i % 10 == 0:
+                exchanges.append((0x7E8, b'\x7F\x22\x78'))
+            if i % 50 != 7:
+                exchanges.append((0x7E8, b'\x62' + did + bytes(rng.randrange(256) for j in range(2 * (index + 1)))))
+            for can_id, payload in exchanges:
+                for frame in isotp_frames(payload):
+                    f.write('(%.6f) can0 %03X#%s\n' % (t, can_id, frame.hex().upper()))
+                    t += 0.0005
+            t += 0.01
+
+
+def main(count: int = 200000) -> None:
+    tempdir = tempfile.mkdtemp()
+    try:
+        filename = os.path.join(tempdir, 'candump.log')
+        make_log(filename, count)
+        size = os.path.getsize(filename)
+        print('%d requests - %.1f MB of candump log - %d CPUs' % (count, size / 1e6, os.cpu_count() or 1))
+
+        reference = None
+        for processes in [1, 2, 4, 8]:
+            t1 = time.perf_counter()
+            results = list(decode_log(filename, processes=processes, chunk_size=size // (processes * 4) + 1, didconfig=DIDCONFIG))
+            elapsed = time.perf_counter() - t1
+            if reference is None:
+                reference = results
+            same = 'same result' if results == reference else 'DIFFERENT RESULT'
+            print('%d process(es) : %6.3f sec - %8.0f transactions/sec - %6.1f MB/s - %s' % (processes, elapsed, len(results) / elapsed, size / elapsed / 1e6, same))
+    finally:
+        shutil.rmtree(tempdir)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,55 @@
+"""
+Measures the cost of the metrics collection on a ``Client``. The same ReadDataByIdentifier request is sent many times
+over a ``QueueConnection`` answered by a server thread, once without metrics and once with a ``ClientMetrics`` attached.
+
+Run with : python -m benchmarks.bench_metrics_overhead
+"""
+import logging
+import threading
+import time
+
+from udsoncan.client import Client
+from udsoncan.connections import QueueConnection
+from udsoncan.metrics import ClientMetrics
+
+
+def serve(conn: QueueConnection, stop: threading.Event) -> None:
+    while not stop.is_set():
+        try:
+            request = conn.touserqueue.get(timeout=0.1)
+        except Exception:
+            continue
+        conn.fromuserqueue.put(b'\x62' + request[1:3] + b'\x12\x34')
+
+
+def run(client: Client, count: int) -> float:
+    t1 = time.perf_counter()
+    for i in range(count):
+        client.read_data_by_identifier(0x1234)
+    return time.perf_counter() - t1
+
+
+def main(count: int = 20000) -> None:
+    conn = QueueConnection(name='bench')
+    stop = threading.Event()
+    thread = threading.Thread(target=serve, args=(conn, stop), daemon=True)
+    thread.start()
+
+    client = Client(conn, request_timeout=2, config={'data_identifiers': {0x1234: '>H'}})
+    client.logger.setLevel(logging.INFO)
+    with client:
+        run(client, 1000)   # Warm up
+        without_metrics = run(client, count)
+        client.metrics = ClientMetrics()
+        with_metrics = run(client, count)
+
+    stop.set()
+    thread.join()
+
+    for name, elapsed in [('without metrics', without_metrics), ('with metrics', with_metrics)]:
+        print('%-16s : %8.3f sec - %6.1f us/request' % (name, elapsed, elapsed / count * 1e6))
+    print('Overhead : %.1f us/request' % ((with_metrics - without_metrics) / count * 1e6))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+"""
+Compares two ways of sampling a signal at high rate over a ``QueueConnection`` : polling it with ``read_data_by_identifier``
+and receiving it through a ``ReadDataByPeriodicIdentifier`` stream. The server thread answers the polling requests and 
+pushes the periodic data messages. The CPU time is measured in the client thread only.
+
+Run with : python -m benchmarks.bench_periodic_stream
+"""
+import logging
+import threading
+import time
+
+from udsoncan import services
+from udsoncan.client import Client
+from udsoncan.connections import QueueConnection
+
+
+def serve(conn: QueueConnection, count: int, stop: threading.Event) -> None:
+    while not stop.is_set():
+        try:
+            request = conn.touserqueue.get(timeout=0.1)
+        except Exception:
+            continue
+        if request[0] == 0x22:
+            conn.fromuserqueue.put(b'\x62' + request[1:3] + b'\x12\x34')
+        elif request[0] == 0x2A:
+            conn.fromuserqueue.put(b'\x6A')
+            if request[1] != services.ReadDataByPeriodicIdentifier.TransmissionMode.stopSending:
+                for i in range(count):
+                    conn.fromuserqueue.put(b'\x6A' + request[2:3] + b'\x12\x34')
+
+
+def main(count: int = 20000) -> None:
+    conn = QueueConnection(name='bench')
+    stop = threading.Event()
+    thread = threading.Thread(target=serve, args=(conn, count, stop), daemon=True)
+    thread.start()
+
+    client = Client(conn, request_timeout=2, config={'data_identifiers': {0xF201: '>H'}})
+    client.logger.setLevel(logging.INFO)
+    with client:
+        t1 = time.perf_counter()
+        cpu1 = time.thread_time()
+        for i in range(count):
+            client.read_data_by_identifier_first(0xF201)
+        polling = (time.perf_counter() - t1, time.thread_time() - cpu1, 2 * count)
+
+        t1 = time.perf_counter()
+        cpu1 = time.thread_time()
+        stream = client.start_periodic_stream(0xF201, maxsize=count)
+        received = len(list(stream.samples(count=count, timeout=2)))
+        streaming = (time.perf_counter() - t1, time.thread_time() - cpu1, received + 2)
+        client.stop_periodic_stream(stream)
+
+    stop.set()
+    thread.join()
+
+    for name, (elapsed, cpu, messages) in [('polling', polling), ('periodic stream', streaming)]:
+        print('%-16s : %8.3f sec - %6.1f us CPU/sample - %d messages' % (name, elapsed, cpu / count * 1e6, messages))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+"""
+Compares the ordinary call path of the ``Client`` with a request prepared by ``Client.prepare``. The same ReadDataByIdentifier request
+(3 DIDs) is sent many times over a ``QueueConnection`` answered by a server thread.
+
+Run with : python -m benchmarks.bench_prepared_request
+"""
+import logging
+import threading
+import time
+
+from udsoncan.client import Client
+from udsoncan.connections import QueueConnection
+
+from typing import Any, Callable
+
+DIDLIST = [0x1234, 0x1235, 0x1236]
+RESPONSE = b'\x62\x12\x34\x00\x01\x12\x35\x00\x02\x12\x36\x00\x03'
+
+
+def serve(conn: QueueConnection, stop: threading.Event) -> None:
+    while not stop.is_set():
+        try:
+            conn.touserqueue.get(timeout=0.1)
+        except Exception:
+            continue
+        conn.fromuserqueue.put(RESPONSE)
+
+
+def timed(func: Callable[[], Any], count: int) -> float:
+    t1 = time.perf_counter()
+    for i in range(count):
+        func()
+    return time.perf_counter() - t1
+
+
+def main(count: int = 20000) -> None:
+    conn = QueueConnection(name='bench')
+    stop = threading.Event()
+    thread = threading.Thread(target=serve, args=(conn, stop), daemon=True)
+    thread.start()
+
+    client = Client(conn, request_timeout=2, config={'data_identifiers': {did: '>H' for did in DIDLIST}})
+    client.logger.setLevel(logging.INFO)
+    prepared = client.prepare(client.read_data_by_identifier, DIDLIST)
+    with client:
+        timed(lambda: client.read_data_by_identifier(DIDLIST), 1000)   # Warm up
+        results = [
+            ('read_data_by_identifier', timed(lambda: client.read_data_by_identifier(DIDLIST), count)),
+            ('prepared', timed(prepared, count)),
+        ]
+
+    stop.set()
+    thread.join()
+
+    print('%d requests over QueueConnection' % count)
+    for name, elapsed in results:
+        print('%-24s : %8.3f sec - %6.1f us/request' % (name, elapsed, elapsed / count * 1e6))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,47 @@
+"""
+Measures the bytes/sec going through ``QueueConnection.send`` and ``QueueConnection.wait_frame`` followed by ``Response.from_payload``,
+with DEBUG logging disabled. The "eager" variant reproduces the previous behavior where the payload was formatted in hexadecimal 
+for the DEBUG log line even when that level is disabled. The "view" variant builds the response with ``data_view=True``.
+
+Run with : python -m benchmarks.bench_queue_throughput
+"""
+import binascii
+import logging
+import time
+
+from udsoncan import Response
+from udsoncan.connections import QueueConnection
+
+
+class EagerLogQueueConnection(QueueConnection):
+    def send(self, data, timeout=None):
+        self.logger.debug('Sending %d bytes : [%s]' % (len(data), binascii.hexlify(data).decode('ascii')))
+        self.specific_send(data, timeout=timeout)
+
+    def wait_frame(self, timeout=None, exception=False):
+        frame = self.specific_wait_frame(timeout=timeout)
+        self.logger.debug('Received %d bytes : [%s]' % (len(frame), binascii.hexlify(frame).decode('ascii')))
+        return frame
+
+
+def run(conn: QueueConnection, payload: bytes, count: int, data_view: bool) -> float:
+    t1 = time.perf_counter()
+    for i in range(count):
+        conn.send(payload)
+        conn.fromuserqueue.put(conn.touserqueue.get())
+        Response.from_payload(conn.wait_frame(), data_view=data_view)
+    return time.perf_counter() - t1
+
+
+def main(size: int = 4095, count: int = 5000) -> None:
+    payload = b'\x76\x01' + bytes(size - 2)     # TransferData positive response
+    for name, cls, data_view in [('eager', EagerLogQueueConnection, False), ('lazy', QueueConnection, False), ('lazy + view', QueueConnection, True)]:
+        conn = cls(name='bench')
+        conn.logger.setLevel(logging.INFO)
+        with conn.open():
+            elapsed = run(conn, payload, count, data_view)
+        print('%-12s : %8.1f MB/sec (%d frames of %d bytes)' % (name, size * count * 2 / elapsed / 1e6, count, size))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+"""
+Compares ``SocketConnection`` reading its socket with a thread of its own against many connections sharing a ``SocketReactor``.
+Each connection is one end of a local socketpair. For each round, a frame is sent to every connection, then read back with ``wait_frame``.
+The time to open and close the connections, the number of threads, the wall time and the CPU time of the process are printed.
+
+Run with : python -m benchmarks.bench_reactor
+"""
+import socket
+import threading
+import time
+
+from udsoncan.connections import SocketConnection, SocketReactor
+
+from typing import Dict, Optional
+
+
+def run(conn_count: int, rounds: int, reactor: Optional[SocketReactor]) -> Dict[str, float]:
+    pairs = [socket.socketpair() for i in range(conn_count)]
+    conns = [SocketConnection(sock, reactor=reactor) for sock, peer in pairs]
+    thread_count = threading.active_count()
+
+    t1 = time.perf_counter()
+    for conn in conns:
+        conn.open()
+    open_time = time.perf_counter() - t1
+    added_threads = threading.active_count() - thread_count
+
+    payload = b'\x62\xF1\x90' + bytes(17)
+    t1 = time.perf_counter()
+    cpu1 = time.process_time()
+    for i in range(rounds):
+        for sock, peer in pairs:
+            peer.send(payload)
+        for conn in conns:
+            conn.wait_frame(timeout=5, exception=True)
+    elapsed = time.perf_counter() - t1
+    cpu = time.process_time() - cpu1
+
+    t1 = time.perf_counter()
+    for conn in conns:
+        conn.close()
+    close_time = time.perf_counter() - t1
+    for sock, peer in pairs:
+        sock.close()
+        peer.close()
+    return {'open': open_time, 'close': close_time, 'threads': added_threads, 'elapsed': elapsed, 'cpu': cpu}
+
+
+def main(rounds: int = 20) -> None:
+    for conn_count in [10, 100, 1000]:
+        count = conn_count * rounds
+        print('%d connections, %d frames each' % (conn_count, rounds))
+        for name in ['Thread per connection', 'SocketReactor']:
+            reactor = SocketReactor() if name == 'SocketReactor' else None
+            result = run(conn_count, rounds, reactor)
+            if reactor is not None:
+                reactor.close()
+            print('  %-22s : %4d threads - open %7.1f ms - close %7.1f ms - %6.1f us/frame - %6.1f us CPU/frame' % (
+                name, result['threads'], result['open'] * 1e3, result['close'] * 1e3, result['elapsed'] / count * 1e6, result['cpu'] / count * 1e6))
+
+
+if __name__ == '__main__':
+    main()
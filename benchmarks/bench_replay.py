@@ -0,0 +1,53 @@
+"""
+Measures the throughput of the ``Client`` alone (encoding, ``send_request`` timing logic and response interpretation) with a ``ReplayConnection``
+playing back a trace without delay. The trace alternates reads of 3 DIDs answered directly and reads answered after a NRC 0x78 (ResponsePending).
+
+Run with : python -m benchmarks.bench_replay
+"""
+import logging
+import time
+
+from udsoncan.capture import CaptureRecord
+from udsoncan.client import Client
+from udsoncan.connections import ReplayConnection
+
+from typing import List
+
+DIDLIST = [0x1234, 0x1235, 0x1236]
+REQUEST = b'\x22\x12\x34\x12\x35\x12\x36'
+RESPONSE = b'\x62\x12\x34\x00\x01\x12\x35\x00\x02\x12\x36\x00\x03'
+
+
+def make_trace(count: int) -> List[CaptureRecord]:
+    trace = []
+    for i in range(count):
+        t = float(i)
+        trace.append(CaptureRecord(t, CaptureRecord.TX, REQUEST))
+        if i % 2 == 1:
+            trace.append(CaptureRecord(t + 0.01, CaptureRecord.RX, b'\x7F\x22\x78'))
+        trace.append(CaptureRecord(t + 0.02, CaptureRecord.RX, RESPONSE))
+    return trace
+
+
+def main(count: int = 50000) -> None:
+    conn = ReplayConnection(make_trace(1000), loop=True, name='bench')
+    client = Client(conn, request_timeout=2, config={'data_identifiers': {did: '>H' for did in DIDLIST}})
+    client.logger.setLevel(logging.WARNING)
+    prepared = client.prepare(client.read_data_by_identifier, DIDLIST)
+
+    with client:
+        results = []
+        for name, func in [('read_data_by_identifier', lambda: client.read_data_by_identifier(DIDLIST)), ('prepared', prepared)]:
+            conn.rewind()
+            t1 = time.perf_counter()
+            for i in range(count):
+                func()
+            results.append((name, time.perf_counter() - t1))
+
+    print('%d requests replayed, half of them with a NRC 0x78' % count)
+    for name, elapsed in results:
+        print('%-24s : %6.3f sec - %6.1f us/request - %8.0f requests/sec' % (name, elapsed, elapsed / count * 1e6, count / elapsed))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+"""
+Measures the parsing of a mix of positive and negative response payloads, with the name lookups done for each of them
+when logging and raising exceptions. The lookups are compared with the previous implementation that searched the class
+attributes with ``inspect.getmembers`` on every call.
+
+Run with : python -m benchmarks.bench_response_parsing
+"""
+import inspect
+import random
+import time
+
+from udsoncan import Response
+from udsoncan.ResponseCode import ResponseCode
+from udsoncan.common.dtc import Dtc
+from udsoncan.services import ECUReset
+
+from typing import Callable, List, Optional
+
+
+def legacy_response_code_name(given_id: Optional[int]) -> str:
+    if given_id is None:
+        return ""
+    for member in inspect.getmembers(ResponseCode):
+        if isinstance(member[1], int):
+            if member[1] == given_id:
+                return member[0]
+    return str(given_id)
+
+
+def legacy_subfunction_name(given_id: int) -> str:
+    for member in inspect.getmembers(ECUReset.ResetType):
+        if isinstance(member[1], int):
+            if member[1] == given_id:
+                return member[0]
+    return 'Custom %s' % ECUReset.ResetType.__pretty_name__
+
+
+def legacy_dtc_format_name(given_id: int) -> Optional[str]:
+    for member in inspect.getmembers(Dtc.Format):
+        if isinstance(member[1], int):
+            if member[1] == given_id:
+                return member[0]
+    return None
+
+
+def make_payloads(count: int) -> List[bytes]:
+    rng = random.Random(1234)
+    positives = [b'\x62\xF1\x90ABCDEFGHIJKLMNOPQ', b'\x51\x01', b'\x50\x03\x00\x32\x01\xF4', b'\x59\x02\xFF\x12\x34\x56\x2F', b'\x7E\x00']
+    negatives = [bytes([0x7F, service, code]) for service in [0x22, 0x27, 0x2E, 0x31, 0x34] for code in [0x10, 0x11, 0x12, 0x13, 0x22, 0x31, 0x33, 0x35, 0x72, 0x78]]
+    return [rng.choice(positives) if rng.random() < 0.5 else rng.choice(negatives) for i in range(count)]
+
+
+def run(payloads: List[bytes], code_name: Callable, subfunction_name: Callable, dtc_format_name: Callable) -> float:
+    t1 = time.perf_counter()
+    for payload in payloads:
+        response = Response.from_payload(payload)
+        if not response.valid:
+            raise RuntimeError('Invalid payload %s' % payload.hex())
+        code_name(response.code)
+        if response.code == Response.Code.PositiveResponse:
+            subfunction_name(1)
+            dtc_format_name(1)
+    return time.perf_counter() - t1
+
+
+def main(count: int = 100000) -> None:
+    payloads = make_payloads(count)
+    run(payloads[:1000], Response.Code.get_name, ECUReset.ResetType.get_name, Dtc.Format.get_name)   # Warm up
+
+    legacy = run(payloads, legacy_response_code_name, legacy_subfunction_name, legacy_dtc_format_name)
+    lookup = run(payloads, Response.Code.get_name, ECUReset.ResetType.get_name, Dtc.Format.get_name)
+
+    for name, elapsed in [('inspect search', legacy), ('lookup tables', lookup)]:
+        print('%-14s : %8.3f sec - %6.2f us/response' % (name, elapsed, elapsed / count * 1e6))
+    print('Speedup : %.1fx' % (legacy / lookup))
+
+
+if __name__ == '__main__':
+    main()
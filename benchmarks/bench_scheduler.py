@@ -0,0 +1,94 @@
+"""
+Measures the cost of sharing a client with a ``SharedClient``, and the wait time of high priority operations while other threads keep the queue full.
+The client talks to a simulated server through a ``SimulatorConnection``, so the time measured is the time spent in the client and the scheduler.
+For the priorities, each polling request also waits 2 ms, about the time taken by a real ECU.
+
+Run with : python -m benchmarks.bench_scheduler
+"""
+import logging
+import statistics
+import threading
+import time
+
+from udsoncan.client import Client
+from udsoncan.scheduler import SharedClient
+from udsoncan.server import Server, SimulatorConnection
+
+DIDCONFIG = {0x1234: '>H'}
+
+
+def make_client() -> Client:
+    client = Client(SimulatorConnection(Server(didconfig=DIDCONFIG, dids={0x1234: 0x55AA})), request_timeout=1, config={'data_identifiers': DIDCONFIG})
+    client.logger.setLevel(logging.WARNING)
+    return client
+
+
+def bench_overhead(count: int) -> None:
+    with make_client() as client:
+        t1 = time.perf_counter()
+        for i in range(count):
+            client.read_data_by_identifier_first(0x1234)
+        direct = (time.perf_counter() - t1) / count
+
+        with SharedClient(client) as shared:
+            view = shared.view()
+            t1 = time.perf_counter()
+            for i in range(count):
+                view.read_data_by_identifier_first(0x1234)
+            blocking = (time.perf_counter() - t1) / count
+
+            t1 = time.perf_counter()
+            futures = [shared.submit('read_data_by_identifier_first', 0x1234) for i in range(count)]
+            for future in futures:
+                future.result()
+            pipelined = (time.perf_counter() - t1) / count
+
+    print('Direct call               : %6.1f us/request' % (direct * 1e6))
+    print('SharedClient, blocking    : %6.1f us/request' % (blocking * 1e6))
+    print('SharedClient, 1000 queued : %6.1f us/request' % (pipelined * 1e6))
+
+
+def bench_priorities(pollers: int, count: int) -> None:
+    with make_client() as client, SharedClient(client) as shared:
+        stop = threading.Event()
+
+        def poll(client: Client) -> None:
+            time.sleep(0.002)
+            client.read_data_by_identifier_first(0x1234)
+
+        def poll_task() -> None:
+            while not stop.is_set():
+                futures = [shared.submit(poll, priority=SharedClient.Priority.LOW) for i in range(20)]
+                for future in futures:
+                    future.result()
+
+        threads = [threading.Thread(target=poll_task) for i in range(pollers)]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.1)
+
+        latencies = {}
+        for name, priority in [('HIGH', SharedClient.Priority.HIGH), ('LOW', SharedClient.Priority.LOW)]:
+            view = shared.view(priority)
+            values = []
+            for i in range(count):
+                t1 = time.perf_counter()
+                view.tester_present()
+                values.append(time.perf_counter() - t1)
+            latencies[name] = values
+
+        stop.set()
+        for thread in threads:
+            thread.join()
+        print('%d bulk polling threads, max queue depth %d' % (pollers, shared.max_queue_depth))
+        for name, values in latencies.items():
+            print('  TesterPresent with %-4s priority : %8.1f us (median) - %8.1f us (max)' % (name, statistics.median(values) * 1e6, max(values) * 1e6))
+
+
+def main() -> None:
+    bench_overhead(1000)
+    bench_priorities(4, 200)
+
+
+if __name__ == '__main__':
+    main()
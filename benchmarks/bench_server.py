@@ -0,0 +1,72 @@
+"""
+Measures the throughput of many clients talking to simulated servers in the same process.
+Each client reads 3 DIDs from its own simulated ECU. The clients are either connected directly with a ``SimulatorConnection`` (no thread),
+or through a ``QueueConnection`` served by a thread per ECU, with one client thread per ECU.
+
+Run with : python -m benchmarks.bench_server
+"""
+import logging
+import threading
+import time
+
+from udsoncan.client import Client
+from udsoncan.connections import QueueConnection
+from udsoncan.server import Server, SimulatorConnection
+
+DIDLIST = [0x1234, 0x1235, 0x1236]
+DIDCONFIG = {did: '>H' for did in DIDLIST}
+
+
+def make_server(i: int) -> Server:
+    return Server(didconfig=DIDCONFIG, dids={did: i & 0xFFFF for did in DIDLIST}, name='ecu%d' % i)
+
+
+def bench_simulator(ecu_count: int, requests_per_ecu: int) -> float:
+    clients = [Client(SimulatorConnection(make_server(i)), request_timeout=1, config={'data_identifiers': DIDCONFIG}) for i in range(ecu_count)]
+    for client in clients:
+        client.logger.setLevel(logging.WARNING)
+        client.open()
+    t1 = time.perf_counter()
+    for j in range(requests_per_ecu):
+        for client in clients:
+            client.read_data_by_identifier(DIDLIST)
+    elapsed = time.perf_counter() - t1
+    for client in clients:
+        client.close()
+    return elapsed
+
+
+def bench_threads(ecu_count: int, requests_per_ecu: int) -> float:
+    servers = [make_server(i) for i in range(ecu_count)]
+    conns = [QueueConnection() for i in range(ecu_count)]
+    for server, conn in zip(servers, conns):
+        server.start(conn)
+
+    def client_task(conn: QueueConnection) -> None:
+        with Client(conn, request_timeout=5, config={'data_identifiers': DIDCONFIG}) as client:
+            client.logger.setLevel(logging.WARNING)
+            for j in range(requests_per_ecu):
+                client.read_data_by_identifier(DIDLIST)
+
+    threads = [threading.Thread(target=client_task, args=(conn,)) for conn in conns]
+    t1 = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - t1
+    for server in servers:
+        server.stop()
+    return elapsed
+
+
+def main(ecu_count: int = 200, requests_per_ecu: int = 100) -> None:
+    count = ecu_count * requests_per_ecu
+    print('%d simulated ECUs, %d requests each' % (ecu_count, requests_per_ecu))
+    for name, func in [('SimulatorConnection', bench_simulator), ('QueueConnection + threads', bench_threads)]:
+        elapsed = func(ecu_count, requests_per_ecu)
+        print('%-26s : %6.3f sec - %6.1f us/request - %8.0f requests/sec' % (name, elapsed, elapsed / count * 1e6, count / elapsed))
+
+
+if __name__ == '__main__':
+    main()
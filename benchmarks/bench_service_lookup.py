@@ -0,0 +1,55 @@
+"""
+Compares the service class lookup done by ``BaseService.from_request_id`` / ``from_response_id``
+against the linear subclass walk that was used before the lookup tables were introduced.
+
+Run with : python -m benchmarks.bench_service_lookup
+"""
+import timeit
+
+import udsoncan.services
+from udsoncan.BaseService import BaseService
+from udsoncan import Response
+
+from typing import List, Optional, Type
+
+
+def legacy_get_all_subclasses(cls) -> List[Type[BaseService]]:
+    lst = []
+    lst.extend(cls.__subclasses__())
+    for x in cls.__subclasses__():
+        lst.extend(legacy_get_all_subclasses(x))
+    return lst
+
+
+def legacy_from_response_id(given_id: int) -> Optional[Type[BaseService]]:
+    for obj in legacy_get_all_subclasses(BaseService):
+        if obj.response_id() == int(given_id):
+            return obj
+    return None
+
+
+def main(number: int = 100000) -> None:
+    response_ids = [service.response_id() for service in legacy_get_all_subclasses(BaseService)]
+    payloads = [bytes([sid, 0x01, 0x02, 0x03]) for sid in response_ids]
+
+    def run_legacy():
+        for sid in response_ids:
+            legacy_from_response_id(sid)
+
+    def run_table():
+        for sid in response_ids:
+            BaseService.from_response_id(sid)
+
+    def run_from_payload():
+        for payload in payloads:
+            Response.from_payload(payload)
+
+    iterations = max(number // len(response_ids), 1)
+    for name, func in [('legacy linear lookup', run_legacy), ('lookup table', run_table), ('Response.from_payload', run_from_payload)]:
+        elapsed = timeit.timeit(func, number=iterations)
+        per_call = elapsed / (iterations * len(response_ids))
+        print('%-24s : %8.3f us/lookup' % (name, per_call * 1e6))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,99 @@
+"""
+Measures the thread count and the throughput of many clients reading a DID from many simulated ECUs over a python-can virtual bus.
+The clients either use a ``PythonIsoTpConnection`` each (one reading thread per connection) or the connections of a single ``SharedCanBus``.
+The simulated ECUs are served through their own ``SharedCanBus`` in both cases.
+
+Run with : python -m benchmarks.bench_shared_bus
+"""
+import logging
+import threading
+import time
+
+from udsoncan.client import Client
+from udsoncan.connections import PythonIsoTpConnection, SharedCanBus
+from udsoncan.server import Server
+
+from typing import List, Tuple
+
+try:
+    import can
+    import isotp
+    _import_err = None
+except ImportError as e:
+    _import_err = e
+
+DIDCONFIG = {0xF190: '>20s'}
+CHANNEL = 'bench_shared_bus'
+
+
+def make_address(i: int, ecu_side: bool = False) -> "isotp.Address":
+    txid, rxid = 0x700 + i, 0x780 + i
+    if ecu_side:
+        txid, rxid = rxid, txid
+    return isotp.Address(isotp.AddressingMode.Normal_11bits, txid=txid, rxid=rxid)
+
+
+def run(ecu_count: int, requests_per_ecu: int, shared: bool) -> Tuple[float, int]:
+    ecu_bus = can.Bus(interface='virtual', channel=CHANNEL)
+    ecus = SharedCanBus(ecu_bus, name='ecus')
+    servers = []
+    ecu_conns = []
+    for i in range(ecu_count):
+        server = Server(didconfig=DIDCONFIG, dids={0xF190: (bytes(20),)}, name='ecu%d' % i)
+        ecu_conns.append(ecus.connection(make_address(i, ecu_side=True)).open())
+        server.start(ecu_conns[-1])
+        servers.append(server)
+
+    thread_count = threading.active_count()
+    tester_buses: List["can.BusABC"] = []
+    if shared:
+        tester_buses.append(can.Bus(interface='virtual', channel=CHANNEL))
+        tester = SharedCanBus(tester_buses[0], name='tester')
+        conns = [tester.connection(make_address(i)) for i in range(ecu_count)]
+    else:
+        conns = []
+        for i in range(ecu_count):
+            tester_buses.append(can.Bus(interface='virtual', channel=CHANNEL))
+            conns.append(PythonIsoTpConnection(isotp.CanStack(tester_buses[-1], address=make_address(i))))
+
+    clients = [Client(conn, request_timeout=5, config={'data_identifiers': DIDCONFIG}) for conn in conns]
+    for client in clients:
+        client.logger.setLevel(logging.WARNING)
+        client.open()
+    added_threads = threading.active_count() - thread_count
+
+    def client_task(client: Client) -> None:
+        for j in range(requests_per_ecu):
+            client.read_data_by_identifier(0xF190)
+
+    threads = [threading.Thread(target=client_task, args=(client,)) for client in clients]
+    t1 = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - t1
+
+    for client in clients:
+        client.close()
+    for server, conn in zip(servers, ecu_conns):
+        server.stop()
+        conn.close()
+    for bus in tester_buses + [ecu_bus]:
+        bus.shutdown()
+    return (elapsed, added_threads)
+
+
+def main(ecu_count: int = 40, requests_per_ecu: int = 20) -> None:
+    if _import_err is not None:
+        print('python-can and can-isotp must be installed to run this benchmark : %s' % _import_err)
+        return
+    count = ecu_count * requests_per_ecu
+    print('%d simulated ECUs, %d requests each' % (ecu_count, requests_per_ecu))
+    for name, shared in [('PythonIsoTpConnection', False), ('SharedCanBus', True)]:
+        elapsed, added_threads = run(ecu_count, requests_per_ecu, shared)
+        print('%-22s : %3d reading threads - %6.3f sec - %8.0f requests/sec' % (name, added_threads, elapsed, count / elapsed))
+
+
+if __name__ == '__main__':
+    main()
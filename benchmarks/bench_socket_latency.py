@@ -0,0 +1,76 @@
+"""
+Measures the round trip latency through a ``SocketConnection`` connected to a local socketpair echoing every payload, 
+and the time needed to close the connection. The "polling" variant reproduces the previous reception thread that woke up every 200 ms.
+
+Run with : python -m benchmarks.bench_socket_latency
+"""
+import selectors
+import socket
+import statistics
+import threading
+import time
+
+from udsoncan.connections import SocketConnection
+
+
+class PollingSocketConnection(SocketConnection):
+    def rxthread_task(self):
+        sel = selectors.DefaultSelector()
+        sel.register(self.sock, selectors.EVENT_READ)
+        while not self.exit_requested:
+            try:
+                events = sel.select(timeout=0.2)
+                if events:
+                    data = self.sock.recv(self.bufsize)
+                    if data is not None:
+                        self.rxqueue.put(data)
+            except Exception:
+                self.exit_requested = True
+
+
+def echo(sock: socket.socket) -> None:
+    while True:
+        try:
+            data = sock.recv(4096)
+        except OSError:
+            return
+        if not data:
+            return
+        sock.send(data)
+
+
+def measure(cls, count: int):
+    sock_client, sock_echo = socket.socketpair()
+    thread = threading.Thread(target=echo, args=(sock_echo,), daemon=True)
+    thread.start()
+
+    conn = cls(sock_client, name='bench')
+    conn.open()
+    latencies = []
+    for i in range(count):
+        t1 = time.perf_counter()
+        conn.send(b'\x3E\x00')
+        conn.wait_frame(timeout=1, exception=True)
+        latencies.append(time.perf_counter() - t1)
+
+    time.sleep(0.05)    # Let the reception thread go back to sleep
+    t1 = time.perf_counter()
+    conn.close()
+    close_time = time.perf_counter() - t1
+
+    sock_client.close()
+    sock_echo.close()
+    thread.join()
+    return latencies, close_time
+
+
+def main(count: int = 2000) -> None:
+    for name, cls in [('polling', PollingSocketConnection), ('event-driven', SocketConnection)]:
+        latencies, close_time = measure(cls, count)
+        latencies.sort()
+        print('%-13s : median %6.1f us - p99 %6.1f us - close %7.2f ms' %
+              (name, statistics.median(latencies) * 1e6, latencies[int(len(latencies) * 0.99)] * 1e6, close_time * 1e3))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,84 @@
+"""
+Compares the cost of negative responses with the exception path of the ``Client`` and with ``Client.try_request``.
+A range of DIDs is probed with ReadDataByIdentifier over a ``QueueConnection`` answered by a server thread that rejects every
+request with RequestOutOfRange (0x31), as a server does for the DIDs it does not support.
+
+Run with : python -m benchmarks.bench_try_request
+"""
+import logging
+import threading
+import time
+
+from udsoncan import Request, services
+from udsoncan.client import Client
+from udsoncan.connections import QueueConnection
+from udsoncan.exceptions import NegativeResponseException
+
+from typing import Any, Callable, List
+
+
+def serve(conn: QueueConnection, stop: threading.Event) -> None:
+    while not stop.is_set():
+        try:
+            conn.touserqueue.get(timeout=0.1)
+        except Exception:
+            continue
+        conn.fromuserqueue.put(b'\x7F\x22\x31')
+
+
+def timed(func: Callable[[int], Any], dids: List[int]) -> float:
+    t1 = time.perf_counter()
+    for did in dids:
+        func(did)
+    return time.perf_counter() - t1
+
+
+def main(count: int = 20000) -> None:
+    conn = QueueConnection(name='bench')
+    stop = threading.Event()
+    thread = threading.Thread(target=serve, args=(conn, stop), daemon=True)
+    thread.start()
+
+    dids = list(range(count))
+    client = Client(conn, request_timeout=2, config={'data_identifiers': {did: '>H' for did in dids}})
+    client.logger.addHandler(logging.NullHandler())     # Warnings are emitted but not printed
+    client.logger.propagate = False
+
+    def with_exception(did: int) -> None:
+        try:
+            client.read_data_by_identifier(did)
+        except NegativeResponseException:
+            pass
+
+    def without_exception(did: int) -> None:
+        client.config['exception_on_negative_response'] = False
+        client.read_data_by_identifier(did)
+
+    def send_request(did: int) -> None:
+        try:
+            client.send_request(Request(services.ReadDataByIdentifier, data=did.to_bytes(2, 'big')))
+        except NegativeResponseException:
+            pass
+
+    def try_request(did: int) -> None:
+        client.try_request(Request(services.ReadDataByIdentifier, data=did.to_bytes(2, 'big')))
+
+    results = []
+    with client:
+        timed(try_request, dids[:1000])   # Warm up
+        for name, func in [('read_data_by_identifier', with_exception),
+                           ('read_data_by_identifier (no exception)', without_exception),
+                           ('send_request', send_request),
+                           ('try_request', try_request)]:
+            results.append((name, timed(func, dids)))
+
+    stop.set()
+    thread.join()
+
+    print('%d negative responses over QueueConnection' % count)
+    for name, elapsed in results:
+        print('%-40s : %8.3f sec - %6.1f us/request' % (name, elapsed, elapsed / count * 1e6))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,201 @@
+"""
+Minimal benchmark harness used by the ``suite_*`` modules and run by ``python -m benchmarks.run``.
+
+A benchmark is a factory registered with ``@benchmark`` or ``@memory_benchmark``. The factory prepares the data and returns the callable to measure.
+A factory written as a generator yields the callable instead, and the code after the ``yield`` is run once the measure is done (to stop threads, close clients, etc.).
+With ``params``, the factory is called once per parameter and the parameter is appended to the benchmark name : ``dtc.parse[1000]``.
+
+Time benchmarks are measured like ``timeit`` : the number of loops is adjusted to last at least ``min_time``, then the measure is repeated.
+Memory benchmarks measure, with ``tracemalloc``, the memory still allocated by the objects returned by one call and the peak reached during that call.
+"""
+import datetime
+import fnmatch
+import gc
+import inspect
+import json
+import os
+import platform
+import statistics
+import subprocess
+import timeit
+import tracemalloc
+
+import udsoncan
+
+from typing import Any, Callable, Dict, IO, Iterable, List, Optional, Tuple
+
+RESULTS_VERSION = 1
+
+
+class Benchmark:
+    name: str
+    kind: str       # 'time' or 'memory'
+    factory: Callable[..., Any]
+    param: Any
+    has_param: bool
+
+    def __init__(self, name: str, kind: str, factory: Callable[..., Any], param: Any = None, has_param: bool = False):
+        self.name = name
+        self.kind = kind
+        self.factory = factory
+        self.param = param
+        self.has_param = has_param
+
+    def _setup(self) -> Tuple[Callable[[], Any], Optional[Iterable[Any]]]:
+        args = (self.param,) if self.has_param else ()
+        if inspect.isgeneratorfunction(self.factory):
+            generator = self.factory(*args)
+            return (next(generator), generator)
+        return (self.factory(*args), None)
+
+    def run(self, min_time: float = 0.2, repeat: int = 5) -> Dict[str, Any]:
+        func, teardown = self._setup()
+        try:
+            if self.kind == 'memory':
+                return self._measure_memory(func)
+            return self._measure_time(func, min_time, repeat)
+        finally:
+            if teardown is not None:
+                for _ in teardown:
+                    pass
+
+    def _measure_time(self, func: Callable[[], Any], min_time: float, repeat: int) -> Dict[str, Any]:
+        timer = timeit.Timer(func)
+        loops = 1
+        while True:
+            elapsed = timer.timeit(loops)
+            if elapsed >= min_time or loops >= 1000000:
+                break
+            loops = loops * 10 if elapsed < min_time / 10 else int(loops * min_time / elapsed * 1.2) + 1
+        times = [elapsed / loops] + [t / loops for t in timer.repeat(repeat - 1, loops)]
+        return {
+            'kind': 'time',
+            'min': min(times),
+            'median': statistics.median(times),
+            'mean': statistics.mean(times),
+            'stdev': statistics.stdev(times) if len(times) > 1 else 0.0,
+            'loops': loops,
+            'repeat': len(times)
+        }
+
+    def _measure_memory(self, func: Callable[[], Any]) -> Dict[str, Any]:
+        gc.collect()
+        tracemalloc.start()
+        try:
+            start = tracemalloc.get_traced_memory()[0]
+            result = func()
+            retained, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        count = len(result) if hasattr(result, '__len__') else None
+        return {
+            'kind': 'memory',
+            'retained_bytes': retained - start,
+            'peak_bytes': peak - start,
+            'items': count
+        }
+
+
+_registry: List[Benchmark] = []
+
+
+def _register(kind: str, name: Optional[str], params: Optional[List[Any]]) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    def decorator(factory: Callable[..., Any]) -> Callable[..., Any]:
+        base_name = name if name is not None else '%s.%s' % (factory.__module__.split('.')[-1].replace('suite_', ''), factory.__name__)
+        if params is None:
+            _registry.append(Benchmark(base_name, kind, factory))
+        else:
+            for param in params:
+                _registry.append(Benchmark('%s[%s]' % (base_name, param), kind, factory, param, has_param=True))
+        return factory
+    return decorator
+
+
+def benchmark(name: Optional[str] = None, params: Optional[List[Any]] = None) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Registers a time benchmark. The name defaults to ``<suite>.<function name>``"""
+    return _register('time', name, params)
+
+
+def memory_benchmark(name: Optional[str] = None, params: Optional[List[Any]] = None) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Registers a memory benchmark. The callable returned by the factory must return the objects to measure"""
+    return _register('memory', name, params)
+
+
+def get_benchmarks(patterns: Optional[List[str]] = None) -> List[Benchmark]:
+    """The registered benchmarks whose name matches one of the ``fnmatch`` patterns, or all of them"""
+    if not patterns:
+        return list(_registry)
+    return [bench for bench in _registry if any(fnmatch.fnmatchcase(bench.name, pattern) for pattern in patterns)]
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        output = subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=os.path.dirname(os.path.abspath(__file__)),
+                                stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, timeout=5, check=True).stdout
+        return output.decode('ascii').strip()
+    except Exception:
+        return None
+
+
+def run_benchmarks(benchmarks: List[Benchmark], min_time: float = 0.2, repeat: int = 5, out: Optional[IO[str]] = None) -> Dict[str, Any]:
+    """Runs the benchmarks and returns the results in the format written by ``save_results``"""
+    results: Dict[str, Any] = {}
+    for bench in benchmarks:
+        result = bench.run(min_time=min_time, repeat=repeat)
+        results[bench.name] = result
+        if out is not None:
+            out.write(format_result(bench.name, result) + '\n')
+            out.flush()
+
+    return {
+        'version': RESULTS_VERSION,
+        'date': datetime.datetime.now().isoformat(timespec='seconds'),
+        'commit': _git_commit(),
+        'udsoncan': udsoncan.__version__,
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'machine': platform.machine(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'benchmarks': results
+    }
+
+
+def format_result(name: str, result: Dict[str, Any]) -> str:
+    if result['kind'] == 'memory':
+        per_item = '' if not result['items'] else ' - %8.1f bytes/item' % (result['retained_bytes'] / result['items'])
+        return '%-56s : %10d bytes retained - %10d bytes peak%s' % (name, result['retained_bytes'], result['peak_bytes'], per_item)
+    return '%-56s : %10.2f us (median) - %10.2f us (min) - +/-%5.1f%%' % (
+        name, result['median'] * 1e6, result['min'] * 1e6, result['stdev'] / result['mean'] * 100 if result['mean'] > 0 else 0)
+
+
+def save_results(results: Dict[str, Any], filename: str) -> None:
+    with open(filename, 'w') as f:
+        json.dump(results, f, indent=2, sort_keys=True)
+
+
+def load_results(filename: str) -> Dict[str, Any]:
+    with open(filename, 'r') as f:
+        results = json.load(f)
+    if results.get('version', None) != RESULTS_VERSION:
+        raise ValueError('%s is not a benchmark result file or has an unsupported version' % filename)
+    return results
+
+
+def compare_results(base: Dict[str, Any], current: Dict[str, Any], threshold: float = 0.1) -> List[Tuple[str, float, float, float, str]]:
+    """
+    Compares 2 runs, benchmark by benchmark. The median time is compared for time benchmarks, the retained memory for memory benchmarks.
+    Returns a list of (name, base value, current value, ratio, verdict) where the verdict is ``regression``, ``improvement`` or an empty string when the change is within the threshold.
+    """
+    rows = []
+    for name, current_result in current['benchmarks'].items():
+        base_result = base['benchmarks'].get(name, None)
+        if base_result is None or base_result['kind'] != current_result['kind']:
+            continue
+        key = 'retained_bytes' if current_result['kind'] == 'memory' else 'median'
+        base_value = base_result[key]
+        current_value = current_result[key]
+        ratio = current_value / base_value if base_value > 0 else float('inf') if current_value > 0 else 1.0
+        verdict = 'regression' if ratio > 1 + threshold else 'improvement' if ratio < 1 - threshold else ''
+        rows.append((name, base_value, current_value, ratio, verdict))
+    return rows
@@ -0,0 +1,71 @@
+"""
+Runs the benchmark suite and stores the results in a JSON file, so that runs can be compared.
+
+Run with : python -m benchmarks.run [-k PATTERN] [-o results.json]
+Compare  : python -m benchmarks.run --compare base.json results.json
+
+The suite covers the encoding and decoding of each service (``services.*``), full client round trips (``client.*``) and
+the parsing of DTC lists with their memory usage (``dtc.*``). Patterns are matched against the benchmark names with ``fnmatch``.
+"""
+import argparse
+import importlib
+import sys
+
+from benchmarks.harness import compare_results, get_benchmarks, load_results, run_benchmarks, save_results
+
+from typing import List, Optional
+
+SUITES = ['benchmarks.suite_services', 'benchmarks.suite_client', 'benchmarks.suite_dtc']
+
+
+def load_suites() -> None:
+    for suite in SUITES:
+        importlib.import_module(suite)
+
+
+def compare(base_filename: str, current_filename: str, threshold: float) -> int:
+    base = load_results(base_filename)
+    current = load_results(current_filename)
+    print('Base    : %s (%s)' % (base['date'], base['commit']))
+    print('Current : %s (%s)' % (current['date'], current['commit']))
+    rows = compare_results(base, current, threshold)
+    for name, base_value, current_value, ratio, verdict in rows:
+        print('%-56s : %12.6g -> %12.6g  x%5.2f  %s' % (name, base_value, current_value, ratio, verdict))
+    regressions = [row for row in rows if row[4] == 'regression']
+    print('%d benchmarks compared, %d regressions above %d%%' % (len(rows), len(regressions), threshold * 100))
+    return 1 if len(regressions) > 0 else 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.run', description='Runs the udsoncan benchmark suite')
+    parser.add_argument('-k', dest='patterns', action='append', help='Runs only the benchmarks matching this pattern. Can be repeated')
+    parser.add_argument('-o', '--output', help='JSON file where the results are written')
+    parser.add_argument('--min-time', type=float, default=0.2, help='Minimum duration of a measure, in seconds (default: 0.2)')
+    parser.add_argument('--repeat', type=int, default=5, help='Number of measures per benchmark (default: 5)')
+    parser.add_argument('--list', action='store_true', help='Lists the benchmarks without running them')
+    parser.add_argument('--compare', nargs=2, metavar=('BASE', 'CURRENT'), help='Compares 2 result files. Exits with 1 if a benchmark regressed')
+    parser.add_argument('--threshold', type=float, default=0.1, help='Relative change reported as a regression by --compare (default: 0.1)')
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        return compare(args.compare[0], args.compare[1], args.threshold)
+
+    load_suites()
+    benchmarks = get_benchmarks(args.patterns)
+    if args.list:
+        for bench in benchmarks:
+            print(bench.name)
+        return 0
+    if len(benchmarks) == 0:
+        print('No benchmark matches the given patterns')
+        return 1
+
+    results = run_benchmarks(benchmarks, min_time=args.min_time, repeat=args.repeat, out=sys.stdout)
+    if args.output:
+        save_results(results, args.output)
+        print('Results written to %s' % args.output)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
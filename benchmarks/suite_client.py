@@ -0,0 +1,104 @@
+"""
+Full ``Client`` round trips. Requests go through a ``QueueConnection`` answered by a simulated server running in a thread,
+or directly to the simulated server through a ``SimulatorConnection`` to measure the client alone.
+"""
+import logging
+
+from udsoncan import Response
+from udsoncan.client import Client
+from udsoncan.connections import QueueConnection
+from udsoncan.server import Server, SimulatorConnection
+from benchmarks.harness import benchmark, memory_benchmark
+
+from typing import Any, Callable, Iterator
+
+DIDLIST = [0x1000 + i for i in range(10)]
+DIDCONFIG = {did: '>HHBB' for did in DIDLIST}
+MISSING_DID = 0x2000    # Known by the client, not by the server
+CLIENT_DIDCONFIG = dict(DIDCONFIG)
+CLIENT_DIDCONFIG[MISSING_DID] = '>H'
+
+
+def make_server() -> Server:
+    return Server(didconfig=DIDCONFIG, dids={did: (1, 2, 3, 4) for did in DIDLIST}, memory={0: bytes(4096)})
+
+
+def queue_client() -> Iterator[Client]:
+    server = make_server()
+    conn = QueueConnection()
+    server.start(conn)
+    client = Client(conn, request_timeout=2, config={'data_identifiers': CLIENT_DIDCONFIG})
+    client.logger.setLevel(logging.WARNING)
+    client.open()
+    try:
+        yield client
+    finally:
+        client.close()
+        server.stop()
+
+
+def simulator_client() -> Iterator[Client]:
+    client = Client(SimulatorConnection(make_server()), request_timeout=2, config={'data_identifiers': CLIENT_DIDCONFIG})
+    client.logger.setLevel(logging.WARNING)
+    client.open()
+    try:
+        yield client
+    finally:
+        client.close()
+
+
+@benchmark()
+def queue_tester_present() -> Iterator[Callable[[], Any]]:
+    for client in queue_client():
+        yield client.tester_present
+
+
+@benchmark()
+def queue_read_data_by_identifier() -> Iterator[Callable[[], Any]]:
+    for client in queue_client():
+        yield lambda: client.read_data_by_identifier(DIDLIST)
+
+
+@benchmark()
+def queue_send_request() -> Iterator[Callable[[], Any]]:
+    for client in queue_client():
+        request = client.prepare('tester_present').request
+        yield lambda: client.send_request(request)
+
+
+@benchmark()
+def simulator_tester_present() -> Iterator[Callable[[], Any]]:
+    for client in simulator_client():
+        yield client.tester_present
+
+
+@benchmark()
+def simulator_read_data_by_identifier() -> Iterator[Callable[[], Any]]:
+    for client in simulator_client():
+        yield lambda: client.read_data_by_identifier(DIDLIST)
+
+
+@benchmark()
+def simulator_read_data_by_identifier_prepared() -> Iterator[Callable[[], Any]]:
+    for client in simulator_client():
+        yield client.prepare('read_data_by_identifier', DIDLIST)
+
+
+@benchmark()
+def simulator_try_request() -> Iterator[Callable[[], Any]]:
+    for client in simulator_client():
+        prepared = client.prepare('read_data_by_identifier', DIDLIST)
+        yield lambda: client.try_request(prepared)
+
+
+@benchmark()
+def simulator_negative_response() -> Iterator[Callable[[], Any]]:
+    for client in simulator_client():
+        prepared = client.prepare('read_data_by_identifier', MISSING_DID)     # NRC RequestOutOfRange
+        yield lambda: client.try_request(prepared)
+
+
+@memory_benchmark()
+def simulator_read_data_by_identifier_responses() -> Iterator[Callable[[], Any]]:
+    for client in simulator_client():
+        yield lambda: [client.read_data_by_identifier(DIDLIST) for i in range(1000)]
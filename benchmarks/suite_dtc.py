@@ -0,0 +1,54 @@
+"""
+Parsing of ReadDTCInformation responses (reportDTCByStatusMask) holding 10, 1000 and 10000 DTCs, to ``Dtc`` objects or to a ``DtcTable``,
+and the memory used by the result.
+"""
+import random
+
+from udsoncan import Response
+from udsoncan.services import ReadDTCInformation
+from benchmarks.harness import benchmark, memory_benchmark
+
+from typing import Any, Callable
+
+DTC_COUNTS = [10, 1000, 10000]
+SUBFUNCTION = ReadDTCInformation.Subfunction.reportDTCByStatusMask
+
+
+def make_payload(dtc_count: int) -> bytes:
+    rng = random.Random(1234)
+    records = b''.join(rng.randrange(1, 0xFFFFFF).to_bytes(3, 'big') + bytes([rng.randrange(256)]) for i in range(dtc_count))
+    return b'\x59\x02\xFF' + records
+
+
+@benchmark(params=DTC_COUNTS)
+def parse(dtc_count: int) -> Callable[[], Any]:
+    payload = make_payload(dtc_count)
+    return lambda: ReadDTCInformation.interpret_response(Response.from_payload(payload), SUBFUNCTION)
+
+
+@benchmark(params=DTC_COUNTS)
+def parse_table(dtc_count: int) -> Callable[[], Any]:
+    payload = make_payload(dtc_count)
+    return lambda: ReadDTCInformation.interpret_response(Response.from_payload(payload), SUBFUNCTION, dtc_table=True)
+
+
+@benchmark(params=DTC_COUNTS)
+def parse_and_filter_confirmed(dtc_count: int) -> Callable[[], Any]:
+    payload = make_payload(dtc_count)
+
+    def func() -> Any:
+        dtcs = ReadDTCInformation.interpret_response(Response.from_payload(payload), SUBFUNCTION).service_data.dtcs
+        return [dtc for dtc in dtcs if dtc.status.confirmed]
+    return func
+
+
+@memory_benchmark(params=DTC_COUNTS)
+def memory(dtc_count: int) -> Callable[[], Any]:
+    payload = make_payload(dtc_count)
+    return lambda: ReadDTCInformation.interpret_response(Response.from_payload(payload), SUBFUNCTION).service_data.dtcs
+
+
+@memory_benchmark(params=DTC_COUNTS)
+def memory_table(dtc_count: int) -> Callable[[], Any]:
+    payload = make_payload(dtc_count)
+    return lambda: ReadDTCInformation.interpret_response(Response.from_payload(payload), SUBFUNCTION, dtc_table=True).service_data.dtc_table
@@ -0,0 +1,124 @@
+"""
+Encoding of the requests (``make_request``) and decoding of the responses (``Response.from_payload`` followed by ``interpret_response``) of each service,
+with payloads of realistic sizes.
+"""
+from udsoncan import AsciiCodec, Baudrate, CommunicationType, DataFormatIdentifier, IOValues, MemoryLocation, Response, services
+from udsoncan.common.dids import CompiledDidConfig
+from benchmarks.harness import benchmark
+
+from typing import Any, Callable, Dict, Tuple
+
+# 10 DIDs read at once, a mix of pack strings and codec instances
+RDBI_DIDCONFIG: Dict[Any, Any] = {0xF190: AsciiCodec(17), 0xF18C: AsciiCodec(16)}
+RDBI_DIDCONFIG.update({0x1000 + i: '>HHBB' for i in range(8)})
+RDBI_DIDLIST = list(RDBI_DIDCONFIG.keys())
+RDBI_PAYLOAD = b'\x62\xF1\x90' + b'WAUZZZ8V0JA000000' + b'\xF1\x8C' + b'SN00000000012345' + b''.join(
+    (0x1000 + i).to_bytes(2, 'big') + b'\x12\x34\x56\x78\x9A\xBC' for i in range(8))
+IO_CONFIG = {0x0456: {'codec': '>HB', 'mask': {'a': 0x01, 'b': 0x02}, 'mask_size': 1}}
+MEMORY_LOCATION = MemoryLocation(0x12345678, 0x100, address_format=32, memorysize_format=16)
+
+
+def _make_service_benchmarks(name: str, make_request: Callable[[], Any], response_payload: bytes, interpret: Callable[[Response], Any]) -> None:
+    benchmark('services.%s.make_request' % name)(lambda: make_request)
+
+    def interpret_response() -> Callable[[], Any]:
+        return lambda: interpret(Response.from_payload(response_payload))
+    benchmark('services.%s.interpret_response' % name)(interpret_response)
+
+
+SERVICES: Dict[str, Tuple[Callable[[], Any], bytes, Callable[[Response], Any]]] = {
+    'DiagnosticSessionControl': (
+        lambda: services.DiagnosticSessionControl.make_request(3),
+        b'\x50\x03\x00\x32\x01\xF4',
+        lambda r: services.DiagnosticSessionControl.interpret_response(r)),
+    'ECUReset': (
+        lambda: services.ECUReset.make_request(1),
+        b'\x51\x01',
+        lambda r: services.ECUReset.interpret_response(r)),
+    'SecurityAccess': (
+        lambda: services.SecurityAccess.make_request(1, services.SecurityAccess.Mode.RequestSeed),
+        b'\x67\x01' + bytes(range(16)),
+        lambda r: services.SecurityAccess.interpret_response(r, services.SecurityAccess.Mode.RequestSeed)),
+    'TesterPresent': (
+        lambda: services.TesterPresent.make_request(),
+        b'\x7E\x00',
+        lambda r: services.TesterPresent.interpret_response(r)),
+    'ReadDataByIdentifier': (
+        lambda: services.ReadDataByIdentifier.make_request(RDBI_DIDLIST, RDBI_DIDCONFIG),
+        RDBI_PAYLOAD,
+        lambda r: services.ReadDataByIdentifier.interpret_response(r, RDBI_DIDLIST, RDBI_DIDCONFIG)),
+    'WriteDataByIdentifier': (
+        lambda: services.WriteDataByIdentifier.make_request(0xF190, 'WAUZZZ8V0JA000000', RDBI_DIDCONFIG),
+        b'\x6E\xF1\x90',
+        lambda r: services.WriteDataByIdentifier.interpret_response(r)),
+    'ReadMemoryByAddress': (
+        lambda: services.ReadMemoryByAddress.make_request(MEMORY_LOCATION),
+        b'\x63' + bytes(0x100),
+        lambda r: services.ReadMemoryByAddress.interpret_response(r)),
+    'WriteMemoryByAddress': (
+        lambda: services.WriteMemoryByAddress.make_request(MEMORY_LOCATION, bytes(0x100)),
+        b'\x7D\x24\x12\x34\x56\x78\x01\x00',
+        lambda r: services.WriteMemoryByAddress.interpret_response(r, MEMORY_LOCATION)),
+    'RoutineControl': (
+        lambda: services.RoutineControl.make_request(0xFF00, services.RoutineControl.ControlType.startRoutine, bytes(8)),
+        b'\x71\x01\xFF\x00\x00',
+        lambda r: services.RoutineControl.interpret_response(r)),
+    'ClearDiagnosticInformation': (
+        lambda: services.ClearDiagnosticInformation.make_request(0xFFFFFF),
+        b'\x54',
+        lambda r: services.ClearDiagnosticInformation.interpret_response(r)),
+    'ControlDTCSetting': (
+        lambda: services.ControlDTCSetting.make_request(services.ControlDTCSetting.SettingType.off),
+        b'\xC5\x02',
+        lambda r: services.ControlDTCSetting.interpret_response(r)),
+    'CommunicationControl': (
+        lambda: services.CommunicationControl.make_request(services.CommunicationControl.ControlType.disableRxAndTx,
+                                                           CommunicationType(subnet=0, normal_msg=True, network_management_msg=True)),
+        b'\x68\x03',
+        lambda r: services.CommunicationControl.interpret_response(r)),
+    'LinkControl': (
+        lambda: services.LinkControl.make_request(services.LinkControl.ControlType.verifyBaudrateTransitionWithSpecificBaudrate, Baudrate(500000)),
+        b'\xC7\x02',
+        lambda r: services.LinkControl.interpret_response(r)),
+    'InputOutputControlByIdentifier': (
+        lambda: services.InputOutputControlByIdentifier.make_request(0x0456, services.InputOutputControlByIdentifier.ControlParam.shortTermAdjustment,
+                                                                     IOValues(0x1234, 0x56), ['a'], IO_CONFIG),
+        b'\x6F\x04\x56\x03\x12\x34\x56',
+        lambda r: services.InputOutputControlByIdentifier.interpret_response(r, services.InputOutputControlByIdentifier.ControlParam.shortTermAdjustment,
+                                                                              ioconfig=IO_CONFIG)),
+    'RequestDownload': (
+        lambda: services.RequestDownload.make_request(MEMORY_LOCATION, DataFormatIdentifier(compression=0, encryption=0)),
+        b'\x74\x20\x0F\xFF',
+        lambda r: services.RequestDownload.interpret_response(r)),
+    'TransferData': (
+        lambda: services.TransferData.make_request(1, bytes(4093)),
+        b'\x76\x01',
+        lambda r: services.TransferData.interpret_response(r)),
+    'RequestTransferExit': (
+        lambda: services.RequestTransferExit.make_request(),
+        b'\x77',
+        lambda r: services.RequestTransferExit.interpret_response(r)),
+    'ReadDTCInformation': (
+        lambda: services.ReadDTCInformation.make_request(services.ReadDTCInformation.Subfunction.reportDTCByStatusMask, status_mask=0xFF),
+        b'\x59\x02\xFF' + b''.join((0x100000 + i).to_bytes(3, 'big') + b'\x2F' for i in range(50)),
+        lambda r: services.ReadDTCInformation.interpret_response(r, services.ReadDTCInformation.Subfunction.reportDTCByStatusMask)),
+}
+
+for _name, (_make_request, _payload, _interpret) in SERVICES.items():
+    _make_service_benchmarks(_name, _make_request, _payload, _interpret)
+
+
+@benchmark('services.Response.from_payload')
+def response_from_payload() -> Callable[[], Any]:
+    return lambda: Response.from_payload(RDBI_PAYLOAD)
+
+
+@benchmark('services.Response.from_payload_negative')
+def response_from_payload_negative() -> Callable[[], Any]:
+    return lambda: Response.from_payload(b'\x7F\x22\x31')
+
+
+@benchmark('services.ReadDataByIdentifier.interpret_response_compiled')
+def rdbi_interpret_compiled() -> Callable[[], Any]:
+    didconfig = CompiledDidConfig(RDBI_DIDCONFIG)
+    return lambda: services.ReadDataByIdentifier.interpret_response(Response.from_payload(RDBI_PAYLOAD), RDBI_DIDLIST, didconfig)
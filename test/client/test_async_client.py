@@ -0,0 +1,240 @@
+from udsoncan.client import AsyncClient, Client
+from udsoncan.connections import AsyncQueueConnection
+from udsoncan.exceptions import *
+from udsoncan import services, MemoryLocation
+from test.UdsTest import UdsTest
+
+import asyncio
+import inspect
+import time
+
+
+class TestAsyncClient(UdsTest):
+
+    def run_with_server(self, client_task, server_task, config=None):
+        async def run():
+            conn = AsyncQueueConnection(name='unittest')
+            client = AsyncClient(conn, request_timeout=0.5)
+            client.set_config('logger_name', 'unittest')
+            client.set_config('data_identifiers', {0x1234: '>H', 0x5678: 'B'})
+            if config is not None:
+                client.set_configs(config)
+            async with client:
+                server = asyncio.ensure_future(server_task(conn))
+                try:
+                    return await client_task(client)
+                finally:
+                    await server
+
+        return asyncio.run(run())
+
+    def test_read_data_by_identifier(self):
+        async def server(conn):
+            request = await asyncio.wait_for(conn.touserqueue.get(), 1)
+            self.assertEqual(request, b'\x22\x12\x34\x56\x78')
+            await conn.fromuserqueue.put(b'\x62\x12\x34\xAB\xCD\x56\x78\x99')
+
+        async def client(client):
+            return await client.read_data_by_identifier([0x1234, 0x5678])
+
+        response = self.run_with_server(client, server)
+        self.assertTrue(response.positive)
+        self.assertEqual(response.service_data.values[0x1234], (0xABCD,))
+        self.assertEqual(response.service_data.values[0x5678], (0x99,))
+
+    def test_wrapper_method(self):
+        async def server(conn):
+            request = await asyncio.wait_for(conn.touserqueue.get(), 1)
+            self.assertEqual(request, b'\x31\x01\x12\x34')
+            await conn.fromuserqueue.put(b'\x71\x01\x12\x34\x00')
+
+        async def client(client):
+            return await client.start_routine(0x1234)
+
+        response = self.run_with_server(client, server)
+        self.assertEqual(response.service_data.control_type_echo, 1)
+        self.assertEqual(response.service_data.routine_id_echo, 0x1234)
+
+    def test_unlock_security_access(self):
+        async def server(conn):
+            request = await asyncio.wait_for(conn.touserqueue.get(), 1)
+            self.assertEqual(request, b'\x27\x01')
+            await conn.fromuserqueue.put(b'\x67\x01\x11\x22')
+            request = await asyncio.wait_for(conn.touserqueue.get(), 1)
+            self.assertEqual(request, b'\x27\x02\xEE\xDD')
+            await conn.fromuserqueue.put(b'\x67\x02')
+
+        async def client(client):
+            return await client.unlock_security_access(1)
+
+        def algo(level, seed, params):
+            return bytes([x ^ 0xFF for x in seed])
+
+        response = self.run_with_server(client, server, config={'security_algo': algo})
+        self.assertTrue(response.positive)
+        self.assertEqual(response.service_data.security_level_echo, 2)
+
+    def test_concurrent_unlock_security_access(self):
+        # The seed and key requests of a coroutine must not be interleaved with the ones of another coroutine using the same client
+        requests = []
+
+        async def server(conn):
+            for i in range(4):
+                request = await asyncio.wait_for(conn.touserqueue.get(), 1)
+                requests.append(request[0:2])
+                await asyncio.sleep(0.01)    # Gives the other coroutine a chance to send its request
+                if request[1] == 0x01:
+                    await conn.fromuserqueue.put(b'\x67\x01\x11\x22')
+                else:
+                    await conn.fromuserqueue.put(b'\x67\x02')
+
+        async def client(client):
+            return await asyncio.gather(client.unlock_security_access(1), client.unlock_security_access(1))
+
+        def algo(level, seed, params):
+            return bytes([x ^ 0xFF for x in seed])
+
+        responses = self.run_with_server(client, server, config={'security_algo': algo})
+        self.assertEqual([response.service_data.security_level_echo for response in responses], [2, 2])
+        self.assertEqual(requests, [b'\x27\x01', b'\x27\x02', b'\x27\x01', b'\x27\x02'])
+
+    def test_download(self):
+        async def server(conn):
+            request = await asyncio.wait_for(conn.touserqueue.get(), 1)
+            self.assertEqual(request, b'\x34\x00\x12\x12\x34\x06')
+            await conn.fromuserqueue.put(b'\x74\x20\x00\x05')
+            for sequence_number, block in [(1, b'abc'), (2, b'def')]:
+                request = await asyncio.wait_for(conn.touserqueue.get(), 1)
+                self.assertEqual(request, b'\x36' + bytes([sequence_number]) + block)
+                await conn.fromuserqueue.put(b'\x76' + bytes([sequence_number]))
+            request = await asyncio.wait_for(conn.touserqueue.get(), 1)
+            self.assertEqual(request, b'\x37')
+            await conn.fromuserqueue.put(b'\x77')
+
+        async def client(client):
+            return await client.download(MemoryLocation(0x1234, 6, 16, 8), b'abcdef')
+
+        response = self.run_with_server(client, server)
+        self.assertTrue(response.positive)
+
+    def test_periodic_stream(self):
+        async def server(conn):
+            request = await asyncio.wait_for(conn.touserqueue.get(), 1)
+            self.assertEqual(request, b'\x2A\x01\x01')
+            await conn.fromuserqueue.put(b'\x6A')
+            for i in range(3):
+                await conn.fromuserqueue.put(b'\x6A\x01' + bytes([i]))
+            request = await asyncio.wait_for(conn.touserqueue.get(), 1)
+            self.assertEqual(request, b'\x2A\x04\x01')
+            await conn.fromuserqueue.put(b'\x6A')
+
+        async def client(client):
+            stream = await client.start_periodic_stream(0xF201, services.ReadDataByPeriodicIdentifier.TransmissionMode.sendAtSlowRate)
+            values = []
+            for i in range(3):
+                sample = await stream.read_async(timeout=1)
+                values.append(sample.value)
+            await client.stop_periodic_stream(stream)
+            return values
+
+        values = self.run_with_server(client, server, config={'data_identifiers': {0xF201: 'B'}})
+        self.assertEqual(values, [(0,), (1,), (2,)])
+
+    def test_negative_response_exception(self):
+        async def server(conn):
+            await asyncio.wait_for(conn.touserqueue.get(), 1)
+            await conn.fromuserqueue.put(b'\x7F\x11\x22')
+
+        async def client(client):
+            with self.assertRaises(NegativeResponseException):
+                await client.ecu_reset(services.ECUReset.ResetType.hardReset)
+
+        self.run_with_server(client, server)
+
+    def test_negative_response_no_exception(self):
+        async def server(conn):
+            await asyncio.wait_for(conn.touserqueue.get(), 1)
+            await conn.fromuserqueue.put(b'\x7F\x11\x22')
+
+        async def client(client):
+            return await client.ecu_reset(services.ECUReset.ResetType.hardReset)
+
+        response = self.run_with_server(client, server, config={'exception_on_negative_response': False})
+        self.assertFalse(response.positive)
+        self.assertEqual(response.code, 0x22)
+
+    def test_response_pending_uses_p2_star(self):
+        async def server(conn):
+            await asyncio.wait_for(conn.touserqueue.get(), 1)
+            await conn.fromuserqueue.put(b'\x7F\x3E\x78')
+            await asyncio.sleep(0.2)    # More than P2, less than P2*
+            await conn.fromuserqueue.put(b'\x7E\x00')
+
+        async def client(client):
+            return await client.tester_present()
+
+        response = self.run_with_server(client, server, config={'p2_timeout': 0.1, 'p2_star_timeout': 0.4})
+        self.assertTrue(response.positive)
+
+    def test_p2_timeout(self):
+        async def server(conn):
+            await asyncio.wait_for(conn.touserqueue.get(), 1)
+
+        async def client(client):
+            t1 = time.monotonic()
+            with self.assertRaises(TimeoutException):
+                await client.tester_present()
+            return time.monotonic() - t1
+
+        diff = self.run_with_server(client, server, config={'p2_timeout': 0.1})
+        self.assertGreater(diff, 0.05)
+        self.assertLess(diff, 0.4)
+
+    def test_many_clients_concurrently(self):
+        nb_clients = 10
+
+        async def server(conn):
+            await asyncio.wait_for(conn.touserqueue.get(), 1)
+            await asyncio.sleep(0.1)
+            await conn.fromuserqueue.put(b'\x7E\x00')
+
+        async def run():
+            conns = [AsyncQueueConnection(name='unittest%d' % i) for i in range(nb_clients)]
+            clients = [AsyncClient(conn, request_timeout=1) for conn in conns]
+            for client in clients:
+                await client.open()
+            servers = [asyncio.ensure_future(server(conn)) for conn in conns]
+            t1 = time.monotonic()
+            responses = await asyncio.gather(*[client.tester_present() for client in clients])
+            diff = time.monotonic() - t1
+            await asyncio.gather(*servers)
+            for client in clients:
+                await client.close()
+            return responses, diff
+
+        responses, diff = asyncio.run(run())
+        self.assertEqual(len(responses), nb_clients)
+        for response in responses:
+            self.assertTrue(response.positive)
+        self.assertLess(diff, 0.1 * nb_clients / 2)  # Done in parallel, not one after the other
+
+    def test_sync_context_manager_refused(self):
+        client = AsyncClient(AsyncQueueConnection(name='unittest'))
+        with self.assertRaises(TypeError):
+            with client:
+                pass
+
+    def test_close_before_open(self):
+        conn = AsyncQueueConnection(name='unittest')
+        asyncio.run(conn.close())
+        self.assertFalse(conn.is_open())
+
+    def test_service_methods_are_coroutines(self):
+        # The methods of the Client that talk to the server are coroutines of the AsyncClient, with the same awaited result type
+        self.assertFalse(issubclass(AsyncClient, Client))
+        for name, method in vars(Client).items():
+            if name.startswith('_') or not inspect.isfunction(method):
+                continue
+            async_method = getattr(AsyncClient, name)
+            self.assertTrue(inspect.iscoroutinefunction(async_method), name)
+            self.assertEqual(inspect.signature(async_method).return_annotation, inspect.signature(method).return_annotation, name)
@@ -0,0 +1,74 @@
+from udsoncan.client import Client
+from udsoncan.metrics import ClientMetrics
+from udsoncan import services
+from udsoncan.exceptions import *
+
+from test.ClientServerTest import ClientServerTest
+
+import time
+
+
+class TestClientMetrics(ClientServerTest):
+    def __init__(self, *args, **kwargs):
+        ClientServerTest.__init__(self, *args, **kwargs)
+
+    def postClientSetUp(self):
+        self.udsclient.metrics = ClientMetrics()
+
+    def test_positive_response(self):
+        self.wait_request_and_respond(b"\x51\x01")
+        self.wait_request_and_respond(b"\x51\x01")
+
+    def _test_positive_response(self):
+        self.udsclient.ecu_reset(1)
+        self.udsclient.ecu_reset(1)
+        entry = self.udsclient.metrics.get(services.ECUReset, 1)
+        self.assertEqual(entry.requests, 2)
+        self.assertEqual(entry.timeouts, 0)
+        self.assertEqual(entry.negative_responses, 0)
+        self.assertEqual(entry.response_pending, 0)
+        self.assertEqual(entry.response_time.count, 2)
+        self.assertEqual(entry.pending_time.count, 0)
+        self.assertEqual(entry.encode_time.count, 2)
+        self.assertEqual(entry.decode_time.count, 2)
+        self.assertEqual(entry.request_size.sum, 4)
+        self.assertEqual(entry.response_size.sum, 4)
+
+    def test_response_pending(self):
+        self.wait_request_and_respond(b"\x7F\x22\x78")
+        time.sleep(0.05)
+        self.conn.fromuserqueue.put(b"\x7F\x22\x78")
+        time.sleep(0.05)
+        self.conn.fromuserqueue.put(b"\x62\x00\x01\x12\x34")
+
+    def _test_response_pending(self):
+        self.udsclient.set_config('data_identifiers', {1: '>H'})
+        self.udsclient.read_data_by_identifier(1)
+        entry = self.udsclient.metrics.get(services.ReadDataByIdentifier)
+        self.assertEqual(entry.requests, 1)
+        self.assertEqual(entry.response_pending, 2)
+        self.assertEqual(entry.response_time.count, 1)
+        self.assertEqual(entry.response_size.count, 3)
+        self.assertEqual(entry.pending_time.count, 1)
+        self.assertGreater(entry.pending_time.sum, 0.09)
+
+    def test_negative_response_and_timeout(self):
+        self.wait_request_and_respond(b"\x7F\x11\x22")
+        self.conn.touserqueue.get(timeout=0.2)
+
+    def _test_negative_response_and_timeout(self):
+        with self.assertRaises(NegativeResponseException):
+            self.udsclient.ecu_reset(2)
+        with self.assertRaises(TimeoutException):
+            self.udsclient.tester_present()
+        self.assertEqual(self.udsclient.metrics.get(services.ECUReset, 2).negative_responses, 1)
+        tester_present = self.udsclient.metrics.get(services.TesterPresent, 0)
+        self.assertEqual(tester_present.timeouts, 1)
+        self.assertEqual(tester_present.response_time.count, 0)
+        self.assertEqual(tester_present.decode_time.count, 0)
+
+    def test_no_metrics_by_default(self):
+        pass
+
+    def _test_no_metrics_by_default(self):
+        self.assertIsNone(Client(self.conn).metrics)
@@ -0,0 +1,175 @@
+from udsoncan.client import Client
+from udsoncan import services, MemoryLocation
+from udsoncan.exceptions import *
+
+from test.ClientServerTest import ClientServerTest
+
+import io
+import os
+import tempfile
+
+
+class TestDownloadUpload(ClientServerTest):
+    def __init__(self, *args, **kwargs):
+        ClientServerTest.__init__(self, *args, **kwargs)
+
+    def serve_download(self, max_length, expected_blocks, first_sequence_number=1):
+        request = self.conn.touserqueue.get(timeout=0.2)
+        self.assertEqual(request[0], 0x34)
+        self.conn.fromuserqueue.put(b"\x74\x20" + max_length.to_bytes(2, 'big'))
+        sequence_number = first_sequence_number
+        for block in expected_blocks:
+            request = self.conn.touserqueue.get(timeout=0.2)
+            self.assertEqual(request, b"\x36" + bytes([sequence_number]) + block)
+            self.conn.fromuserqueue.put(b"\x76" + bytes([sequence_number]))
+            sequence_number = (sequence_number + 1) & 0xFF
+        request = self.conn.touserqueue.get(timeout=0.2)
+        self.assertEqual(request, b"\x37")
+        self.conn.fromuserqueue.put(b"\x77")
+
+    def test_download_bytes(self):
+        self.serve_download(6, [b'\x00\x01\x02\x03', b'\x04\x05\x06\x07', b'\x08\x09'])
+
+    def _test_download_bytes(self):
+        progress_list = []
+
+        def callback(progress):
+            progress_list.append((progress.transferred, progress.block_count, progress.ratio))
+        response = self.udsclient.download(MemoryLocation(0x1234, 10, 16, 8), bytes(range(10)), progress_callback=callback)
+        self.assertTrue(response.positive)
+        self.assertTrue(issubclass(response.service, services.RequestTransferExit))
+        self.assertEqual(progress_list, [(4, 1, 0.4), (8, 2, 0.8), (10, 3, 1.0)])
+
+    def test_download_block_size_limited_by_user(self):
+        self.serve_download(0x100, [b'\x00\x01\x02', b'\x03\x04\x05', b'\x06'])
+
+    def _test_download_block_size_limited_by_user(self):
+        self.udsclient.download(MemoryLocation(0x1234, 7, 16, 8), bytearray(range(7)), block_size=3)
+
+    def test_download_file_path(self):
+        self.serve_download(5, [b'abc', b'def', b'g'])
+
+    def _test_download_file_path(self):
+        with tempfile.TemporaryDirectory() as tempdir:
+            filename = os.path.join(tempdir, 'image.bin')
+            with open(filename, 'wb') as f:
+                f.write(b'abcdefg')
+            self.udsclient.download(MemoryLocation(0x1234, 7, 16, 8), filename)
+
+    def test_download_file_object(self):
+        self.serve_download(5, [b'abc', b'def', b'g'])
+
+    def _test_download_file_object(self):
+        self.udsclient.download(MemoryLocation(0x1234, 7, 16, 8), io.BytesIO(b'abcdefg'))
+
+    def test_download_iterator(self):
+        self.serve_download(5, [b'abc', b'def', b'ghi', b'j'])
+
+    def _test_download_iterator(self):
+        progress_list = []
+        chunks = iter([b'a', b'bcdefgh', memoryview(b'i'), bytearray(b'j')])
+        self.udsclient.download(MemoryLocation(0x1234, 10, 16, 8), chunks, progress_callback=lambda p: progress_list.append(p.ratio))
+        self.assertEqual(progress_list, [None, None, None, None])
+
+    def test_download_sequence_number_wraps(self):
+        self.serve_download(3, [bytes([i & 0xFF]) for i in range(260)])
+
+    def _test_download_sequence_number_wraps(self):
+        self.udsclient.download(MemoryLocation(0x1234, 260, 16, 16), bytes([i & 0xFF for i in range(260)]))
+
+    def test_download_wrong_sequence_number_echo(self):
+        self.wait_request_and_respond(b"\x74\x20\x00\x06")
+        self.wait_request_and_respond(b"\x76\x02")
+
+    def _test_download_wrong_sequence_number_echo(self):
+        with self.assertRaises(UnexpectedResponseException):
+            self.udsclient.download(MemoryLocation(0x1234, 10, 16, 8), bytes(10))
+
+    def test_download_negative_response_exception(self):
+        self.wait_request_and_respond(b"\x74\x20\x00\x06")
+        self.wait_request_and_respond(b"\x76\x01")
+        self.wait_request_and_respond(b"\x7F\x36\x72")
+
+    def _test_download_negative_response_exception(self):
+        with self.assertRaises(NegativeResponseException) as handle:
+            self.udsclient.download(MemoryLocation(0x1234, 10, 16, 8), bytes(10))
+        self.assertTrue(issubclass(handle.exception.response.service, services.TransferData))
+        self.assertEqual(handle.exception.response.code, 0x72)
+
+    def test_download_negative_response_no_exception(self):
+        self.wait_request_and_respond(b"\x7F\x34\x70")
+
+    def _test_download_negative_response_no_exception(self):
+        self.udsclient.config['exception_on_negative_response'] = False
+        response = self.udsclient.download(MemoryLocation(0x1234, 10, 16, 8), bytes(10))
+        self.assertFalse(response.positive)
+        self.assertTrue(issubclass(response.service, services.RequestDownload))
+
+    def test_download_bad_param(self):
+        pass
+
+    def _test_download_bad_param(self):
+        with self.assertRaises(ValueError):
+            self.udsclient.download(MemoryLocation(0x1234, 10, 16, 8), bytes(10), block_size=0)
+
+        with self.assertRaises(ValueError):
+            self.udsclient.download(MemoryLocation(0x1234, 10, 16, 8), 1234)
+
+    def serve_upload(self, blocks):
+        request = self.conn.touserqueue.get(timeout=0.2)
+        self.assertEqual(request[0], 0x35)
+        self.conn.fromuserqueue.put(b"\x75\x20\x01\x02")
+        sequence_number = 1
+        for block in blocks:
+            request = self.conn.touserqueue.get(timeout=0.2)
+            self.assertEqual(request, b"\x36" + bytes([sequence_number]))
+            self.conn.fromuserqueue.put(b"\x76" + bytes([sequence_number]) + block)
+            sequence_number = (sequence_number + 1) & 0xFF
+        request = self.conn.touserqueue.get(timeout=0.2)
+        self.assertEqual(request, b"\x37")
+        self.conn.fromuserqueue.put(b"\x77")
+
+    def test_upload_bytearray(self):
+        self.serve_upload([b'abcd', b'efgh', b'ij'])
+
+    def _test_upload_bytearray(self):
+        data = bytearray()
+        progress_list = []
+        response = self.udsclient.upload(MemoryLocation(0x1234, 10, 16, 8), data, progress_callback=lambda p: progress_list.append(p.transferred))
+        self.assertTrue(response.positive)
+        self.assertEqual(data, b'abcdefghij')
+        self.assertEqual(progress_list, [4, 8, 10])
+
+    def test_upload_file_path(self):
+        self.serve_upload([b'abcd', b'efg'])
+
+    def _test_upload_file_path(self):
+        with tempfile.TemporaryDirectory() as tempdir:
+            filename = os.path.join(tempdir, 'dump.bin')
+            self.udsclient.upload(MemoryLocation(0x1234, 7, 16, 8), filename)
+            with open(filename, 'rb') as f:
+                self.assertEqual(f.read(), b'abcdefg')
+
+    def test_upload_file_path_failure(self):
+        self.wait_request_and_respond(b"\x75\x20\x01\x02")
+        self.wait_request_and_respond(b"\x76\x01abcd")
+        self.wait_request_and_respond(b"\x7F\x36\x72")  # General programming failure
+
+    def _test_upload_file_path_failure(self):
+        with tempfile.TemporaryDirectory() as tempdir:
+            filename = os.path.join(tempdir, 'dump.bin')
+            with self.assertRaises(NegativeResponseException):
+                self.udsclient.upload(MemoryLocation(0x1234, 7, 16, 8), filename)
+            self.assertFalse(os.path.exists(filename))
+
+    def test_upload_empty_block(self):
+        self.wait_request_and_respond(b"\x75\x20\x01\x02")
+        self.wait_request_and_respond(b"\x76\x01\xAA")
+        self.wait_request_and_respond(b"\x76\x02")
+
+    def _test_upload_empty_block(self):
+        stream = io.BytesIO()
+        with self.assertRaises(UnexpectedResponseException):
+            self.udsclient.upload(MemoryLocation(0x1234, 10, 16, 8), stream)
+        self.assertEqual(stream.getvalue(), b'\xAA')
+
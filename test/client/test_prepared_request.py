@@ -0,0 +1,141 @@
+from udsoncan.client import AsyncClient, PreparedRequest
+from udsoncan.connections import AsyncQueueConnection
+from udsoncan.exceptions import *
+from udsoncan.metrics import ClientMetrics
+from udsoncan import services, MemoryLocation
+from test.ClientServerTest import ClientServerTest
+from test.UdsTest import UdsTest
+
+import asyncio
+
+
+class TestPreparedRequest(ClientServerTest):
+    def __init__(self, *args, **kwargs):
+        ClientServerTest.__init__(self, *args, **kwargs)
+
+    def postClientSetUp(self):
+        self.udsclient.config["data_identifiers"] = {
+            0x1234: '>H',
+            0x5678: 'B'
+        }
+
+    def test_rdbi_repeated(self):
+        for i in range(3):
+            request = self.conn.touserqueue.get(timeout=0.2)
+            self.assertEqual(request, b"\x22\x12\x34\x56\x78")
+            self.conn.fromuserqueue.put(b"\x62\x12\x34" + bytes([0, i]) + b"\x56\x78\x99")
+
+    def _test_rdbi_repeated(self):
+        prepared = self.udsclient.prepare(self.udsclient.read_data_by_identifier, [0x1234, 0x5678])
+        self.assertIsInstance(prepared, PreparedRequest)
+        self.assertEqual(prepared.name, 'read_data_by_identifier')
+        self.assertEqual(prepared.payload, b"\x22\x12\x34\x56\x78")
+        for i in range(3):
+            response = prepared()
+            self.assertTrue(response.positive)
+            self.assertEqual(response.service_data.values[0x1234], (i,))
+            self.assertEqual(response.service_data.values[0x5678], (0x99,))
+
+    def test_rdbi_missing_did(self):
+        self.wait_request_and_respond(b"\x62\x12\x34\x00\x01")
+
+    def _test_rdbi_missing_did(self):
+        prepared = self.udsclient.prepare('read_data_by_identifier', [0x1234, 0x5678])
+        with self.assertRaises(UnexpectedResponseException):
+            prepared()
+
+    def test_negative_response_no_exception(self):
+        self.wait_request_and_respond(b"\x7F\x22\x31")
+
+    def _test_negative_response_no_exception(self):
+        self.udsclient.config['exception_on_negative_response'] = False
+        prepared = self.udsclient.prepare('read_data_by_identifier', 0x1234)
+        response = prepared()
+        self.assertFalse(response.positive)
+        self.assertEqual(response.code, 0x31)
+
+    def test_timeout(self):
+        pass
+
+    def _test_timeout(self):
+        prepared = self.udsclient.prepare('tester_present')
+        with self.assertRaises(TimeoutException):
+            prepared(timeout=0.1)
+
+    def test_read_memory_by_address(self):
+        request = self.conn.touserqueue.get(timeout=0.2)
+        self.assertEqual(request, b"\x23\x12\x12\x34\x04")
+        self.conn.fromuserqueue.put(b"\x63\x99\x88\x77\x66\x00")
+
+    def _test_read_memory_by_address(self):
+        self.udsclient.config['tolerate_zero_padding'] = True
+        prepared = self.udsclient.prepare(self.udsclient.read_memory_by_address, MemoryLocation(address=0x1234, memorysize=4, address_format=16, memorysize_format=8))
+        response = prepared()
+        self.assertEqual(response.service_data.memory_block, b"\x99\x88\x77\x66")
+
+    def test_routine_control(self):
+        request = self.conn.touserqueue.get(timeout=0.2)
+        self.assertEqual(request, b"\x31\x03\x12\x34")
+        self.conn.fromuserqueue.put(b"\x71\x03\x12\x35")
+
+    def _test_routine_control(self):
+        prepared = self.udsclient.prepare(self.udsclient.get_routine_result, 0x1234)
+        with self.assertRaises(UnexpectedResponseException):
+            prepared()
+
+    def test_tester_present_spr(self):
+        request = self.conn.touserqueue.get(timeout=0.2)
+        self.assertEqual(request, b"\x3E\x80")
+        self.conn.fromuserqueue.put('wait')  # Syncronize
+
+    def _test_tester_present_spr(self):
+        prepared = self.udsclient.prepare(self.udsclient.tester_present)
+        with self.udsclient.suppress_positive_response:
+            self.assertIsNone(prepared())
+        self.conn.fromuserqueue.get(timeout=0.2)  # Avoid closing connection prematurely
+
+    def test_metrics(self):
+        self.wait_request_and_respond(b"\x7E\x00")
+
+    def _test_metrics(self):
+        self.udsclient.metrics = ClientMetrics()
+        prepared = self.udsclient.prepare('tester_present')
+        prepared()
+        metrics = self.udsclient.metrics.for_request(prepared.request)
+        self.assertEqual(metrics.requests, 1)
+        self.assertEqual(metrics.decode_time.count, 1)
+
+    def test_bad_prepare(self):
+        pass
+
+    def _test_bad_prepare(self):
+        with self.assertRaises(ValueError):
+            self.udsclient.prepare(self.udsclient.change_session, 1)
+
+        with self.assertRaises(ValueError):
+            self.udsclient.prepare('read_data_by_identifier', 0x10000)
+
+        with self.assertRaises(ConfigError):
+            self.udsclient.prepare('read_data_by_identifier', 0x9999)
+
+
+class TestAsyncPreparedRequest(UdsTest):
+
+    def test_rdbi(self):
+        async def run():
+            conn = AsyncQueueConnection(name='unittest')
+            client = AsyncClient(conn, request_timeout=0.5)
+            client.set_config('data_identifiers', {0x1234: '>H'})
+            async with client:
+                prepared = client.prepare(client.read_data_by_identifier, 0x1234)
+                responses = []
+                for i in range(2):
+                    call = asyncio.ensure_future(prepared())
+                    request = await asyncio.wait_for(conn.touserqueue.get(), 1)
+                    self.assertEqual(request, b'\x22\x12\x34')
+                    await conn.fromuserqueue.put(b'\x62\x12\x34\x00' + bytes([i]))
+                    responses.append(await call)
+                return responses
+
+        responses = asyncio.run(run())
+        self.assertEqual([response.service_data.values[0x1234] for response in responses], [(0,), (1,)])
@@ -1,8 +1,11 @@
 from udsoncan.exceptions import *
-from udsoncan import DidCodec, AsciiCodec
+from udsoncan import DidCodec, AsciiCodec, services
+from udsoncan.cache import DidCache
 import struct
+import time
 from copy import deepcopy
 from test.ClientServerTest import ClientServerTest
+from test.UdsTest import UdsTest
 
 
 class StubbedDidCodec(DidCodec):
@@ -37,6 +40,19 @@ class CodecWithNoLength(DidCodec):
         return did_payload
 
 
+class InstanceCountingCodec(DidCodec):
+    instance_count = 0
+
+    def __init__(self):
+        InstanceCountingCodec.instance_count += 1
+
+    def decode(self, did_payload):
+        return struct.unpack('B', did_payload)[0]
+
+    def __len__(self):
+        return 1
+
+
 class TestReadDataByIdentifier(ClientServerTest):
     def __init__(self, *args, **kwargs):
         ClientServerTest.__init__(self, *args, **kwargs)
@@ -331,3 +347,314 @@ class TestReadDataByIdentifier(ClientServerTest):
     def _test_no_length(self):
         with self.assertRaises(NotImplementedError):
             self.udsclient.read_data_by_identifier(didlist=[6])
+
+    def test_rdbi_codec_class_instantiated_once(self):
+        for i in range(3):
+            self.wait_request_and_respond(b"\x62\x00\x07" + bytes([i]))
+
+    def _test_rdbi_codec_class_instantiated_once(self):
+        self.udsclient.config['data_identifiers'][7] = InstanceCountingCodec
+        InstanceCountingCodec.instance_count = 0
+        for i in range(3):
+            response = self.udsclient.read_data_by_identifier(didlist=7)
+            self.assertEqual(response.service_data.values[7], i)
+        self.assertEqual(InstanceCountingCodec.instance_count, 1)
+
+    def test_rdbi_compiled_config_invalidated_by_set_config(self):
+        self.wait_request_and_respond(b"\x62\x00\x01\x12\x34")
+        self.wait_request_and_respond(b"\x62\x00\x01\x12\x34")
+        self.wait_request_and_respond(b"\x62\x00\x01\x12\x34")
+
+    def _test_rdbi_compiled_config_invalidated_by_set_config(self):
+        response = self.udsclient.read_data_by_identifier(didlist=1)
+        self.assertEqual(response.service_data.values[1], (0x1234,))
+
+        self.udsclient.set_config('data_identifiers', {1: '<H'})
+        response = self.udsclient.read_data_by_identifier(didlist=1)
+        self.assertEqual(response.service_data.values[1], (0x3412,))
+
+        self.udsclient.config['data_identifiers'][1] = 'BB'
+        response = self.udsclient.read_data_by_identifier(didlist=1)
+        self.assertEqual(response.service_data.values[1], (0x12, 0x34))
+
+
+class TestReadDataByIdentifierBulk(ClientServerTest):
+    def __init__(self, *args, **kwargs):
+        ClientServerTest.__init__(self, *args, **kwargs)
+
+    def postClientSetUp(self):
+        didconfig = {0x100 + i: '>H' for i in range(10)}
+        didconfig[0x200] = AsciiCodec(20)
+        self.udsclient.config["data_identifiers"] = didconfig
+
+    def serve_rdbi(self, max_did=None, max_response_size=None, nrc=None):
+        # Answers each DID 0x01XX with value 0x00XX. Returns the DID lists received
+        requests = []
+        while True:
+            try:
+                request = self.conn.touserqueue.get(timeout=0.2)
+            except Exception:
+                return requests
+            self.assertEqual(request[0], 0x22)
+            dids = list(struct.unpack('>%dH' % ((len(request) - 1) // 2), request[1:]))
+            requests.append(dids)
+            response = b'\x62'
+            for did in dids:
+                value = b'abcdefghijklmnopqrst' if did == 0x200 else struct.pack('>H', did & 0xFF)
+                response += struct.pack('>H', did) + value
+            if nrc is not None:
+                self.conn.fromuserqueue.put(bytes([0x7F, 0x22, nrc]))
+            elif max_did is not None and len(dids) > max_did:
+                self.conn.fromuserqueue.put(b'\x7F\x22\x13')
+            elif max_response_size is not None and len(response) > max_response_size:
+                self.conn.fromuserqueue.put(b'\x7F\x22\x14')
+            else:
+                self.conn.fromuserqueue.put(response)
+
+    def test_bulk_packing(self):
+        requests = self.serve_rdbi()
+        self.assertEqual([len(dids) for dids in requests], [4, 4, 2, 1])
+        self.assertEqual(requests[3], [0x200])
+
+    def _test_bulk_packing(self):
+        didlist = [0x200] + [0x100 + i for i in range(10)] + [0x101]
+        values = self.udsclient.read_data_by_identifier_bulk(didlist, max_response_size=20)
+        self.assertEqual(list(values.keys()), [0x200] + [0x100 + i for i in range(10)])
+        self.assertEqual(values[0x200], 'abcdefghijklmnopqrst')
+        for i in range(10):
+            self.assertEqual(values[0x100 + i], (i,))
+
+    def test_bulk_config_limits(self):
+        requests = self.serve_rdbi()
+        self.assertEqual([len(dids) for dids in requests], [3, 3, 3, 1])
+
+    def _test_bulk_config_limits(self):
+        self.udsclient.set_config('rdbi_max_did_per_request', 3)
+        values = self.udsclient.read_data_by_identifier_bulk([0x100 + i for i in range(10)])
+        self.assertEqual(len(values), 10)
+
+    def test_bulk_learn_did_count(self):
+        requests = self.serve_rdbi(max_did=3)
+        self.assertEqual([len(dids) for dids in requests], [10, 5] + [2] * 5 + [2] * 5)
+
+    def _test_bulk_learn_did_count(self):
+        didlist = [0x100 + i for i in range(10)]
+        values = self.udsclient.read_data_by_identifier_bulk(didlist)
+        self.assertEqual(list(values.keys()), didlist)
+        self.assertEqual(self.udsclient.rdbi_limits.max_did_per_request, 2)
+        self.assertIsNone(self.udsclient.rdbi_limits.max_response_size)
+
+        values = self.udsclient.read_data_by_identifier_bulk(didlist)  # Uses the learned limit right away
+        self.assertEqual(list(values.keys()), didlist)
+
+    def test_bulk_learn_response_size(self):
+        requests = self.serve_rdbi(max_response_size=20)
+        self.assertEqual([len(dids) for dids in requests], [10, 4, 4, 2])
+
+    def _test_bulk_learn_response_size(self):
+        values = self.udsclient.read_data_by_identifier_bulk([0x100 + i for i in range(10)])
+        self.assertEqual(len(values), 10)
+        self.assertEqual(self.udsclient.rdbi_limits.max_response_size, 20)
+
+    def test_bulk_single_did_refused(self):
+        self.serve_rdbi(max_response_size=5)
+
+    def _test_bulk_single_did_refused(self):
+        with self.assertRaises(NegativeResponseException) as handle:
+            self.udsclient.read_data_by_identifier_bulk([0x100, 0x200])
+        self.assertEqual(handle.exception.response.code, 0x14)
+
+    def test_bulk_other_negative_response(self):
+        requests = self.serve_rdbi(nrc=0x31)
+        self.assertEqual(len(requests), 1)
+
+    def _test_bulk_other_negative_response(self):
+        with self.assertRaises(NegativeResponseException):
+            self.udsclient.read_data_by_identifier_bulk([0x100 + i for i in range(10)])
+        self.assertIsNone(self.udsclient.rdbi_limits.max_did_per_request)
+
+    def test_bulk_negative_response_no_exception(self):
+        self.serve_rdbi(nrc=0x22)
+
+    def _test_bulk_negative_response_no_exception(self):
+        self.udsclient.config['exception_on_negative_response'] = False
+        response = self.udsclient.read_data_by_identifier_bulk([0x100, 0x101])
+        self.assertFalse(response.positive)
+
+    def test_bulk_no_config(self):
+        pass
+
+    def _test_bulk_no_config(self):
+        with self.assertRaises(ConfigError):
+            self.udsclient.read_data_by_identifier_bulk([0x100, 0x999])
+
+
+class TestReadDataByIdentifierPacking(UdsTest):
+
+    def test_pack_didlist(self):
+        didconfig = {1: '>H', 2: '>L', 3: '>B', 4: ReadRemainingDataCodec, 5: AsciiCodec(30)}
+        groups = services.ReadDataByIdentifier.pack_didlist([4, 1, 2, 3, 5, 1, 3], didconfig, max_response_size=12)
+        self.assertEqual(groups, [[2, 1], [3], [4], [5]])
+
+        groups = services.ReadDataByIdentifier.pack_didlist([1, 2, 3], didconfig, max_response_size=4095, max_did_per_request=1)
+        self.assertEqual(groups, [[2], [1], [3]])
+
+        groups = services.ReadDataByIdentifier.pack_didlist([1, 2, 3], didconfig, max_response_size=4095)
+        self.assertEqual(groups, [[2, 1, 3]])
+
+    def test_pack_didlist_request_size(self):
+        didconfig = {'default': '>B'}
+        groups = services.ReadDataByIdentifier.pack_didlist(list(range(10)), didconfig, max_response_size=8)
+        self.assertEqual(groups, [[0, 1], [2, 3], [4, 5], [6, 7], [8, 9]])  # Response is 1+3n bytes
+
+        groups = services.ReadDataByIdentifier.pack_didlist(list(range(4)), {'default': AsciiCodec(0)}, max_response_size=7)
+        self.assertEqual(groups, [[0, 1, 2], [3]])  # Request is 1+2n bytes
+
+    def test_pack_didlist_bad_params(self):
+        with self.assertRaises(ConfigError):
+            services.ReadDataByIdentifier.pack_didlist([1, 2], {1: '>H'}, max_response_size=100)
+
+        with self.assertRaises(ValueError):
+            services.ReadDataByIdentifier.pack_didlist([1], {1: '>H'}, max_response_size=2)
+
+        with self.assertRaises(ValueError):
+            services.ReadDataByIdentifier.pack_didlist([1], {1: '>H'}, max_response_size=100, max_did_per_request=0)
+
+    def test_response_size(self):
+        didconfig = {1: '>H', 2: AsciiCodec(10), 3: ReadRemainingDataCodec}
+        self.assertEqual(services.ReadDataByIdentifier.response_size([1, 2], didconfig), 1 + 4 + 12)
+        self.assertIsNone(services.ReadDataByIdentifier.response_size([1, 3], didconfig))
+
+
+class TestReadDataByIdentifierCache(ClientServerTest):
+    def __init__(self, *args, **kwargs):
+        ClientServerTest.__init__(self, *args, **kwargs)
+
+    def postClientSetUp(self):
+        self.udsclient.set_config('data_identifiers', {0xF190: AsciiCodec(4), 0x0001: '>H', 0x0002: '>H'})
+        self.udsclient.set_config('did_cache', {0xF190: 'static', 0x0001: 0.2})
+
+    def serve(self):
+        # Answers RDBI, WDBI, ECUReset and DiagnosticSessionControl. Returns the requests received
+        requests = []
+        while True:
+            try:
+                request = self.conn.touserqueue.get(timeout=0.5)
+            except Exception:
+                return requests
+            requests.append(request)
+            if request[0] == 0x22:
+                response = b'\x62'
+                for did in struct.unpack('>%dH' % ((len(request) - 1) // 2), request[1:]):
+                    response += struct.pack('>H', did) + (b'ABCD' if did == 0xF190 else struct.pack('>H', did + 0x100))
+                self.conn.fromuserqueue.put(response)
+            elif request[0] == 0x2E:
+                self.conn.fromuserqueue.put(b'\x6E' + request[1:3])
+            elif request[0] == 0x11:
+                self.conn.fromuserqueue.put(b'\x51' + request[1:2])
+            elif request[0] == 0x10:
+                self.conn.fromuserqueue.put(b'\x50' + request[1:2] + b'\x00\x32\x01\xF4')
+
+    def test_cache_hits(self):
+        requests = self.serve()
+        self.assertEqual(requests, [b'\x22\xF1\x90\x00\x01\x00\x02', b'\x22\x00\x02', b'\x22\x00\x01'])
+
+    def _test_cache_hits(self):
+        response = self.udsclient.read_data_by_identifier([0xF190, 0x0001, 0x0002])
+        self.assertEqual(response.service_data.values, {0xF190: 'ABCD', 0x0001: (0x101,), 0x0002: (0x102,)})
+        self.assertEqual((self.udsclient.did_cache.hits, self.udsclient.did_cache.misses), (0, 2))
+
+        response = self.udsclient.read_data_by_identifier([0x0002, 0xF190, 0x0001])   # Only 0x0002 is sent
+        self.assertEqual(list(response.service_data.values.items()), [(0x0002, (0x102,)), (0xF190, 'ABCD'), (0x0001, (0x101,))])
+        self.assertEqual((self.udsclient.did_cache.hits, self.udsclient.did_cache.misses), (2, 2))
+
+        response = self.udsclient.read_data_by_identifier(0xF190)     # Nothing sent
+        self.assertTrue(response.positive)
+        self.assertEqual(response.service_data.values, {0xF190: 'ABCD'})
+        self.assertEqual(self.udsclient.read_data_by_identifier_first(0xF190), 'ABCD')
+        self.assertEqual(self.udsclient.did_cache.hits, 4)
+
+        time.sleep(0.25)    # 0x0001 expires, 0xF190 is static
+        response = self.udsclient.read_data_by_identifier([0x0001, 0xF190])
+        self.assertEqual(response.service_data.values, {0x0001: (0x101,), 0xF190: 'ABCD'})
+        self.assertEqual((self.udsclient.did_cache.hits, self.udsclient.did_cache.misses), (5, 3))
+
+    def test_cache_invalidation(self):
+        requests = self.serve()
+        self.assertEqual([request[0] for request in requests], [0x22, 0x2E, 0x22, 0x10, 0x22, 0x11, 0x22])
+        self.assertEqual(requests[2], b'\x22\x00\x01')
+        self.assertEqual(requests[4], b'\x22\x00\x01')
+        self.assertEqual(requests[6], b'\x22\xF1\x90\x00\x01')
+
+    def _test_cache_invalidation(self):
+        didlist = [0xF190, 0x0001]
+        self.udsclient.read_data_by_identifier(didlist)
+        self.udsclient.write_data_by_identifier(0x0001, 0x1234)
+        self.udsclient.read_data_by_identifier(didlist)     # Reads 0x0001 only
+        self.udsclient.change_session(3)
+        self.udsclient.read_data_by_identifier(didlist)     # Reads 0x0001 only, 0xF190 is static
+        self.udsclient.ecu_reset(1)
+        self.udsclient.read_data_by_identifier(didlist)     # Reads both
+
+    def test_bulk_uses_cache(self):
+        requests = self.serve()
+        self.assertEqual(requests, [b'\x22\xF1\x90', b'\x22\x00\x02'])
+
+    def _test_bulk_uses_cache(self):
+        self.udsclient.read_data_by_identifier(0xF190)
+        values = self.udsclient.read_data_by_identifier_bulk([0xF190, 0x0002])
+        self.assertEqual(values, {0xF190: 'ABCD', 0x0002: (0x102,)})
+
+    def test_bad_config(self):
+        pass
+
+    def _test_bad_config(self):
+        for policy in [0, -1, 'forever', None, True]:
+            with self.assertRaises(ConfigError):
+                self.udsclient.set_config('did_cache', {0x0001: policy})
+
+        with self.assertRaises(ConfigError):
+            self.udsclient.set_config('did_cache', [0x0001])
+
+
+class TestDidCache(UdsTest):
+    def test_lookup_store(self):
+        cache = DidCache()
+        self.assertEqual(cache.lookup(1, None), (False, None))
+        self.assertEqual((cache.hits, cache.misses), (0, 0))    # DIDs without policy are not counted
+
+        self.assertEqual(cache.lookup(1, 10), (False, None))
+        cache.store(1, 'value', 10)
+        cache.store(2, 'static value', DidCache.STATIC)
+        cache.store(3, 'not cached', None)
+        self.assertEqual(cache.lookup(1, 10), (True, 'value'))
+        self.assertEqual(cache.lookup(2, DidCache.STATIC), (True, 'static value'))
+        self.assertEqual((cache.hits, cache.misses), (2, 1))
+        self.assertIn(1, cache)
+        self.assertNotIn(3, cache)
+        self.assertEqual(len(cache), 2)
+
+        cache.reset_counters()
+        self.assertEqual((cache.hits, cache.misses), (0, 0))
+
+    def test_invalidate(self):
+        cache = DidCache()
+        cache.store(1, 'a', 10)
+        cache.store(2, 'b', DidCache.STATIC)
+        cache.store(3, 'c', 10)
+        cache.invalidate([3, 4])
+        self.assertEqual(len(cache), 2)
+        cache.invalidate(keep_static=True)
+        self.assertNotIn(1, cache)
+        self.assertIn(2, cache)
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+
+    def test_expiry(self):
+        cache = DidCache()
+        cache.store(1, 'a', 0.05)
+        self.assertIn(1, cache)
+        time.sleep(0.1)
+        self.assertNotIn(1, cache)
+        self.assertEqual(cache.lookup(1, 0.05), (False, None))
+        self.assertEqual(len(cache), 0)    # Expired value removed
@@ -0,0 +1,159 @@
+from udsoncan.client import Client, PeriodicSample
+from udsoncan import services
+from udsoncan.exceptions import *
+
+from test.ClientServerTest import ClientServerTest
+
+import time
+
+
+class TestReadDataByPeriodicIdentifier(ClientServerTest):
+    def __init__(self, *args, **kwargs):
+        ClientServerTest.__init__(self, *args, **kwargs)
+
+    def postClientSetUp(self):
+        self.udsclient.config['data_identifiers'] = {
+            0xF201: '>H',
+            0xF202: 'B',
+            0x1234: '>H'
+        }
+
+    def test_rdbpi_start_success(self):
+        request = self.conn.touserqueue.get(timeout=0.2)
+        self.assertEqual(request, b"\x2A\x02\x01\x02")
+        self.conn.fromuserqueue.put(b"\x6A")
+
+    def _test_rdbpi_start_success(self):
+        response = self.udsclient.read_data_by_periodic_identifier(services.ReadDataByPeriodicIdentifier.TransmissionMode.sendAtMediumRate, [0xF201, 0x02])
+        self.assertTrue(response.positive)
+        self.assertIsNone(response.service_data.did)
+
+    def test_rdbpi_stop_all(self):
+        request = self.conn.touserqueue.get(timeout=0.2)
+        self.assertEqual(request, b"\x2A\x04")
+        self.conn.fromuserqueue.put(b"\x6A")
+
+    def _test_rdbpi_stop_all(self):
+        response = self.udsclient.read_data_by_periodic_identifier(services.ReadDataByPeriodicIdentifier.TransmissionMode.stopSending, [])
+        self.assertTrue(response.positive)
+
+    def test_rdbpi_denied_exception(self):
+        self.wait_request_and_respond(b"\x7F\x2A\x31")
+
+    def _test_rdbpi_denied_exception(self):
+        with self.assertRaises(NegativeResponseException):
+            self.udsclient.start_periodic_stream([0xF201])
+        self.assertEqual(self.udsclient.periodic_streams, {})
+
+    def test_rdbpi_denied_no_exception(self):
+        self.wait_request_and_respond(b"\x7F\x2A\x31")
+
+    def _test_rdbpi_denied_no_exception(self):
+        self.udsclient.config['exception_on_negative_response'] = False
+        response = self.udsclient.start_periodic_stream([0xF201])
+        self.assertFalse(response.positive)
+        self.assertEqual(self.udsclient.periodic_streams, {})
+
+    def test_rdbpi_bad_params(self):
+        pass
+
+    def _test_rdbpi_bad_params(self):
+        with self.assertRaises(ValueError):
+            self.udsclient.read_data_by_periodic_identifier(0, [1])
+
+        with self.assertRaises(ValueError):
+            self.udsclient.read_data_by_periodic_identifier(5, [1])
+
+        with self.assertRaises(ValueError):
+            self.udsclient.read_data_by_periodic_identifier(1, [0x100])
+
+        with self.assertRaises(ValueError):
+            self.udsclient.read_data_by_periodic_identifier(1, [])
+
+        with self.assertRaises(ValueError):
+            self.udsclient.start_periodic_stream([1], transmission_mode=services.ReadDataByPeriodicIdentifier.TransmissionMode.stopSending)
+
+        with self.assertRaises(ConfigError):
+            self.udsclient.start_periodic_stream([0xF203])
+
+    def test_stream(self):
+        request = self.conn.touserqueue.get(timeout=0.2)
+        self.assertEqual(request, b"\x2A\x03\x01\x02")
+        self.conn.fromuserqueue.put(b"\x6A\x01\x00\x01")   # Sent before the positive response
+        self.conn.fromuserqueue.put(b"\x6A")
+        self.conn.fromuserqueue.put(b"\x6A\x02\x05\x00\x00\x00\x00\x00")    # Padded CAN frame
+        self.conn.fromuserqueue.put(b"\x6A\x01\x00\x02")
+        self.conn.fromuserqueue.put(b"\x6A\x01\x00")    # Incomplete. Dropped
+        self.conn.fromuserqueue.put(b"\x6A\x09\x00")    # Not streamed. Dropped
+        self.conn.fromuserqueue.put(b"\x6A\x02\x06")
+
+        request = self.conn.touserqueue.get(timeout=0.5)
+        self.assertEqual(request, b"\x2A\x04\x01\x02")
+        self.conn.fromuserqueue.put(b"\x6A\x01\x00\x03")   # Still in transit when stop is requested
+        self.conn.fromuserqueue.put(b"\x6A")
+
+    def _test_stream(self):
+        received = []
+        stream = self.udsclient.start_periodic_stream([1, 0xF202], callback=received.append)
+        self.assertTrue(stream.active)
+        self.assertIs(self.udsclient.periodic_streams[0xF201], stream)
+
+        samples = list(stream.samples(count=4, timeout=0.5))
+        self.assertEqual([(s.did, s.value) for s in samples], [(0xF201, (1,)), (0xF202, (5,)), (0xF201, (2,)), (0xF202, (6,))])
+        self.assertIsInstance(samples[0], PeriodicSample)
+        self.assertEqual(received, samples)
+
+        response = self.udsclient.stop_periodic_stream(stream)
+        self.assertTrue(response.positive)
+        self.assertFalse(stream.active)
+        self.assertEqual(self.udsclient.periodic_streams, {})
+        self.assertEqual(stream.pending(), 1)
+        self.assertEqual(stream.read(timeout=0).value, (3,))
+        self.assertIsNone(stream.read())    # Stopped, does not block
+
+    def test_stream_during_other_request(self):
+        self.wait_request_and_respond(b"\x6A")
+        self.conn.fromuserqueue.put(b"\x6A\x01\x00\x01")    # Received before the next request
+
+        request = self.conn.touserqueue.get(timeout=0.5)
+        self.assertEqual(request, b"\x22\x12\x34")
+        self.conn.fromuserqueue.put(b"\x6A\x01\x00\x02")
+        self.conn.fromuserqueue.put(b"\x6A\x02\x03")
+        self.conn.fromuserqueue.put(b"\x62\x12\x34\xAB\xCD")
+
+    def _test_stream_during_other_request(self):
+        stream = self.udsclient.start_periodic_stream([1, 2], maxsize=2)
+        time.sleep(0.05)
+        values = self.udsclient.read_data_by_identifier_first(0x1234)
+        self.assertEqual(values, (0xABCD,))
+        self.assertEqual(stream.pending(), 2)
+        self.assertEqual(stream.overflow_count, 1)
+        self.assertEqual(stream.read(timeout=0).value, (2,))
+        self.assertEqual(stream.read(timeout=0).value, (3,))
+        self.assertIsNone(stream.read(timeout=0))
+
+    def test_stream_does_not_extend_timeout(self):
+        self.wait_request_and_respond(b"\x6A")
+        self.conn.touserqueue.get(timeout=0.5)
+        for i in range(6):
+            self.conn.fromuserqueue.put(b"\x6A\x02" + bytes([i]))
+            time.sleep(0.05)
+
+    def _test_stream_does_not_extend_timeout(self):
+        stream = self.udsclient.start_periodic_stream([2])
+        t1 = time.monotonic()
+        with self.assertRaises(TimeoutException):
+            self.udsclient.tester_present()
+        self.assertLess(time.monotonic() - t1, 0.29)
+        self.assertGreater(stream.pending(), 0)
+
+    def test_duplicate_stream(self):
+        self.wait_request_and_respond(b"\x6A")
+        self.wait_request_and_respond(b"\x6A")
+
+    def _test_duplicate_stream(self):
+        self.udsclient.start_periodic_stream([1])
+        with self.assertRaises(ValueError):
+            self.udsclient.start_periodic_stream([2, 1])
+        self.udsclient.stop_periodic_stream()
+        self.assertEqual(self.udsclient.periodic_streams, {})
@@ -173,6 +173,21 @@ class GenericTestStatusMaskRequest_DtcAndStatusMaskResponse():
     def _test_normal_behaviour_param_instance(self):
         getattr(self.udsclient, self.client_function).__call__(Dtc.Status(test_failed_this_operation_cycle = True, confirmed = True, test_not_completed_since_last_clear = True, test_not_completed_this_operation_cycle = True))
 
+    def test_dtc_table(self):
+        self.wait_request_and_respond(b"\x59"+self.sb+b"\xFB\x12\x34\x56\x20\x12\x34\x57\x60\x00\x00\x00\x00\x00")
+
+    def _test_dtc_table(self):
+        self.udsclient.config['use_dtc_table'] = True
+        response = getattr(self.udsclient, self.client_function).__call__(0x5A)
+        self.assertEqual(response.service_data.dtcs, [])
+        self.assertEqual(response.service_data.dtc_count, 2)
+        table = response.service_data.dtc_table
+        self.assertEqual(list(table.ids), [0x123456, 0x123457])
+        self.assertEqual(list(table.status), [0x20, 0x60])
+        self.assertIsNone(table.severity)
+        self.assertEqual(table[1].id, 0x123457)
+        self.assertEqual(table[1].status.get_byte_as_int(), 0x60)
+
     def test_normal_behaviour_zeropadding_ok_ignore_allzero(self):
         data = b'\x59'+self.sb+b'\xFB\x12\x34\x56\x20\x12\x34\x57\x60'
 
@@ -1828,6 +1843,21 @@ class TestReportDTCBySeverityMaskRecord(ClientServerTest):	# Subfn = 0x8
     def _test_normal_behaviour_param_instance(self):
         self.udsclient.get_dtc_by_status_severity_mask(status_mask = Dtc.Status(test_failed=True), severity_mask=Dtc.Severity(check_immediately=True, check_at_next_exit=True))
 
+    def test_dtc_table(self):
+        self.wait_request_and_respond(b"\x59\x08\xFB\x80\x99\x12\x34\x56\x20\x40\x88\x12\x34\x57\x60")
+
+    def _test_dtc_table(self):
+        self.udsclient.config['use_dtc_table'] = True
+        response = self.udsclient.get_dtc_by_status_severity_mask(status_mask = 0x01, severity_mask=0xC0)
+        self.assertEqual(response.service_data.dtcs, [])
+        self.assertEqual(response.service_data.dtc_count, 2)
+        table = response.service_data.dtc_table
+        self.assertEqual(list(table.severity), [0x80, 0x40])
+        self.assertEqual(list(table.functional_unit), [0x99, 0x88])
+        self.assertEqual([dtc.id for dtc in table.where(check_at_next_exit=True)], [0x123457])
+        self.assertEqual(table[0].severity.get_byte_as_int(), 0x80)
+        self.assertEqual(table[0].functional_unit, 0x99)
+
     def test_dtc_duplicate(self):
         self.wait_request_and_respond(b'\x59\x08\xFB\x80\x99\x12\x34\x56\x20\x40\x88\x12\x34\x56\x60')
 
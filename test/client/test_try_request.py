@@ -0,0 +1,149 @@
+from udsoncan.client import AsyncClient, Outcome
+from udsoncan.connections import AsyncQueueConnection
+from udsoncan.exceptions import *
+from udsoncan import Request, services
+from test.ClientServerTest import ClientServerTest
+from test.UdsTest import UdsTest
+
+import asyncio
+
+
+class TestTryRequest(ClientServerTest):
+    def __init__(self, *args, **kwargs):
+        ClientServerTest.__init__(self, *args, **kwargs)
+
+    def postClientSetUp(self):
+        self.udsclient.config["data_identifiers"] = {
+            0x1234: '>H'
+        }
+
+    def make_rdbi_request(self, did):
+        return Request(services.ReadDataByIdentifier, data=did.to_bytes(2, 'big'))
+
+    def test_positive(self):
+        request = self.conn.touserqueue.get(timeout=0.2)
+        self.assertEqual(request, b"\x22\x12\x34")
+        self.conn.fromuserqueue.put(b"\x62\x12\x34\x00\x01")
+
+    def _test_positive(self):
+        outcome = self.udsclient.try_request(self.make_rdbi_request(0x1234))
+        self.assertIsInstance(outcome, Outcome)
+        self.assertTrue(outcome)
+        self.assertTrue(outcome.positive)
+        self.assertEqual(outcome.status, Outcome.POSITIVE)
+        self.assertEqual(outcome.code, 0)
+        self.assertEqual(outcome.response.data, b"\x12\x34\x00\x01")
+
+    def test_negative(self):
+        self.wait_request_and_respond(b"\x7F\x22\x31")
+
+    def _test_negative(self):
+        with self.assertLogs(self.udsclient.logger, level='INFO') as logs:
+            outcome = self.udsclient.try_request(self.make_rdbi_request(0x1234))
+            self.udsclient.logger.info('done')
+        self.assertEqual(logs.output, ['INFO:%s:done' % self.udsclient.logger.name])  # Nothing logged by the request
+        self.assertFalse(outcome)
+        self.assertEqual(outcome.status, Outcome.NEGATIVE)
+        self.assertEqual(outcome.code, 0x31)
+        self.assertFalse(outcome.response.positive)
+
+    def test_negative_probe_not_logged(self):
+        self.wait_request_and_respond(b"\x7F\x22\x12")    # Not a negative response of ReadDataByIdentifier
+        self.wait_request_and_respond(b"\x7F\x22\xFE")    # Unknown code
+
+    def _test_negative_probe_not_logged(self):
+        with self.assertLogs(self.udsclient.logger, level='DEBUG') as logs:
+            outcome1 = self.udsclient.try_request(self.make_rdbi_request(0x1234))
+            outcome2 = self.udsclient.try_request(self.make_rdbi_request(0x1234))
+            self.udsclient.logger.debug('done')
+        self.assertEqual(logs.output, ['DEBUG:%s:done' % self.udsclient.logger.name])
+        self.assertEqual(outcome1.code, 0x12)
+        self.assertEqual(outcome2.code, 0xFE)
+
+    def test_negative_after_pending(self):
+        self.wait_request_and_respond(b"\x7F\x22\x78")
+        self.conn.fromuserqueue.put(b"\x7F\x22\x31")
+
+    def _test_negative_after_pending(self):
+        outcome = self.udsclient.try_request(self.make_rdbi_request(0x1234))
+        self.assertEqual(outcome.status, Outcome.NEGATIVE)
+        self.assertEqual(outcome.code, 0x31)
+
+    def test_timeout(self):
+        pass
+
+    def _test_timeout(self):
+        outcome = self.udsclient.try_request(self.make_rdbi_request(0x1234), timeout=0.1)
+        self.assertEqual(outcome.status, Outcome.TIMEOUT)
+        self.assertIsNone(outcome.response)
+        self.assertIsNone(outcome.code)
+
+    def test_invalid(self):
+        self.wait_request_and_respond(b"\x7F\x22")
+
+    def _test_invalid(self):
+        outcome = self.udsclient.try_request(self.make_rdbi_request(0x1234))
+        self.assertEqual(outcome.status, Outcome.INVALID)
+        self.assertFalse(outcome.response.valid)
+
+    def test_unexpected(self):
+        self.wait_request_and_respond(b"\x7E\x00")
+
+    def _test_unexpected(self):
+        outcome = self.udsclient.try_request(self.make_rdbi_request(0x1234))
+        self.assertEqual(outcome.status, Outcome.UNEXPECTED)
+        self.assertTrue(outcome.response.unexpected)
+
+    def test_prepared(self):
+        self.wait_request_and_respond(b"\x62\x12\x34\x00\x01")
+
+    def _test_prepared(self):
+        outcome = self.udsclient.try_request(self.udsclient.prepare('read_data_by_identifier', 0x1234))
+        self.assertTrue(outcome)
+        self.assertEqual(outcome.response.service_data.values[0x1234], (1,))
+
+    def test_prepared_unexpected(self):
+        self.wait_request_and_respond(b"\x62\x12\x35\x00\x01")
+
+    def _test_prepared_unexpected(self):
+        self.udsclient.config["data_identifiers"][0x1235] = '>H'
+        outcome = self.udsclient.try_request(self.udsclient.prepare('read_data_by_identifier', 0x1234))
+        self.assertEqual(outcome.status, Outcome.UNEXPECTED)
+
+    def test_prepared_invalid(self):
+        self.wait_request_and_respond(b"\x62\x12\x34\x00")
+
+    def _test_prepared_invalid(self):
+        outcome = self.udsclient.try_request(self.udsclient.prepare('read_data_by_identifier', 0x1234))
+        self.assertEqual(outcome.status, Outcome.INVALID)
+        self.assertFalse(outcome.response.valid)
+
+    def test_suppress_positive_response(self):
+        request = self.conn.touserqueue.get(timeout=0.2)
+        self.assertEqual(request, b"\x3E\x80")
+        self.conn.fromuserqueue.put('wait')  # Syncronize
+
+    def _test_suppress_positive_response(self):
+        with self.udsclient.suppress_positive_response:
+            outcome = self.udsclient.try_request(services.TesterPresent.make_request())
+        self.assertTrue(outcome)
+        self.assertIsNone(outcome.response)
+        self.conn.fromuserqueue.get(timeout=0.2)  # Avoid closing connection prematurely
+
+
+class TestAsyncTryRequest(UdsTest):
+
+    def test_negative(self):
+        async def run():
+            conn = AsyncQueueConnection(name='unittest')
+            client = AsyncClient(conn, request_timeout=0.5)
+            async with client:
+                call = asyncio.ensure_future(client.try_request(Request(services.ReadDataByIdentifier, data=b'\x12\x34')))
+                request = await asyncio.wait_for(conn.touserqueue.get(), 1)
+                self.assertEqual(request, b'\x22\x12\x34')
+                await conn.fromuserqueue.put(b'\x7F\x22\x31')
+                return await call
+
+        outcome = asyncio.run(run())
+        self.assertEqual(outcome.status, Outcome.NEGATIVE)
+        self.assertEqual(outcome.code, 0x31)
@@ -0,0 +1,68 @@
+from benchmarks import harness, run
+from test.UdsTest import UdsTest
+
+import io
+import json
+import os
+import shutil
+import tempfile
+
+
+class TestBenchmarkHarness(UdsTest):
+
+    def setUp(self):
+        self.tempdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tempdir)
+
+    def test_time_and_teardown(self):
+        calls = []
+
+        def factory(n):
+            calls.append('setup')
+            yield lambda: sum(range(n))
+            calls.append('teardown')
+
+        result = harness.Benchmark('sum[10]', 'time', factory, 10, has_param=True).run(min_time=0.001, repeat=3)
+        self.assertEqual(calls, ['setup', 'teardown'])
+        self.assertEqual(result['kind'], 'time')
+        self.assertEqual(result['repeat'], 3)
+        self.assertGreater(result['loops'], 0)
+        self.assertLessEqual(result['min'], result['median'])
+
+    def test_memory(self):
+        result = harness.Benchmark('list', 'memory', lambda: lambda: [object() for i in range(1000)]).run()
+        self.assertEqual(result['items'], 1000)
+        self.assertGreater(result['retained_bytes'], 1000 * 16)
+        self.assertGreaterEqual(result['peak_bytes'], result['retained_bytes'])
+
+    def test_suites_registered(self):
+        run.load_suites()
+        names = [bench.name for bench in harness.get_benchmarks()]
+        self.assertIn('services.ReadDataByIdentifier.interpret_response', names)
+        self.assertIn('dtc.parse[10000]', names)
+        self.assertIn('client.queue_read_data_by_identifier', names)
+        self.assertEqual(len(names), len(set(names)))
+        self.assertEqual([bench.name for bench in harness.get_benchmarks(['dtc.memory[*'])], ['dtc.memory[10]', 'dtc.memory[1000]', 'dtc.memory[10000]'])
+
+    def test_save_and_compare(self):
+        benchmarks = [harness.Benchmark('a', 'time', lambda: lambda: None), harness.Benchmark('b', 'memory', lambda: lambda: bytearray(1000))]
+        out = io.StringIO()
+        results = harness.run_benchmarks(benchmarks, min_time=0.001, repeat=2, out=out)
+        self.assertEqual(len(out.getvalue().splitlines()), 2)
+        filename = os.path.join(self.tempdir, 'results.json')
+        harness.save_results(results, filename)
+        loaded = harness.load_results(filename)
+        self.assertEqual(loaded['benchmarks'].keys(), {'a', 'b'})
+
+        slower = json.loads(json.dumps(loaded))
+        slower['benchmarks']['a']['median'] *= 2
+        rows = {row[0]: row for row in harness.compare_results(loaded, slower)}
+        self.assertEqual(rows['a'][4], 'regression')
+        self.assertEqual(rows['b'][4], '')
+
+        with open(filename, 'w') as f:
+            json.dump({'hello': 1}, f)
+        with self.assertRaises(ValueError):
+            harness.load_results(filename)
@@ -0,0 +1,191 @@
+from udsoncan.capture import CaptureReader, CaptureRecord, CaptureWriter
+from udsoncan.client import Client
+from udsoncan.connections import QueueConnection, RecorderConnection, ReplayConnection
+from udsoncan.exceptions import *
+from test.UdsTest import UdsTest
+
+import os
+import shutil
+import tempfile
+import threading
+import time
+
+
+class TestCapture(UdsTest):
+
+    def setUp(self):
+        self.tempdir = tempfile.mkdtemp()
+        self.filename = os.path.join(self.tempdir, 'capture.bin')
+
+    def tearDown(self):
+        shutil.rmtree(self.tempdir)
+
+    def make_records(self, count):
+        return [CaptureRecord(1000.0 + i, i % 2, bytes([i & 0xFF]) * (i % 7)) for i in range(count)]
+
+    def write(self, records, **kwargs):
+        with CaptureWriter(self.filename, **kwargs) as writer:
+            for record in records:
+                writer.write(record.direction, record.payload, timestamp=record.timestamp)
+        return writer
+
+    def test_write_read(self):
+        for compress in [False, True]:
+            records = self.make_records(100)
+            writer = self.write(records, compress=compress, records_per_block=16)
+            self.assertEqual(writer.record_count, 100)
+            with CaptureReader(self.filename) as reader:
+                self.assertEqual(reader.compressed, compress)
+                self.assertEqual(len(reader), 100)
+                self.assertEqual(reader.block_count, 7)
+                self.assertEqual(list(reader), records)
+                self.assertIsInstance(reader[1].payload, bytes)
+
+    def test_empty(self):
+        self.write([])
+        with CaptureReader(self.filename) as reader:
+            self.assertEqual(len(reader), 0)
+            self.assertEqual(list(reader), [])
+
+    def test_seek(self):
+        records = self.make_records(100)
+        self.write(records, records_per_block=10)
+        with CaptureReader(self.filename) as reader:
+            self.assertEqual(reader[0], records[0])
+            self.assertEqual(reader[55], records[55])
+            self.assertEqual(reader[-1], records[-1])
+            with self.assertRaises(IndexError):
+                reader[100]
+            self.assertEqual(list(reader.records(start=95)), records[95:])
+            self.assertEqual(list(reader.records(start_time=1042.5)), records[43:])
+            self.assertEqual(list(reader.records(start_time=1042, end_time=1050)), records[42:51])
+            self.assertEqual(list(reader.records(start_time=2000)), [])
+
+    def test_unclosed_capture(self):
+        records = self.make_records(50)
+        writer = CaptureWriter(self.filename, records_per_block=8, compress=True)
+        for record in records:
+            writer.write(record.direction, record.payload, timestamp=record.timestamp)
+        writer.flush()
+        with open(self.filename, 'rb') as f:
+            data = f.read()
+        writer.close()
+
+        with open(self.filename, 'wb') as f:
+            f.write(data + b'\x10\x00')   # Incomplete block header at the end
+        with CaptureReader(self.filename) as reader:
+            self.assertEqual(len(reader), 50)
+            self.assertEqual(list(reader), records)
+            self.assertEqual(list(reader.records(start=41)), records[41:])
+
+    def test_not_a_capture(self):
+        with open(self.filename, 'wb') as f:
+            f.write(b'Hello, World!')
+        with self.assertRaises(ValueError):
+            CaptureReader(self.filename)
+
+        with open(self.filename, 'wb') as f:
+            pass
+        with self.assertRaises(ValueError):
+            CaptureReader(self.filename)
+
+    def test_recorder_connection(self):
+        conn = QueueConnection(name='unittest')
+
+        def server():
+            conn.touserqueue.get(timeout=1)
+            conn.fromuserqueue.put(b'\x7F\x22\x78')
+            conn.fromuserqueue.put(b'\x62\x12\x34\x00\x01')
+
+        thread = threading.Thread(target=server)
+        thread.start()
+        recorder = RecorderConnection(conn, self.filename, compress=True)
+        with Client(recorder, request_timeout=1, config={'data_identifiers': {0x1234: '>H'}}) as client:
+            response = client.read_data_by_identifier(0x1234)
+        thread.join()
+        self.assertEqual(response.service_data.values[0x1234], (1,))
+        self.assertFalse(recorder.is_open())
+
+        with CaptureReader(self.filename) as reader:
+            records = list(reader)
+        self.assertEqual([(record.direction, record.payload) for record in records], [
+            (CaptureRecord.TX, b'\x22\x12\x34'),
+            (CaptureRecord.RX, b'\x7F\x22\x78'),
+            (CaptureRecord.RX, b'\x62\x12\x34\x00\x01')
+        ])
+        self.assertTrue(records[0].timestamp <= records[1].timestamp <= records[2].timestamp)
+
+
+class TestReplayConnection(UdsTest):
+
+    def make_trace(self):
+        return [
+            CaptureRecord(10.0, CaptureRecord.RX, b'\x62\xF2\x00\x00'),     # Ignored, before the first request
+            CaptureRecord(10.0, CaptureRecord.TX, b'\x22\x12\x34'),
+            CaptureRecord(10.01, CaptureRecord.RX, b'\x62\x12\x34\x00\x01'),
+            CaptureRecord(11.0, CaptureRecord.TX, b'\x22\x12\x34'),
+            CaptureRecord(11.02, CaptureRecord.RX, b'\x7F\x22\x78'),
+            CaptureRecord(11.1, CaptureRecord.RX, b'\x62\x12\x34\x00\x02'),
+            CaptureRecord(12.0, CaptureRecord.TX, b'\x3E\x00'),
+        ]
+
+    def make_client(self, conn):
+        return Client(conn, request_timeout=1, config={'data_identifiers': {0x1234: '>H'}})
+
+    def test_replay(self):
+        conn = ReplayConnection(self.make_trace())
+        self.assertEqual(conn.request_count, 3)
+        with self.make_client(conn) as client:
+            self.assertEqual(client.read_data_by_identifier(0x1234).service_data.values[0x1234], (1,))
+            self.assertEqual(client.read_data_by_identifier(0x1234).service_data.values[0x1234], (2,))   # After NRC 0x78
+            with self.assertRaises(TimeoutException):   # No response recorded
+                client.tester_present()
+            with self.assertRaises(ValueError):   # End of trace
+                client.tester_present()
+
+            conn.rewind()
+            self.assertEqual(client.read_data_by_identifier(0x1234).service_data.values[0x1234], (1,))
+
+    def test_mismatch(self):
+        conn = ReplayConnection(self.make_trace())
+        with self.make_client(conn) as client:
+            with self.assertRaises(ValueError):
+                client.tester_present()
+
+        conn = ReplayConnection(self.make_trace(), check_requests=False)
+        with self.make_client(conn) as client:
+            response = client.read_data_by_identifier(0x1234)
+        self.assertEqual(response.service_data.values[0x1234], (1,))
+
+    def test_loop(self):
+        conn = ReplayConnection(self.make_trace()[:3], loop=True)
+        with self.make_client(conn) as client:
+            for i in range(5):
+                client.read_data_by_identifier(0x1234)
+        self.assertEqual(conn.position, 1)
+
+    def test_realtime(self):
+        conn = ReplayConnection(self.make_trace(), realtime=True)
+        with self.make_client(conn) as client:
+            client.read_data_by_identifier(0x1234)
+            t1 = time.monotonic()
+            client.read_data_by_identifier(0x1234)
+            self.assertGreaterEqual(time.monotonic() - t1, 0.09)
+
+            t1 = time.monotonic()
+            with self.assertRaises(TimeoutException):
+                client.send_request(client.prepare('tester_present').request, timeout=0.1)
+            self.assertGreaterEqual(time.monotonic() - t1, 0.09)
+
+    def test_from_capture_file(self):
+        tempdir = tempfile.mkdtemp()
+        try:
+            filename = os.path.join(tempdir, 'capture.bin')
+            with CaptureWriter(filename) as writer:
+                for record in self.make_trace():
+                    writer.write(record.direction, record.payload, timestamp=record.timestamp)
+
+            with self.make_client(ReplayConnection(filename)) as client:
+                self.assertEqual(client.read_data_by_identifier(0x1234).service_data.values[0x1234], (1,))
+        finally:
+            shutil.rmtree(tempdir)
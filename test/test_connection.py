@@ -1,9 +1,13 @@
 from test.UdsTest import UdsTest
 from udsoncan.connections import *
+import binascii
+import logging
+import queue
 import socket
 import threading
 import time
 import unittest
+from unittest import mock
 
 try:
     import isotp
@@ -24,6 +28,13 @@ except Exception as e:
     _STACK_UNVAILABLE_REASON = str(e)
     _STACK_POSSIBLE = False
 
+try:
+    import isotp
+    import can
+    _SHARED_BUS_POSSIBLE = True
+except ImportError:
+    _SHARED_BUS_POSSIBLE = False
+
 try:
     from aioisotp.sync import SyncISOTPNetwork
     _AISOTP_POSSIBLE = True
@@ -125,6 +136,254 @@ class TestSocketConnection(UdsTest):
                 payload2 = conn2.wait_frame(timeout=1, exception=True)
                 self.assertEqual(payload1, payload2)
 
+    def test_close_does_not_wait_for_poll(self):
+        conn = SocketConnection(self.sock1, name='unittest')
+        conn.open()
+        time.sleep(0.05)    # Let the reception thread block on its selector
+        t1 = time.monotonic()
+        conn.close()
+        self.assertLess(time.monotonic() - t1, 0.1)
+        self.assertFalse(conn.rxthread.is_alive())
+
+    def test_reopen(self):
+        conn1 = SocketConnection(self.sock1, name='unittest')
+        conn2 = SocketConnection(self.sock2, name='unittest')
+        conn1.open()
+        conn1.close()
+        with conn1.open():
+            with conn2.open():
+                conn2.send(b"\x11\x22")
+                self.assertEqual(conn1.wait_frame(timeout=1, exception=True), b"\x11\x22")
+
+
+class TestSocketConnectionDirect(UdsTest):
+    def setUp(self):
+        self.sock1, self.sock2 = socket.socketpair()
+
+    def tearDown(self):
+        self.sock1.close()
+        self.sock2.close()
+
+    def test_no_thread(self):
+        thread_count = threading.active_count()
+        with SocketConnection(self.sock1, name='unittest', direct=True).open() as conn:
+            self.assertEqual(threading.active_count(), thread_count)
+            self.assertIsNone(conn.rxthread)
+            self.sock2.send(b'\x01\x02\x03')
+            frame = conn.wait_frame(timeout=1, exception=True)
+            self.assertIsInstance(frame, memoryview)
+            self.assertEqual(frame, b'\x01\x02\x03')
+            conn.send(b'\x04\x05')
+            self.assertEqual(self.sock2.recv(100), b'\x04\x05')
+
+    def test_timeout(self):
+        self.sock1.settimeout(5)
+        with SocketConnection(self.sock1, name='unittest', direct=True).open() as conn:
+            t1 = time.monotonic()
+            with self.assertRaises(TimeoutException):
+                conn.wait_frame(timeout=0.05, exception=True)
+            self.assertLess(time.monotonic() - t1, 1)
+            self.assertIsNone(conn.wait_frame(timeout=0))
+        self.assertEqual(self.sock1.gettimeout(), 5)    # Restored on close
+
+    def test_send_after_zero_timeout(self):
+        # A zero timeout must not leave the socket non-blocking. A send() filling the socket buffer would raise BlockingIOError
+        with SocketConnection(self.sock1, name='unittest', direct=True).open() as conn:
+            self.assertIsNone(conn.wait_frame(timeout=0))
+            self.sock2.send(b'\x01\x02')
+            time.sleep(0.01)
+            self.assertEqual(conn.wait_frame(timeout=0), b'\x01\x02')
+            self.assertNotEqual(self.sock1.gettimeout(), 0)
+
+            received = []
+            def read_all():
+                while sum(len(x) for x in received) < 1000000:
+                    received.append(self.sock2.recv(65536))
+            thread = threading.Thread(target=read_all, daemon=True)
+            thread.start()
+            conn.send(b'\x03' * 1000000)
+            thread.join(timeout=5)
+            self.assertEqual(sum(len(x) for x in received), 1000000)
+
+    def test_empty_rxqueue(self):
+        with SocketConnection(self.sock1, name='unittest', direct=True).open() as conn:
+            self.sock2.send(b'\x01' * 1000)
+            time.sleep(0.01)
+            conn.empty_rxqueue()
+            self.assertIsNone(conn.wait_frame(timeout=0.01))
+            self.sock2.send(b'\x02')
+            self.assertEqual(conn.wait_frame(timeout=1), b'\x02')
+
+    def test_peer_closed(self):
+        with SocketConnection(self.sock1, name='unittest', direct=True).open() as conn:
+            self.sock2.close()
+            with self.assertRaises(ConnectionError):
+                conn.wait_frame(timeout=1, exception=True)
+
+    def test_client(self):
+        from udsoncan.client import Client
+        from udsoncan.server import Server
+        server = Server(didconfig={0x1234: '>H'}, dids={0x1234: 0x55AA})
+        server_conn = SocketConnection(self.sock2, name='unittest_server')
+        server.start(server_conn)
+        try:
+            with Client(SocketConnection(self.sock1, name='unittest', direct=True), request_timeout=1,
+                        config={'data_identifiers': {0x1234: '>H'}}) as client:
+                for i in range(10):
+                    self.assertEqual(client.read_data_by_identifier_first(0x1234), (0x55AA,))
+        finally:
+            server.stop()
+            server_conn.close()
+
+    def test_client_responses_not_overwritten(self):
+        # The frames are received in a reused buffer. The responses given by the client must not change with the next frames
+        from udsoncan.client import Client
+        from udsoncan.server import Server
+        server = Server()
+        server_conn = SocketConnection(self.sock2, name='unittest_server')
+        server.start(server_conn)
+        try:
+            with Client(SocketConnection(self.sock1, name='unittest', direct=True), request_timeout=1) as client:
+                response1 = client.change_session(1)
+                response2 = client.change_session(3)
+        finally:
+            server.stop()
+            server_conn.close()
+        self.assertEqual(bytes(response1.original_payload[0:2]), b'\x50\x01')
+        self.assertEqual(bytes(response2.original_payload[0:2]), b'\x50\x03')
+        self.assertEqual(response1.service_data.session_echo, 1)
+
+    def test_no_reactor(self):
+        with self.assertRaises(ValueError):
+            SocketConnection(self.sock1, reactor=SocketReactor(), direct=True)
+
+
+class TestSocketReactor(UdsTest):
+    def setUp(self):
+        self.reactor = SocketReactor(name='unittest')
+        self.socks = []
+
+    def make_pair(self):
+        sock1, sock2 = socket.socketpair()
+        self.socks += [sock1, sock2]
+        return (SocketConnection(sock1, name='unittest', reactor=self.reactor), sock2)
+
+    def test_single_thread(self):
+        thread_count = threading.active_count()
+        pairs = [self.make_pair() for i in range(50)]
+        for conn, peer in pairs:
+            conn.open()
+        self.assertEqual(threading.active_count(), thread_count + 1)
+        self.assertEqual(self.reactor.connection_count, 50)
+
+        for i, (conn, peer) in enumerate(pairs):
+            peer.send(bytes([i]))
+        for i, (conn, peer) in enumerate(pairs):
+            self.assertEqual(conn.wait_frame(timeout=1, exception=True), bytes([i]))
+            conn.send(b'\x12\x34')
+            self.assertEqual(peer.recv(100), b'\x12\x34')
+
+        for conn, peer in pairs:
+            conn.close()
+            self.assertFalse(conn.is_open())
+        self.assertEqual(self.reactor.connection_count, 0)
+        self.reactor.close()
+        self.assertIsNone(self.reactor.rxthread)
+        self.assertEqual(threading.active_count(), thread_count)
+
+    def test_close_unregisters(self):
+        conn1, peer1 = self.make_pair()
+        conn2, peer2 = self.make_pair()
+        conn1.open()
+        conn2.open()
+        time.sleep(0.05)    # Let the reactor thread block on its selector
+        t1 = time.monotonic()
+        conn1.close()
+        self.assertLess(time.monotonic() - t1, 0.1)
+        peer1.send(b'\x01')
+        peer2.send(b'\x02')
+        self.assertEqual(conn2.wait_frame(timeout=1, exception=True), b'\x02')
+        self.assertTrue(conn1.rxqueue.empty())
+
+        with conn1.open():  # Reopen
+            self.assertEqual(conn1.wait_frame(timeout=1, exception=True), b'\x01')
+
+    def test_peer_closed(self):
+        conn1, peer1 = self.make_pair()
+        conn2, peer2 = self.make_pair()
+        with conn1.open(), conn2.open():
+            peer1.close()
+            time.sleep(0.05)
+            peer2.send(b'\x02')
+            self.assertEqual(conn2.wait_frame(timeout=1, exception=True), b'\x02')
+            with self.assertRaises(TimeoutException):
+                conn1.wait_frame(timeout=0.05, exception=True)
+
+    def tearDown(self):
+        self.reactor.close()
+        for sock in self.socks:
+            sock.close()
+
+
+class FakeJ2534Interface:
+    def __init__(self):
+        self.rx_batches = queue.Queue()
+        self.written = []
+        self.read_calls = 0
+
+    def PassThruReadMsgsBatch(self, ChannelID, protocol, pNumMsgs=16, Timeout=20):
+        self.read_calls += 1
+        try:
+            messages = self.rx_batches.get(timeout=Timeout / 1000)
+        except queue.Empty:
+            messages = []
+        return 0, messages[:pNumMsgs]
+
+    def PassThruWriteMsgs(self, ChannelID, Data, protocol, pNumMsgs=1, Timeout=1000):
+        self.written.append(bytes(Data))
+        return 0
+
+    def PassThruDisconnect(self, ChannelID):
+        return 0
+
+    def PassThruClose(self, DeviceID):
+        return 0
+
+
+class TestJ2534ConnectionThreads(UdsTest):
+    # Exercises the reception thread without a J2534 DLL by bypassing the constructor
+    def setUp(self):
+        self.conn = J2534Connection.__new__(J2534Connection)
+        BaseConnection.__init__(self.conn, 'unittest')
+        self.conn.interface = FakeJ2534Interface()
+        self.conn.protocol = mock.Mock(value=6)
+        self.conn.channelID = 1
+        self.conn.devID = 1
+        self.conn.debug = False
+        self.conn.rx_batch_size = 4
+        self.conn.rx_read_timeout = 0.05
+        self.conn.rxqueue = queue.Queue()
+        self.conn.result = 0
+        self.conn.log_last_operation = lambda *args, **kwargs: None
+        self.conn.open()
+
+    def tearDown(self):
+        self.conn.close()
+
+    def test_batched_read(self):
+        self.conn.interface.rx_batches.put([b'\x01', b'\x02', b'\x03'])
+        self.assertEqual(self.conn.wait_frame(timeout=1), b'\x01')
+        self.assertEqual(self.conn.wait_frame(timeout=1), b'\x02')
+        self.assertEqual(self.conn.wait_frame(timeout=1), b'\x03')
+
+    def test_send_not_starved_by_reads(self):
+        time.sleep(0.02)
+        for i in range(5):
+            t1 = time.monotonic()
+            self.conn.send(bytes([i]))
+            self.assertLess(time.monotonic() - t1, self.conn.rx_read_timeout + 0.04)   # At most one read in progress
+        self.assertEqual(self.conn.interface.written, [b'\x00', b'\x01', b'\x02', b'\x03', b'\x04'])
+
 
 class TestSocketConnectionBlocking(UdsTest):
     def server_sock_thread_task(self):
@@ -198,6 +457,35 @@ class TestQueueConnection(UdsTest):
         frame = self.conn.touserqueue.get()
         self.assertEqual(frame, payload)
 
+    def test_send_buffers(self):
+        # The queued frames are bytes copies. Reusing the buffer after send() does not change them
+        buffer = bytearray(b"\x00\x01\x02\x03")
+        self.conn.send(buffer)
+        self.conn.send(memoryview(buffer)[1:3])
+        buffer[1] = 0xFF
+        frame = self.conn.touserqueue.get()
+        self.assertIsInstance(frame, bytes)
+        self.assertEqual(frame, b"\x00\x01\x02\x03")
+        frame = self.conn.touserqueue.get()
+        self.assertIsInstance(frame, bytes)
+        self.assertEqual(frame, b"\x01\x02")
+
+    def test_hex_formatted_only_for_debug(self):
+        payload = b"\x00\x01\x02\x03"
+        with mock.patch('binascii.hexlify', wraps=binascii.hexlify) as hexlify:
+            self.conn.logger.setLevel(logging.INFO)
+            self.conn.send(payload)
+            self.conn.fromuserqueue.put(payload)
+            self.conn.wait_frame()
+            self.assertEqual(hexlify.call_count, 0)
+
+            self.conn.logger.setLevel(logging.DEBUG)
+            self.conn.send(payload)
+            self.conn.fromuserqueue.put(payload)
+            self.conn.wait_frame()
+            self.assertEqual(hexlify.call_count, 2)
+        self.conn.logger.setLevel(logging.NOTSET)
+
     def test_truncate(self):
         payload = b"\x00\x01\x02\x03" * 5000
         self.conn.send(payload)
@@ -278,6 +566,75 @@ class TestPythonIsoTpConnection(UdsTest):
         self.vcan0_bus.shutdown()
 
 
+@unittest.skipIf(_SHARED_BUS_POSSIBLE == False, 'Cannot test SharedCanBus. python-can and isotp must be installed')
+class TestSharedCanBus(UdsTest):
+    def setUp(self):
+        channel = 'udsoncan_unittest_%d' % id(self)
+        self.tester_bus = can.Bus(interface='virtual', channel=channel)
+        self.ecu_bus = can.Bus(interface='virtual', channel=channel)
+        self.tester = SharedCanBus(self.tester_bus, name='tester')
+        self.ecus = SharedCanBus(self.ecu_bus, name='ecus')
+        self.servers = []
+
+    def make_address(self, i, ecu_side=False):
+        txid, rxid = 0x700 + i, 0x780 + i
+        if ecu_side:
+            txid, rxid = rxid, txid
+        return isotp.Address(isotp.AddressingMode.Normal_11bits, txid=txid, rxid=rxid)
+
+    def start_servers(self, count):
+        from udsoncan.server import Server
+        for i in range(count):
+            server = Server(didconfig={0xF190: '>20s'}, dids={0xF190: (('ECU %02d' % i).encode('ascii').ljust(20, b'.'),)})
+            server.start(self.ecus.connection(self.make_address(i, ecu_side=True), name='ecu%d' % i).open())
+            self.servers.append(server)
+
+    def test_single_thread_for_all_connections(self):
+        from udsoncan.client import Client
+        count = 10
+        self.start_servers(count)
+        thread_count = threading.active_count()
+        conns = [self.tester.connection(self.make_address(i), name='unittest%d' % i) for i in range(count)]
+        for conn in conns:
+            conn.open()
+        self.assertEqual(threading.active_count(), thread_count + 1)
+        self.assertEqual(self.tester.connection_count, count)
+
+        for i, conn in enumerate(conns):    # 20 bytes responses, sent in multiple CAN frames
+            client = Client(conn, request_timeout=2, config={'data_identifiers': {0xF190: '>20s'}})
+            self.assertEqual(client.read_data_by_identifier_first(0xF190), (('ECU %02d' % i).encode('ascii').ljust(20, b'.'),))
+
+        for conn in conns:
+            conn.close()
+        self.assertEqual(self.tester.connection_count, 0)
+        self.assertIsNone(self.tester.rxthread)
+        self.assertEqual(threading.active_count(), thread_count)
+
+    def test_routing(self):
+        conn = self.tester.connection(self.make_address(1), name='unittest').open()
+        try:
+            self.ecu_bus.send(can.Message(arbitration_id=0x782, data=b'\x02\x7E\x00', is_extended_id=False))   # Other server
+            self.ecu_bus.send(can.Message(arbitration_id=0x781, data=b'\x03\x01\x02\x03', is_extended_id=False))
+            self.assertEqual(conn.wait_frame(timeout=1), b'\x01\x02\x03')
+            with self.assertRaises(TimeoutException):
+                conn.wait_frame(timeout=0.1, exception=True)
+
+            conn.send(b'\x3E\x00')
+            msg = self.ecu_bus.recv(1)
+            self.assertEqual(msg.arbitration_id, 0x701)
+            self.assertEqual(bytes(msg.data[0:3]), b'\x02\x3E\x00')
+        finally:
+            conn.close()
+
+    def tearDown(self):
+        for server in self.servers:
+            server.stop()
+        for conn in list(self.ecus._connections):
+            conn.close()
+        self.tester_bus.shutdown()
+        self.ecu_bus.shutdown()
+
+
 @unittest.skipIf(_AISOTP_POSSIBLE == False, "aisotp module is not present.")
 class TestSyncAioIsotpConnection(UdsTest):
 
@@ -0,0 +1,149 @@
+from udsoncan import Dtc, DtcTable, Response
+from udsoncan.services import ReadDTCInformation
+from udsoncan.exceptions import *
+from test.UdsTest import UdsTest
+
+import random
+import sys
+from unittest import mock
+
+
+class TestDtcTable(UdsTest):
+
+    def make_table(self):
+        data = b'\x12\x34\x56\x09\x12\x34\x57\x08\x00\x00\x00\x00\xAB\xCD\xEF\x01'
+        return DtcTable.from_records(data)
+
+    def test_from_records(self):
+        table = self.make_table()
+        self.assertEqual(len(table), 3)
+        self.assertEqual(list(table.ids), [0x123456, 0x123457, 0xABCDEF])
+        self.assertEqual(list(table.status), [0x09, 0x08, 0x01])
+        self.assertFalse(table.has_severity)
+
+        table = DtcTable.from_records(b'\x12\x34\x56\x09\x00\x00\x00\x00', ignore_all_zero_dtc=False)
+        self.assertEqual(list(table.ids), [0x123456, 0])
+
+        with self.assertRaises(ValueError):
+            DtcTable.from_records(b'\x12\x34\x56')
+
+    def test_from_records_with_severity(self):
+        data = b'\x80\x99\x12\x34\x56\x20\x00\x00\x00\x00\x00\x00\x40\x88\x12\x34\x57\x60'
+        table = DtcTable.from_records(data, with_severity=True)
+        self.assertTrue(table.has_severity)
+        self.assertEqual(list(table.ids), [0x123456, 0x123457])
+        self.assertEqual(list(table.status), [0x20, 0x60])
+        self.assertEqual(list(table.severity), [0x80, 0x40])
+        self.assertEqual(list(table.functional_unit), [0x99, 0x88])
+
+        self.assertEqual(len(DtcTable.from_records(b'\x00' * 6, with_severity=True)), 0)
+        self.assertEqual(len(DtcTable.from_records(b'', with_severity=True)), 0)
+
+        with self.assertRaises(ValueError):
+            DtcTable.from_records(data[:-2], with_severity=True)
+
+    def test_materialize(self):
+        table = self.make_table()
+        dtc = table[0]
+        self.assertIsInstance(dtc, Dtc)
+        self.assertEqual(dtc.id, 0x123456)
+        self.assertTrue(dtc.status.test_failed)
+        self.assertTrue(dtc.status.confirmed)
+        self.assertIsNone(dtc.functional_unit)
+        self.assertIsNot(table[0], dtc)   # Created on each access
+
+        self.assertEqual(table[-1].id, 0xABCDEF)
+        with self.assertRaises(IndexError):
+            table[3]
+
+        self.assertEqual([dtc.id for dtc in table], [0x123456, 0x123457, 0xABCDEF])
+        self.assertEqual([dtc.id for dtc in table.to_list()], [0x123456, 0x123457, 0xABCDEF])
+        self.assertEqual(list(table[1:].ids), [0x123457, 0xABCDEF])
+
+        self.assertIn(0x123457, table)
+        self.assertIn(Dtc(0x123457), table)
+        self.assertNotIn(0x111111, table)
+        self.assertEqual(table.index(0xABCDEF), 2)
+        self.assertEqual(table.get(0x123457).status.get_byte_as_int(), 0x08)
+        self.assertIsNone(table.get(0x111111))
+
+    def test_where(self):
+        table = self.make_table()
+        self.assertEqual(list(table.where(confirmed=True).ids), [0x123456, 0x123457])
+        self.assertEqual(list(table.where(confirmed=True, test_failed=False).ids), [0x123457])
+        self.assertEqual(list(table.where(test_failed=True).ids), [0x123456, 0xABCDEF])
+        self.assertEqual(list(table.where(status_mask=0x08).ids), [0x123456, 0x123457])
+        self.assertEqual(list(table.where(status_mask=Dtc.Status(test_failed=True)).ids), [0x123456, 0xABCDEF])
+        self.assertEqual(len(table.where(status_mask=0)), 0)
+        self.assertEqual(len(table.where()), 3)
+
+        table = DtcTable([0x111111, 0x222222], [0x00, 0x08])
+        self.assertEqual(list(table.where(confirmed=False).ids), [0x111111])
+
+        with self.assertRaises(ValueError):
+            table.where(not_a_flag=True)
+
+        with self.assertRaises(ValueError):
+            table.where(check_immediately=True)   # No severity
+
+    def test_where_severity(self):
+        data = b'\x80\x99\x12\x34\x56\x20\x40\x88\x12\x34\x57\x60\x20\x77\x12\x34\x58\x20'
+        table = DtcTable.from_records(data, with_severity=True)
+        self.assertEqual(list(table.where(check_immediately=True).ids), [0x123456])
+        self.assertEqual(list(table.where(severity_mask=0xC0).ids), [0x123456, 0x123457])
+        self.assertEqual(list(table.where(severity_mask=Dtc.Severity(maintenance_only=True), test_failed_since_last_clear=True).ids), [0x123458])
+        filtered = table.where(check_immediately=False)
+        self.assertEqual(list(filtered.functional_unit), [0x88, 0x77])
+
+    def test_constructor(self):
+        table = DtcTable([0x123456], [0x01], [0x80], [0x10])
+        self.assertEqual(table[0].severity.get_byte_as_int(), 0x80)
+
+        with self.assertRaises(ValueError):
+            DtcTable([0x123456], [])
+
+        with self.assertRaises(ValueError):
+            DtcTable([0x123456], [0x01], [0x80])
+
+        with self.assertRaises(ValueError):
+            DtcTable([0x123456], [0x01], [0x80], [])
+
+    def test_same_as_dtc_list(self):
+        rng = random.Random(0)
+        for subfunction, record_size in [(ReadDTCInformation.Subfunction.reportDTCByStatusMask, 4), (ReadDTCInformation.Subfunction.reportDTCBySeverityMaskRecord, 6)]:
+            records = b''.join(bytes(rng.randrange(256) for i in range(record_size)) for j in range(500))
+            payload = b'\x59' + bytes([subfunction, 0xFF]) + records + b'\x00' * record_size + b'\x00\x00'
+
+            dtc_list = ReadDTCInformation.interpret_response(Response.from_payload(payload), subfunction).service_data
+            dtc_table = ReadDTCInformation.interpret_response(Response.from_payload(payload), subfunction, dtc_table=True).service_data
+
+            self.assertEqual(dtc_table.dtcs, [])
+            self.assertEqual(dtc_table.dtc_count, dtc_list.dtc_count)
+            self.assertEqual(dtc_table.status_availability.get_byte_as_int(), 0xFF)
+            self.assertIsNone(dtc_list.dtc_table)
+            for dtc, expected in zip(dtc_table.dtc_table, dtc_list.dtcs):
+                self.assertEqual(dtc.id, expected.id)
+                self.assertEqual(dtc.status.get_byte_as_int(), expected.status.get_byte_as_int())
+                self.assertEqual(dtc.severity.get_byte_as_int(), expected.severity.get_byte_as_int())
+                self.assertEqual(dtc.functional_unit, expected.functional_unit)
+
+    def test_incomplete_record(self):
+        subfunction = ReadDTCInformation.Subfunction.reportDTCByStatusMask
+        with self.assertRaises(InvalidResponseException):
+            ReadDTCInformation.interpret_response(Response.from_payload(b'\x59\x02\xFF\x12\x34\x56\x20\x12'), subfunction, dtc_table=True)
+
+        with self.assertRaises(InvalidResponseException):
+            ReadDTCInformation.interpret_response(Response.from_payload(b'\x59\x02\xFF\x12\x34\x56\x20\x00'), subfunction, tolerate_zero_padding=False, dtc_table=True)
+
+        # Extra bytes are ignored for this subfunction, as with the list of Dtc
+        subfunction = ReadDTCInformation.Subfunction.reportSeverityInformationOfDTC
+        response = ReadDTCInformation.interpret_response(Response.from_payload(b'\x59\x09\xFB\x80\x99\x12\x34\x56\x20\x01'), subfunction, dtc_table=True)
+        self.assertEqual(list(response.service_data.dtc_table.ids), [0x123456])
+
+        with self.assertRaises(InvalidResponseException):
+            ReadDTCInformation.interpret_response(Response.from_payload(b'\x59\x09\xFB\x80\x99\x12'), subfunction, dtc_table=True)
+
+    def test_to_numpy_without_numpy(self):
+        with mock.patch.dict(sys.modules, {'numpy': None}):   # Makes the import fail even if numpy is installed
+            with self.assertRaisesRegex(ImportError, 'numpy must be installed'):
+                self.make_table().to_numpy()
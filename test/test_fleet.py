@@ -0,0 +1,205 @@
+from udsoncan.client import Client, AsyncClient
+from udsoncan.connections import QueueConnection, AsyncQueueConnection
+from udsoncan.fleet import ClientFleet, EcuResult
+from udsoncan.exceptions import *
+from test.UdsTest import UdsTest
+
+import asyncio
+import queue
+import threading
+import time
+
+
+class FakeEcu:
+    """Answers ReadDataByIdentifier 0xF190 on a QueueConnection after a delay"""
+
+    def __init__(self, conn, vin, delay=0, nrc=None):
+        self.conn = conn
+        self.response = b'\x62\xF1\x90' + vin if nrc is None else bytes([0x7F, 0x22, nrc])
+        self.delay = delay
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def run(self):
+        try:
+            self.conn.touserqueue.get(timeout=2)
+        except queue.Empty:
+            return
+        time.sleep(self.delay)
+        self.conn.fromuserqueue.put(self.response)
+
+
+class TestClientFleet(UdsTest):
+
+    def make_fleet(self, n, **kwargs):
+        members = {}
+        conns = {}
+        for i in range(n):
+            name = 'ecu%d' % i
+            conns[name] = QueueConnection(name=name)
+            config = {'data_identifiers': {0xF190: '4s'}, 'request_timeout': 1, 'logger_name': 'unittest'}
+            members[name] = (conns[name], config)
+        return ClientFleet(members, **kwargs), conns
+
+    def test_members(self):
+        conn = QueueConnection()
+        client = Client(QueueConnection())
+        fleet = ClientFleet({'a': (conn, None), 'b': client, 'c': (AsyncQueueConnection(), {})})
+        self.assertIs(fleet.clients['b'], client)
+        self.assertIs(fleet.clients['a'].conn, conn)
+        self.assertIsInstance(fleet.clients['c'], AsyncClient)
+        self.assertEqual(fleet.max_workers, 3)
+
+        with self.assertRaises(ValueError):
+            ClientFleet({'a': conn})
+
+        with self.assertRaises(ValueError):
+            ClientFleet({'a': client}, max_workers=0)
+
+    def test_run_service_concurrently(self):
+        fleet, conns = self.make_fleet(5)
+        for i, conn in enumerate(conns.values()):
+            FakeEcu(conn, b'VIN%d' % i, delay=0.2)
+
+        with fleet:
+            t1 = time.monotonic()
+            results = fleet.run('read_data_by_identifier_first', 0xF190)
+            elapsed = time.monotonic() - t1
+
+        self.assertEqual(list(results.keys()), ['ecu0', 'ecu1', 'ecu2', 'ecu3', 'ecu4'])
+        for i, (name, result) in enumerate(results.items()):
+            self.assertIsInstance(result, EcuResult)
+            self.assertTrue(result.success)
+            self.assertEqual(result.get(), (b'VIN%d' % i,))
+            self.assertGreaterEqual(result.duration, 0.2)
+        self.assertLess(elapsed, 0.8)   # Sequential would take 1 sec
+
+    def test_run_callable_with_exceptions(self):
+        fleet, conns = self.make_fleet(2)
+        FakeEcu(conns['ecu0'], b'ABCD')
+        FakeEcu(conns['ecu1'], b'', nrc=0x31)
+
+        def operation(client, did):
+            return client.read_data_by_identifier_first(did)
+
+        with fleet:
+            results = fleet.run(operation, 0xF190)
+
+        self.assertEqual(results['ecu0'].value, (b'ABCD',))
+        self.assertFalse(results['ecu1'].success)
+        self.assertIsInstance(results['ecu1'].exception, NegativeResponseException)
+        with self.assertRaises(NegativeResponseException):
+            results['ecu1'].get()
+
+    def test_ecu_timeout(self):
+        fleet, conns = self.make_fleet(2)
+        FakeEcu(conns['ecu0'], b'FAST')
+        FakeEcu(conns['ecu1'], b'SLOW', delay=0.5)
+
+        with fleet:
+            t1 = time.monotonic()
+            results = fleet.run('read_data_by_identifier_first', 0xF190, ecu_timeout=0.2)
+            elapsed = time.monotonic() - t1
+
+        self.assertTrue(results['ecu0'].success)
+        self.assertIsInstance(results['ecu1'].exception, TimeoutException)
+        self.assertLess(elapsed, 0.45)
+
+    def test_busy_after_timeout(self):
+        fleet, conns = self.make_fleet(2)
+        FakeEcu(conns['ecu0'], b'ABCD', delay=0.5)
+        FakeEcu(conns['ecu1'], b'EFGH')
+
+        with fleet:
+            results = fleet.run('read_data_by_identifier_first', 0xF190, ecu_timeout=0.2)
+            self.assertIsInstance(results['ecu0'].exception, TimeoutException)
+            self.assertTrue(results['ecu1'].success)
+
+            # ecu0 is still waiting for its response. It must not be given a second request
+            FakeEcu(conns['ecu1'], b'IJKL')
+            results = fleet.run('read_data_by_identifier_first', 0xF190)
+            self.assertIsInstance(results['ecu0'].exception, TimeoutException)
+            self.assertIn('busy', str(results['ecu0'].exception))
+            self.assertIsNone(results['ecu0'].duration)
+            self.assertEqual(results['ecu1'].get(), (b'IJKL',))
+            self.assertEqual(list(results.keys()), ['ecu0', 'ecu1'])
+            self.assertTrue(conns['ecu0'].touserqueue.empty())
+
+            time.sleep(0.5)     # The late response completes the previous operation
+            FakeEcu(conns['ecu0'], b'MNOP')
+            results = fleet.run('read_data_by_identifier_first', 0xF190, ecu_timeout=0.5)
+            self.assertEqual(results['ecu0'].get(), (b'MNOP',))
+
+    def test_ecu_timeout_bounded_pool(self):
+        fleet, conns = self.make_fleet(2, max_workers=1)
+        for conn in conns.values():
+            FakeEcu(conn, b'XXXX', delay=0.5)
+
+        with fleet:
+            t1 = time.monotonic()
+            results = fleet.run('read_data_by_identifier_first', 0xF190, ecu_timeout=0.2)
+            elapsed = time.monotonic() - t1
+
+        # ecu1 starts once ecu0 releases the only worker, at about 0.5 sec, and gets its own deadline from there
+        self.assertIsInstance(results['ecu0'].exception, TimeoutException)
+        self.assertIsInstance(results['ecu1'].exception, TimeoutException)
+        self.assertLess(elapsed, 0.9)
+
+    def test_overall_timeout_bounded_pool(self):
+        fleet, conns = self.make_fleet(3, max_workers=1)
+        for conn in conns.values():
+            FakeEcu(conn, b'XXXX', delay=0.15)
+
+        with fleet:
+            results = fleet.run('read_data_by_identifier_first', 0xF190, timeout=0.25)
+
+        self.assertTrue(results['ecu0'].success)
+        self.assertIsInstance(results['ecu1'].exception, TimeoutException)
+        self.assertIsInstance(results['ecu2'].exception, TimeoutException)
+        self.assertIsNone(results['ecu2'].duration)  # Never started
+
+    def test_run_refuses_async_clients(self):
+        fleet = ClientFleet({'a': (AsyncQueueConnection(), None)})
+        with self.assertRaises(ValueError):
+            fleet.run('tester_present')
+
+    def test_run_async(self):
+        async def server(conn, payload, delay):
+            await asyncio.wait_for(conn.touserqueue.get(), 1)
+            await asyncio.sleep(delay)
+            await conn.fromuserqueue.put(b'\x62\xF1\x90' + payload)
+
+        async def run():
+            conns = {'ecu%d' % i: AsyncQueueConnection(name='ecu%d' % i) for i in range(3)}
+            config = {'data_identifiers': {0xF190: '4s'}, 'request_timeout': 1, 'logger_name': 'unittest'}
+            fleet = ClientFleet({name: (conn, config) for name, conn in conns.items()})
+            async with fleet:
+                servers = [
+                    asyncio.ensure_future(server(conns['ecu0'], b'ECU0', 0)),
+                    asyncio.ensure_future(server(conns['ecu1'], b'ECU1', 0.1)),
+                    asyncio.ensure_future(server(conns['ecu2'], b'ECU2', 0.6)),
+                ]
+                results = await fleet.run_async('read_data_by_identifier_first', 0xF190, ecu_timeout=0.3)
+                await asyncio.gather(*servers, return_exceptions=True)
+                return results
+
+        results = asyncio.run(run())
+        self.assertEqual(results['ecu0'].value, (b'ECU0',))
+        self.assertEqual(results['ecu1'].value, (b'ECU1',))
+        self.assertIsInstance(results['ecu2'].exception, TimeoutException)
+
+    def test_run_async_overall_timeout(self):
+        async def slow(client):
+            await asyncio.sleep(1)
+
+        async def fast(client):
+            return client
+
+        async def run():
+            fleet = ClientFleet({'a': (AsyncQueueConnection(), None), 'b': (AsyncQueueConnection(), None)})
+            operations = {fleet.clients['a']: fast, fleet.clients['b']: slow}
+            return fleet, await fleet.run_async(lambda client: operations[client](client), timeout=0.2)
+
+        fleet, results = asyncio.run(run())
+        self.assertIs(results['a'].value, fleet.clients['a'])
+        self.assertIsInstance(results['b'].exception, TimeoutException)
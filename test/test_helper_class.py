@@ -1,4 +1,4 @@
-from udsoncan import DataFormatIdentifier, AddressAndLengthFormatIdentifier, MemoryLocation, CommunicationType, Baudrate, IOMasks, Dtc, DidCodec, AsciiCodec, Filesize, DynamicDidDefinition, make_did_codec_from_definition
+from udsoncan import DataFormatIdentifier, AddressAndLengthFormatIdentifier, MemoryLocation, CommunicationType, Baudrate, IOMasks, Dtc, DidCodec, AsciiCodec, Filesize, DynamicDidDefinition, make_did_codec_from_definition, TransferProgress
 from test.UdsTest import UdsTest
 import struct
 
@@ -264,6 +264,12 @@ class TestIOMasks(UdsTest):
 
 
 class TestDtc(UdsTest):
+    def test_format_name(self):
+        self.assertEqual(Dtc.Format.get_name(0), 'ISO15031_6')
+        self.assertEqual(Dtc.Format.get_name(4), 'SAE_J2012_DA_DTCFormat_04')
+        self.assertIsNone(Dtc.Format.get_name(0x55))
+        self.assertEqual(Dtc.Format.get_name(None), '')
+
     def test_init(self):
         dtc = Dtc(0x1234)
         self.assertEqual(dtc.id, 0x1234)
@@ -284,6 +290,59 @@ class TestDtc(UdsTest):
         with self.assertRaises(TypeError):
             Dtc()
 
+    def test_init_status_severity(self):
+        dtc = Dtc(0x1234, status=0x09, severity=0x40)
+        self.assertTrue(dtc.status.test_failed)
+        self.assertTrue(dtc.status.confirmed)
+        self.assertFalse(dtc.status.pending)
+        self.assertTrue(dtc.severity.check_at_next_exit)
+        self.assertEqual(repr(dtc)[:45], '<DTC ID=0x001234, Status=0x09, Severity=0x40,')
+
+    def test_shared_flags(self):
+        dtc1 = Dtc(1, status=0x08)
+        dtc2 = Dtc(2, status=0x08)
+        self.assertIs(dtc1._status, dtc2._status)   # Same interned instance until accessed
+        self.assertIs(dtc1._status, Dtc.Status.shared(0x08))
+
+        dtc1.status.test_failed = True
+        self.assertFalse(dtc1.status.is_shared())
+        self.assertEqual(dtc1.status.get_byte_as_int(), 0x09)
+        self.assertEqual(dtc2.status.get_byte_as_int(), 0x08)
+        self.assertEqual(Dtc.Status.shared(0x08).get_byte_as_int(), 0x08)
+
+        shared = Dtc.Status.shared(0x08)
+        self.assertTrue(shared.is_shared())
+        with self.assertRaises(AttributeError):
+            shared.confirmed = False
+        with self.assertRaises(AttributeError):
+            shared.set_byte(0)
+        with self.assertRaises(ValueError):
+            Dtc.Status.shared(0x100)
+
+        self.assertIs(Dtc.Severity.shared(0x85), Dtc.Severity.shared(0x80))
+        self.assertTrue(Dtc.Severity.shared(0x85).is_shared())
+        self.assertFalse(Dtc.Status(confirmed=True).is_shared())
+
+        status = Dtc.Status()
+        dtc1.status = status
+        status.pending = True
+        self.assertTrue(dtc1.status.pending)
+
+    def test_slots(self):
+        dtc = Dtc(1)
+        self.assertFalse(hasattr(dtc, '__dict__'))
+        self.assertFalse(hasattr(dtc.status, '__dict__'))
+        self.assertFalse(hasattr(dtc.severity, '__dict__'))
+        with self.assertRaises(AttributeError):
+            dtc.not_an_attribute = 1
+
+        self.assertIsNone(dtc._snapshots)
+        self.assertEqual(dtc.snapshots, [])
+        dtc.snapshots.append(1)
+        self.assertEqual(dtc.snapshots, [1])
+        dtc.extended_data = [Dtc.ExtendedData()]
+        self.assertEqual(dtc.extended_data[0].raw_data, b'')
+
     def test_set_status_with_byte_no_error(self):
         dtc = Dtc(1)
         for i in range(255):
@@ -580,3 +639,23 @@ class TestDynamicDidDefinition(UdsTest):
         diddef.add(MemoryLocation(address=0x1235, memorysize=1, address_format=16, memorysize_format=16))
         with self.assertRaises(ValueError):
             alfid = diddef.get_alfid()
+
+
+class TestTransferProgress(UdsTest):
+    def test_progress(self):
+        progress = TransferProgress(TransferProgress.DOWNLOAD, block_size=10, total=30)
+        self.assertEqual(progress.ratio, 0)
+        self.assertEqual(progress.throughput, 0)
+        progress.update(10)
+        self.assertEqual(progress.transferred, 10)
+        self.assertEqual(progress.block_count, 1)
+        self.assertAlmostEqual(progress.ratio, 1 / 3)
+
+    def test_unknown_total(self):
+        progress = TransferProgress(TransferProgress.UPLOAD, block_size=10)
+        progress.update(10)
+        self.assertIsNone(progress.ratio)
+
+    def test_bad_direction(self):
+        with self.assertRaises(ValueError):
+            TransferProgress('sideways', block_size=10)
@@ -0,0 +1,306 @@
+from udsoncan import AsciiCodec
+from udsoncan.logdecoder import *
+from udsoncan.logdecoder import _decode_range
+from test.UdsTest import UdsTest
+
+import json
+import os
+import shutil
+import tempfile
+
+
+def isotp_frames(payload):
+    # Splits a payload in classic CAN ISO-TP frames, padded with 0x00
+    if len(payload) <= 7:
+        return [(bytes([len(payload)]) + payload).ljust(8, b'\x00')]
+    frames = [bytes([0x10 | (len(payload) >> 8), len(payload) & 0xFF]) + payload[:6]]
+    sequence = 1
+    for i in range(6, len(payload), 7):
+        frames.append((bytes([0x20 | sequence]) + payload[i:i + 7]).ljust(8, b'\x00'))
+        sequence = (sequence + 1) & 0xF
+    return frames
+
+
+def candump_lines(t, can_id, payload):
+    return ['(%.6f) can0 %03X#%s' % (t + i * 0.001, can_id, frame.hex().upper()) for i, frame in enumerate(isotp_frames(payload))]
+
+
+class TestParsers(UdsTest):
+
+    def test_candump(self):
+        self.assertEqual(parse_candump_line('(1436509052.249713) can0 7E0#0322F19000000000'), (1436509052.249713, 0x7E0, bytes.fromhex('0322F19000000000')))
+        self.assertEqual(parse_candump_line('(1.5) vcan0 18DA10F1#0322F190'), (1.5, 0x18DA10F1, bytes.fromhex('0322F190')))
+        self.assertEqual(parse_candump_line('(1.5) can0 7E0##1023E00'), (1.5, 0x7E0, b'\x02\x3E\x00'))     # CAN FD
+        self.assertEqual(parse_candump_line('  can0  7E8   [4]  03 62 F1 90'), (0.0, 0x7E8, bytes.fromhex('0362F190')))
+        self.assertEqual(parse_candump_line('(0.1)  can0  7E8   [2]  02 7E'), (0.1, 0x7E8, b'\x02\x7E'))
+        self.assertIsNone(parse_candump_line('(1.5) can0 7E0#R'))
+        self.assertIsNone(parse_candump_line(''))
+        self.assertIsNone(parse_candump_line('hello world'))
+
+    def test_asc(self):
+        self.assertEqual(parse_asc_line('   0.012345 1  7E0             Rx   d 8 03 22 F1 90 00 00 00 00'), (0.012345, 0x7E0, bytes.fromhex('0322F19000000000')))
+        self.assertEqual(parse_asc_line('1.0 1 18DAF110x Rx d 3 02 7E 00'), (1.0, 0x18DAF110, b'\x02\x7E\x00'))
+        self.assertEqual(parse_asc_line('1.0 1 2016 Rx d 2 2 126', base=10), (1.0, 0x7E0, b'\x02\x7E'))
+        self.assertIsNone(parse_asc_line('date Mon Jan 1 10:00:00 am 2024'))
+        self.assertIsNone(parse_asc_line('1.0 1 7E0 Rx r'))
+
+    def test_csv(self):
+        self.assertEqual(parse_csv_line('12.5,7E0,0322F190'), (12.5, 0x7E0, bytes.fromhex('0322F190')))
+        self.assertEqual(parse_csv_line('12.5,7E0,03 22 F1 90\n'), (12.5, 0x7E0, bytes.fromhex('0322F190')))
+        self.assertIsNone(parse_csv_line('timestamp,id,data'))
+
+    def test_detect_format(self):
+        self.assertEqual(detect_format('trace.ASC'), 'asc')
+        self.assertEqual(detect_format('/tmp/trace.csv'), 'csv')
+        self.assertEqual(detect_format('candump-2024-01-01.log'), 'candump')
+
+
+class TestIsoTpReassembler(UdsTest):
+
+    def test_single_frame(self):
+        reassembler = IsoTpReassembler()
+        self.assertEqual(reassembler.feed(0x7E0, bytes.fromhex('0322F19000000000'), 1.0, 10), (b'\x22\xF1\x90', 1.0, 10))
+        self.assertEqual(reassembler.feed(0x7E0, bytes.fromhex('000A') + bytes(range(10)), 2.0, 11), (bytes(range(10)), 2.0, 11))    # CAN FD
+        self.assertIsNone(reassembler.feed(0x7E0, bytes.fromhex('0522F1'), 3.0, 12))    # Too short
+
+    def test_multi_frame(self):
+        reassembler = IsoTpReassembler()
+        payload = bytes(range(20))
+        frames = isotp_frames(payload)
+        self.assertIsNone(reassembler.feed(0x7E8, frames[0], 1.0, 1))
+        self.assertIsNone(reassembler.feed(0x7E0, bytes.fromhex('3000000000000000'), 1.1, 2))   # Flow control
+        self.assertIsNone(reassembler.feed(0x7E8, frames[1], 1.2, 3))
+        self.assertEqual(reassembler.feed(0x7E8, frames[2], 1.3, 4), (payload, 1.0, 1))
+
+    def test_escape_first_frame(self):
+        reassembler = IsoTpReassembler()
+        self.assertIsNone(reassembler.feed(0x7E8, bytes.fromhex('100000000004') + b'\x01\x02', 1.0, 1))
+        self.assertEqual(reassembler.feed(0x7E8, bytes.fromhex('210304'), 1.0, 2), (b'\x01\x02\x03\x04', 1.0, 1))
+
+    def test_bad_sequence(self):
+        reassembler = IsoTpReassembler()
+        frames = isotp_frames(bytes(range(20)))
+        reassembler.feed(0x7E8, frames[0])
+        self.assertIsNone(reassembler.feed(0x7E8, frames[2]))
+        self.assertIsNone(reassembler.feed(0x7E8, frames[1]))   # Message dropped
+        self.assertIsNone(reassembler.feed(0x7E8, frames[1]))   # Consecutive frame without first frame
+
+
+class TestUdsLogDecoder(UdsTest):
+
+    def feed(self, decoder, t, can_id, payload):
+        completed = []
+        for frame in isotp_frames(payload):
+            completed += decoder.feed(t, can_id, frame)
+        return completed
+
+    def test_pairing(self):
+        decoder = UdsLogDecoder()
+        self.assertEqual(self.feed(decoder, 1.0, 0x7E0, b'\x22\xF1\x90'), [])
+        self.assertEqual(self.feed(decoder, 1.01, 0x7E9, b'\x62\xF1\x90\x00'), [])  # Other ECU, ignored
+        completed = self.feed(decoder, 1.02, 0x7E8, b'\x62\xF1\x90' + b'A' * 17)
+        self.assertEqual(len(completed), 1)
+        self.assertEqual(completed[0].tester_id, 0x7E0)
+        self.assertEqual(completed[0].ecu_id, 0x7E8)
+        self.assertEqual(completed[0].request, b'\x22\xF1\x90')
+        self.assertEqual(completed[0].response, b'\x62\xF1\x90' + b'A' * 17)
+        self.assertEqual(completed[0].response_timestamp, 1.02)
+        self.assertEqual(decoder.flush(), [])
+
+    def test_extended_ids(self):
+        decoder = UdsLogDecoder()
+        self.feed(decoder, 1.0, 0x18DA10F1, b'\x3E\x00')
+        completed = self.feed(decoder, 1.0, 0x18DAF110, b'\x7E\x00')
+        self.assertEqual(len(completed), 1)
+        self.assertEqual(completed[0].tester_id, 0x18DA10F1)
+
+    def test_address_pairs(self):
+        decoder = UdsLogDecoder(address_pairs=[(0x600, 0x680)])
+        self.feed(decoder, 1.0, 0x600, b'\x3E\x00')
+        self.assertEqual(self.feed(decoder, 1.0, 0x7E8, b'\x7E\x00'), [])
+        self.assertEqual(len(self.feed(decoder, 1.0, 0x680, b'\x7E\x00')), 1)
+
+    def test_response_pending(self):
+        decoder = UdsLogDecoder(response_timeout=1)
+        self.feed(decoder, 1.0, 0x7E0, b'\x31\x01\x12\x34')
+        self.assertEqual(self.feed(decoder, 1.9, 0x7E8, b'\x7F\x31\x78'), [])
+        self.assertEqual(self.feed(decoder, 2.8, 0x7E8, b'\x7F\x31\x78'), [])
+        completed = self.feed(decoder, 3.5, 0x7E8, b'\x71\x01\x12\x34')
+        self.assertEqual(len(completed), 1)
+        self.assertEqual(completed[0].pending_count, 2)
+        self.assertEqual(completed[0].response, b'\x71\x01\x12\x34')
+
+    def test_no_response(self):
+        decoder = UdsLogDecoder(response_timeout=1)
+        self.feed(decoder, 1.0, 0x7E0, b'\x3E\x00')
+        completed = self.feed(decoder, 1.5, 0x7E0, b'\x3E\x00')     # New request on the same ID
+        self.assertEqual(len(completed), 1)
+        self.assertIsNone(completed[0].response)
+        self.assertIsNone(completed[0].ecu_id)
+
+        completed = self.feed(decoder, 3.0, 0x7E1, b'\x3E\x00')     # Timeout
+        self.assertEqual(len(completed), 1)
+        self.assertEqual(completed[0].timestamp, 1.5)
+        self.assertEqual(self.feed(decoder, 3.1, 0x7E8, b'\x7E\x00'), [])   # Too late
+        self.assertEqual(len(decoder.flush()), 1)
+
+    def test_functional(self):
+        decoder = UdsLogDecoder(response_timeout=1)
+        self.feed(decoder, 1.0, 0x7DF, b'\x3E\x00')
+        self.assertEqual(len(self.feed(decoder, 1.01, 0x7E8, b'\x7E\x00')), 1)
+        self.assertEqual(len(self.feed(decoder, 1.02, 0x7E9, b'\x7E\x00')), 1)
+        self.assertEqual(decoder.flush(), [])   # Answered, not reported as unanswered
+
+        self.feed(decoder, 2.0, 0x7DF, b'\x3E\x00')
+        completed = decoder.flush()
+        self.assertEqual(len(completed), 1)
+        self.assertIsNone(completed[0].response)
+
+
+class TestDecodeTransaction(UdsTest):
+
+    def make_transaction(self, request, response):
+        transaction = UdsTransaction(1.0, 0x7E0, request)
+        if response is not None:
+            transaction.ecu_id = 0x7E8
+            transaction.response = response
+            transaction.response_timestamp = 1.25
+        return transaction
+
+    def test_rdbi(self):
+        result = decode_transaction(self.make_transaction(b'\x22\x12\x34\x12\x35', b'\x62\x12\x34\x00\x01\x12\x35\x41\x42'),
+                                    didconfig={0x1234: '>H', 0x1235: AsciiCodec(2)})
+        self.assertEqual(result['service'], 'ReadDataByIdentifier')
+        self.assertEqual(result['status'], 'positive')
+        self.assertEqual(result['latency'], 0.25)
+        self.assertEqual(result['data']['values'], {0x1234: [1], 0x1235: 'AB'})
+        self.assertIsNone(result['error'])
+        json.dumps(result)
+
+        result = decode_transaction(self.make_transaction(b'\x22\x12\x34', b'\x62\x12\x34\x00\x01'))
+        self.assertEqual(result['status'], 'positive')
+        self.assertIsNone(result['data'])
+        self.assertIn('DID configuration', result['error'])
+
+    def test_subfunction_services(self):
+        result = decode_transaction(self.make_transaction(b'\x27\x01', b'\x67\x01\x11\x22'))
+        self.assertEqual(result['subfunction'], 1)
+        self.assertEqual(result['data'], {'security_level_echo': 1, 'seed': '1122'})
+
+        result = decode_transaction(self.make_transaction(b'\x19\x02\xFF', b'\x59\x02\xFF\x12\x34\x56\x09'))
+        self.assertEqual(result['data']['dtcs'], [{'id': 0x123456, 'status': 0x09, 'severity': 0}])
+
+        result = decode_transaction(self.make_transaction(b'\x10\x03', b'\x50\x03\x00\x32\x01\xF4'))
+        self.assertEqual(result['data']['session_echo'], 3)
+
+        result = decode_transaction(self.make_transaction(b'\x19', b'\x59\x02\xFF'))   # Truncated request
+        self.assertEqual(result['status'], 'positive')
+        self.assertIsNone(result['data'])
+        self.assertIn('no subfunction', result['error'])
+
+    def test_negative_and_missing(self):
+        result = decode_transaction(self.make_transaction(b'\x10\x02', b'\x7F\x10\x22'))
+        self.assertEqual(result['status'], 'negative')
+        self.assertEqual(result['nrc'], 0x22)
+
+        result = decode_transaction(self.make_transaction(b'\x10\x02', None))
+        self.assertEqual(result['status'], 'no_response')
+        self.assertIsNone(result['latency'])
+
+        result = decode_transaction(self.make_transaction(b'\x10\x02', b'\xFF\x00'))
+        self.assertEqual(result['status'], 'invalid')
+
+        result = decode_transaction(self.make_transaction(b'\x3E\x00', b'\x50\x03\x00\x32\x01\xF4'))
+        self.assertEqual(result['error'], 'Response does not match the request service')
+
+
+class TestDecodeLog(UdsTest):
+
+    def setUp(self):
+        self.tempdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tempdir)
+
+    def make_log(self, count):
+        lines = ['# Header']
+        t = 0.0
+        for i in range(count):
+            did = 0x1000 + i
+            lines += candump_lines(t, 0x7E0, b'\x22' + did.to_bytes(2, 'big'))
+            if i % 5 == 0:
+                lines += candump_lines(t + 0.01, 0x7E8, b'\x7F\x22\x78')
+            if i % 7 != 3:
+                lines += candump_lines(t + 0.02, 0x7E8, b'\x62' + did.to_bytes(2, 'big') + i.to_bytes(2, 'big') + bytes(i % 20))
+            t += 0.1
+        filename = os.path.join(self.tempdir, 'trace.log')
+        with open(filename, 'w') as f:
+            f.write('\n'.join(lines) + '\n')
+        return filename
+
+    def test_sequential(self):
+        filename = self.make_log(50)
+        results = list(decode_log(filename, didconfig={0x1000 + i: '>H' for i in range(50)}, response_timeout=0.05))
+        self.assertEqual(len(results), 50)
+        self.assertEqual(results[1]['data']['values'], {0x1001: [1]})
+        self.assertEqual(results[3]['status'], 'no_response')
+        self.assertEqual(results[5]['pending_count'], 1)
+        self.assertEqual([r['timestamp'] for r in results], sorted(r['timestamp'] for r in results))
+
+    def test_chunks_same_result(self):
+        filename = self.make_log(200)
+        didconfig = {0x1000 + i: '>H' for i in range(200)}
+        expected = list(decode_log(filename, didconfig=didconfig, response_timeout=0.05))
+        self.assertEqual(len(expected), 200)
+        for chunk_size in [100, 1000, 7777]:
+            chunks = []
+            start = 0
+            size = os.path.getsize(filename)
+            while start < size:
+                end = start + chunk_size
+                chunks += list(_decode_range(filename, 'candump', start, end if end < size else None, {
+                    'address_pairs': None, 'functional_ids': None, 'didconfig': didconfig, 'response_timeout': 0.05, 'standard_version': 2020}))
+                start = end
+            self.assertEqual(chunks, expected)
+
+    def test_parallel(self):
+        filename = self.make_log(200)
+        didconfig = {0x1000 + i: '>H' for i in range(200)}
+        expected = list(decode_log(filename, didconfig=didconfig))
+        self.assertEqual(list(decode_log(filename, didconfig=didconfig, processes=2, chunk_size=2000)), expected)
+
+    def test_other_formats(self):
+        asc = os.path.join(self.tempdir, 'trace.asc')
+        with open(asc, 'w') as f:
+            f.write('date Mon Jan 1 10:00:00 am 2024\nbase hex  timestamps absolute\n')
+            f.write('   1.000000 1  7E0             Rx   d 8 02 3E 00 00 00 00 00 00\n')
+            f.write('   1.010000 1  7E8             Rx   d 8 02 7E 00 00 00 00 00 00\n')
+        results = list(decode_log(asc))
+        self.assertEqual(len(results), 1)
+        self.assertEqual(results[0]['service'], 'TesterPresent')
+        self.assertEqual(results[0]['status'], 'positive')
+
+        csv = os.path.join(self.tempdir, 'trace.csv')
+        with open(csv, 'w') as f:
+            f.write('timestamp,id,data\n1.0,7E0,023E00\n1.01,7E8,027E00\n')
+        self.assertEqual(list(decode_log(csv)), results)
+
+        with self.assertRaises(ValueError):
+            list(decode_log(csv, fmt='blf'))
+
+    def test_outputs(self):
+        filename = self.make_log(10)
+        results = list(decode_log(filename, didconfig={0x1000 + i: '>H' for i in range(10)}, response_timeout=0.05))
+        jsonl = os.path.join(self.tempdir, 'out.jsonl')
+        with open(jsonl, 'w') as f:
+            self.assertEqual(write_jsonl(results, f), 10)
+        with open(jsonl) as f:
+            lines = [json.loads(line) for line in f]
+        self.assertEqual(len(lines), 10)
+        self.assertEqual(lines[0]['request'], '221000')
+
+        columns = to_columns(results)
+        self.assertEqual(len(columns['timestamp']), 10)
+        self.assertEqual(columns['status'][3], 'no_response')
+        self.assertEqual(json.loads(columns['data'][1]), {'values': {'4097': [1]}})
+        self.assertEqual(to_columns([]), {})
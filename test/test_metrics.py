@@ -0,0 +1,95 @@
+from udsoncan.metrics import Histogram, ClientMetrics
+from udsoncan import services, Request
+from test.UdsTest import UdsTest
+
+
+class TestHistogram(UdsTest):
+
+    def test_observe(self):
+        h = Histogram([1, 2, 5])
+        for value in [0.5, 1, 1.5, 3, 5, 10]:
+            h.observe(value)
+        self.assertEqual(h.counts, [2, 1, 2, 1])
+        self.assertEqual(h.cumulative_counts(), [2, 3, 5, 6])
+        self.assertEqual(h.count, 6)
+        self.assertEqual(h.sum, 21)
+        self.assertEqual(h.snapshot(), {'bounds': [1, 2, 5], 'counts': [2, 1, 2, 1], 'sum': 21, 'count': 6})
+
+        h.reset()
+        self.assertEqual(h.counts, [0, 0, 0, 0])
+        self.assertEqual(h.count, 0)
+
+    def test_bad_bounds(self):
+        with self.assertRaises(ValueError):
+            Histogram([])
+
+        with self.assertRaises(ValueError):
+            Histogram([1, 3, 2])
+
+        with self.assertRaises(ValueError):
+            Histogram([1, 1])
+
+
+class TestClientMetrics(UdsTest):
+
+    def test_get(self):
+        metrics = ClientMetrics()
+        entry = metrics.get(services.ECUReset, 1)
+        self.assertIs(metrics.get(services.ECUReset, 1), entry)
+        self.assertIsNot(metrics.get(services.ECUReset, 2), entry)
+        self.assertEqual(entry.service_name, 'ECUReset')
+        self.assertEqual(entry.subfunction, 1)
+
+    def test_for_request(self):
+        metrics = ClientMetrics()
+        self.assertIs(metrics.for_request(Request(services.ECUReset, subfunction=3)), metrics.get(services.ECUReset, 3))
+        self.assertIs(metrics.for_request(Request(services.ReadDataByIdentifier, data=b'\x00\x01')), metrics.get(services.ReadDataByIdentifier))
+
+        with self.assertRaises(ValueError):
+            metrics.for_request(Request())
+
+    def test_snapshot_and_reset(self):
+        metrics = ClientMetrics(time_buckets=[0.1, 1], size_buckets=[4, 8])
+        entry = metrics.get(services.TesterPresent, 0)
+        entry.requests += 2
+        entry.timeouts += 1
+        entry.response_time.observe(0.05)
+        entry.request_size.observe(2)
+
+        snapshot = metrics.snapshot()
+        self.assertEqual(len(snapshot), 1)
+        self.assertEqual(snapshot[0]['service'], 'TesterPresent')
+        self.assertEqual(snapshot[0]['subfunction'], 0)
+        self.assertEqual(snapshot[0]['requests'], 2)
+        self.assertEqual(snapshot[0]['timeouts'], 1)
+        self.assertEqual(snapshot[0]['response_time'], {'bounds': [0.1, 1], 'counts': [1, 0, 0], 'sum': 0.05, 'count': 1})
+        self.assertEqual(snapshot[0]['request_size']['counts'], [1, 0, 0])
+
+        entry.requests += 1
+        self.assertEqual(snapshot[0]['requests'], 2)  # Snapshot is a copy
+
+        metrics.reset()
+        self.assertEqual(metrics.snapshot(), [])
+
+    def test_prometheus(self):
+        metrics = ClientMetrics(time_buckets=[0.1, 1])
+        entry = metrics.get(services.ECUReset, 1)
+        entry.requests = 3
+        entry.response_time.observe(0.05)
+        entry.response_time.observe(0.5)
+        metrics.get(services.ReadDataByIdentifier).negative_responses = 1
+
+        text = metrics.to_prometheus(labels={'ecu': 'engine "1"'})
+        lines = text.splitlines()
+        self.assertTrue(text.endswith('\n'))
+        self.assertIn('# TYPE udsoncan_requests_total counter', lines)
+        self.assertIn('udsoncan_requests_total{service="ECUReset",subfunction="0x01",ecu="engine \\"1\\""} 3', lines)
+        self.assertIn('udsoncan_negative_responses_total{service="ReadDataByIdentifier",subfunction="",ecu="engine \\"1\\""} 1', lines)
+        self.assertIn('# TYPE udsoncan_response_time_seconds histogram', lines)
+        self.assertIn('udsoncan_response_time_seconds_bucket{service="ECUReset",subfunction="0x01",ecu="engine \\"1\\"",le="0.1"} 1', lines)
+        self.assertIn('udsoncan_response_time_seconds_bucket{service="ECUReset",subfunction="0x01",ecu="engine \\"1\\"",le="1"} 2', lines)
+        self.assertIn('udsoncan_response_time_seconds_bucket{service="ECUReset",subfunction="0x01",ecu="engine \\"1\\"",le="+Inf"} 2', lines)
+        self.assertIn('udsoncan_response_time_seconds_sum{service="ECUReset",subfunction="0x01",ecu="engine \\"1\\""} 0.55', lines)
+        self.assertIn('udsoncan_response_time_seconds_count{service="ECUReset",subfunction="0x01",ecu="engine \\"1\\""} 2', lines)
+
+        self.assertTrue(metrics.to_prometheus(prefix='ecu').startswith('# HELP ecu_requests_total'))
@@ -105,3 +105,26 @@ class TestRequest(UdsTest):
         with self.assertRaises(ValueError):
             Request(service=DummyServiceNoSubunction, suppress_positive_response=True)
 
+    def test_from_payload_service_defined_after_lookup(self):
+        req = Request.from_payload(b'\xBA\x01')
+        self.assertIsNone(req.service)
+
+        class LateDefinedService(BaseService):
+            _sid = 0xBA
+
+        req = Request.from_payload(b'\xBA\x01')
+        self.assertIs(req.service, LateDefinedService)
+
+    def test_from_payload_most_derived_service_wins(self):
+        class OriginalService(BaseService):
+            _sid = 0xBB
+
+        class DerivedService(OriginalService):
+            pass
+
+        class OtherService(BaseService):
+            _sid = 0xBB
+
+        req = Request.from_payload(b'\xBB\x01')
+        self.assertIs(req.service, DerivedService)
+        self.assertIs(BaseService.from_response_id(0xFB), DerivedService)
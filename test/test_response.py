@@ -1,5 +1,5 @@
 from udsoncan import Response
-from udsoncan.BaseService import BaseService
+from udsoncan.BaseService import BaseService, BaseSubfunction
 from test.UdsTest import UdsTest
 import inspect
 
@@ -95,6 +95,21 @@ class TestResponse(UdsTest):
         self.assertEqual(response.code, 0x10)
         self.assertEqual(response.data, b'\x12\x34\x56\x78')
 
+    def test_from_payload_data_view(self):
+        payload = b'\x7E\x01\x12\x34\x56\x78'
+        response = Response.from_payload(payload, data_view=True)
+        self.assertTrue(response.valid)
+        self.assertIsInstance(response.data, memoryview)
+        self.assertIs(response.data.obj, payload)
+        self.assertEqual(response.data, b'\x01\x12\x34\x56\x78')
+
+    def test_from_payload_buffers(self):
+        for payload in [bytearray(b'\x7E\x01\x12\x34'), memoryview(b'\x7E\x01\x12\x34')]:
+            response = Response.from_payload(payload)
+            self.assertTrue(response.valid)
+            self.assertIsInstance(response.data, bytes)
+            self.assertEqual(response.data, b'\x01\x12\x34')
+
     def test_from_empty_payload(self):
         payload = b''
         response = Response.from_payload(payload)
@@ -150,3 +165,55 @@ class TestResponse(UdsTest):
         self.assertTrue(Response.Code.is_supported_by_standard(Response.Code.GeneralReject, 2006))
         self.assertTrue(Response.Code.is_supported_by_standard(Response.Code.GeneralReject, 2013))
         self.assertTrue(Response.Code.is_supported_by_standard(Response.Code.GeneralReject, 2020))
+
+    def test_response_code_names(self):
+        self.assertEqual(Response.Code.get_name(0x78), 'RequestCorrectlyReceived_ResponsePending')
+        self.assertEqual(Response.Code.get_name(0), 'PositiveResponse')
+        self.assertEqual(Response.Code.get_name(0xFE), '254')
+        self.assertEqual(Response.Code.get_name(None), '')
+        # Codes with many names give the first name in alphabetical order
+        self.assertEqual(Response.Code.get_name(0x38), 'GeneralSecurityViolation')
+        self.assertEqual(Response.Code.get_name(0x39), 'SecureDataTransmissionNotAllowed')
+
+        self.assertTrue(Response.Code.is_negative(0x10))
+        self.assertFalse(Response.Code.is_negative(0))
+        self.assertFalse(Response.Code.is_negative(None))
+        self.assertFalse(Response.Code.is_negative(0xFE))
+
+        with self.assertRaises(ValueError):
+            Response.Code.is_supported_by_standard(0xFE, 2020)
+
+    def test_response_code_subclass_names(self):
+        class CustomCode(Response.Code):
+            ManufacturerSpecificCondition = 0xFE
+            SecureDataTransmissionNotAllowed = 0x49
+
+        self.assertEqual(CustomCode.get_name(0xFE), 'ManufacturerSpecificCondition')
+        self.assertTrue(CustomCode.is_negative(0xFE))
+        self.assertEqual(CustomCode.get_name(0x49), 'SecureDataTransmissionNotAllowed')
+        self.assertEqual(CustomCode.get_name(0x10), 'GeneralReject')
+        self.assertTrue(CustomCode.is_supported_by_standard(CustomCode.GeneralReject, 2006))
+        # The parent tables are unchanged
+        self.assertEqual(Response.Code.get_name(0xFE), '254')
+        self.assertFalse(Response.Code.is_negative(0xFE))
+        self.assertEqual(Response.Code.get_name(0x39), 'SecureDataTransmissionNotAllowed')
+
+    def test_subfunction_names(self):
+        class DummySubfunction(BaseSubfunction):
+            __pretty_name__ = 'dummy'
+            zzz = 1
+            aaa = 1
+            bbb = 2
+            custom = (0x40, 0x4F)
+
+        class ExtendedDummySubfunction(DummySubfunction):
+            ccc = 3
+
+        self.assertEqual(DummySubfunction.get_name(1), 'aaa')
+        self.assertEqual(DummySubfunction.get_name(2), 'bbb')
+        self.assertEqual(DummySubfunction.get_name(0x40), 'custom')
+        self.assertEqual(DummySubfunction.get_name(0x4F), 'custom')
+        self.assertEqual(DummySubfunction.get_name(0x50), 'Custom dummy')
+        self.assertEqual(DummySubfunction.get_name(3), 'Custom dummy')
+        self.assertEqual(ExtendedDummySubfunction.get_name(3), 'ccc')
+        self.assertEqual(ExtendedDummySubfunction.get_name(2), 'bbb')
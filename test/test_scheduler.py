@@ -0,0 +1,122 @@
+from udsoncan.client import Client
+from udsoncan.exceptions import *
+from udsoncan.scheduler import SharedClient
+from udsoncan.server import Server, SimulatorConnection
+from test.UdsTest import UdsTest
+
+import concurrent.futures
+import threading
+
+
+class TestSharedClient(UdsTest):
+
+    def setUp(self):
+        self.server = Server(didconfig={0x1234: '>H', 0x1235: '>H'}, dids={0x1234: 0x55AA, 0x1235: 0x1122})
+        self.client = Client(SimulatorConnection(self.server), request_timeout=1, config={'data_identifiers': {0x1234: '>H', 0x1235: '>H'}})
+        self.client.open()
+        self.shared = SharedClient(self.client, name='unittest')
+        self.shared.start()
+
+    def tearDown(self):
+        self.shared.close()
+        self.client.close()
+
+    def block_worker(self):
+        # Keeps the worker busy until the returned event is set, so that the next operations are queued
+        started = threading.Event()
+        release = threading.Event()
+
+        def blocking_operation(client):
+            started.set()
+            release.wait(1)
+        self.shared.submit(blocking_operation, producer='blocker')
+        self.assertTrue(started.wait(1))
+        return release
+
+    def test_results(self):
+        future = self.shared.submit('read_data_by_identifier_first', 0x1234)
+        self.assertEqual(future.result(1), (0x55AA,))
+        future = self.shared.submit(lambda client, did: client.read_data_by_identifier_first(did), 0x1235)
+        self.assertEqual(future.result(1), (0x1122,))
+        future = self.shared.submit('read_data_by_identifier_first', 0x9999)
+        with self.assertRaises(ConfigError):
+            future.result(1)
+        self.assertEqual(self.shared.view().read_data_by_identifier_first(0x1234), (0x55AA,))
+        with self.assertRaises(AttributeError):
+            self.shared.view().config
+
+    def test_priorities(self):
+        order = []
+
+        def operation(client, name):
+            order.append(name)
+
+        release = self.block_worker()
+        self.shared.submit(operation, 'low1', priority=SharedClient.Priority.LOW)
+        self.shared.submit(operation, 'normal', priority=SharedClient.Priority.NORMAL)
+        self.shared.submit(operation, 'low2', priority=SharedClient.Priority.LOW)
+        last = self.shared.submit(operation, 'high', priority=SharedClient.Priority.HIGH)
+        self.assertEqual(self.shared.queue_depth, 4)
+        self.assertEqual(self.shared.queue_depth_by_priority(), {0: 1, 1: 1, 2: 2})
+        release.set()
+        concurrent.futures.wait([last], 1)
+        self.shared.submit(operation, 'done').result(1)
+        self.assertEqual(order, ['high', 'normal', 'low1', 'low2', 'done'])
+
+    def test_fairness(self):
+        order = []
+
+        def operation(client, name):
+            order.append(name)
+
+        release = self.block_worker()
+        futures = [self.shared.submit(operation, 'a%d' % i, producer='a') for i in range(4)]
+        futures += [self.shared.submit(operation, 'b%d' % i, producer='b') for i in range(2)]
+        release.set()
+        concurrent.futures.wait(futures, 1)
+        self.assertEqual(order, ['a0', 'b0', 'a1', 'b1', 'a2', 'a3'])
+
+    def test_many_threads(self):
+        errors = []
+
+        def task(did, expected, priority):
+            view = self.shared.view(priority)
+            try:
+                for i in range(50):
+                    self.assertEqual(view.read_data_by_identifier_first(did), expected)
+                    view.tester_present()
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=task, args=(0x1234, (0x55AA,), SharedClient.Priority.LOW)),
+                   threading.Thread(target=task, args=(0x1235, (0x1122,), SharedClient.Priority.NORMAL)),
+                   threading.Thread(target=task, args=(0x1234, (0x55AA,), SharedClient.Priority.HIGH))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+        self.assertEqual(self.shared.executed, 300)
+        self.assertEqual(sum(histogram.count for histogram in self.shared.wait_time.values()), 300)
+        snapshot = self.shared.snapshot()
+        self.assertEqual(snapshot['queue_depth'], 0)
+        self.assertGreaterEqual(snapshot['max_queue_depth'], 1)
+        self.assertEqual(sorted(snapshot['wait_time'].keys()), [0, 1, 2])
+
+    def test_close_cancels(self):
+        release = self.block_worker()
+        future = self.shared.submit('tester_present')
+        release.set()
+        self.shared.close()
+        self.assertTrue(future.cancelled() or future.done())
+        with self.assertRaises(RuntimeError):
+            self.shared.submit('tester_present')
+
+    def test_cancel(self):
+        calls = []
+        release = self.block_worker()
+        future = self.shared.submit(lambda client: calls.append(1))
+        self.assertTrue(future.cancel())
+        release.set()
+        self.shared.submit('tester_present').result(1)
+        self.assertEqual(calls, [])
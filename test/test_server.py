@@ -0,0 +1,158 @@
+from udsoncan import AsciiCodec, Dtc, MemoryLocation, services
+from udsoncan.client import Client
+from udsoncan.connections import QueueConnection, SocketConnection
+from udsoncan.exceptions import *
+from udsoncan.server import Server, SimulatorConnection, default_security_algo
+from test.UdsTest import UdsTest
+
+import socket
+import unittest
+
+
+class TestServer(UdsTest):
+
+    def make_server(self, **kwargs):
+        return Server(didconfig={0x1234: '>H', 0xF190: AsciiCodec(5)},
+                      dids={0x1234: 0x55AA, 0xF190: 'HELLO', 0xF200: b'\x01\x02\x03'},
+                      dtcs=[Dtc(0x123456, status=0x09), Dtc(0x654321, status=0x04)],
+                      memory={0x1000: bytes(range(16))},
+                      routines={0x0203: lambda control_type, data: bytes([control_type]) + data},
+                      **kwargs)
+
+    def make_client(self, server):
+        config = {
+            'data_identifiers': {0x1234: '>H', 0xF190: AsciiCodec(5), 0xF200: '>BBB'},
+            'security_algo': default_security_algo,
+        }
+        return Client(SimulatorConnection(server), request_timeout=1, config=config)
+
+    def test_process(self):
+        server = self.make_server()
+        self.assertEqual(server.process(b'\x3E\x00'), b'\x7E\x00')
+        self.assertIsNone(server.process(b'\x3E\x80'))     # Suppressed positive response
+        self.assertEqual(server.process(b'\x3E\x05'), b'\x7F\x3E\x12')
+        self.assertEqual(server.process(b'\xBA\x00'), b'\x7F\xBA\x11')
+        self.assertEqual(server.process(b'\x10'), b'\x7F\x10\x13')
+        self.assertIsNone(server.process(b''))
+        self.assertEqual(server.request_count, 5)
+
+    def test_custom_handler(self):
+        server = self.make_server()
+        server.register_handler(services.TesterPresent, lambda request: None)
+        self.assertIsNone(server.process(b'\x3E\x00'))
+        server.register_handler(0x3E, None)
+        self.assertEqual(server.process(b'\x3E\x00'), b'\x7F\x3E\x11')
+
+        def failing_handler(request):
+            raise RuntimeError('Oops')
+        server.register_handler(services.TesterPresent, failing_handler)
+        self.assertEqual(server.process(b'\x3E\x00'), b'\x7F\x3E\x10')
+
+    def test_data_identifiers(self):
+        server = self.make_server()
+        with self.make_client(server) as client:
+            values = client.read_data_by_identifier([0x1234, 0xF190, 0xF200]).service_data.values
+            self.assertEqual(values, {0x1234: (0x55AA,), 0xF190: 'HELLO', 0xF200: (1, 2, 3)})
+            client.write_data_by_identifier(0x1234, 0x1111)
+            self.assertEqual(server.dids[0x1234], (0x1111,))
+            self.assertEqual(client.read_data_by_identifier_first(0x1234), (0x1111,))
+
+            with self.assertRaises(NegativeResponseException) as context:
+                client.write_data_by_identifier(0xF200, (1, 2, 3))    # Read only, not in the server didconfig
+            self.assertEqual(context.exception.response.code, 0x31)
+
+    def test_sessions_and_security(self):
+        server = self.make_server(sessions=[1, 3])
+        with self.make_client(server) as client:
+            with self.assertRaises(NegativeResponseException) as context:
+                client.unlock_security_access(1)
+            self.assertEqual(context.exception.response.code, 0x7F)
+
+            response = client.change_session(3)
+            self.assertEqual(response.service_data.p2_server_max, 0.05)
+            self.assertEqual(server.session, 3)
+            client.unlock_security_access(1)
+            self.assertEqual(server.security_level, 1)
+
+            with self.assertRaises(NegativeResponseException) as context:
+                client.change_session(2)
+            self.assertEqual(context.exception.response.code, 0x12)
+
+            client.change_session(1)
+            self.assertEqual(server.security_level, 0)
+
+            client.change_session(3)
+            client.request_seed(1)
+            with self.assertRaises(NegativeResponseException) as context:
+                client.send_key(1, b'\x00\x00\x00\x00')
+            self.assertEqual(context.exception.response.code, 0x35)
+            with self.assertRaises(NegativeResponseException) as context:
+                client.send_key(1, b'\x00\x00\x00\x00')
+            self.assertEqual(context.exception.response.code, 0x24)
+
+            client.ecu_reset(1)
+            self.assertEqual(server.reset_count, 1)
+            self.assertEqual(server.session, 1)
+
+    def test_dtcs(self):
+        server = self.make_server()
+        with self.make_client(server) as client:
+            self.assertEqual(client.get_number_of_dtc_by_status_mask(0x01).service_data.dtc_count, 1)
+            dtcs = client.get_dtc_by_status_mask(0x0C).service_data.dtcs
+            self.assertEqual([(dtc.id, dtc.status.get_byte_as_int()) for dtc in dtcs], [(0x123456, 0x09), (0x654321, 0x04)])
+            self.assertEqual(len(client.get_supported_dtc().service_data.dtcs), 2)
+            client.clear_dtc(0x123456)
+            self.assertEqual([dtc.id for dtc in server.dtcs], [0x654321])
+            with self.assertRaises(NegativeResponseException):
+                client.clear_dtc(0x123456)
+            client.clear_dtc()
+            self.assertEqual(server.dtcs, [])
+
+    def test_memory(self):
+        server = self.make_server()
+        with self.make_client(server) as client:
+            response = client.read_memory_by_address(MemoryLocation(0x1004, 4, address_format=16, memorysize_format=8))
+            self.assertEqual(response.service_data.memory_block, b'\x04\x05\x06\x07')
+            client.write_memory_by_address(MemoryLocation(0x1000, 2, address_format=32, memorysize_format=8), b'\xAA\xBB')
+            self.assertEqual(server.memory[0x1000][0:3], b'\xAA\xBB\x02')
+            with self.assertRaises(NegativeResponseException) as context:
+                client.read_memory_by_address(MemoryLocation(0x100E, 4, address_format=16, memorysize_format=8))
+            self.assertEqual(context.exception.response.code, 0x31)
+
+    def test_routine(self):
+        server = self.make_server()
+        with self.make_client(server) as client:
+            response = client.start_routine(0x0203, b'\x99')
+            self.assertEqual(response.service_data.routine_status_record, b'\x01\x99')
+            with self.assertRaises(NegativeResponseException):
+                client.start_routine(0x0204)
+
+    def test_queue_connection(self):
+        server = self.make_server()
+        conn = QueueConnection(name='unittest')
+        server.start(conn)
+        try:
+            with Client(conn, request_timeout=1, config={'data_identifiers': {0x1234: '>H'}}) as client:
+                for i in range(10):
+                    self.assertEqual(client.read_data_by_identifier_first(0x1234), (0x55AA,))
+        finally:
+            server.stop()
+        with self.assertRaises(RuntimeError):
+            server.start(conn)
+            server.start(conn)
+        server.stop()
+
+    @unittest.skipIf(not hasattr(socket, 'AF_UNIX'), 'Unix sockets not available')
+    def test_socket_connection(self):
+        server = self.make_server()
+        client_socket, server_socket = socket.socketpair(socket.AF_UNIX, socket.SOCK_SEQPACKET)
+        self.addCleanup(client_socket.close)
+        self.addCleanup(server_socket.close)
+        server_conn = SocketConnection(server_socket)
+        server.start(server_conn)
+        try:
+            with Client(SocketConnection(client_socket), request_timeout=1) as client:
+                client.tester_present()
+        finally:
+            server.stop()
+            server_conn.close()
@@ -1,25 +1,36 @@
-import inspect
-
 from udsoncan.ResponseCode import ResponseCode
 from abc import ABC
 
-from typing import Type, List, Optional
+from typing import Type, List, Optional, Dict, Tuple, Any
 
 
 class BaseSubfunction:
+    _names: Dict[int, str] = {}
+    _ranges: List[Tuple[int, int, str]] = []
+
+    # Builds the lookup tables used by get_name once, when a subclass is created
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._names = {}
+        cls._ranges = []
+        for name in sorted(dir(cls)):   # When many names share a value, the first in alphabetical order is used
+            if name.startswith('__') and name.endswith('__'):
+                continue
+            value = getattr(cls, name)
+            if isinstance(value, int):
+                cls._names.setdefault(value, name)
+            elif isinstance(value, tuple):
+                cls._ranges.append((value[0], value[1], name))
 
     @classmethod
     def get_name(cls, subfn_id: int) -> str:
-        attributes = inspect.getmembers(cls, lambda a: not (inspect.isroutine(a)))
-        subfn_list = [a for a in attributes if not (a[0].startswith('__') and a[0].endswith('__'))]
-
-        for subfn in subfn_list:
-            if isinstance(subfn[1], int):
-                if subfn[1] == subfn_id:  # [1] is value
-                    return subfn[0] 		# [0] is property name
-            elif isinstance(subfn[1], tuple):
-                if subfn_id >= subfn[1][0] or subfn_id <= subfn[1][1]:
-                    return subfn[0]
+        name = cls._names.get(subfn_id, None)
+        if name is not None:
+            return name
+
+        for low, high, range_name in cls._ranges:
+            if subfn_id >= low and subfn_id <= high:
+                return range_name
         name = cls.__name__ if not hasattr(cls, '__pretty_name__') else cls.__pretty_name__
         return 'Custom %s' % name
 
@@ -54,6 +65,14 @@ class BaseService(ABC):
     def response_id(cls) -> int:
         return cls._sid + 0x40
 
+    # Lookup tables mapping a service ID to its service class. Built lazily once per class on which
+    # from_request_id/from_response_id is called and dropped every time a new service class is defined.
+    _id_lookup_cache: Dict[Type["BaseService"], Tuple[Dict[int, Type["BaseService"]], Dict[int, Type["BaseService"]]]] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        BaseService._id_lookup_cache.clear()    # A new service may shadow or extend the known ones.
+
     @staticmethod
     def __get_all_subclasses(cls) -> List[Type["BaseService"]]:
         import udsoncan.services    # This import is required for __subclasses__ to have a value. Python never import twice the same package.
@@ -70,21 +89,31 @@ class BaseService(ABC):
                 lst.extend(subclasses)
         return lst
 
+    @staticmethod
+    def __get_id_lookup(cls) -> Tuple[Dict[int, Type["BaseService"]], Dict[int, Type["BaseService"]]]:
+        lookup = BaseService._id_lookup_cache.get(cls, None)
+        if lookup is None:
+            request_lookup: Dict[int, Type["BaseService"]] = {}
+            response_lookup: Dict[int, Type["BaseService"]] = {}
+            for obj in BaseService.__get_all_subclasses(cls):
+                if not hasattr(obj, '_sid'):    # Intermediate class that does not define a service
+                    continue
+                # A subclass specializes the service it extends and replaces it. Between unrelated classes, the first one defined wins
+                for lookup_dict, service_id in ((request_lookup, obj.request_id()), (response_lookup, obj.response_id())):
+                    known = lookup_dict.get(service_id, None)
+                    if known is None or issubclass(obj, known):
+                        lookup_dict[service_id] = obj
+            lookup = (request_lookup, response_lookup)
+            BaseService._id_lookup_cache[cls] = lookup
+        return lookup
+
     @classmethod  # Returns an instance of the service identified by the service ID (Request)
     def from_request_id(cls, given_id: int) -> Optional[Type["BaseService"]]:
-        classes = BaseService.__get_all_subclasses(cls)
-        for obj in classes:
-            if obj.request_id() == given_id:
-                return obj
-        return None
+        return BaseService.__get_id_lookup(cls)[0].get(given_id, None)
 
     @classmethod  # Returns an instance of the service identified by the service ID (Response)
     def from_response_id(cls, given_id: int) -> Optional[Type["BaseService"]]:
-        classes = BaseService.__get_all_subclasses(cls)
-        for obj in classes:
-            if obj.response_id() == int(given_id):
-                return obj
-        return None
+        return BaseService.__get_id_lookup(cls)[1].get(int(given_id), None)
 
     # Default subfunction ID for service that does not implement subfunction_id().
     def subfunction_id(self) -> int:
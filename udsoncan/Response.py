@@ -4,8 +4,9 @@ import inspect
 import struct
 
 from udsoncan.Request import Request
+from udsoncan.typing import BytesLike
 
-from typing import Type, Optional, Union
+from typing import Type, Optional, Union, cast
 
 
 class Response:
@@ -62,7 +63,7 @@ class Response:
 
     .. data:: original_payload 
 
-            (bytes) When the response is built with `Response.from_payload`, this property contains a copy of the payload used. None otherwise.
+            (bytes, bytearray or memoryview) When the response is built with `Response.from_payload`, this property contains the payload used, as given. None otherwise.
 
     .. data:: original_request 
 
@@ -74,7 +75,7 @@ class Response:
     subfunction: Optional[int]
     data: Optional[bytes]
     suppress_positive_response: bool
-    original_payload: Optional[bytes]
+    original_payload: Optional[BytesLike]
     service_data: Optional[BaseResponseData]
     original_request: Optional[Request]
 
@@ -154,13 +155,18 @@ class Response:
     # Analyzes a TP frame and builds a Response object. Used by client
 
     @classmethod
-    def from_payload(cls, payload: bytes) -> "Response":
+    def from_payload(cls, payload: Union[bytes, bytearray, memoryview], data_view: bool = False) -> "Response":
         """
         Creates a ``Response`` object from a payload coming from the underlying protocol.
         This method is meant to be used by a UDS client
 
         :param payload: The payload of data to parse
-        :type payload: bytes
+        :type payload: bytes, bytearray or memoryview
+
+        :param data_view: When ``True``, ``data`` is a ``memoryview`` on the given payload instead of a copy of its content. 
+            Meant for large responses that are only forwarded or inspected. Services expect ``data`` to be bytes, so such a response 
+            cannot be given to ``interpret_response()``
+        :type data_view: bool
 
         :return: A :ref:`Response<Response>` object with populated fields
         :rtype: :ref:`Response<Response>`
@@ -217,7 +223,12 @@ class Response:
         response.valid = True
         response.invalid_reason = ""
         if len(payload) > data_start:
-            response.data = payload[data_start:]
+            if data_view:
+                response.data = cast(bytes, memoryview(payload)[data_start:])
+            elif isinstance(payload, bytes):
+                response.data = payload[data_start:]
+            else:
+                response.data = bytes(memoryview(payload)[data_start:])     # bytearray or memoryview given by the transport layer
         return response
 
     def __repr__(self) -> str:
@@ -1,5 +1,4 @@
-import inspect
-from typing import Dict
+from typing import Any, Dict
 
 
 class ResponseCode:
@@ -75,15 +74,25 @@ class ResponseCode:
     CertificateNotAvailable = 0x38 + 7
     AuditTrailInformationNotAvailable = 0x38 + 8
 
-    @classmethod
-    def is_supported_by_standard(cls, code: int, standard_version: int) -> bool:
-        if not isinstance(code, int):
-            raise ValueError("given code must be an integer value, not %s" % (code.__class__.__name__))
+    _names: Dict[int, str]
+    _codes_version: Dict[int, int]
 
-        if not isinstance(standard_version, int):
-            raise ValueError("given standard_version must be an integer value, not %s" % (standard_version.__class__.__name__))
+    # Subclasses adding or renaming codes get their own lookup tables, built once when they are created
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._make_lookup_tables()
+
+    # Builds the lookup tables used by get_name, is_negative and is_supported_by_standard. Called once, right after the class creation.
+    @classmethod
+    def _make_lookup_tables(cls) -> None:
+        # Same name as a scan of inspect.getmembers() would give : the first in alphabetical order when many names share a code
+        cls._names = {}
+        for name in sorted(dir(cls)):
+            value = getattr(cls, name)
+            if not name.startswith('__') and isinstance(value, int):
+                cls._names.setdefault(value, name)
 
-        codes_version: Dict[int, int] = {
+        cls._codes_version = {
             cls.PositiveResponse: 2006,
             cls.GeneralReject: 2006,
             cls.ServiceNotSupported: 2006,
@@ -155,10 +164,18 @@ class ResponseCode:
             cls.AuditTrailInformationNotAvailable: 2006,
         }
 
-        if code not in codes_version:
+    @classmethod
+    def is_supported_by_standard(cls, code: int, standard_version: int) -> bool:
+        if not isinstance(code, int):
+            raise ValueError("given code must be an integer value, not %s" % (code.__class__.__name__))
+
+        if not isinstance(standard_version, int):
+            raise ValueError("given standard_version must be an integer value, not %s" % (standard_version.__class__.__name__))
+
+        if code not in cls._codes_version:
             raise ValueError('Do not know the standard version in which this code has been introduced: %s' % (code))
 
-        return standard_version >= codes_version[code]
+        return standard_version >= cls._codes_version[code]
 
     # Returns the name of the response code as a string
 
@@ -167,11 +184,7 @@ class ResponseCode:
         if given_id is None:
             return ""
 
-        for member in inspect.getmembers(cls):
-            if isinstance(member[1], int):
-                if member[1] == given_id:
-                    return member[0]
-        return str(given_id)
+        return cls._names.get(given_id, str(given_id))
 
     # Tells if a code is a negative code
     @classmethod
@@ -179,8 +192,7 @@ class ResponseCode:
         if given_id in [None, cls.PositiveResponse]:
             return False
 
-        for member in inspect.getmembers(cls):
-            if isinstance(member[1], int):
-                if member[1] == given_id:
-                    return True
-        return False
+        return given_id in cls._names
+
+
+ResponseCode._make_lookup_tables()
@@ -13,11 +13,13 @@ from udsoncan.common.DataFormatIdentifier import *
 from udsoncan.common.dids import *
 from udsoncan.common.DidCodec import *
 from udsoncan.common.dtc import *
+from udsoncan.common.DtcTable import *
 from udsoncan.common.DynamicDidDefinition import *
 from udsoncan.common.Filesize import *
 from udsoncan.common.IOControls import *
 from udsoncan.common.MemoryLocation import *
 from udsoncan.common.Routine import *
+from udsoncan.common.TransferProgress import *
 from udsoncan.common.Units import *
 from udsoncan.typing import *
 
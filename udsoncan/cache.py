@@ -0,0 +1,116 @@
+import threading
+import time
+
+from typing import Any, Dict, Iterable, Optional, Tuple, Union
+
+DidCachePolicy = Union[float, int, str]
+
+
+class DidCache:
+    """
+    Keeps the values of data identifiers (DID) read by a :ref:`Client<Client>` so that they are not read again from the server while they are valid.
+    Only the DIDs listed in the client configuration ``did_cache`` are cached. See :ref:`did_cache<config_did_cache>`.
+
+    The cache of a client is available in ``client.did_cache``.
+
+    .. data:: hits
+
+        Number of DID values given from the cache
+
+    .. data:: misses
+
+        Number of DID values with a cache policy that had to be read from the server
+    """
+
+    STATIC = 'static'
+    """Policy of the DIDs that never change while the server is running. They are kept until the next ECU reset"""
+
+    _entries: Dict[int, Tuple[Any, Optional[float]]]     # DID : (value, expiry time). Expiry is None for static values
+    hits: int
+    misses: int
+
+    def __init__(self) -> None:
+        self._entries = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def validate_policy(cls, did: int, policy: Any) -> None:
+        if policy == cls.STATIC:
+            return
+        if isinstance(policy, bool) or not isinstance(policy, (int, float)) or policy <= 0:
+            raise ValueError('Cache policy of DID 0x%04x must be a positive time to live in seconds or "%s". Got %s' % (did, cls.STATIC, repr(policy)))
+
+    def lookup(self, did: int, policy: Optional[DidCachePolicy]) -> Tuple[bool, Any]:
+        """
+        Searches a DID in the cache and counts a hit or a miss.
+
+        :param did: The data identifier
+        :type did: int
+
+        :param policy: The cache policy of this DID, ``None`` if it is not cached. A DID without policy is not counted.
+        :type policy: float or str
+
+        :return: A tuple ``(found, value)``
+        :rtype: tuple
+        """
+        if policy is None:
+            return (False, None)
+
+        with self._lock:
+            entry = self._entries.get(did, None)
+            if entry is not None:
+                value, expiry = entry
+                if expiry is None or time.monotonic() < expiry:
+                    self.hits += 1
+                    return (True, value)
+                del self._entries[did]
+            self.misses += 1
+        return (False, None)
+
+    def store(self, did: int, value: Any, policy: Optional[DidCachePolicy]) -> None:
+        """Stores the value of a DID read from the server. Nothing is stored if the DID has no policy"""
+        if policy is None:
+            return
+        expiry = None if policy == self.STATIC else time.monotonic() + float(policy)
+        with self._lock:
+            self._entries[did] = (value, expiry)
+
+    def invalidate(self, dids: Optional[Iterable[int]] = None, keep_static: bool = False) -> None:
+        """
+        Removes values from the cache.
+
+        :param dids: The DIDs to remove. All of them if ``None``
+        :type dids: list[int]
+
+        :param keep_static: When True, the values having the ``static`` policy are kept
+        :type keep_static: bool
+        """
+        with self._lock:
+            if dids is None:
+                dids = list(self._entries.keys())
+            for did in dids:
+                entry = self._entries.get(did, None)
+                if entry is not None and not (keep_static and entry[1] is None):
+                    del self._entries[did]
+
+    def clear(self) -> None:
+        """Removes all the values from the cache"""
+        with self._lock:
+            self._entries = {}
+
+    def reset_counters(self) -> None:
+        """Sets the hit and miss counters back to 0"""
+        self.hits = 0
+        self.misses = 0
+
+    def __contains__(self, did: int) -> bool:
+        entry = self._entries.get(did, None)
+        return entry is not None and (entry[1] is None or time.monotonic() < entry[1])
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return '<%s: %d values, %d hits, %d misses at 0x%08x>' % (self.__class__.__name__, len(self._entries), self.hits, self.misses, id(self))
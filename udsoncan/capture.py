@@ -0,0 +1,317 @@
+import bisect
+import mmap
+import struct
+import threading
+import time
+import zlib
+
+from typing import Any, BinaryIO, Iterator, List, Optional, Tuple, Union
+
+# File layout :
+#   File header : magic, version, flags
+#   Blocks      : block header (stored size, raw size, record count, first timestamp) followed by the records, compressed or not
+#   Records     : record header (payload length, timestamp, direction) followed by the payload
+#   Index       : written when the capture is closed. One entry per block (offset, first record number, first timestamp), then a trailer
+# A capture that was not closed (crash, power loss) has no index. The reader rebuilds it by walking the block headers.
+_FILE_HEADER = struct.Struct('<6sBB')
+_BLOCK_HEADER = struct.Struct('<IIId')
+_RECORD_HEADER = struct.Struct('<IdB')
+_INDEX_ENTRY = struct.Struct('<QQd')
+_TRAILER = struct.Struct('<QQ4s')
+
+_MAGIC = b'UDSCAP'
+_INDEX_MAGIC = b'UIDX'
+_VERSION = 1
+_FLAG_ZLIB = 0x01
+
+
+class CaptureRecord:
+    """
+    A payload exchanged with a server, read from a capture file.
+
+    .. data:: timestamp
+
+        Time at which the payload was sent or received, given by ``time.time()``
+
+    .. data:: direction
+
+        ``CaptureRecord.TX`` for a payload sent by the client, ``CaptureRecord.RX`` for a payload received from the server
+
+    .. data:: payload
+
+        The payload as ``bytes``
+    """
+    __slots__ = ('timestamp', 'direction', 'payload')
+
+    TX = 0
+    RX = 1
+
+    timestamp: float
+    direction: int
+    payload: bytes
+
+    def __init__(self, timestamp: float, direction: int, payload: bytes):
+        self.timestamp = timestamp
+        self.direction = direction
+        self.payload = payload
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, CaptureRecord):
+            return False
+        return self.timestamp == other.timestamp and self.direction == other.direction and self.payload == other.payload
+
+    def __repr__(self) -> str:
+        return '<%s: %.6f %s [%s] at 0x%08x>' % (self.__class__.__name__, self.timestamp, 'TX' if self.direction == self.TX else 'RX', self.payload.hex(), id(self))
+
+
+class CaptureWriter:
+    """
+    Writes payloads in a compact binary capture file. Records are grouped in blocks of ``records_per_block`` records, optionally compressed with zlib.
+    The file is only appended to. An index of the blocks is written when the writer is closed, making the seek by time or by record number fast.
+
+    Files written by this class are read with :class:`CaptureReader<udsoncan.capture.CaptureReader>`. A file that was never closed can still be read.
+
+    :param filename: The file to create. An existing file is overwritten
+    :type filename: str
+
+    :param compress: Compress the blocks with zlib
+    :type compress: bool
+
+    :param records_per_block: Number of records in a block. Bigger blocks compress better, smaller blocks are faster to seek into
+    :type records_per_block: int
+
+    :param buffer_size: Size of the file write buffer, in bytes
+    :type buffer_size: int
+    """
+
+    compress: bool
+    records_per_block: int
+    record_count: int
+    _file: BinaryIO
+    _block: bytearray
+    _block_count: int
+    _block_first_timestamp: float
+    _index: List[Tuple[int, int, float]]
+
+    def __init__(self, filename: str, compress: bool = False, records_per_block: int = 1024, buffer_size: int = 1024 * 1024):
+        if not isinstance(records_per_block, int) or records_per_block < 1:
+            raise ValueError('records_per_block must be a positive integer')
+        self.compress = compress
+        self.records_per_block = records_per_block
+        self.record_count = 0
+        self._lock = threading.Lock()
+        self._block = bytearray()
+        self._block_count = 0
+        self._block_first_timestamp = 0
+        self._index = []
+        self._file = open(filename, 'wb', buffering=buffer_size)
+        self._file.write(_FILE_HEADER.pack(_MAGIC, _VERSION, _FLAG_ZLIB if compress else 0))
+        self._offset = _FILE_HEADER.size
+
+    def write(self, direction: int, payload: Union[bytes, bytearray, memoryview], timestamp: Optional[float] = None) -> None:
+        """
+        Adds a record to the capture.
+
+        :param direction: ``CaptureRecord.TX`` or ``CaptureRecord.RX``
+        :type direction: int
+
+        :param payload: The payload sent or received
+        :type payload: bytes
+
+        :param timestamp: Time of the record. ``time.time()`` is used when ``None``
+        :type timestamp: float
+        """
+        if timestamp is None:
+            timestamp = time.time()
+        with self._lock:
+            if self._block_count == 0:
+                self._block_first_timestamp = timestamp
+            self._block += _RECORD_HEADER.pack(len(payload), timestamp, direction)
+            self._block += payload
+            self._block_count += 1
+            self.record_count += 1
+            if self._block_count >= self.records_per_block:
+                self._write_block()
+
+    def _write_block(self) -> None:
+        if self._block_count == 0:
+            return
+        data = zlib.compress(self._block) if self.compress else self._block
+        self._index.append((self._offset, self.record_count - self._block_count, self._block_first_timestamp))
+        self._file.write(_BLOCK_HEADER.pack(len(data), len(self._block), self._block_count, self._block_first_timestamp))
+        self._file.write(data)
+        self._offset += _BLOCK_HEADER.size + len(data)
+        self._block = bytearray()
+        self._block_count = 0
+
+    def flush(self) -> None:
+        """Writes the pending records to the file, in a smaller block if needed"""
+        with self._lock:
+            self._write_block()
+            self._file.flush()
+
+    def close(self) -> None:
+        """Writes the pending records and the index, then closes the file"""
+        with self._lock:
+            if self._file.closed:
+                return
+            self._write_block()
+            for entry in self._index:
+                self._file.write(_INDEX_ENTRY.pack(*entry))
+            self._file.write(_TRAILER.pack(self._offset, len(self._index), _INDEX_MAGIC))
+            self._file.close()
+
+    def __enter__(self) -> "CaptureWriter":
+        return self
+
+    def __exit__(self, type, value, traceback) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return '<%s: %d records%s at 0x%08x>' % (self.__class__.__name__, self.record_count, ' compressed' if self.compress else '', id(self))
+
+
+class CaptureReader:
+    """
+    Reads a capture file written by :class:`CaptureWriter<udsoncan.capture.CaptureWriter>` or by a :class:`RecorderConnection<udsoncan.connections.RecorderConnection>`.
+    The file is memory-mapped and the records are decoded lazily, one block at a time, so that very large captures are read without loading them in memory.
+    The index of the blocks is used to start reading at a given time or record number without decoding what comes before.
+
+    Iterating the reader gives all the :class:`CaptureRecord<udsoncan.capture.CaptureRecord>` in the order they were written.
+
+    :param filename: The capture file
+    :type filename: str
+
+    :raises ValueError: If the file is not a capture file
+    """
+
+    compressed: bool
+    _blocks: List[Tuple[int, int, float]]   # (offset, first record number, first timestamp)
+    _block_starts: List[int]
+    _block_timestamps: List[float]
+    _record_count: int
+
+    def __init__(self, filename: str):
+        self._file = open(filename, 'rb')
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # Empty file
+            self._file.close()
+            raise ValueError('%s is not a capture file' % filename)
+
+        if len(self._mmap) < _FILE_HEADER.size:
+            self.close()
+            raise ValueError('%s is not a capture file' % filename)
+        magic, version, flags = _FILE_HEADER.unpack_from(self._mmap, 0)
+        if magic != _MAGIC or version != _VERSION:
+            self.close()
+            raise ValueError('%s is not a capture file or has an unsupported version' % filename)
+        self.compressed = (flags & _FLAG_ZLIB) != 0
+
+        self._load_index()
+        self._block_starts = [block[1] for block in self._blocks]
+        self._block_timestamps = [block[2] for block in self._blocks]
+
+    def _load_index(self) -> None:
+        size = len(self._mmap)
+        if size >= _FILE_HEADER.size + _TRAILER.size:
+            index_offset, entry_count, magic = _TRAILER.unpack_from(self._mmap, size - _TRAILER.size)
+            if magic == _INDEX_MAGIC and index_offset + entry_count * _INDEX_ENTRY.size + _TRAILER.size == size:
+                self._blocks = [_INDEX_ENTRY.unpack_from(self._mmap, index_offset + i * _INDEX_ENTRY.size) for i in range(entry_count)]
+                if entry_count > 0:
+                    self._record_count = self._blocks[-1][1] + _BLOCK_HEADER.unpack_from(self._mmap, self._blocks[-1][0])[2]
+                else:
+                    self._record_count = 0
+                return
+
+        # No index. The capture was not closed, walk the block headers. An incomplete block at the end is ignored
+        self._blocks = []
+        offset = _FILE_HEADER.size
+        record_count = 0
+        while offset + _BLOCK_HEADER.size <= size:
+            stored_size, raw_size, count, first_timestamp = _BLOCK_HEADER.unpack_from(self._mmap, offset)
+            if offset + _BLOCK_HEADER.size + stored_size > size:
+                break
+            self._blocks.append((offset, record_count, first_timestamp))
+            record_count += count
+            offset += _BLOCK_HEADER.size + stored_size
+        self._record_count = record_count
+
+    def _read_block(self, block_index: int) -> Iterator[CaptureRecord]:
+        offset = self._blocks[block_index][0]
+        stored_size, raw_size, count, first_timestamp = _BLOCK_HEADER.unpack_from(self._mmap, offset)
+        start = offset + _BLOCK_HEADER.size
+        data: Any
+        if self.compressed:
+            data = zlib.decompress(self._mmap[start:start + stored_size])
+            position = 0
+        else:
+            data = self._mmap
+            position = start
+
+        unpack_from = _RECORD_HEADER.unpack_from
+        header_size = _RECORD_HEADER.size
+        for i in range(count):
+            length, timestamp, direction = unpack_from(data, position)
+            position += header_size
+            yield CaptureRecord(timestamp, direction, data[position:position + length])
+            position += length
+
+    def records(self, start_time: Optional[float] = None, end_time: Optional[float] = None, start: int = 0) -> Iterator[CaptureRecord]:
+        """
+        Iterates the records of the capture, lazily. The blocks before ``start_time`` or ``start`` are skipped without being decoded.
+
+        :param start_time: Skips the records older than this time. Records are expected to be written in chronological order
+        :type start_time: float
+
+        :param end_time: Stops at the first record newer than this time
+        :type end_time: float
+
+        :param start: Number of the first record to return
+        :type start: int
+        """
+        if start < 0:
+            start = max(self._record_count + start, 0)
+        first_block = max(bisect.bisect_right(self._block_starts, start) - 1, 0)
+        if start_time is not None:
+            first_block = max(first_block, bisect.bisect_right(self._block_timestamps, start_time) - 1)
+
+        for block_index in range(first_block, len(self._blocks)):
+            record_number = self._block_starts[block_index]
+            for record in self._read_block(block_index):
+                if record_number >= start and (start_time is None or record.timestamp >= start_time):
+                    if end_time is not None and record.timestamp > end_time:
+                        return
+                    yield record
+                record_number += 1
+
+    def __iter__(self) -> Iterator[CaptureRecord]:
+        return self.records()
+
+    def __len__(self) -> int:
+        return self._record_count
+
+    def __getitem__(self, index: int) -> CaptureRecord:
+        if index < 0:
+            index += self._record_count
+        if index < 0 or index >= self._record_count:
+            raise IndexError('Record index out of range')
+        return next(self.records(start=index))
+
+    @property
+    def block_count(self) -> int:
+        """Number of blocks in the capture"""
+        return len(self._blocks)
+
+    def close(self) -> None:
+        self._mmap.close()
+        self._file.close()
+
+    def __enter__(self) -> "CaptureReader":
+        return self
+
+    def __exit__(self, type, value, traceback) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return '<%s: %d records in %d blocks%s at 0x%08x>' % (self.__class__.__name__, self._record_count, len(self._blocks), ' compressed' if self.compressed else '', id(self))
@@ -1,7 +1,7 @@
 from udsoncan import Request, Response, services
 from udsoncan.common.Routine import Routine
 from udsoncan.common.dtc import Dtc
-from udsoncan.common.dids import DataIdentifier
+from udsoncan.common.dids import DataIdentifier, CompiledDidConfig
 from udsoncan.common.MemoryLocation import MemoryLocation
 from udsoncan.common.DynamicDidDefinition import DynamicDidDefinition
 from udsoncan.common.CommunicationType import CommunicationType
@@ -9,19 +9,30 @@ from udsoncan.common.DataFormatIdentifier import DataFormatIdentifier
 from udsoncan.common.Baudrate import Baudrate
 from udsoncan.common.IOControls import IOValues, IOMasks
 from udsoncan.common.Filesize import Filesize
-from udsoncan.connections import BaseConnection
+from udsoncan.common.TransferProgress import TransferProgress
+from udsoncan.connections import BaseConnection, AsyncBaseConnection
 from udsoncan.BaseService import BaseService
 
 from udsoncan.exceptions import *
 from udsoncan.configs import default_client_config
-from udsoncan.typing import ClientConfig
+from udsoncan.metrics import ClientMetrics
+from udsoncan.cache import DidCache
+from udsoncan.typing import ClientConfig, BytesLike, TransferDataSource, TransferDataDestination, TransferProgressCallbackType
 from udsoncan import valid_standards
+import asyncio
+import collections
 import logging
 import binascii
 import functools
+import os
 import time
 
-from typing import Callable, Optional, Union, Dict, List, Any, cast, Type
+from typing import Callable, Optional, Union, Dict, List, Any, cast, Type, Generator, Tuple, TypeVar, Iterator, Iterable, BinaryIO
+
+T = TypeVar('T')
+# What a service method of the client is made of. Yields the requests to send, receives the responses and returns the value given to the user.
+ServiceCallGenerator = Generator[Request, Optional[Response], T]
+RequestStepsGenerator = Generator[Tuple[str, Any], Any, T]
 
 
 class SessionTiming:
@@ -37,21 +48,281 @@ class SessionTiming:
         self.p2_star_server_max = p2_star_server_max
 
 
-class Client:
+class ReadDataByIdentifierLimits:
+    """Container for the server limits learned by :meth:`read_data_by_identifier_bulk<Client.read_data_by_identifier_bulk>` from negative responses."""
+
+    max_response_size: Optional[int]
+    """Largest response size, in bytes, that the server is known to accept. ``None`` if not learned yet """
+    max_did_per_request: Optional[int]
+    """Largest number of DIDs in a request that the server is known to accept. ``None`` if not learned yet """
+
+    def __init__(self, max_response_size: Optional[int] = None, max_did_per_request: Optional[int] = None) -> None:
+        self.max_response_size = max_response_size
+        self.max_did_per_request = max_did_per_request
+
+
+class PeriodicSample:
     """
-    __init__(self, conn, config=default_client_config, request_timeout = None)
+    A value received from the server in a periodic data message (:ref:`ReadDataByPeriodicIdentifier<ReadDataByPeriodicIdentifier>`)
 
-    Object that interacts with a UDS server. 
-    It builds a service request, sends it to the server, receives and parses its response, detects communication anomalies and logs what it is doing for further debugging.
+    .. data:: did
 
-    :param conn: The underlying protocol interface.
-    :type conn: :ref:`Connection<Connection>`
+        The periodic data identifier (0xF200-0xF2FF)
 
-    :param config: The :ref:`client configuration<client_config>`
-    :type config: dict
+    .. data:: value
 
-    :param request_timeout: Maximum amount of time to wait for a response. This parameter exists for backward compatibility only. For detailed timeout handling, see :ref:`Client configuration<config_timeouts>`
-    :type request_timeout: int
+        The value returned by the :ref:`DidCodec<DidCodec>` of the DID
+
+    .. data:: timestamp
+
+        Time of reception, given by ``time.monotonic()``
+    """
+
+    did: int
+    value: Any
+    timestamp: float
+
+    def __init__(self, did: int, value: Any, timestamp: float):
+        self.did = did
+        self.value = value
+        self.timestamp = timestamp
+
+    def __repr__(self) -> str:
+        return '<%s: 0x%04x=%s at 0x%08x>' % (self.__class__.__name__, self.did, self.value, id(self))
+
+
+class PeriodicDataStream:
+    """
+    Values of periodic data identifiers sent by the server after :meth:`Client.start_periodic_stream<udsoncan.client.Client.start_periodic_stream>`.
+    Periodic data messages are decoded as soon as the client reads them from the connection, either while reading the stream 
+    or while waiting for the response of another request. Each value is given to the callback, if any, and kept in a bounded queue.
+
+    .. data:: didlist
+
+        The periodic data identifiers (0xF200-0xF2FF) of the stream
+
+    .. data:: transmission_mode
+
+        The transmission mode requested to the server
+
+    .. data:: active
+
+        ``True`` until the stream is stopped with :meth:`Client.stop_periodic_stream<udsoncan.client.Client.stop_periodic_stream>`
+
+    .. data:: overflow_count
+
+        Number of values dropped because the queue was full. The oldest values are dropped first
+    """
+
+    didlist: List[int]
+    transmission_mode: int
+    callback: Optional[Callable[[PeriodicSample], None]]
+    active: bool
+    overflow_count: int
+    _client: "BaseClient"
+    _samples: "collections.deque[PeriodicSample]"
+
+    def __init__(self, client: "BaseClient", didlist: List[int], transmission_mode: int,
+                 callback: Optional[Callable[[PeriodicSample], None]] = None, maxsize: int = 1000):
+        if not isinstance(maxsize, int) or maxsize < 1:
+            raise ValueError('maxsize must be a positive integer')
+        self._client = client
+        self.didlist = didlist
+        self.transmission_mode = transmission_mode
+        self.callback = callback
+        self.active = True
+        self.overflow_count = 0
+        self._samples = collections.deque(maxlen=maxsize)
+
+    def _push(self, sample: PeriodicSample) -> None:
+        if len(self._samples) == self._samples.maxlen:
+            self.overflow_count += 1
+        self._samples.append(sample)
+        if self.callback is not None:
+            self.callback(sample)
+
+    def pending(self) -> int:
+        """Number of values received and not read yet"""
+        return len(self._samples)
+
+    def poll(self) -> int:
+        """Processes the frames already received by the connection without blocking, calling the callback for each value. 
+        Returns the number of values waiting in the queue"""
+        while cast(Client, self._client)._receive_periodic_data(timeout=0):
+            pass
+        return len(self._samples)
+
+    def read(self, timeout: Optional[float] = None) -> Optional[PeriodicSample]:
+        """
+        Returns the oldest value received, waiting up to ``timeout`` seconds for one to arrive. Used with a synchronous :ref:`Client<Client>`.
+
+        :param timeout: Maximum time to wait in seconds. ``None`` waits until a value is received or the stream is stopped
+        :type timeout: float
+
+        :return: The value or ``None`` if no value has been received in time
+        :rtype: :class:`PeriodicSample<udsoncan.client.PeriodicSample>`
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while len(self._samples) == 0 and self.active:
+            remaining = None if deadline is None else max(deadline - time.monotonic(), 0)
+            received = cast(Client, self._client)._receive_periodic_data(timeout=remaining)
+            if not received and remaining is not None and remaining <= 0:
+                break
+        return self._samples.popleft() if len(self._samples) > 0 else None
+
+    async def read_async(self, timeout: Optional[float] = None) -> Optional[PeriodicSample]:
+        """Same as :meth:`read<udsoncan.client.PeriodicDataStream.read>`, for an :class:`AsyncClient<udsoncan.client.AsyncClient>`"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while len(self._samples) == 0 and self.active:
+            remaining = None if deadline is None else max(deadline - time.monotonic(), 0)
+            received = await cast(AsyncClient, self._client)._receive_periodic_data_async(timeout=remaining)
+            if not received and remaining is not None and remaining <= 0:
+                break
+        return self._samples.popleft() if len(self._samples) > 0 else None
+
+    def samples(self, count: Optional[int] = None, timeout: Optional[float] = None) -> Iterator[PeriodicSample]:
+        """
+        Generator of the values received. Stops after ``count`` values, when no value is received within ``timeout`` seconds or when the stream is stopped.
+
+        :param count: Number of values to read. ``None`` for no limit
+        :type count: int
+
+        :param timeout: Maximum time to wait for each value in seconds. ``None`` for no limit
+        :type timeout: float
+        """
+        n = 0
+        while count is None or n < count:
+            sample = self.read(timeout=timeout)
+            if sample is None:
+                return
+            yield sample
+            n += 1
+
+    def __repr__(self) -> str:
+        return '<%s: [%s] %s at 0x%08x>' % (self.__class__.__name__, ', '.join(['0x%04x' % did for did in self.didlist]),
+                                            'active' if self.active else 'stopped', id(self))
+
+
+class Outcome:
+    """
+    Result of a request sent with :meth:`Client.try_request<udsoncan.client.Client.try_request>`. 
+    The outcome of a request is known without catching an exception, which is much faster when most requests are expected to fail.
+    An outcome is true when it is positive.
+
+    .. data:: status
+
+        One of ``Outcome.POSITIVE``, ``Outcome.NEGATIVE``, ``Outcome.TIMEOUT``, ``Outcome.INVALID``, ``Outcome.UNEXPECTED``
+
+    .. data:: request
+
+        The :ref:`Request<Request>` sent to the server
+
+    .. data:: response
+
+        The :ref:`Response<Response>` received from the server. ``None`` on timeout or when the positive response was suppressed
+    """
+    __slots__ = ('status', 'request', 'response')
+
+    POSITIVE = 'positive'
+    NEGATIVE = 'negative'
+    TIMEOUT = 'timeout'
+    INVALID = 'invalid'
+    UNEXPECTED = 'unexpected'
+
+    status: str
+    request: Request
+    response: Optional[Response]
+
+    def __init__(self, status: str, request: Request, response: Optional[Response] = None):
+        self.status = status
+        self.request = request
+        self.response = response
+
+    @property
+    def positive(self) -> bool:
+        """True if the server gave a positive response"""
+        return self.status == self.POSITIVE
+
+    @property
+    def code(self) -> Optional[int]:
+        """The response code. ``None`` if there is no response"""
+        return None if self.response is None else self.response.code
+
+    def __bool__(self) -> bool:
+        return self.status == self.POSITIVE
+
+    def __repr__(self) -> str:
+        code = '' if self.response is None or self.response.code is None else ' 0x%02x' % self.response.code
+        return '<%s: %s%s at 0x%08x>' % (self.__class__.__name__, self.status, code, id(self))
+
+
+class _EncodedRequest(Request):
+    # A request built directly in its encoded form. The payload is sent as is, without the copies made by get_payload()
+    payload: bytearray
+
+    def __init__(self, service: Type[BaseService], payload: bytearray):
+        super().__init__(service)
+        self.payload = payload
+
+    def get_payload(self, suppress_positive_response: Optional[bool] = None) -> bytes:
+        return bytes(self.payload)
+
+
+class PreparedRequest:
+    """
+    A request validated and encoded once by :meth:`Client.prepare<udsoncan.client.Client.prepare>`, that can be sent many times.
+    Calling the object sends the request and returns the response interpreted exactly like the client method it was prepared from,
+    without validating the parameters, encoding the payload or logging the request again. 
+    With an :class:`AsyncClient<udsoncan.client.AsyncClient>`, calling the object returns an awaitable.
+
+    Errors are handled according to the ``exception_on_<type>_response`` configuration, like any other request. 
+    A prepared request can also be given to :meth:`Client.try_request<udsoncan.client.Client.try_request>` to get an :class:`Outcome<udsoncan.client.Outcome>` instead.
+
+    .. data:: name
+
+        Name of the client method the request was prepared from
+
+    .. data:: request
+
+        The :ref:`Request<Request>` sent to the server. It must not be modified
+
+    .. data:: payload
+
+        The encoded request
+    """
+
+    name: str
+    request: Request
+    payload: bytes
+    _client: "BaseClient"
+    _interpreter: Callable[[Response], Any]
+
+    def __init__(self, client: "BaseClient", name: str, request: Request, interpreter: Callable[[Response], Any]):
+        self._client = client
+        self.name = name
+        self.request = request
+        self.payload = request.get_payload()
+        self._interpreter = interpreter
+
+    def __call__(self, timeout: float = -1) -> Any:
+        """
+        Sends the request and interprets the response.
+
+        :param timeout: Maximum time to wait for the response. When not given, the timeouts of the client configuration are used
+        :type timeout: float
+
+        :return: The same value as the client method the request was prepared from
+        """
+        return self._client._call_prepared(self, timeout)
+
+    def __repr__(self) -> str:
+        return '<%s: %s [%s] at 0x%08x>' % (self.__class__.__name__, self.name, self.payload.hex(), id(self))
+
+
+class BaseClient:
+    """
+    Base class of the :ref:`Client<Client>` and the :ref:`AsyncClient<AsyncClient>`. Holds the configuration and the logic of the services, 
+    that builds the requests and interprets the responses without talking to the connection. Not meant to be used directly.
     """
 
     class SuppressPositiveResponse:
@@ -101,43 +372,38 @@ class Client:
             else:
                 return self.modifier
 
-    conn: BaseConnection
+    conn: Union[BaseConnection, AsyncBaseConnection]
     config: ClientConfig
-    suppress_positive_response: "Client.SuppressPositiveResponse"
-    payload_override: "Client.PayloadOverrider"
+    suppress_positive_response: "BaseClient.SuppressPositiveResponse"
+    payload_override: "BaseClient.PayloadOverrider"
     last_response: Optional[Response]
     session_timing: SessionTiming
+    rdbi_limits: ReadDataByIdentifierLimits
+    periodic_streams: Dict[int, PeriodicDataStream]
     logger: logging.Logger
+    metrics: Optional[ClientMetrics]
+    _compiled_didconfig: Optional[CompiledDidConfig]
 
-    def __init__(self, conn: BaseConnection, config: ClientConfig = default_client_config, request_timeout: Optional[float] = None):
+    def __init__(self, conn: Union[BaseConnection, AsyncBaseConnection], config: ClientConfig = default_client_config, request_timeout: Optional[float] = None):
         self.conn = conn
         self.config = cast(ClientConfig, dict(config))  # Makes a copy of given configuration
 
         # For backward compatibility
         if request_timeout is not None:
             self.config['request_timeout'] = request_timeout
-        self.suppress_positive_response = Client.SuppressPositiveResponse()
-        self.payload_override = Client.PayloadOverrider()
+        self.suppress_positive_response = BaseClient.SuppressPositiveResponse()
+        self.payload_override = BaseClient.PayloadOverrider()
         self.last_response = None
 
         self.session_timing = SessionTiming(p2_server_max=None, p2_star_server_max=None)
+        self.rdbi_limits = ReadDataByIdentifierLimits()
+        self.periodic_streams = {}   # Maps a periodic DID to its active stream
+        self.metrics = None     # Set a ClientMetrics to collect metrics
+        self.did_cache = DidCache()
+        self._compiled_didconfig = None
 
         self.refresh_config()
 
-    def __enter__(self):
-        self.open()
-        return self
-
-    def __exit__(self, type, value, traceback):
-        self.close()
-
-    def open(self) -> None:
-        if not self.conn.is_open():
-            self.conn.open()
-
-    def close(self) -> None:
-        self.conn.close()
-
     def configure_logger(self) -> None:
         logger_name = 'UdsClient'
         if 'logger_name' in self.config:
@@ -155,6 +421,7 @@ class Client:
 
     def refresh_config(self) -> None:
         self.configure_logger()
+        self._compiled_didconfig = None
         for k in default_client_config:
             if k not in self.config:
                 self.config[k] = default_client_config[k]  # type:ignore
@@ -164,51 +431,155 @@ class Client:
         if self.config['standard_version'] not in valid_standards:
             raise ConfigError('Valid standard versions are 2006, 2013, 2020. %s is not supported' % self.config['standard_version'])
 
-    # Decorator to apply on functions that the user will call.
-    # Each function raises exceptions. This decorator handles these exceptions, logs them,
-    # then suppresses them or not depending on the client configuration.
-    # if func1 and func2 are decorated and func2 calls func1, it should be done this way : self.func1._func_no_error_management(self, ...)
-
-    def standard_error_management(func: Callable):  # type: ignore
-        @functools.wraps(func)
-        def decorated(self: "Client", *args, **kwargs):
+        if not isinstance(self.config['did_cache'], dict):
+            raise ConfigError('did_cache must be a dict mapping a data identifier to a cache policy')
+        for did, policy in self.config['did_cache'].items():
             try:
-                return func(self, *args, **kwargs)
+                DidCache.validate_policy(did, policy)
+            except ValueError as e:
+                raise ConfigError(str(e))
+
+    # Each method that the user calls to talk to the server is split in two :
+    # - A private generator, named _<method>_steps, that yields the requests to send and receives the server responses (or None) through the yield statement.
+    #   The value it returns is given to the user. The generators are defined here, so the Client and the AsyncClient share the same service logic.
+    #   A generator that needs another service does it this way : response = yield from self._<other method>_steps(...)
+    # - The public method of the Client or the AsyncClient, that runs the generator with _call_service. _call_service handles the exceptions raised 
+    #   by the generator, logs them, then suppresses them or not depending on the client configuration.
+
+    def _start_service_call(self, service_call: ServiceCallGenerator[Any]) -> Request:
+        # Runs a service call until its first request. The time taken is the encoding time of that request.
+        if self.metrics is None:
+            return next(service_call)
+        t1 = time.perf_counter()
+        request = next(service_call)
+        self.metrics.for_request(request).encode_time.observe(time.perf_counter() - t1)
+        return request
+
+    def _resume_service_call(self, service_call: ServiceCallGenerator[Any], request: Request, response: Optional[Response]) -> Request:
+        # Gives the response to a service call and runs it until the next request or the end (StopIteration).
+        # The time taken is the decoding time of the response.
+        if self.metrics is None:
+            return service_call.send(response)
+        t1 = time.perf_counter()
+        try:
+            return service_call.send(response)
+        finally:
+            self.metrics.for_request(request).decode_time.observe(time.perf_counter() - t1)
+
+    def _manage_service_exception(self, e: Exception) -> Any:
+        """Logs an exception raised by a service call, then raises it again or returns the response attached to it, depending on the configuration"""
+        if isinstance(e, NegativeResponseException):
+            e.response.positive = False
+            if self.config['exception_on_negative_response']:
+                logline = '[%s] : %s' % (e.__class__.__name__, str(e))
+                self.logger.warning(logline)
+                raise e
+            else:
+                self.logger.warning(str(e))
+                return e.response
 
-            except NegativeResponseException as e:
-                e.response.positive = False
-                if self.config['exception_on_negative_response']:
-                    logline = '[%s] : %s' % (e.__class__.__name__, str(e))
-                    self.logger.warning(logline)
-                    raise
-                else:
-                    self.logger.warning(str(e))
-                    return e.response
+        elif isinstance(e, InvalidResponseException):
+            e.response.valid = False
+            if self.config['exception_on_invalid_response']:
+                self.logger.error('[%s] : %s' % (e.__class__.__name__, str(e)))
+                raise e
+            else:
+                self.logger.error(str(e))
+                return e.response
 
-            except InvalidResponseException as e:
-                e.response.valid = False
-                if self.config['exception_on_invalid_response']:
-                    self.logger.error('[%s] : %s' % (e.__class__.__name__, str(e)))
-                    raise
-                else:
-                    self.logger.error(str(e))
-                    return e.response
+        elif isinstance(e, UnexpectedResponseException):
+            e.response.unexpected = True
+            if self.config['exception_on_unexpected_response']:
+                self.logger.error('[%s] : %s' % (e.__class__.__name__, str(e)))
+                raise e
+            else:
+                self.logger.error(str(e))
+                return e.response
 
-            except UnexpectedResponseException as e:
-                e.response.unexpected = True
-                if self.config['exception_on_unexpected_response']:
-                    self.logger.error('[%s] : %s' % (e.__class__.__name__, str(e)))
-                    raise
-                else:
-                    self.logger.error(str(e))
-                    return e.response
+        else:
+            self.logger.error('[%s] : %s' % (e.__class__.__name__, str(e)))
+            raise e
 
-            except Exception as e:
-                self.logger.error('[%s] : %s' % (e.__class__.__name__, str(e)))
-                raise
+    def prepare(self, service: Union[str, Callable], *args: Any, **kwargs: Any) -> PreparedRequest:
+        """
+        Validates and encodes a request once so that it can be sent repeatedly with a minimal overhead, for example in a polling loop.
+        The returned object is called to send the request. Example : ``read_speed = client.prepare(client.read_data_by_identifier, 0xF40D)`` then ``response = read_speed()``
+
+        The request is bound to the client configuration at the time it is prepared (``data_identifiers``, ``server_address_format``, etc.). 
+        It must be prepared again after a configuration change. Prepared requests do not use the :ref:`DID cache<config_did_cache>`.
+
+        Supported methods are ``read_data_by_identifier``, ``read_memory_by_address``, ``routine_control``, ``start_routine``, ``stop_routine``, ``get_routine_result`` and ``tester_present``.
+
+        :param service: The client method to prepare or its name
+        :type service: callable or str
+
+        :param args: The arguments given to the client method
+
+        :return: The prepared request
+        :rtype: :class:`PreparedRequest<udsoncan.client.PreparedRequest>`
+
+        :raises ValueError: If the method cannot be prepared or if the arguments are invalid
+        """
+        name = service if isinstance(service, str) else getattr(service, '__name__', repr(service))
+        preparer = getattr(self, '_prepare_%s' % name, None)
+        if preparer is None:
+            raise ValueError('Client method "%s" cannot be prepared' % name)
+        request, interpreter = preparer(*args, **kwargs)
+        return PreparedRequest(self, name, request, interpreter)
+
+    # Each _prepare_<method> function makes the request of a client method and returns it with the function that interprets its response
+    def _prepare_read_data_by_identifier(self, didlist: Union[int, List[int]]) -> Tuple[Request, Callable[[Response], Any]]:
+        didlist = services.ReadDataByIdentifier.validate_didlist_input(didlist)
+        if 'data_identifiers' not in self.config or not isinstance(self.config['data_identifiers'], dict):
+            raise ConfigError('Configuration does not contains a valid data identifier description.')
+        didconfig = self.get_compiled_didconfig()
+        request = services.ReadDataByIdentifier.make_request(didlist=didlist, didconfig=didconfig)
+        return (request, functools.partial(self._interpret_rdbi_response, didlist=didlist, didconfig=didconfig))
+
+    def _prepare_read_memory_by_address(self, memory_location: MemoryLocation) -> Tuple[Request, Callable[[Response], Any]]:
+        request = self._make_read_memory_by_address_request(memory_location)
+        return (request, functools.partial(self._interpret_read_memory_by_address_response, memory_location=memory_location))
+
+    def _prepare_routine_control(self, routine_id: int, control_type: int, data: Optional[bytes] = None) -> Tuple[Request, Callable[[Response], Any]]:
+        request = services.RoutineControl.make_request(routine_id, control_type, data=data)
+        return (request, functools.partial(self._interpret_routine_control_response, routine_id=routine_id, control_type=control_type))
+
+    def _prepare_start_routine(self, routine_id: int, data: Optional[bytes] = None) -> Tuple[Request, Callable[[Response], Any]]:
+        return self._prepare_routine_control(routine_id, services.RoutineControl.ControlType.startRoutine, data)
+
+    def _prepare_stop_routine(self, routine_id: int, data: Optional[bytes] = None) -> Tuple[Request, Callable[[Response], Any]]:
+        return self._prepare_routine_control(routine_id, services.RoutineControl.ControlType.stopRoutine, data)
 
-        decorated._func_no_error_management = func  # type:ignore
-        return decorated
+    def _prepare_get_routine_result(self, routine_id: int, data: Optional[bytes] = None) -> Tuple[Request, Callable[[Response], Any]]:
+        return self._prepare_routine_control(routine_id, services.RoutineControl.ControlType.requestRoutineResults, data)
+
+    def _prepare_tester_present(self) -> Tuple[Request, Callable[[Response], Any]]:
+        request = services.TesterPresent.make_request()
+        assert request.subfunction is not None
+        return (request, functools.partial(self._interpret_tester_present_response, subfunction=request.subfunction))
+
+    def _call_prepared(self, prepared: PreparedRequest, timeout: float) -> Any:
+        # Sends a prepared request with the connection. Implemented by the Client and the AsyncClient
+        raise NotImplementedError()
+
+    def _interpret_prepared_response(self, prepared: PreparedRequest, response: Optional[Response]) -> Any:
+        if response is None:
+            return None
+        if self.metrics is None:
+            return prepared._interpreter(response)
+        t1 = time.perf_counter()
+        try:
+            return prepared._interpreter(response)
+        finally:
+            self.metrics.for_request(prepared.request).decode_time.observe(time.perf_counter() - t1)
+
+    def get_compiled_didconfig(self) -> CompiledDidConfig:
+        """Returns the DID codecs of ``config['data_identifiers']`` compiled for reuse between requests.
+        The compiled configuration is discarded when the configuration is changed with ``set_config`` or ``set_configs``
+        or when ``config['data_identifiers']`` is replaced."""
+        if self._compiled_didconfig is None or self._compiled_didconfig.didconfig is not self.config['data_identifiers']:
+            self._compiled_didconfig = CompiledDidConfig(self.config['data_identifiers'])
+        return self._compiled_didconfig
 
     def service_log_prefix(self, service: Type[BaseService]):
         return "%s<0x%02x>" % (service.get_name(), service.request_id())
@@ -222,25 +593,14 @@ class Client:
         """
         return self.session_timing
 
-    @standard_error_management
-    def change_session(self, newsession: int) -> Optional[services.DiagnosticSessionControl.InterpretedResponse]:
-        """ 
-        Requests the server to change the diagnostic session with a :ref:`DiagnosticSessionControl<DiagnosticSessionControl>` service request
-
-        :Effective configuration: ``exception_on_<type>_response``
-
-        :param newsession: The session to try to switch. Values from :class:`DiagnosticSessionControl.Session <udsoncan.services.DiagnosticSessionControl.Session>` can be used.
-        :type newsession: int 
-
-        :return: The server response parsed by :meth:`DiagnosticSessionControl.interpret_response<udsoncan.services.DiagnosticSessionControl.interpret_response>`
-        :rtype: :ref:`Response<Response>`
-        """
+    def _change_session_steps(self, newsession: int) -> ServiceCallGenerator[Optional[services.DiagnosticSessionControl.InterpretedResponse]]:
         req = services.DiagnosticSessionControl.make_request(newsession)
 
         named_newsession = '%s (0x%02x)' % (services.DiagnosticSessionControl.Session.get_name(newsession), newsession)
         self.logger.info('%s - Switching session to %s' % (self.service_log_prefix(services.DiagnosticSessionControl), named_newsession))
 
-        response = self.send_request(req)
+        self.did_cache.invalidate(keep_static=True)
+        response = yield req
         if response is None:
             return None
 
@@ -261,29 +621,14 @@ class Client:
 
         return response
 
-    @standard_error_management
-    def request_seed(self, level: int, data=bytes()) -> Optional[services.SecurityAccess.InterpretedResponse]:
-        """ 
-        Requests a seed to unlock a security level with the :ref:`SecurityAccess<SecurityAccess>` service 
-
-        :Effective configuration: ``exception_on_<type>_response``
-
-        :param level: The security level to unlock. If value is even, it will be converted to the corresponding odd value
-        :type level: int 
-
-        :param data: The data to send to the server (securityAccessDataRecord)
-        :type data: bytes 
-
-        :return: The server response parsed by :meth:`SecurityAccess.interpret_response<udsoncan.services.SecurityAccess.interpret_response>`
-        :rtype: :ref:`Response<Response>`
-        """
+    def _request_seed_steps(self, level: int, data=bytes()) -> ServiceCallGenerator[Optional[services.SecurityAccess.InterpretedResponse]]:
         req = services.SecurityAccess.make_request(level, mode=services.SecurityAccess.Mode.RequestSeed, data=data)
         assert req.subfunction is not None
         # level may be corrected by service.
         self.logger.info('%s - Requesting seed to unlock security access level 0x%02x' %
                          (self.service_log_prefix(services.SecurityAccess), req.subfunction))
 
-        response = self.send_request(req)
+        response = yield req
         if response is None:
             return None
 
@@ -299,23 +644,7 @@ class Client:
         self.logger.debug('Received seed [%s]' % (binascii.hexlify(response.service_data.seed).decode('ascii')))
         return response
 
-    # Performs a SecurityAccess service request. Send key
-    @standard_error_management
-    def send_key(self, level: int, key: bytes) -> Optional[services.SecurityAccess.InterpretedResponse]:
-        """ 
-        Sends a key to unlock a security level with the :ref:`SecurityAccess<SecurityAccess>` service 
-
-        :Effective configuration: ``exception_on_<type>_response``
-
-        :param level: The security level to unlock. If value is odd, it will be converted to the corresponding even value
-        :type level: int 
-
-        :param key: The key to send to the server
-        :type key: bytes 
-
-        :return: The server response parsed by :meth:`SecurityAccess.interpret_response<udsoncan.services.SecurityAccess.interpret_response>`
-        :rtype: :ref:`Response<Response>`
-        """
+    def _send_key_steps(self, level: int, key: bytes) -> ServiceCallGenerator[Optional[services.SecurityAccess.InterpretedResponse]]:
         req = services.SecurityAccess.make_request(level, mode=services.SecurityAccess.Mode.SendKey, data=key)
         assert req.subfunction is not None
 
@@ -323,7 +652,7 @@ class Client:
                          (self.service_log_prefix(services.SecurityAccess), req.subfunction))
         self.logger.debug('\tKey to send [%s]' % (binascii.hexlify(key).decode('ascii')))
 
-        response = self.send_request(req)
+        response = yield req
         if response is None:
             return None
 
@@ -337,29 +666,15 @@ class Client:
 
         return response
 
-    @standard_error_management
-    def unlock_security_access(self, level, seed_params=bytes()) -> Optional[services.SecurityAccess.InterpretedResponse]:
-        """
-        Successively calls request_seed and send_key to unlock a security level with the :ref:`SecurityAccess<SecurityAccess>` service.
-        The key computation is done by calling config['security_algo']
-
-        :Effective configuration: ``exception_on_<type>_response`` ``security_algo`` ``security_algo_params``
-
-        :param level: The level to unlock. Can be the odd or even variant of it.
-        :type level: int
-
-        :param seed_params: Optional data to attach to the RequestSeed request (securityAccessDataRecord).
-        :type seed_params: bytes
-
-        :return: The server response parsed by :meth:`SecurityAccess.interpret_response<udsoncan.services.SecurityAccess.interpret_response>`
-        :rtype: :ref:`Response<Response>`
-        """
-
+    def _unlock_security_access_steps(self, level, seed_params=bytes()) -> ServiceCallGenerator[Optional[services.SecurityAccess.InterpretedResponse]]:
         if 'security_algo' not in self.config or not callable(self.config['security_algo']):
             raise NotImplementedError("Client configuration does not provide a security algorithm")
 
-        response = self.request_seed._func_no_error_management(self, level, data=seed_params)
+        response = yield from self._request_seed_steps(level, data=seed_params)
+        if response is None:
+            return None
         seed = response.service_data.seed
+        assert seed is not None
         if len(seed) > 0 and seed == b'\x00' * len(seed):
             self.logger.info('%s - Security access level 0x%02x is already unlocked, no key will be sent.' %
                              (self.service_log_prefix(services.SecurityAccess), level))
@@ -369,7 +684,7 @@ class Client:
 
         # Starting from V1.12, level is now passed to the algorithm.
         # We now use named parameters for backward compatibility
-        algo_params = {}
+        algo_params: Dict[str, Any] = {}
         try:
             algo_args = self.config['security_algo'].__code__.co_varnames[:self.config['security_algo'].__code__.co_argcount]
 
@@ -383,93 +698,67 @@ class Client:
             algo_params = {'seed': seed, 'params': params, 'level': level}
 
         key = self.config['security_algo'].__call__(**algo_params)  # type: ignore
-        return self.send_key._func_no_error_management(self, level, key)
-
-    @standard_error_management
-    def tester_present(self) -> Optional[services.TesterPresent.InterpretedResponse]:
-        """
-        Sends a TesterPresent request to keep the session active.
+        return (yield from self._send_key_steps(level, key))
 
-        :Effective configuration: ``exception_on_<type>_response``
-
-        :return: The server response parsed by :meth:`TesterPresent.interpret_response<udsoncan.services.TesterPresent.interpret_response>`
-        :rtype: :ref:`Response<Response>`
-        """
+    def _tester_present_steps(self) -> ServiceCallGenerator[Optional[services.TesterPresent.InterpretedResponse]]:
         req = services.TesterPresent.make_request()
         assert req.subfunction is not None
 
         self.logger.info('%s - Sending TesterPresent request' % (self.service_log_prefix(services.TesterPresent)))
-        response = self.send_request(req)
+        response = yield req
         if response is None:
             return None
 
-        response = services.TesterPresent.interpret_response(response)
-
-        if req.subfunction != response.service_data.subfunction_echo:
-            raise UnexpectedResponseException(response, "Response subfunction received from server (0x%02x) does not match the requested subfunction (0x%02x)" % (
-                response.service_data.subfunction_echo, req.subfunction))
-
-        return response
+        return self._interpret_tester_present_response(response, req.subfunction)
 
-    @standard_error_management
-    def read_data_by_identifier_first(self, didlist: Union[int, List[int]]) -> Optional[Any]:
-        """
-        Shortcut to extract a single DID. 
-        Calls read_data_by_identifier then returns the first DID asked for. 
+    def _interpret_tester_present_response(self, response: Response, subfunction: int) -> services.TesterPresent.InterpretedResponse:
+        interpreted_response = services.TesterPresent.interpret_response(response)
 
-        :Effective configuration: ``exception_on_<type>_response`` ``data_identifiers`` ``tolerate_zero_padding``
+        if subfunction != interpreted_response.service_data.subfunction_echo:
+            raise UnexpectedResponseException(interpreted_response, "Response subfunction received from server (0x%02x) does not match the requested subfunction (0x%02x)" % (
+                interpreted_response.service_data.subfunction_echo, subfunction))
 
-        :param didlist: The list of DID to be read
-        :type didlist: list[int]
+        return interpreted_response
 
-        :return: The server response parsed by :meth:`ReadDataByIdentifier.interpret_response<udsoncan.services.ReadDataByIdentifier.interpret_response>`
-        :rtype: :ref:`Response<Response>`
-        """
+    def _read_data_by_identifier_first_steps(self, didlist: Union[int, List[int]]) -> ServiceCallGenerator[Optional[Any]]:
         didlist = services.ReadDataByIdentifier.validate_didlist_input(didlist)
-        response = self.read_data_by_identifier(didlist)
+        response = yield from self._read_data_by_identifier_steps(didlist)
+        if response is None:
+            return None
         values = response.service_data.values
         if len(values) > 0 and len(didlist) > 0:
             return values[didlist[0]]
         return None
 
-    @standard_error_management
-    def test_data_identifier(self, didlist: Union[int, List[int]]) -> Optional[Response]:
-        """
-            Sends a request for the ReadDataByIdentifier and returns blindly the received response without parsing.
-            The requested DIDs do not have to be inside the client list of supported DID.
-            This method can be useful for testing if a DID exists on an ECU
-
-            :Effective configuration: ``exception_on_<type>_response``
-
-            :param didlist: The DIDs to peek
-            :type didlist: list[int] 
-
-            :return: The raw server response. The response will not be parsed by any service, causing ``service_data`` to always be ``None``
-            :rtype: :ref:`Response<Response>`
-
-        """
+    def _test_data_identifier_steps(self, didlist: Union[int, List[int]]) -> ServiceCallGenerator[Optional[Response]]:
         # Do the validation. No need to read return value as we enforced a single DID already
         didlist = services.ReadDataByIdentifier.validate_didlist_input(didlist)
         req = services.ReadDataByIdentifier.make_request(didlist=didlist, didconfig=None)  # No config
-        return self.send_request(req)
-
-    @standard_error_management
-    def read_data_by_identifier(self, didlist: Union[int, List[int]]) -> Optional[services.ReadDataByIdentifier.InterpretedResponse]:
-        """
-        Requests a value associated with a data identifier (DID) through the :ref:`ReadDataByIdentifier<ReadDataByIdentifier>` service.
+        return (yield req)
 
-        :Effective configuration: ``exception_on_<type>_response`` ``data_identifiers`` ``tolerate_zero_padding``
-
-        See :ref:`an example<reading_a_did>` about how to read a DID
-
-        :param didlist: The list of DID to be read
-        :type didlist: list[int]
-
-        :return: The server response parsed by :meth:`ReadDataByIdentifier.interpret_response<udsoncan.services.ReadDataByIdentifier.interpret_response>`
-        :rtype: :ref:`Response<Response>`
-        """
+    def _read_data_by_identifier_steps(self, didlist: Union[int, List[int]]) -> ServiceCallGenerator[Optional[services.ReadDataByIdentifier.InterpretedResponse]]:
         didlist = services.ReadDataByIdentifier.validate_didlist_input(didlist)
-        req = services.ReadDataByIdentifier.make_request(didlist=didlist, didconfig=self.config['data_identifiers'])
+
+        cached_values: Dict[int, Any] = {}
+        cache_policies = self.config['did_cache']
+        if len(cache_policies) > 0:
+            for did in didlist:
+                if did not in cached_values:
+                    found, value = self.did_cache.lookup(did, cache_policies.get(did, None))
+                    if found:
+                        cached_values[did] = value
+
+            if len(cached_values) > 0:
+                self.logger.debug("%s - Using cached values for %d data identifier : %s" %
+                                  (self.service_log_prefix(services.ReadDataByIdentifier), len(cached_values), list(map(hex, cached_values.keys()))))
+                full_didlist = didlist
+                didlist = [did for did in didlist if did not in cached_values]
+                if len(didlist) == 0:
+                    cached_response = Response(service=services.ReadDataByIdentifier, code=Response.Code.PositiveResponse)
+                    cached_response.service_data = services.ReadDataByIdentifier.ResponseData(values={did: cached_values[did] for did in full_didlist})
+                    return cast(services.ReadDataByIdentifier.InterpretedResponse, cached_response)
+
+        req = services.ReadDataByIdentifier.make_request(didlist=didlist, didconfig=self.get_compiled_didconfig())
 
         if len(didlist) == 1:
             self.logger.info("%s - Reading data identifier : 0x%04x (%s)" %
@@ -481,16 +770,30 @@ class Client:
         if 'data_identifiers' not in self.config or not isinstance(self.config['data_identifiers'], dict):
             raise ConfigError('Configuration does not contains a valid data identifier description.')
 
-        response = self.send_request(req)
+        response = yield req
         if response is None:
             return None
 
+        response = self._interpret_rdbi_response(response, didlist, self.get_compiled_didconfig())
+
+        if len(cache_policies) > 0:
+            for did, value in response.service_data.values.items():
+                self.did_cache.store(did, value, cache_policies.get(did, None))
+
+            if len(cached_values) > 0:
+                response.service_data.values.update(cached_values)
+                response.service_data.values = {did: response.service_data.values[did] for did in full_didlist}
+
+        return response
+
+    def _interpret_rdbi_response(self, response: Response, didlist: List[int], didconfig: CompiledDidConfig) -> services.ReadDataByIdentifier.InterpretedResponse:
+        # Parses a ReadDataByIdentifier response and checks that it contains exactly the requested DIDs
         try:
-            response = services.ReadDataByIdentifier.interpret_response(response,
-                                                                        didlist=didlist,
-                                                                        didconfig=self.config['data_identifiers'],
-                                                                        tolerate_zero_padding=self.config['tolerate_zero_padding']
-                                                                        )
+            interpreted_response = services.ReadDataByIdentifier.interpret_response(response,
+                                                                                    didlist=didlist,
+                                                                                    didconfig=didconfig,
+                                                                                    tolerate_zero_padding=self.config['tolerate_zero_padding']
+                                                                                    )
         except ConfigError as e:
             if e.key in didlist:
                 raise
@@ -499,23 +802,1562 @@ class Client:
                     response, "Server returned values for data identifier 0x%04x that was not requested and no Codec was defined for it. Parsing must be stopped." % (e.key))
 
         set_request_didlist = set(didlist)
-        set_response_didlist = set(response.service_data.values.keys())
+        set_response_didlist = set(interpreted_response.service_data.values.keys())
         extra_did = set_response_didlist - set_request_didlist
         missing_did = set_request_didlist - set_response_didlist
 
         if len(extra_did) > 0:
             raise UnexpectedResponseException(
-                response, "Server returned values for %d data identifier that were not requested. Dids are : %s" % (len(extra_did), extra_did))
+                interpreted_response, "Server returned values for %d data identifier that were not requested. Dids are : %s" % (len(extra_did), extra_did))
 
         if len(missing_did) > 0:
             raise UnexpectedResponseException(
-                response, "%d data identifier values are missing from server response. Dids are : %s" % (len(missing_did), missing_did))
+                interpreted_response, "%d data identifier values are missing from server response. Dids are : %s" % (len(missing_did), missing_did))
 
+        return interpreted_response
+
+    def _read_data_by_identifier_bulk_steps(self,
+                                            didlist: Union[int, List[int]],
+                                            max_response_size: Optional[int] = None,
+                                            max_did_per_request: Optional[int] = None) -> ServiceCallGenerator[Optional[Dict[int, Any]]]:
+        didlist = services.ReadDataByIdentifier.validate_didlist_input(didlist)
+        if 'data_identifiers' not in self.config or not isinstance(self.config['data_identifiers'], dict):
+            raise ConfigError('Configuration does not contains a valid data identifier description.')
+        didconfig = self.get_compiled_didconfig()
+
+        if max_response_size is None:
+            max_response_size = self.config['rdbi_max_response_size']
+        if max_response_size is None:
+            max_response_size = getattr(self.conn, 'mtu', None)
+        if max_response_size is None:
+            max_response_size = 4095    # ISO-TP limit without escape sequence
+        if max_did_per_request is None:
+            max_did_per_request = self.config['rdbi_max_did_per_request']
+
+        def pack(dids: List[int]) -> List[List[int]]:
+            assert max_response_size is not None
+            response_size_limit = max_response_size
+            did_count_limit = max_did_per_request
+            if self.rdbi_limits.max_response_size is not None:
+                response_size_limit = min(response_size_limit, self.rdbi_limits.max_response_size)
+            if self.rdbi_limits.max_did_per_request is not None:
+                did_count_limit = self.rdbi_limits.max_did_per_request if did_count_limit is None else min(
+                    did_count_limit, self.rdbi_limits.max_did_per_request)
+            return services.ReadDataByIdentifier.pack_didlist(dids, didconfig, max_response_size=response_size_limit, max_did_per_request=did_count_limit)
+
+        groups = pack(didlist)
+        self.logger.info("%s - Reading %d data identifiers in %d requests" %
+                         (self.service_log_prefix(services.ReadDataByIdentifier), len(set(didlist)), len(groups)))
+
+        values: Dict[int, Any] = {}
+        while len(groups) > 0:
+            group = groups[0]
+            try:
+                response = yield from self._read_data_by_identifier_steps(group)
+            except NegativeResponseException as e:
+                if not self._learn_rdbi_limits(e.response, group):
+                    raise
+                groups = pack([did for remaining_group in groups for did in remaining_group])
+                continue
+
+            if response is None:
+                return None
+            values.update(response.service_data.values)
+            groups.pop(0)
+
+        return {did: values[did] for did in didlist}
+
+    def _learn_rdbi_limits(self, response: Response, group: List[int]) -> bool:
+        # Lowers the learned server limits after a request for a group of DIDs has been refused.
+        # Returns False if nothing can be learned from the response. Limits are halved so that only a few requests are needed to find a working size.
+        if len(group) < 2:
+            return False
+
+        if response.code == Response.Code.ResponseTooLong:
+            expected_size = services.ReadDataByIdentifier.response_size(group, self.get_compiled_didconfig())
+            if expected_size is None:
+                return False
+            largest_single = max([services.ReadDataByIdentifier.response_size(did, self.get_compiled_didconfig()) or 0 for did in group])
+            self.rdbi_limits.max_response_size = max(expected_size // 2, largest_single)
+            self.logger.warning('Server refused a response of %d bytes. Limiting responses to %d bytes' % (expected_size, self.rdbi_limits.max_response_size))
+            return True
+
+        if response.code == Response.Code.IncorrectMessageLengthOrInvalidFormat:
+            self.rdbi_limits.max_did_per_request = max(len(group) // 2, 1)
+            self.logger.warning('Server refused a request with %d data identifiers. Limiting requests to %d data identifiers' % (len(group), self.rdbi_limits.max_did_per_request))
+            return True
+
+        return False
+
+    def _read_data_by_periodic_identifier_steps(self, transmission_mode: int, didlist: Union[int, List[int]]) -> ServiceCallGenerator[Optional[services.ReadDataByPeriodicIdentifier.InterpretedResponse]]:
+        req = services.ReadDataByPeriodicIdentifier.make_request(transmission_mode=transmission_mode, didlist=didlist)
+        mode_name = services.ReadDataByPeriodicIdentifier.TransmissionMode.get_name(transmission_mode)
+        self.logger.info("%s - %s for periodic data identifiers %s" % (self.service_log_prefix(services.ReadDataByPeriodicIdentifier),
+                                                                         mode_name, list(map(hex, services.ReadDataByPeriodicIdentifier.validate_didlist_input(didlist)))))
+
+        response = yield req
+        if response is None:
+            return None
+
+        return services.ReadDataByPeriodicIdentifier.interpret_response(response)
+
+    def _start_periodic_stream_steps(self,
+                                     didlist: Union[int, List[int]],
+                                     transmission_mode: int = services.ReadDataByPeriodicIdentifier.TransmissionMode.sendAtFastRate,
+                                     callback: Optional[Callable[[PeriodicSample], None]] = None,
+                                     maxsize: int = 1000) -> ServiceCallGenerator[PeriodicDataStream]:
+        didlist = services.ReadDataByPeriodicIdentifier.validate_didlist_input(didlist)
+        if transmission_mode not in [services.ReadDataByPeriodicIdentifier.TransmissionMode.sendAtSlowRate,
+                                     services.ReadDataByPeriodicIdentifier.TransmissionMode.sendAtMediumRate,
+                                     services.ReadDataByPeriodicIdentifier.TransmissionMode.sendAtFastRate]:
+            raise ValueError('transmission_mode must be a transmission rate')
+        if len(didlist) == 0:
+            raise ValueError('At least one periodic data identifier must be given')
+
+        if 'data_identifiers' not in self.config or not isinstance(self.config['data_identifiers'], dict):
+            raise ConfigError('Configuration does not contains a valid data identifier description.')
+        didconfig = self.get_compiled_didconfig()
+        for did in didlist:
+            didconfig.get(did)   # Make sure the codec is valid before starting. May raise
+            if did in self.periodic_streams:
+                raise ValueError('Periodic data identifier 0x%04x is already streamed. Stop its stream first' % did)
+
+        stream = PeriodicDataStream(self, didlist, transmission_mode, callback=callback, maxsize=maxsize)
+        # Registered before sending the request so that messages sent before the positive response are not lost
+        for did in didlist:
+            self.periodic_streams[did] = stream
+        try:
+            yield from self._read_data_by_periodic_identifier_steps(transmission_mode, didlist)
+        except BaseException:
+            self._unregister_periodic_stream(stream)
+            raise
+
+        return stream
+
+    def _stop_periodic_stream_steps(self, stream: Optional[PeriodicDataStream] = None) -> ServiceCallGenerator[Optional[services.ReadDataByPeriodicIdentifier.InterpretedResponse]]:
+        didlist = [] if stream is None else stream.didlist
+        response = yield from self._read_data_by_periodic_identifier_steps(services.ReadDataByPeriodicIdentifier.TransmissionMode.stopSending, didlist)
+
+        streams = set(self.periodic_streams.values()) if stream is None else set([stream])
+        for stopped_stream in streams:
+            self._unregister_periodic_stream(stopped_stream)
+        return response
+
+    def _unregister_periodic_stream(self, stream: PeriodicDataStream) -> None:
+        stream.active = False
+        for did in stream.didlist:
+            if self.periodic_streams.get(did, None) is stream:
+                del self.periodic_streams[did]
+
+    def _dispatch_periodic_data(self, payload: BytesLike) -> bool:
+        # Gives a periodic data message to its stream. Returns False if the payload is not a periodic data message
+        if not services.ReadDataByPeriodicIdentifier.is_periodic_data(payload):
+            return False
+
+        did = services.ReadDataByPeriodicIdentifier.PERIODIC_DID_BASE + payload[1]
+        stream = self.periodic_streams.get(did, None)
+        if stream is None:
+            self.logger.debug('Ignoring periodic data message for data identifier 0x%04x that is not streamed' % did)
+            return True
+
+        try:
+            # bytes() copies a frame received in a reused buffer (memoryview), which the decoded value could refer to
+            response = services.ReadDataByPeriodicIdentifier.interpret_periodic_data(Response.from_payload(bytes(payload)),
+                                                                                     didconfig=self.get_compiled_didconfig(),
+                                                                                     tolerate_zero_padding=self.config['tolerate_zero_padding'])
+        except Exception as e:
+            self.logger.error('Cannot decode periodic data message for data identifier 0x%04x. %s: %s' % (did, e.__class__.__name__, str(e)))
+            return True
+
+        stream._push(PeriodicSample(did, response.service_data.value, time.monotonic()))
+        return True
+
+    # Performs a WriteDataByIdentifier request.
+
+    def _write_data_by_identifier_steps(self, did: int, value: Any) -> ServiceCallGenerator[Optional[services.WriteDataByIdentifier.InterpretedResponse]]:
+        req = services.WriteDataByIdentifier.make_request(did, value, didconfig=self.config['data_identifiers'])
+        self.logger.info("%s - Writing data identifier 0x%04x (%s)" %
+                         (self.service_log_prefix(services.WriteDataByIdentifier), did, DataIdentifier.name_from_id(did)))
+
+        self.did_cache.invalidate([did])
+        response = yield req
+        if response is None:
+            return None
+        response = services.WriteDataByIdentifier.interpret_response(response)
+
+        if response.service_data.did_echo != did:
+            raise UnexpectedResponseException(
+                response, "Server returned a response for data identifier 0x%04x while client requested for did 0x%04x" % (response.service_data.did_echo, did))
+
+        return response
+
+    def _ecu_reset_steps(self, reset_type: int) -> ServiceCallGenerator[Optional[services.ECUReset.InterpretedResponse]]:
+        req = services.ECUReset.make_request(reset_type)
+        self.logger.info("%s - Requesting reset of type 0x%02x (%s)" %
+                         (self.service_log_prefix(services.ECUReset), reset_type, services.ECUReset.ResetType.get_name(reset_type)))
+
+        self.did_cache.clear()
+        response = yield req
+        if response is None:
+            return None
+        response = services.ECUReset.interpret_response(response)
+
+        if response.service_data.reset_type_echo != reset_type:
+            raise UnexpectedResponseException(response, "Response subfunction received from server (0x%02x) does not match the requested subfunction (0x%02x)" % (
+                response.service_data.reset_type_echo, reset_type))
+
+        if response.service_data.reset_type_echo == services.ECUReset.ResetType.enableRapidPowerShutDown and response.service_data.powerdown_time != 0xFF:
+            assert response.service_data.powerdown_time is not None
+            self.logger.info('Server will shutdown in %d seconds.' % (response.service_data.powerdown_time))
+
+        return response
+
+    def _clear_dtc_steps(self, group: int = 0xFFFFFF, memory_selection: Optional[int] = None) -> ServiceCallGenerator[Optional[services.ClearDiagnosticInformation.InterpretedResponse]]:
+
+        request = services.ClearDiagnosticInformation.make_request(
+            group, memory_selection=memory_selection, standard_version=self.config['standard_version'])
+        memys_str = ''
+        if memory_selection is not None:
+            memys_str = ' , MemorySelection : %d' % memory_selection
+        if group == 0xFFFFFF:
+            self.logger.info('%s - Clearing all DTCs (group mask : 0xFFFFFF%s)' %
+                             (self.service_log_prefix(services.ClearDiagnosticInformation), memys_str))
+        else:
+            self.logger.info('%s - Clearing DTCs matching group mask : 0x%06x%s' %
+                             (self.service_log_prefix(services.ClearDiagnosticInformation), group, memys_str))
+
+        response = yield request
+        if response is None:
+            return None
+
+        response = services.ClearDiagnosticInformation.interpret_response(response)
+
+        return response
+
+    def _routine_control_steps(self, routine_id: int, control_type: int, data: Optional[bytes] = None) -> ServiceCallGenerator[Optional[services.RoutineControl.InterpretedResponse]]:
+        request = services.RoutineControl.make_request(routine_id, control_type, data=data)
+        payload_length = 0 if data is None else len(data)
+        action = "ISOSAEReserved action for routine ID"
+        if control_type == services.RoutineControl.ControlType.startRoutine:
+            action = "Starting routine ID"
+        elif control_type == services.RoutineControl.ControlType.stopRoutine:
+            action = "Stoping routine ID"
+        elif control_type == services.RoutineControl.ControlType.requestRoutineResults:
+            action = "Requesting result for routine ID"
+
+        self.logger.info("%s - ControlType=0x%02x - %s 0x%04x (%s) with a payload of %d bytes" %
+                         (self.service_log_prefix(services.RoutineControl), control_type, action, routine_id, Routine.name_from_id(routine_id), payload_length))
+        if data is not None:
+            self.logger.debug("\tPayload data : %s" % binascii.hexlify(data).decode('ascii'))
+
+        response = yield request
+        if response is None:
+            return None
+        return self._interpret_routine_control_response(response, routine_id, control_type)
+
+    def _interpret_routine_control_response(self, response: Response, routine_id: int, control_type: int) -> services.RoutineControl.InterpretedResponse:
+        interpreted_response = services.RoutineControl.interpret_response(response)
+
+        if control_type != interpreted_response.service_data.control_type_echo:
+            raise UnexpectedResponseException(interpreted_response, "Control type of response (0x%02x) does not match request control type (0x%02x)" % (
+                interpreted_response.service_data.control_type_echo, control_type))
+
+        if routine_id != interpreted_response.service_data.routine_id_echo:
+            raise UnexpectedResponseException(interpreted_response, "Response received from server (ID = 0x%04x) does not match the requested routine ID (0x%04x)" % (
+                interpreted_response.service_data.routine_id_echo, routine_id))
+
+        return interpreted_response
+
+    def _access_timing_parameter_steps(self,
+                                       access_type: int,
+                                       timing_param_record: Optional[bytes] = None
+                                       ) -> ServiceCallGenerator[Optional[services.AccessTimingParameter.InterpretedResponse]]:
+
+        request = services.AccessTimingParameter.make_request(access_type, timing_param_record)
+        payload_length = 0 if timing_param_record is None else len(timing_param_record)
+
+        self.logger.info('%s - AccessType=0x%02x (%s) - Sending request with record payload of %d bytes' % (self.service_log_prefix(
+            services.AccessTimingParameter), access_type, services.AccessTimingParameter.AccessType.get_name(access_type), payload_length))
+        if timing_param_record is not None:
+            self.logger.debug("Payload data : %s" % binascii.hexlify(timing_param_record).decode('ascii'))
+
+        response = yield request
+        if response is None:
+            return None
+
+        response = services.AccessTimingParameter.interpret_response(response)
+
+        if access_type != response.service_data.access_type_echo:
+            raise UnexpectedResponseException(response, "Access type of response (0x%02x) does not match request access type (0x%02x)" % (
+                response.service_data.access_type_echo, access_type))
+
+        allowed_response_record_access_type = [
+            services.AccessTimingParameter.AccessType.readExtendedTimingParameterSet,
+            services.AccessTimingParameter.AccessType.readCurrentlyActiveTimingParameters
+        ]
+
+        if len(response.service_data.timing_param_record) > 0 and access_type not in allowed_response_record_access_type:
+            self.logger.warning("Server returned data in the AccessTimingParameter response although none was asked")
+
+        return response
+
+    def _communication_control_steps(self,
+                                     control_type: int,
+                                     communication_type: Union[int, bytes, CommunicationType],
+                                     node_id: Optional[int] = None,
+                                     ) -> ServiceCallGenerator[Optional[services.CommunicationControl.InterpretedResponse]]:
+
+        communication_type = services.CommunicationControl.normalize_communication_type(communication_type)
+
+        request = services.CommunicationControl.make_request(
+            control_type, communication_type, node_id, standard_version=self.config['standard_version'])
+
+        self.logger.info('%s - ControlType=0x%02x (%s) - Sending request with a CommunicationType byte of 0x%02x (%s). nodeIdentificationNumber=%s ' % (
+            self.service_log_prefix(services.CommunicationControl),
+            control_type,
+            services.CommunicationControl.ControlType.get_name(control_type),
+            communication_type.get_byte_as_int(),
+            str(communication_type),
+            str(node_id)
+        )
+        )
+
+        response = yield request
+        if response is None:
+            return None
+
+        response = services.CommunicationControl.interpret_response(response)
+
+        if control_type != response.service_data.control_type_echo:
+            raise UnexpectedResponseException(response, "Control type of response (0x%02x) does not match request control type (0x%02x)" % (
+                response.service_data.control_type_echo, control_type))
+
+        return response
+
+    def _request_upload_download_steps(self, service_cls, memory_location, dfi=None):
+        dfi = service_cls.normalize_data_format_identifier(dfi)
+
+        if service_cls not in [services.RequestDownload, services.RequestUpload]:
+            raise ValueError('Service must either be RequestDownload or RequestUpload')
+
+        if not isinstance(memory_location, MemoryLocation):
+            raise ValueError('memory_location must be an instance of MemoryLocation')
+
+        # If user does not specify a byte format, we apply the one in client configuration.
+        if 'server_address_format' in self.config:
+            memory_location.set_format_if_none(address_format=self.config['server_address_format'])
+
+        if 'server_memorysize_format' in self.config:
+            memory_location.set_format_if_none(memorysize_format=self.config['server_memorysize_format'])
+
+        request = service_cls.make_request(memory_location=memory_location, dfi=dfi)
+
+        action = ""
+        if service_cls == services.RequestDownload:
+            action = "Requesting a download (client to server)"
+        elif service_cls == services.RequestUpload:
+            action = "Requesting an upload (server to client)"
+        else:
+            raise ValueError("Bad service")
+
+        self.logger.info('%s - %s for memory location [%s] and DataFormatIdentifier 0x%02x (%s)' %
+                         (self.service_log_prefix(service_cls), action, str(memory_location), dfi.get_byte_as_int(), str(dfi)))
+
+        response = yield request
+        if response is None:
+            return None
+        service_cls.interpret_response(response)
+
+        return response
+
+    def _transfer_data_steps(self,
+                             sequence_number: int,
+                             data: Optional[bytes] = None
+                             ) -> ServiceCallGenerator[Optional[services.TransferData.InterpretedResponse]]:
+        request = services.TransferData.make_request(sequence_number, data)
+
+        data_len = 0 if data is None else len(data)
+        self.logger.info('%s - Sending a block of data with SequenceNumber=%d that is %d bytes long .' %
+                         (self.service_log_prefix(services.TransferData), sequence_number, data_len))
+        if data is not None and self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug('Data to transfer : %s' % binascii.hexlify(data).decode('ascii'))
+
+        response = yield request
+        if response is None:
+            return None
+        response = services.TransferData.interpret_response(response)
+
+        if sequence_number != response.service_data.sequence_number_echo:
+            raise UnexpectedResponseException(response, "Block sequence number of response (0x%02x) does not match request block sequence number (0x%02x)" % (
+                response.service_data.sequence_number_echo, sequence_number))
+
+        return response
+
+    def _request_transfer_exit_steps(self, data: Optional[bytes] = None) -> ServiceCallGenerator[Optional[services.RequestTransferExit.InterpretedResponse]]:
+        request = services.RequestTransferExit.make_request(data)
+        self.logger.info('%s - Sending exit request' % (self.service_log_prefix(services.RequestTransferExit)))
+
+        response = yield request
+        if response is None:
+            return None
+        response = services.RequestTransferExit.interpret_response(response)
+
+        return response
+
+    def _download_steps(self,
+                        memory_location: MemoryLocation,
+                        data_source: TransferDataSource,
+                        dfi: Optional[DataFormatIdentifier] = None,
+                        block_size: Optional[int] = None,
+                        progress_callback: Optional[TransferProgressCallbackType] = None,
+                        transfer_exit_data: Optional[bytes] = None
+                        ) -> ServiceCallGenerator[Optional[services.RequestTransferExit.InterpretedResponse]]:
+        if block_size is not None:
+            if not isinstance(block_size, int) or block_size < 1:
+                raise ValueError('block_size must be a positive integer')
+        source, total = self._load_transfer_source(data_source)
+
+        response = yield from self._request_upload_download_steps(services.RequestDownload, memory_location, dfi)
+        if response is None:
+            return None
+
+        server_block_size = response.service_data.max_length - 2     # max_length includes the service ID and the block sequence counter
+        if server_block_size < 1:
+            raise UnexpectedResponseException(response, 'Server maximum block length (%d) is too small to transfer data' % response.service_data.max_length)
+        if block_size is None:
+            block_size = server_block_size
+        else:
+            block_size = min(block_size, server_block_size)
+
+        blocks = self._make_transfer_blocks(source, block_size)
+        progress = TransferProgress(TransferProgress.DOWNLOAD, block_size=block_size, total=total)
+        self.logger.info('%s - Downloading %s bytes in blocks of %d bytes' %
+                         (self.service_log_prefix(services.TransferData), '?' if total is None else str(total), block_size))
+
+        debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
+        request_id = services.TransferData.request_id()
+        sequence_number = 1
+        for block in blocks:
+            # The block is copied once, directly at its place in the payload. A new buffer is used for each block
+            # because some connections keep a reference to the payload after sending it.
+            payload = bytearray(2 + len(block))
+            payload[0] = request_id
+            payload[1] = sequence_number
+            payload[2:] = block
+            response = yield _EncodedRequest(services.TransferData, payload)
+            if response is None:
+                return None
+            self._check_transfer_data_response(response, sequence_number)
+
+            progress.update(len(block))
+            if debug_enabled:
+                self.logger.debug('Block with SequenceNumber=%d transferred. %d bytes' % (sequence_number, len(block)))
+            if progress_callback is not None:
+                progress_callback(progress)
+            sequence_number = (sequence_number + 1) & 0xFF
+
+        self.logger.info('%s - Downloaded %d bytes in %d blocks in %.3f sec (%.1f bytes/sec)' %
+                         (self.service_log_prefix(services.TransferData), progress.transferred, progress.block_count, progress.elapsed, progress.throughput))
+
+        response = yield from self._request_transfer_exit_steps(transfer_exit_data)
+        return response
+
+    def _upload_steps(self,
+                      memory_location: MemoryLocation,
+                      destination: TransferDataDestination,
+                      dfi: Optional[DataFormatIdentifier] = None,
+                      progress_callback: Optional[TransferProgressCallbackType] = None,
+                      transfer_exit_data: Optional[bytes] = None
+                      ) -> ServiceCallGenerator[Optional[services.RequestTransferExit.InterpretedResponse]]:
+        write: Callable[[bytes], Any]
+        f: Optional[BinaryIO] = None
+        if isinstance(destination, bytearray):
+            write = destination.extend
+        elif isinstance(destination, (str, os.PathLike)):
+            f = open(destination, 'wb')
+            write = f.write
+        elif hasattr(destination, 'write'):
+            write = destination.write
+        else:
+            raise ValueError('destination must be a bytearray, a path or a binary file object')
+
+        completed = False
+        try:
+            response = yield from self._request_upload_download_steps(services.RequestUpload, memory_location, dfi)
+            if response is None:
+                return None
+
+            progress = TransferProgress(TransferProgress.UPLOAD, block_size=response.service_data.max_length - 2, total=memory_location.memorysize)
+            self.logger.info('%s - Uploading %d bytes' % (self.service_log_prefix(services.TransferData), memory_location.memorysize))
+
+            debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
+            sequence_number = 1
+            while progress.transferred < memory_location.memorysize:
+                request = Request(services.TransferData, data=bytes((sequence_number,)))
+                response = yield request
+                if response is None:
+                    return None
+                response = self._check_transfer_data_response(response, sequence_number)
+
+                block = response.service_data.parameter_records
+                if len(block) == 0:
+                    raise UnexpectedResponseException(response, 'Server sent an empty block after %d bytes out of %d' %
+                                                      (progress.transferred, memory_location.memorysize))
+                write(block)
+
+                progress.update(len(block))
+                if debug_enabled:
+                    self.logger.debug('Block with SequenceNumber=%d transferred. %d bytes' % (sequence_number, len(block)))
+                if progress_callback is not None:
+                    progress_callback(progress)
+                sequence_number = (sequence_number + 1) & 0xFF
+            completed = True
+        finally:
+            if f is not None:
+                f.close()
+                if not completed:
+                    os.remove(f.name)  # Do not leave a truncated file behind
+
+        self.logger.info('%s - Uploaded %d bytes in %d blocks in %.3f sec (%.1f bytes/sec)' %
+                         (self.service_log_prefix(services.TransferData), progress.transferred, progress.block_count, progress.elapsed, progress.throughput))
+
+        response = yield from self._request_transfer_exit_steps(transfer_exit_data)
+        return response
+
+    def _check_transfer_data_response(self, response: Response, sequence_number: int) -> services.TransferData.InterpretedResponse:
+        response = services.TransferData.interpret_response(response)
+        if sequence_number != response.service_data.sequence_number_echo:
+            raise UnexpectedResponseException(response, "Block sequence number of response (0x%02x) does not match request block sequence number (0x%02x)" % (
+                response.service_data.sequence_number_echo, sequence_number))
+        return response
+
+    @classmethod
+    def _load_transfer_source(cls, data_source: TransferDataSource) -> Tuple[Union[memoryview, BinaryIO, Iterator[BytesLike]], Optional[int]]:
+        # Validates the data source before anything is sent to the server. Returns the source in a form usable by _make_transfer_blocks and its size when known.
+        if isinstance(data_source, (str, os.PathLike)):
+            with open(data_source, 'rb') as f:
+                data_source = f.read()
+
+        if isinstance(data_source, (bytes, bytearray, memoryview)):
+            view = memoryview(data_source)
+            if view.ndim != 1 or view.itemsize != 1:
+                view = view.cast('B')
+            return view, len(view)
+
+        if hasattr(data_source, 'read'):
+            return cast(BinaryIO, data_source), None
+
+        if isinstance(data_source, Iterable):
+            return iter(data_source), None
+
+        raise ValueError('data_source must be a bytes-like object, a path, a binary file object or an iterable of bytes-like objects')
+
+    @classmethod
+    def _make_transfer_blocks(cls, source: Union[memoryview, BinaryIO, Iterator[BytesLike]], block_size: int) -> Iterator[BytesLike]:
+        if isinstance(source, memoryview):
+            return (source[i:i + block_size] for i in range(0, len(source), block_size))
+
+        if hasattr(source, 'read'):
+            reader = cast(BinaryIO, source)
+            return cls._rechunk_transfer_data(iter(functools.partial(reader.read, block_size), b''), block_size)
+
+        return cls._rechunk_transfer_data(cast(Iterator[BytesLike], source), block_size)
+
+    @classmethod
+    def _rechunk_transfer_data(cls, chunks: Iterator[BytesLike], block_size: int) -> Iterator[BytesLike]:
+        buffer = bytearray()
+        for chunk in chunks:
+            if not isinstance(chunk, (bytes, bytearray, memoryview)):
+                raise ValueError('Data chunks must be bytes-like objects. Got %s' % chunk.__class__.__name__)
+            if len(buffer) == 0 and len(chunk) == block_size:
+                yield chunk     # Already of the right size. No copy needed
+                continue
+            buffer += chunk
+            while len(buffer) >= block_size:
+                yield buffer[:block_size]
+                del buffer[:block_size]
+
+        if len(buffer) > 0:
+            yield buffer
+
+    def _link_control_steps(self, control_type: int, baudrate: Optional[Baudrate] = None) -> ServiceCallGenerator[Optional[services.LinkControl.InterpretedResponse]]:
+        request = services.LinkControl.make_request(control_type, baudrate)
+        baudrate_str = 'No baudrate specified' if baudrate is None else 'Baudrate : ' + str(baudrate)
+
+        action = "Performing LinkControl request"
+        if control_type in [services.LinkControl.ControlType.verifyBaudrateTransitionWithFixedBaudrate, services.LinkControl.ControlType.verifyBaudrateTransitionWithSpecificBaudrate]:
+            action = "Verifiying support"
+        elif control_type == services.LinkControl.ControlType.transitionBaudrate:
+            action = "Switching"
+
+        self.logger.info('%s - ControlType=0x%02x (%s) - %s for baudrate %s ' % (self.service_log_prefix(services.LinkControl),
+                         control_type, services.LinkControl.ControlType.get_name(control_type), action, baudrate_str))
+
+        response = yield request
+        if response is None:
+            return None
+        response = services.LinkControl.interpret_response(response)
+
+        if control_type != response.service_data.control_type_echo:
+            raise UnexpectedResponseException(response, "Control type of response (0x%02x) does not match request control type (0x%02x)" % (
+                response.service_data.control_type_echo, control_type))
+
+        return response
+
+    def _io_control_steps(self,
+                          did: int,
+                          control_param: Optional[int] = None,
+                          values: Optional[Union[List[Any], Dict[str, Any], IOValues]] = None,
+                          masks: Optional[Union[List[str], Dict[str, bool], IOMasks, bool]] = None
+                          ) -> ServiceCallGenerator[Optional[services.InputOutputControlByIdentifier.InterpretedResponse]]:
+        if 'input_output' not in self.config:
+            raise ConfigError('input_output', msg='input_output must be defined in client configuration in order to use InputOutputControlByIdentifier service')
+
+        request = services.InputOutputControlByIdentifier.make_request(
+            did,
+            control_param=control_param,
+            values=values,
+            masks=masks,
+            ioconfig=self.config['input_output']
+        )
+
+        control_param_str = 'no control parameter' if control_param is None else 'control parameter 0x%02x (%s)' % (
+            control_param, services.InputOutputControlByIdentifier.ControlParam.get_name(control_param))
+        self.logger.info('%s - Sending request for DID=0x%04x, %s.' %
+                         (self.service_log_prefix(services.InputOutputControlByIdentifier), did, control_param_str))
+
+        response = yield request
+        if response is None:
+            return None
+        response = services.InputOutputControlByIdentifier.interpret_response(
+            response,
+            control_param=control_param,
+            tolerate_zero_padding=self.config['tolerate_zero_padding'],
+            ioconfig=self.config['input_output']
+        )
+
+        if response.service_data.did_echo != did:
+            raise UnexpectedResponseException(
+                response, "Echo of the DID number (0x%04x) does not match the value in the request (0x%04x)" % (response.service_data.did_echo, did))
+
+        if control_param != response.service_data.control_param_echo:
+            control_param_str = '0x%02x' % control_param if control_param is not None else '<None>'
+            received_control_param_str = '0x%02x' % response.service_data.control_param_echo if response.service_data.control_param_echo is not None else '<None>'
+            raise UnexpectedResponseException(response, 'Echo of the InputOutputControlParameter (%s) does not match the value in the request (%s)' % (
+                received_control_param_str, control_param_str))
+
+        return response
+
+    def _control_dtc_setting_steps(self, setting_type: int, data: Optional[bytes] = None) -> ServiceCallGenerator[Optional[services.ControlDTCSetting.InterpretedResponse]]:
+        request = services.ControlDTCSetting.make_request(setting_type, data)
+        data_len = 0 if data is None else len(data)
+        action = "Performing ControlDTCSetting request"
+        if setting_type == services.ControlDTCSetting.SettingType.on:
+            action = "Turning DTC On"
+        elif setting_type == services.ControlDTCSetting.SettingType.off:
+            action = "Turning DTC Off"
+
+        self.logger.info('%s - SettingType=0x%02x (%s) - %s with a payload of %d bytes' % (self.service_log_prefix(services.ControlDTCSetting),
+                         setting_type, services.ControlDTCSetting.SettingType.get_name(setting_type), action, data_len))
+        if data is not None:
+            self.logger.debug("Payload of data : %s" % binascii.hexlify(data).decode('ascii'))
+
+        response = yield request
+        if response is None:
+            return None
+
+        response = services.ControlDTCSetting.interpret_response(response)
+
+        if response.service_data.setting_type_echo != setting_type:
+            raise UnexpectedResponseException(response, "Setting type of response (0x%02x) does not match request control type (0x%02x)" % (
+                response.service_data.setting_type_echo, setting_type))
+
+        return response
+
+    def _read_memory_by_address_steps(self, memory_location: MemoryLocation) -> ServiceCallGenerator[Optional[services.ReadMemoryByAddress.InterpretedResponse]]:
+        request = self._make_read_memory_by_address_request(memory_location)
+        self.logger.info('%s - Reading memory address at %s' % (self.service_log_prefix(services.ReadMemoryByAddress), str(memory_location)))
+
+        response = yield request
+        if response is None:
+            return None
+        return self._interpret_read_memory_by_address_response(response, memory_location)
+
+    def _make_read_memory_by_address_request(self, memory_location: MemoryLocation) -> Request:
+        if not isinstance(memory_location, MemoryLocation):
+            raise ValueError('memory_location must be an instance of MemoryLocation')
+
+        if 'server_address_format' in self.config:
+            memory_location.set_format_if_none(address_format=self.config['server_address_format'])
+
+        if 'server_memorysize_format' in self.config:
+            memory_location.set_format_if_none(memorysize_format=self.config['server_memorysize_format'])
+
+        return services.ReadMemoryByAddress.make_request(memory_location)
+
+    def _interpret_read_memory_by_address_response(self, response: Response, memory_location: MemoryLocation) -> services.ReadMemoryByAddress.InterpretedResponse:
+        interpreted_response = services.ReadMemoryByAddress.interpret_response(response)
+        memdata = interpreted_response.service_data.memory_block
+
+        if len(memdata) < memory_location.memorysize:
+            raise UnexpectedResponseException(interpreted_response, 'Data block given by the server is too short. Client requested for %d bytes but only received %s bytes' % (
+                memory_location.memorysize, str(len(response.data)) if response.data is not None else '<None>'))
+
+        if len(memdata) > memory_location.memorysize:
+            extra_bytes = len(memdata) - memory_location.memorysize
+            if memdata[memory_location.memorysize:] == b'\x00' * extra_bytes and self.config['tolerate_zero_padding']:
+                interpreted_response.service_data.memory_block = memdata[0:memory_location.memorysize]  # trim exceeding zeros
+            else:
+                raise UnexpectedResponseException(interpreted_response, 'Data block given by the server is too long. Client requested for %d bytes but received %s bytes' % (
+                    memory_location.memorysize, str(len(response.data)) if response.data is not None else '<None>'))
+
+        return interpreted_response
+
+    def _write_memory_by_address_steps(self, memory_location: MemoryLocation, data: bytes) -> ServiceCallGenerator[Optional[services.WriteMemoryByAddress.InterpretedResponse]]:
+
+        if not isinstance(memory_location, MemoryLocation):
+            raise ValueError('memory_location must be an instance of MemoryLocation')
+
+        if 'server_address_format' in self.config:
+            memory_location.set_format_if_none(address_format=self.config['server_address_format'])
+
+        if 'server_memorysize_format' in self.config:
+            memory_location.set_format_if_none(memorysize_format=self.config['server_memorysize_format'])
+
+        request = services.WriteMemoryByAddress.make_request(memory_location, data)
+        self.logger.info('%s - Writing %d bytes to memory address at %s' %
+                         (self.service_log_prefix(services.WriteMemoryByAddress), len(data), str(memory_location)))
+
+        if len(data) != memory_location.memorysize:
+            self.logger.warning('%s: Given data block length (%d bytes) does not match MemoryLocation size (%d bytes)' %
+                                (self.service_log_prefix(services.WriteMemoryByAddress), len(data), memory_location.memorysize))
+
+        response = yield request
+        if response is None:
+            return None
+        response = services.WriteMemoryByAddress.interpret_response(response, memory_location)
+
+        alfid_byte = memory_location.alfid.get_byte_as_int()   # AddressAndLengthFormatIdentifier
+
+        # We make sure that the echo from the server matches the request we sent.
+        if response.service_data.alfid_echo != alfid_byte:
+            raise UnexpectedResponseException(response, 'AddressAndLengthFormatIdentifier echoed back by the server (0x%02X) does not match the one requested by the client (0x%02X)' % (
+                response.service_data.alfid_echo, int(alfid_byte)))
+
+        if response.service_data.memory_location_echo.address != memory_location.address:
+            raise UnexpectedResponseException(response, 'Address echoed back by the server (0x%X) does not match the one requested by the client (0x%X)' % (
+                response.service_data.memory_location_echo.address, memory_location.address))
+
+        if response.service_data.memory_location_echo.memorysize != memory_location.memorysize:
+            raise UnexpectedResponseException(response, 'Memory size echoed back by the server (0x%X) does not match the one requested by the client (0x%X)' % (
+                response.service_data.memory_location_echo.memorysize, memory_location.memorysize))
+
+        return response
+
+    # Performs a ReadDiagnsticInformation service request.
+    # Many requests are encoded the same way and many responses are encoded the same way. Request grouping and response grouping are independent.
+
+    def _read_dtc_information_steps(self,
+                                    subfunction: int,
+                                    status_mask: Optional[Union[Dtc.Status, int]] = None,
+                                    severity_mask: Optional[Union[Dtc.Severity, int]] = None,
+                                    dtc: Optional[Union[int, Dtc]] = None,
+                                    snapshot_record_number: Optional[int] = None,
+                                    extended_data_record_number: Optional[int] = None,
+                                    extended_data_size: Optional[int] = None,
+                                    memory_selection: Optional[int] = None,
+                                    functional_group_id: Optional[int] = None,
+                                    dtc_class: Optional[Union[int, Dtc.DtcClass]] = None
+                                    ):
+        if dtc is not None and isinstance(dtc, Dtc):
+            dtc = dtc.id
+
+        request = services.ReadDTCInformation.make_request(subfunction=subfunction,
+                                                           status_mask=status_mask,
+                                                           severity_mask=severity_mask,
+                                                           dtc=dtc,
+                                                           snapshot_record_number=snapshot_record_number,
+                                                           extended_data_record_number=extended_data_record_number,
+                                                           memory_selection=memory_selection,
+                                                           standard_version=self.config['standard_version'],
+                                                           functional_group_id=functional_group_id,
+                                                           dtc_class=dtc_class)
+
+        self.logger.info('%s - Sending request with subfunction "%s" (0x%02X).' % (self.service_log_prefix(services.ReadDTCInformation),
+                         services.ReadDTCInformation.Subfunction.get_name(subfunction), subfunction))
+        response = yield request
+        if response is None:
+            return None
+
+        extended_data_size2: Optional[Union[int, Dict[int, int]]] = None
+        if extended_data_size is None:
+            if 'extended_data_size' in self.config:
+                extended_data_size2 = self.config['extended_data_size']
+        else:
+            extended_data_size2 = extended_data_size
+
+        # So, if subfunction is a mismatch, chances are that the response won't be decoded properly because we use the
+        # request subfunction to select the decoding algorithm, not the received one.
+        # We want to report the subfunction mismatch as a primary cause.
+        error = None
+        try:
+            response = services.ReadDTCInformation.interpret_response(response, subfunction=subfunction,
+                                                                      tolerate_zero_padding=self.config['tolerate_zero_padding'],
+                                                                      ignore_all_zero_dtc=self.config['ignore_all_zero_dtc'],
+                                                                      dtc_snapshot_did_size=self.config['dtc_snapshot_did_size'],
+                                                                      didconfig=self.config['data_identifiers'] if 'data_identifiers' in self.config else None,
+                                                                      extended_data_size=extended_data_size2,
+                                                                      standard_version=self.config['standard_version'],
+                                                                      dtc_table=self.config['use_dtc_table'])
+        except Exception as e:
+            error = e
+
+        # If nothing can be checked, raise the error right away
+        if isinstance(error, InvalidResponseException):
+            if response.service_data is None:
+                raise error
+            response = cast(services.ReadDTCInformation.InterpretedResponse, response)
+            if cast(services.ReadDTCInformation.InterpretedResponse, response).service_data.subfunction_echo is None:
+                raise error
+
+        response = cast(services.ReadDTCInformation.InterpretedResponse, response)
+        # We can report a subfunction mismatch before decoding error.
+        if response.service_data.subfunction_echo != subfunction:
+            received_subfn_echo = 'None' if response.service_data.subfunction_echo is None else '%02x' % response.service_data.subfunction_echo
+            raise UnexpectedResponseException(
+                response, 'Echo of ReadDTCInformation subfunction gotten from server (%s) does not match the value in the request subfunction (0x%02x)' % (received_subfn_echo, subfunction))
+
+        # Nothing else to check, report the real error.
+        if error:
+            raise error
+
+        if subfunction in [services.ReadDTCInformation.Subfunction.reportDTCSnapshotRecordByDTCNumber, services.ReadDTCInformation.Subfunction.reportUserDefMemoryDTCSnapshotRecordByDTCNumber]:
+            if len(response.service_data.dtcs) == 1:
+                assert dtc is not None
+                if dtc != response.service_data.dtcs[0].id:
+                    raise UnexpectedResponseException(
+                        response, 'Server returned snapshot with DTC ID 0x%06x while client requested for 0x%06x' % (response.service_data.dtcs[0].id, dtc))
+
+        if subfunction in [services.ReadDTCInformation.Subfunction.reportDTCSnapshotRecordByRecordNumber, services.ReadDTCInformation.Subfunction.reportDTCSnapshotRecordByDTCNumber, services.ReadDTCInformation.Subfunction.reportUserDefMemoryDTCSnapshotRecordByDTCNumber]:
+            assert snapshot_record_number is not None
+            if len(response.service_data.dtcs) == 1 and snapshot_record_number != 0xFF:
+                for snapshot in response.service_data.dtcs[0].snapshots:
+                    gotten_record_number = snapshot if isinstance(snapshot, int) else snapshot.record_number
+                    if gotten_record_number != snapshot_record_number:
+                        raise UnexpectedResponseException(response, 'Server returned snapshot with record number %s while client requested for 0x%02x' % (
+                            '0x%02x' % gotten_record_number if gotten_record_number is not None else '<None>', snapshot_record_number))
+
+        if subfunction in [services.ReadDTCInformation.Subfunction.reportDTCExtendedDataRecordByDTCNumber, services.ReadDTCInformation.Subfunction.reportMirrorMemoryDTCExtendedDataRecordByDTCNumber, services.ReadDTCInformation.Subfunction.reportUserDefMemoryDTCExtDataRecordByDTCNumber]:
+            # Standard specifies that values between 0xF0 and 0xFF are for reporting groups (more than one record)
+            assert extended_data_record_number is not None
+            if len(response.service_data.dtcs) == 1 and extended_data_record_number < 0xF0:
+                for extended_data in response.service_data.dtcs[0].extended_data:
+                    assert extended_data.record_number is not None
+                    if extended_data.record_number != extended_data_record_number:
+                        raise UnexpectedResponseException(response, 'Extended data record number given by the server (0x%02x) does not match the record number requested by the client (0x%02x)' % (
+                            extended_data.record_number, extended_data_record_number))
+
+        if subfunction in [services.ReadDTCInformation.Subfunction.reportUserDefMemoryDTCByStatusMask, services.ReadDTCInformation.Subfunction.reportUserDefMemoryDTCSnapshotRecordByDTCNumber, services.ReadDTCInformation.Subfunction.reportUserDefMemoryDTCExtDataRecordByDTCNumber]:
+            if memory_selection is not None and memory_selection != response.service_data.memory_selection_echo:
+                received_ms_echo = 'None' if response.service_data.memory_selection_echo is None else '%02x' % response.service_data.memory_selection_echo
+                raise UnexpectedResponseException(
+                    response, 'Echo of ReadDTCInformation MemorySelection gotten from server (%s) does not match the value in the request (0x%02x)' % (received_ms_echo, memory_selection))
+
+        if subfunction == services.ReadDTCInformation.Subfunction.reportDTCExtDataRecordByRecordNumber:
+            if extended_data_record_number is not None:
+                for dtc_obj in response.service_data.dtcs:
+                    for extended_data in dtc_obj.extended_data:
+                        if extended_data.record_number != extended_data_record_number:
+                            raise UnexpectedResponseException(response, 'Extended data record number given by the server for DTC 0x%06X has a value of %d but requested record number was %d', (
+                                dtc_obj.id, extended_data.record_number, extended_data_record_number))
+
+        if subfunction in [services.ReadDTCInformation.Subfunction.reportWWHOBDDTCWithPermanentStatus, services.ReadDTCInformation.Subfunction.reportWWHOBDDTCByMaskRecord]:
+            assert response.service_data.functional_group_id is not None
+            assert functional_group_id is not None
+            if functional_group_id != response.service_data.functional_group_id:
+                raise UnexpectedResponseException(response, "FunctionalGroupIdentifier in the server response does not match the value in the request. Requested 0x%02x, got 0x%02x" % (functional_group_id, response.service_data.functional_group_id))
+
+        if Dtc.Format.get_name(response.service_data.dtc_format) is None:
+            self.logger.warning('Unknown DTC Format Identifier %s. Value should be between 0 and 4' %
+                                ('0x%02x' % response.service_data.dtc_format if response.service_data.dtc_format is not None else '<None>')
+                                )
+
+        return response
+
+    def _request_file_transfer_steps(self,
+                                     moop: int,
+                                     path: str,
+                                     dfi: Optional[DataFormatIdentifier] = None,
+                                     filesize: Optional[Union[int, Filesize]] = None
+                                     ) -> ServiceCallGenerator[Optional[services.RequestFileTransfer.InterpretedResponse]]:
+
+        request = services.RequestFileTransfer.make_request(moop=moop, path=path, dfi=dfi, filesize=filesize)
+        self.logger.info('%s - Sending a "%s"(0x%02x) request on "%s". ' % (self.service_log_prefix(services.RequestFileTransfer),
+                         services.RequestFileTransfer.ModeOfOperation.get_name(moop), moop, path))
+        self.logger.debug("%s - DataFormatIdentifier = %s. Filesize = %s" % (self.service_log_prefix(services.RequestFileTransfer), dfi, filesize))
+
+        response = yield request
+        if response is None:
+            return None
+
+        try:
+            response = services.RequestFileTransfer.interpret_response(response, tolerate_zero_padding=self.config['tolerate_zero_padding'])
+        except InvalidResponseException as e:
+            if e.response.service_data is not None:
+                service_data = cast(services.RequestFileTransfer.ResponseData, e.response.service_data)
+                if service_data.moop_echo is not None and service_data.moop_echo != moop:
+                    raise UnexpectedResponseException(e.response, 'ModeOfOperation echo does not match request and caused the service to failed decoding the payload correctly. Received 0x%02x, Requested=0x%02x' % (
+                        service_data.moop_echo, moop))
+                else:
+                    raise e
+            else:
+                raise e
+
+        if response.service_data.moop_echo != moop:
+            raise UnexpectedResponseException(
+                response, 'ModeOfOperation echo does not match request. Received 0x%02x, Requested=0x%02x' % (response.service_data.moop_echo, moop))
+
+        if response.service_data.dfi is not None and dfi is not None:
+            received = response.service_data.dfi.get_byte_as_int()
+            expected = dfi.get_byte_as_int()
+            if received != expected:
+                raise UnexpectedResponseException(
+                    response, 'DataFormatIdentifier echo does not match request. Received 0x%02x, Requested=0x%02x' % (received, expected))
+
+        return response
+
+    def _dynamically_define_did_steps(self,
+                                      did: int,
+                                      did_definition: Union[DynamicDidDefinition, MemoryLocation]
+                                      ) -> ServiceCallGenerator[Optional[services.DynamicallyDefineDataIdentifier.InterpretedResponse]]:
+
+        self.logger.info('%s - Dynamically defining DID %s.' % (self.service_log_prefix(services.DynamicallyDefineDataIdentifier), did))
+
+        if isinstance(did_definition, MemoryLocation):
+            did_definition = DynamicDidDefinition(did_definition)
+
+        if did_definition.is_by_source_did():
+            subfunction = services.DynamicallyDefineDataIdentifier.Subfunction.defineByIdentifier
+        elif did_definition.is_by_memory_address():
+            subfunction = services.DynamicallyDefineDataIdentifier.Subfunction.defineByMemoryAddress
+            entries = cast(List[DynamicDidDefinition.ByMemloc], did_definition.get())
+            if 'server_address_format' in self.config:
+                for entry in entries:
+                    entry.memloc.set_format_if_none(address_format=self.config['server_address_format'])
+
+            if 'server_memorysize_format' in self.config:
+                for entry in entries:
+                    entry.memloc.set_format_if_none(memorysize_format=self.config['server_memorysize_format'])
+        else:
+            raise ValueError('Cannot determine the subfunction from DID Definition')
+
+        request = services.DynamicallyDefineDataIdentifier.make_request(subfunction, did, did_definition)
+
+        response = yield request
+        if response is None:
+            return None
+
+        response = services.DynamicallyDefineDataIdentifier.interpret_response(response)
+
+        if subfunction != response.service_data.subfunction_echo:
+            raise UnexpectedResponseException(response, "Subfunction echo of response (0x%02x) does not match request subfunction (0x%02x)" % (
+                response.service_data.subfunction_echo, subfunction))
+
+        if response.service_data.did_echo is not None:
+            if did != response.service_data.did_echo:
+                raise UnexpectedResponseException(response, "DID echo of response (0x%02x) does not match requested DID (0x%02x)" %
+                                                  (response.service_data.did_echo, did))
+
+        return response
+
+    def _do_clear_dynamically_defined_did_steps(self, did: Optional[int] = None) -> ServiceCallGenerator[Optional[services.DynamicallyDefineDataIdentifier.InterpretedResponse]]:
+        subfunction = services.DynamicallyDefineDataIdentifier.Subfunction.clearDynamicallyDefinedDataIdentifier
+
+        didstr = 'all DIDs' if did is None else 'DID %s' % did
+        self.logger.info('%s - Sending a "%s"(0x%02x) for %s. ' % (self.service_log_prefix(services.DynamicallyDefineDataIdentifier),
+                         services.DynamicallyDefineDataIdentifier.Subfunction.get_name(subfunction), subfunction, didstr))
+
+        request = services.DynamicallyDefineDataIdentifier.make_request(subfunction, did=did)
+        response = yield request
+        if response is None:
+            return None
+        response = services.DynamicallyDefineDataIdentifier.interpret_response(response)
+
+        if subfunction != response.service_data.subfunction_echo:
+            raise UnexpectedResponseException(response, "Subfunction echo of response (0x%02x) does not match request subfunction (0x%02x)" % (
+                response.service_data.subfunction_echo, subfunction))
+
+        if did is not None:
+            if did != response.service_data.did_echo:
+                raise UnexpectedResponseException(
+                    response, "DID echo of response (%s) does not match requested DID (0x%02x)" % (
+                        '0x%02x' % response.service_data.did_echo if response.service_data.did_echo is not None else '<None>',
+                        did))
+
+        return response
+
+    # Basic transmission of requests. This will need to be improved
+
+    def _interpret_prepared_outcome(self, prepared: PreparedRequest, outcome: Outcome) -> Outcome:
+        if outcome.status != Outcome.POSITIVE or outcome.response is None:
+            return outcome
+        try:
+            outcome.response = self._interpret_prepared_response(prepared, outcome.response)
+        except InvalidResponseException as e:
+            e.response.valid = False
+            outcome.status = Outcome.INVALID
+        except UnexpectedResponseException as e:
+            e.response.unexpected = True
+            outcome.status = Outcome.UNEXPECTED
+        return outcome
+
+    # Operations on the connection yielded by _send_request_steps
+    _IO_EMPTY_RXQUEUE = 'empty_rxqueue'
+    _IO_SEND = 'send'
+    _IO_WAIT_FRAME = 'wait_frame'
+
+    # The logic of send_request, independent of the connection being synchronous or not.
+    # Yields (operation, argument) tuples to be executed on the connection and receives their result.
+    # The payload can be given when it is already encoded, otherwise it is taken from the request.
+    # When outcome is True, the result is given in an Outcome instead of raising exceptions for timeouts, negative, invalid and unexpected responses.
+    def _send_request_steps(self, request: Request, timeout: float = -1, payload: Optional[BytesLike] = None, outcome: bool = False) -> RequestStepsGenerator[Union[Optional[Response], Outcome]]:
+        if request.service is None:
+            raise ValueError("Request has no service")
+
+        if timeout < 0:
+            # Timeout not provided by user: defaults to Client request_timeout value
+            overall_timeout = self.config['request_timeout']
+            p2 = self.config['p2_timeout'] if self.session_timing.p2_server_max is None else self.session_timing.p2_server_max
+            if overall_timeout is not None:
+                single_request_timeout = min(overall_timeout, p2)
+            else:
+                single_request_timeout = p2
+        else:
+            overall_timeout = timeout
+            single_request_timeout = timeout
+        respect_overall_timeout = True
+        if overall_timeout is None:
+            respect_overall_timeout = False
+        using_p2_star = False  # Will switch to true when Nrc 0x78 will be received the first time.
+
+        if len(self.periodic_streams) == 0:
+            yield (self._IO_EMPTY_RXQUEUE, None)
+        else:
+            # Keep the periodic data already received. Discard anything else like the empty_rxqueue() would do
+            while True:
+                try:
+                    old_payload = yield (self._IO_WAIT_FRAME, 0)
+                except TimeoutException:
+                    break
+                if old_payload is None:
+                    break
+                self._dispatch_periodic_data(old_payload)
+        # try_request() is meant for probing many requests. The per-request log lines are left out in that case
+        if not outcome:
+            self.logger.debug("Sending request to server")
+        override_suppress_positive_response = False
+        if self.suppress_positive_response.enabled == True and request.service.use_subfunction():
+            payload = request.get_payload(suppress_positive_response=True)
+            override_suppress_positive_response = True
+        elif payload is None:
+            payload = request.payload if isinstance(request, _EncodedRequest) else request.get_payload()
+
+        if self.payload_override.enabled:
+            payload = self.payload_override.get_overrided_payload(bytes(payload))
+
+        if self.suppress_positive_response.enabled and not request.service.use_subfunction():
+            self.logger.warning('SuppressPositiveResponse cannot be used for service %s. Ignoring' % (request.service.get_name()))
+
+        metrics = None if self.metrics is None else self.metrics.for_request(request)
+        if metrics is not None:
+            metrics.requests += 1
+            metrics.request_size.observe(len(payload))
+
+        yield (self._IO_SEND, payload)
+        sent_time = time.perf_counter() if metrics is not None else 0
+        pending_start_time: Optional[float] = None
+        first_response = True
+
+        spr_used = request.suppress_positive_response or override_suppress_positive_response
+        wait_nrc = self.suppress_positive_response.enabled and self.suppress_positive_response.wait_nrc
+
+        if spr_used and not wait_nrc:
+            return Outcome(Outcome.POSITIVE, request) if outcome else None
+
+        done_receiving = False
+        if respect_overall_timeout:
+            overall_timeout_time = time.monotonic() + overall_timeout
+
+        timed_out = False
+        periodic_data_received = False
+        wait_deadline: Optional[float] = None   # End of the wait for the current response. Set before the first wait
+        while not done_receiving and not timed_out:
+            done_receiving = True
+            if periodic_data_received and wait_deadline is not None:
+                # Still waiting for the same response. Periodic data messages do not restart the timeout
+                timeout_value = max(wait_deadline - time.monotonic(), 0)
+                periodic_data_received = False
+            else:
+                if not outcome:
+                    self.logger.debug("Waiting for server response")
+                if not respect_overall_timeout or (respect_overall_timeout and time.monotonic() + single_request_timeout < overall_timeout_time):
+                    timeout_type_used = 'single_request'
+                    timeout_value = single_request_timeout
+                else:
+                    timeout_type_used = 'overall'
+                    timeout_value = max(overall_timeout_time - time.monotonic(), 0)
+                wait_deadline = time.monotonic() + timeout_value
+
+            try:
+                recv_payload = yield (self._IO_WAIT_FRAME, timeout_value)
+            except TimeoutException:
+                timed_out = True
+            except Exception as e:
+                raise e
+
+            if timed_out or recv_payload is None:
+                if spr_used:
+                    return Outcome(Outcome.POSITIVE, request) if outcome else None
+                if metrics is not None:
+                    metrics.timeouts += 1
+                if outcome:
+                    return Outcome(Outcome.TIMEOUT, request)
+                if timeout_type_used == 'single_request':
+                    timeout_name_to_report = 'P2* timeout' if using_p2_star else 'P2 timeout'
+                    timeout_value_to_report = single_request_timeout
+                elif timeout_type_used == 'overall':
+                    timeout_name_to_report = 'Global request timeout'
+                    timeout_value_to_report = overall_timeout
+                else:  # Shouldn't go here.
+                    timeout_name_to_report = 'Timeout'
+                    timeout_value_to_report = timeout_value
+
+                raise TimeoutException('Did not receive response in time. %s time has expired (timeout=%.3f sec)' %
+                                       (timeout_name_to_report, float(timeout_value_to_report)))
+
+            if len(self.periodic_streams) > 0 and self._dispatch_periodic_data(recv_payload):
+                periodic_data_received = True
+                done_receiving = False
+                continue
+
+            if metrics is not None:
+                received_time = time.perf_counter()
+                metrics.response_size.observe(len(recv_payload))
+                if first_response:
+                    metrics.response_time.observe(received_time - sent_time)
+                    first_response = False
+
+            # A connection in direct mode gives a memoryview on a buffer reused for the next frame. The response is kept
+            # by the user, so it gets its own copy. No copy is made for bytes
+            response = Response.from_payload(bytes(recv_payload))
+            self.last_response = response
+            if not outcome:
+                self.logger.debug("Received response from server")
+
+            if not response.valid:
+                if outcome:
+                    return Outcome(Outcome.INVALID, request, response)
+                raise InvalidResponseException(response)
+
+            assert response.service is not None
+            assert response.code is not None
+
+            if response.service.response_id() != request.service.response_id():
+                if outcome:
+                    response.unexpected = True
+                    return Outcome(Outcome.UNEXPECTED, request, response)
+                msg = "Response gotten from server has a service ID different than the request service ID. Received=0x%02x, Expected=0x%02x" % (
+                    response.service.response_id(), request.service.response_id())
+                raise UnexpectedResponseException(response, msg)
+
+            if not response.positive:
+                if not outcome:    # Negative responses are expected when probing
+                    try:
+                        if not Response.Code.is_supported_by_standard(response.code, self.config['standard_version']):
+                            self.logger.warning('Given response code "%s" (0x%02x) is not supported byt the UDS standard version that the clients s enforcing (%s)' % (
+                                response.code_name,
+                                response.code,
+                                self.config['standard_version']))
+                    except ValueError:
+                        self.logger.warning('Unkown response code "%s" (0x%02x)', response.code_name, response.code)
+
+                    if not request.service.is_supported_negative_response(response.code):
+                        self.logger.warning('Given response code "%s" (0x%02x) is not a supported negative response code according to UDS standard.' % (
+                            response.code_name, response.code))
+
+                if response.code == Response.Code.RequestCorrectlyReceived_ResponsePending:
+                    if metrics is not None:
+                        metrics.response_pending += 1
+                        if pending_start_time is None:
+                            pending_start_time = received_time
+                    if self.config['nrc78_callback'] is not None:
+                        self.config['nrc78_callback']()
+                    
+                    done_receiving = False
+                    if not using_p2_star:
+                        # Received a 0x78 NRC: timeout is now set to P2*
+                        p2_star = self.config['p2_star_timeout'] if self.session_timing.p2_star_server_max is None else self.session_timing.p2_star_server_max
+                        single_request_timeout = p2_star
+                        using_p2_star = True
+                        self.logger.debug("Server requested to wait with response code %s (0x%02x), single request timeout is now set to P2* (%.3f seconds)" %
+                                          (response.code_name, response.code, single_request_timeout))
+                else:
+                    if metrics is not None:
+                        metrics.negative_responses += 1
+                        if pending_start_time is not None:
+                            metrics.pending_time.observe(received_time - pending_start_time)
+                    if outcome:
+                        return Outcome(Outcome.NEGATIVE, request, response)
+                    raise NegativeResponseException(response)
+
+        if metrics is not None and pending_start_time is not None:
+            metrics.pending_time.observe(received_time - pending_start_time)
+
+        assert response.service is not None
+        self.logger.info('Received positive response for service %s (0x%02x) from server.' %
+                         (response.service.get_name(), response.service.request_id()))
+
+        response.original_request = request
+
+        if spr_used:
+            return Outcome(Outcome.POSITIVE, request) if outcome else None
+
+        return Outcome(Outcome.POSITIVE, request, response) if outcome else response
+
+    def _authentication_steps(self,
+                              authentication_task: int,
+                              communication_configuration: Optional[int] = None,
+                              certificate_client: Optional[bytes] = None,
+                              challenge_client: Optional[bytes] = None,
+                              algorithm_indicator: Optional[bytes] = None,
+                              certificate_evaluation_id: Optional[int] = None,
+                              certificate_data: Optional[bytes] = None,
+                              proof_of_ownership_client: Optional[bytes] = None,
+                              ephemeral_public_key_client: Optional[bytes] = None,
+                              additional_parameter: Optional[bytes] = None) -> ServiceCallGenerator[Optional[
+                              services.Authentication.InterpretedResponse]]:
+
+        request = services.Authentication.make_request(authentication_task,
+                                                       communication_configuration,
+                                                       certificate_client,
+                                                       challenge_client,
+                                                       algorithm_indicator,
+                                                       certificate_evaluation_id,
+                                                       certificate_data,
+                                                       proof_of_ownership_client,
+                                                       ephemeral_public_key_client,
+                                                       additional_parameter)
+
+        self.logger.info(f'{self.service_log_prefix(services.Authentication)} - Sending request with authentication'
+                         f' task "{services.Authentication.AuthenticationTask.get_name(authentication_task)}"'
+                         f' ({authentication_task:#02x}')
+        response = yield request
+        if response is None:
+            return None
+
+        response = services.Authentication.interpret_response(response)
+        if authentication_task != response.service_data.authentication_task_echo:
+            raise UnexpectedResponseException(response, f'Authentication Task echo of response'
+                                              f' ({response.service_data.authentication_task_echo:#02x}) does not match'
+                                                        f' request Authentication Task ({authentication_task:#02x})')
         return response
 
-    # Performs a WriteDataByIdentifier request.
 
-    @standard_error_management
+class Client(BaseClient):
+    """
+    __init__(self, conn, config=default_client_config, request_timeout = None)
+
+    Object that interacts with a UDS server. 
+    It builds a service request, sends it to the server, receives and parses its response, detects communication anomalies and logs what it is doing for further debugging.
+
+    :param conn: The underlying protocol interface.
+    :type conn: :ref:`Connection<Connection>`
+
+    :param config: The :ref:`client configuration<client_config>`
+    :type config: dict
+
+    :param request_timeout: Maximum amount of time to wait for a response. This parameter exists for backward compatibility only. For detailed timeout handling, see :ref:`Client configuration<config_timeouts>`
+    :type request_timeout: int
+    """
+
+    conn: BaseConnection
+
+    def __init__(self, conn: BaseConnection, config: ClientConfig = default_client_config, request_timeout: Optional[float] = None):
+        BaseClient.__init__(self, conn, config=config, request_timeout=request_timeout)
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, type, value, traceback):
+        self.close()
+
+    def open(self) -> None:
+        if not self.conn.is_open():
+            self.conn.open()
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def _call_service(self, steps: Callable[..., ServiceCallGenerator[T]], *args: Any, **kwargs: Any) -> Any:
+        try:
+            service_call = steps(*args, **kwargs)
+            try:
+                request = self._start_service_call(service_call)
+                while True:
+                    try:
+                        response = self.send_request(request)
+                    except Exception as e:
+                        request = service_call.throw(e)
+                    else:
+                        request = self._resume_service_call(service_call, request, response)
+            except StopIteration as stop:
+                return stop.value
+        except Exception as e:
+            return self._manage_service_exception(e)
+
+    def _call_prepared(self, prepared: PreparedRequest, timeout: float) -> Any:
+        try:
+            response = cast(Optional[Response], self._run_request_steps(self._send_request_steps(prepared.request, timeout, prepared.payload)))
+            return self._interpret_prepared_response(prepared, response)
+        except Exception as e:
+            return self._manage_service_exception(e)
+
+    def change_session(self, newsession: int) -> Optional[services.DiagnosticSessionControl.InterpretedResponse]:
+        """ 
+        Requests the server to change the diagnostic session with a :ref:`DiagnosticSessionControl<DiagnosticSessionControl>` service request
+
+        :Effective configuration: ``exception_on_<type>_response``
+
+        :param newsession: The session to try to switch. Values from :class:`DiagnosticSessionControl.Session <udsoncan.services.DiagnosticSessionControl.Session>` can be used.
+        :type newsession: int 
+
+        :return: The server response parsed by :meth:`DiagnosticSessionControl.interpret_response<udsoncan.services.DiagnosticSessionControl.interpret_response>`
+        :rtype: :ref:`Response<Response>`
+        """
+        return self._call_service(self._change_session_steps, newsession)
+
+    def request_seed(self, level: int, data=bytes()) -> Optional[services.SecurityAccess.InterpretedResponse]:
+        """ 
+        Requests a seed to unlock a security level with the :ref:`SecurityAccess<SecurityAccess>` service 
+
+        :Effective configuration: ``exception_on_<type>_response``
+
+        :param level: The security level to unlock. If value is even, it will be converted to the corresponding odd value
+        :type level: int 
+
+        :param data: The data to send to the server (securityAccessDataRecord)
+        :type data: bytes 
+
+        :return: The server response parsed by :meth:`SecurityAccess.interpret_response<udsoncan.services.SecurityAccess.interpret_response>`
+        :rtype: :ref:`Response<Response>`
+        """
+        return self._call_service(self._request_seed_steps, level, data)
+
+    # Performs a SecurityAccess service request. Send key
+    def send_key(self, level: int, key: bytes) -> Optional[services.SecurityAccess.InterpretedResponse]:
+        """ 
+        Sends a key to unlock a security level with the :ref:`SecurityAccess<SecurityAccess>` service 
+
+        :Effective configuration: ``exception_on_<type>_response``
+
+        :param level: The security level to unlock. If value is odd, it will be converted to the corresponding even value
+        :type level: int 
+
+        :param key: The key to send to the server
+        :type key: bytes 
+
+        :return: The server response parsed by :meth:`SecurityAccess.interpret_response<udsoncan.services.SecurityAccess.interpret_response>`
+        :rtype: :ref:`Response<Response>`
+        """
+        return self._call_service(self._send_key_steps, level, key)
+
+    def unlock_security_access(self, level, seed_params=bytes()) -> Optional[services.SecurityAccess.InterpretedResponse]:
+        """
+        Successively calls request_seed and send_key to unlock a security level with the :ref:`SecurityAccess<SecurityAccess>` service.
+        The key computation is done by calling config['security_algo']
+
+        :Effective configuration: ``exception_on_<type>_response`` ``security_algo`` ``security_algo_params``
+
+        :param level: The level to unlock. Can be the odd or even variant of it.
+        :type level: int
+
+        :param seed_params: Optional data to attach to the RequestSeed request (securityAccessDataRecord).
+        :type seed_params: bytes
+
+        :return: The server response parsed by :meth:`SecurityAccess.interpret_response<udsoncan.services.SecurityAccess.interpret_response>`
+        :rtype: :ref:`Response<Response>`
+        """
+        return self._call_service(self._unlock_security_access_steps, level, seed_params)
+
+    def tester_present(self) -> Optional[services.TesterPresent.InterpretedResponse]:
+        """
+        Sends a TesterPresent request to keep the session active.
+
+        :Effective configuration: ``exception_on_<type>_response``
+
+        :return: The server response parsed by :meth:`TesterPresent.interpret_response<udsoncan.services.TesterPresent.interpret_response>`
+        :rtype: :ref:`Response<Response>`
+        """
+        return self._call_service(self._tester_present_steps)
+
+    def read_data_by_identifier_first(self, didlist: Union[int, List[int]]) -> Optional[Any]:
+        """
+        Shortcut to extract a single DID. 
+        Calls read_data_by_identifier then returns the first DID asked for. 
+
+        :Effective configuration: ``exception_on_<type>_response`` ``data_identifiers`` ``tolerate_zero_padding``
+
+        :param didlist: The list of DID to be read
+        :type didlist: list[int]
+
+        :return: The server response parsed by :meth:`ReadDataByIdentifier.interpret_response<udsoncan.services.ReadDataByIdentifier.interpret_response>`
+        :rtype: :ref:`Response<Response>`
+        """
+        return self._call_service(self._read_data_by_identifier_first_steps, didlist)
+
+    def test_data_identifier(self, didlist: Union[int, List[int]]) -> Optional[Response]:
+        """
+            Sends a request for the ReadDataByIdentifier and returns blindly the received response without parsing.
+            The requested DIDs do not have to be inside the client list of supported DID.
+            This method can be useful for testing if a DID exists on an ECU
+
+            :Effective configuration: ``exception_on_<type>_response``
+
+            :param didlist: The DIDs to peek
+            :type didlist: list[int] 
+
+            :return: The raw server response. The response will not be parsed by any service, causing ``service_data`` to always be ``None``
+            :rtype: :ref:`Response<Response>`
+
+        """
+        return self._call_service(self._test_data_identifier_steps, didlist)
+
+    def read_data_by_identifier(self, didlist: Union[int, List[int]]) -> Optional[services.ReadDataByIdentifier.InterpretedResponse]:
+        """
+        Requests a value associated with a data identifier (DID) through the :ref:`ReadDataByIdentifier<ReadDataByIdentifier>` service.
+
+        The DIDs having a valid value in the :ref:`DID cache<config_did_cache>` are not requested to the server; their cached value is added to the response values.
+        If all the DIDs are cached, no request is sent and the returned response contains only the values.
+
+        :Effective configuration: ``exception_on_<type>_response`` ``data_identifiers`` ``tolerate_zero_padding`` ``did_cache``
+
+        See :ref:`an example<reading_a_did>` about how to read a DID
+
+        :param didlist: The list of DID to be read
+        :type didlist: list[int]
+
+        :return: The server response parsed by :meth:`ReadDataByIdentifier.interpret_response<udsoncan.services.ReadDataByIdentifier.interpret_response>`
+        :rtype: :ref:`Response<Response>`
+        """
+        return self._call_service(self._read_data_by_identifier_steps, didlist)
+
+    def read_data_by_identifier_bulk(self,
+                                     didlist: Union[int, List[int]],
+                                     max_response_size: Optional[int] = None,
+                                     max_did_per_request: Optional[int] = None) -> Optional[Dict[int, Any]]:
+        """
+        Reads any number of data identifiers (DID) through as many :ref:`ReadDataByIdentifier<ReadDataByIdentifier>` requests as needed.
+        DIDs are packed in the fewest requests whose expected response fits ``max_response_size`` and that contain at most ``max_did_per_request`` DIDs,
+        using the length of the DID codecs.
+
+        When the server refuses a request with the negative response ``ResponseTooLong`` (0x14) or ``IncorrectMessageLengthOrInvalidFormat`` (0x13),
+        the limit is lowered, remembered in ``client.rdbi_limits`` for the next calls, and the remaining DIDs are packed again.
+        A request containing a single DID is never retried.
+
+        :Effective configuration: ``exception_on_<type>_response`` ``data_identifiers`` ``tolerate_zero_padding`` ``rdbi_max_response_size`` ``rdbi_max_did_per_request``
+
+        :param didlist: The list of DID to be read
+        :type didlist: list[int]
+
+        :param max_response_size: Maximum size of a response payload in bytes. If not specified, ``config['rdbi_max_response_size']`` is used.
+        :type max_response_size: int
+
+        :param max_did_per_request: Maximum number of DIDs in a single request. If not specified, ``config['rdbi_max_did_per_request']`` is used.
+        :type max_did_per_request: int
+
+        :return: A dictionary mapping each DID (int) with the value returned by its :ref:`DidCodec<DidCodec>`.decode method, in the order of ``didlist``
+        :rtype: dict
+        """
+        return self._call_service(self._read_data_by_identifier_bulk_steps, didlist, max_response_size, max_did_per_request)
+
+    def read_data_by_periodic_identifier(self, transmission_mode: int, didlist: Union[int, List[int]]) -> Optional[services.ReadDataByPeriodicIdentifier.InterpretedResponse]:
+        """
+        Requests the server to start or stop sending periodic data messages through the :ref:`ReadDataByPeriodicIdentifier<ReadDataByPeriodicIdentifier>` service.
+        The periodic data messages are not read by this method, see :meth:`start_periodic_stream<udsoncan.client.Client.start_periodic_stream>`
+
+        :Effective configuration: ``exception_on_<type>_response``
+
+        :param transmission_mode: The transmission rate, or ``stopSending``. See :class:`ReadDataByPeriodicIdentifier.TransmissionMode<udsoncan.services.ReadDataByPeriodicIdentifier.TransmissionMode>`
+        :type transmission_mode: int
+
+        :param didlist: The periodic data identifiers. Either the full DID (0xF200-0xF2FF) or its last byte (0x00-0xFF).
+            Can be empty with ``stopSending`` to stop all periodic transmissions
+        :type didlist: list[int]
+
+        :return: The server response parsed by :meth:`ReadDataByPeriodicIdentifier.interpret_response<udsoncan.services.ReadDataByPeriodicIdentifier.interpret_response>`
+        :rtype: :ref:`Response<Response>`
+        """
+        return self._call_service(self._read_data_by_periodic_identifier_steps, transmission_mode, didlist)
+
+    def start_periodic_stream(self,
+                              didlist: Union[int, List[int]],
+                              transmission_mode: int = services.ReadDataByPeriodicIdentifier.TransmissionMode.sendAtFastRate,
+                              callback: Optional[Callable[[PeriodicSample], None]] = None,
+                              maxsize: int = 1000) -> PeriodicDataStream:
+        """
+        Requests the server to send periodic data messages for a list of periodic data identifiers and returns a 
+        :class:`PeriodicDataStream<udsoncan.client.PeriodicDataStream>` that receives their decoded values.
+        Periodic data messages received while waiting for the response of another request are given to their stream instead of being treated as unexpected responses.
+
+        :Effective configuration: ``exception_on_<type>_response`` ``data_identifiers`` ``tolerate_zero_padding``
+
+        :param didlist: The periodic data identifiers. Either the full DID (0xF200-0xF2FF) or its last byte (0x00-0xFF).
+            Their codecs are taken from ``config['data_identifiers']`` using the full DID
+        :type didlist: list[int]
+
+        :param transmission_mode: The transmission rate. One of ``sendAtSlowRate``, ``sendAtMediumRate``, ``sendAtFastRate``. 
+            See :class:`ReadDataByPeriodicIdentifier.TransmissionMode<udsoncan.services.ReadDataByPeriodicIdentifier.TransmissionMode>`
+        :type transmission_mode: int
+
+        :param callback: Optional function called with each :class:`PeriodicSample<udsoncan.client.PeriodicSample>` received
+        :type callback: callable
+
+        :param maxsize: Number of values kept in the stream queue until they are read. The oldest values are dropped when the queue is full
+        :type maxsize: int
+
+        :return: The stream
+        :rtype: :class:`PeriodicDataStream<udsoncan.client.PeriodicDataStream>`
+        """
+        return self._call_service(self._start_periodic_stream_steps, didlist, transmission_mode, callback, maxsize)
+
+    def stop_periodic_stream(self, stream: Optional[PeriodicDataStream] = None) -> Optional[services.ReadDataByPeriodicIdentifier.InterpretedResponse]:
+        """
+        Requests the server to stop sending the periodic data messages of a stream started with :meth:`start_periodic_stream<udsoncan.client.Client.start_periodic_stream>`.
+        Values already received stay readable from the stream.
+
+        :Effective configuration: ``exception_on_<type>_response``
+
+        :param stream: The stream to stop. If ``None``, the server is requested to stop all periodic transmissions and all the streams are stopped
+        :type stream: :class:`PeriodicDataStream<udsoncan.client.PeriodicDataStream>`
+
+        :return: The server response parsed by :meth:`ReadDataByPeriodicIdentifier.interpret_response<udsoncan.services.ReadDataByPeriodicIdentifier.interpret_response>`
+        :rtype: :ref:`Response<Response>`
+        """
+        return self._call_service(self._stop_periodic_stream_steps, stream)
+
+    def _receive_periodic_data(self, timeout: Optional[float]) -> bool:
+        # Reads a frame from the connection for the periodic streams. Returns False if no frame was received in time
+        try:
+            payload = self.conn.wait_frame(timeout=timeout, exception=True)
+        except TimeoutException:
+            return False
+        if payload is None:
+            return False
+        if not self._dispatch_periodic_data(payload):
+            self.logger.warning('Ignoring unexpected message received while waiting for periodic data')
+        return True
+
     def write_data_by_identifier(self, did: int, value: Any) -> Optional[services.WriteDataByIdentifier.InterpretedResponse]:
         """
         Requests to write a value associated with a data identifier (DID) through the :ref:`WriteDataByIdentifier<WriteDataByIdentifier>` service.
@@ -532,22 +2374,8 @@ class Client:
         :rtype: :ref:`Response<Response>`
 
         """
-        req = services.WriteDataByIdentifier.make_request(did, value, didconfig=self.config['data_identifiers'])
-        self.logger.info("%s - Writing data identifier 0x%04x (%s)" %
-                         (self.service_log_prefix(services.WriteDataByIdentifier), did, DataIdentifier.name_from_id(did)))
-
-        response = self.send_request(req)
-        if response is None:
-            return None
-        response = services.WriteDataByIdentifier.interpret_response(response)
-
-        if response.service_data.did_echo != did:
-            raise UnexpectedResponseException(
-                response, "Server returned a response for data identifier 0x%04x while client requested for did 0x%04x" % (response.service_data.did_echo, did))
-
-        return response
+        return self._call_service(self._write_data_by_identifier_steps, did, value)
 
-    @standard_error_management
     def ecu_reset(self, reset_type: int) -> Optional[services.ECUReset.InterpretedResponse]:
         """
         Requests the server to execute a reset sequence through the :ref:`ECUReset<ECUReset>` service.
@@ -561,26 +2389,8 @@ class Client:
         :rtype: :ref:`Response<Response>`
 
         """
-        req = services.ECUReset.make_request(reset_type)
-        self.logger.info("%s - Requesting reset of type 0x%02x (%s)" %
-                         (self.service_log_prefix(services.ECUReset), reset_type, services.ECUReset.ResetType.get_name(reset_type)))
-
-        response = self.send_request(req)
-        if response is None:
-            return None
-        response = services.ECUReset.interpret_response(response)
-
-        if response.service_data.reset_type_echo != reset_type:
-            raise UnexpectedResponseException(response, "Response subfunction received from server (0x%02x) does not match the requested subfunction (0x%02x)" % (
-                response.service_data.reset_type_echo, reset_type))
+        return self._call_service(self._ecu_reset_steps, reset_type)
 
-        if response.service_data.reset_type_echo == services.ECUReset.ResetType.enableRapidPowerShutDown and response.service_data.powerdown_time != 0xFF:
-            assert response.service_data.powerdown_time is not None
-            self.logger.info('Server will shutdown in %d seconds.' % (response.service_data.powerdown_time))
-
-        return response
-
-    @standard_error_management
     def clear_dtc(self, group: int = 0xFFFFFF, memory_selection: Optional[int] = None) -> Optional[services.ClearDiagnosticInformation.InterpretedResponse]:
         """
         Requests the server to clear its active Diagnostic Trouble Codes with the :ref:`ClearDiagnosticInformation<ClearDiagnosticInformation>` service.
@@ -601,26 +2411,7 @@ class Client:
         :rtype: :ref:`Response<Response>`
 
         """
-
-        request = services.ClearDiagnosticInformation.make_request(
-            group, memory_selection=memory_selection, standard_version=self.config['standard_version'])
-        memys_str = ''
-        if memory_selection is not None:
-            memys_str = ' , MemorySelection : %d' % memory_selection
-        if group == 0xFFFFFF:
-            self.logger.info('%s - Clearing all DTCs (group mask : 0xFFFFFF%s)' %
-                             (self.service_log_prefix(services.ClearDiagnosticInformation), memys_str))
-        else:
-            self.logger.info('%s - Clearing DTCs matching group mask : 0x%06x%s' %
-                             (self.service_log_prefix(services.ClearDiagnosticInformation), group, memys_str))
-
-        response = self.send_request(request)
-        if response is None:
-            return None
-
-        response = services.ClearDiagnosticInformation.interpret_response(response)
-
-        return response
+        return self._call_service(self._clear_dtc_steps, group, memory_selection)
 
     # Performs a RoutineControl Service request
     def start_routine(self, routine_id: int, data: Optional[bytes] = None) -> Optional[services.RoutineControl.InterpretedResponse]:
@@ -679,7 +2470,6 @@ class Client:
         return self.routine_control(routine_id, services.RoutineControl.ControlType.requestRoutineResults, data)
 
     # Performs a RoutineControl Service request
-    @standard_error_management
     def routine_control(self, routine_id: int, control_type: int, data: Optional[bytes] = None) -> Optional[services.RoutineControl.InterpretedResponse]:
         """
         Sends a generic request for the :ref:`RoutineControl<RoutineControl>` service with custom subfunction (control_type).
@@ -698,35 +2488,7 @@ class Client:
         :return: The server response parsed by :meth:`RoutineControl.interpret_response<udsoncan.services.RoutineControl.interpret_response>`
         :rtype: :ref:`Response<Response>`
         """
-        request = services.RoutineControl.make_request(routine_id, control_type, data=data)
-        payload_length = 0 if data is None else len(data)
-        action = "ISOSAEReserved action for routine ID"
-        if control_type == services.RoutineControl.ControlType.startRoutine:
-            action = "Starting routine ID"
-        elif control_type == services.RoutineControl.ControlType.stopRoutine:
-            action = "Stoping routine ID"
-        elif control_type == services.RoutineControl.ControlType.requestRoutineResults:
-            action = "Requesting result for routine ID"
-
-        self.logger.info("%s - ControlType=0x%02x - %s 0x%04x (%s) with a payload of %d bytes" %
-                         (self.service_log_prefix(services.RoutineControl), control_type, action, routine_id, Routine.name_from_id(routine_id), payload_length))
-        if data is not None:
-            self.logger.debug("\tPayload data : %s" % binascii.hexlify(data).decode('ascii'))
-
-        response = self.send_request(request)
-        if response is None:
-            return None
-        response = services.RoutineControl.interpret_response(response)
-
-        if control_type != response.service_data.control_type_echo:
-            raise UnexpectedResponseException(response, "Control type of response (0x%02x) does not match request control type (0x%02x)" % (
-                response.service_data.control_type_echo, control_type))
-
-        if routine_id != response.service_data.routine_id_echo:
-            raise UnexpectedResponseException(response, "Response received from server (ID = 0x%04x) does not match the requested routine ID (0x%04x)" % (
-                response.service_data.routine_id_echo, routine_id))
-
-        return response
+        return self._call_service(self._routine_control_steps, routine_id, control_type, data)
 
     def read_extended_timing_parameters(self) -> Optional[services.AccessTimingParameter.InterpretedResponse]:
         """
@@ -779,7 +2541,6 @@ class Client:
         """
         return self.access_timing_parameter(access_type=services.AccessTimingParameter.AccessType.setTimingParametersToGivenValues, timing_param_record=params)
 
-    @standard_error_management
     def access_timing_parameter(self,
                                 access_type: int,
                                 timing_param_record: Optional[bytes] = None
@@ -799,87 +2560,33 @@ class Client:
         :rtype: :ref:`Response<Response>`
 
         """
+        return self._call_service(self._access_timing_parameter_steps, access_type, timing_param_record)
 
-        request = services.AccessTimingParameter.make_request(access_type, timing_param_record)
-        payload_length = 0 if timing_param_record is None else len(timing_param_record)
-
-        self.logger.info('%s - AccessType=0x%02x (%s) - Sending request with record payload of %d bytes' % (self.service_log_prefix(
-            services.AccessTimingParameter), access_type, services.AccessTimingParameter.AccessType.get_name(access_type), payload_length))
-        if timing_param_record is not None:
-            self.logger.debug("Payload data : %s" % binascii.hexlify(timing_param_record).decode('ascii'))
-
-        response = self.send_request(request)
-        if response is None:
-            return None
-
-        response = services.AccessTimingParameter.interpret_response(response)
-
-        if access_type != response.service_data.access_type_echo:
-            raise UnexpectedResponseException(response, "Access type of response (0x%02x) does not match request access type (0x%02x)" % (
-                response.service_data.access_type_echo, access_type))
-
-        allowed_response_record_access_type = [
-            services.AccessTimingParameter.AccessType.readExtendedTimingParameterSet,
-            services.AccessTimingParameter.AccessType.readCurrentlyActiveTimingParameters
-        ]
-
-        if len(response.service_data.timing_param_record) > 0 and access_type not in allowed_response_record_access_type:
-            self.logger.warning("Server returned data in the AccessTimingParameter response although none was asked")
-
-        return response
-
-    @standard_error_management
     def communication_control(self,
                               control_type: int,
                               communication_type: Union[int, bytes, CommunicationType],
-                              node_id: Optional[int] = None,
-                              ) -> Optional[services.CommunicationControl.InterpretedResponse]:
-        """
-        Switches the transmission or reception of certain messages on/off with :ref:`CommunicationControl<CommunicationControl>` service.
-
-        :Effective configuration: ``exception_on_<type>_response``
-
-        :param control_type: The action to request such as enabling or disabling some messages. See :class:`CommunicationControl.ControlType<udsoncan.services.CommunicationControl.ControlType>`. This value can also be ECU manufacturer-specific
-        :type control_type: int
-
-        :param communication_type: Indicates what section of the network and the type of message that should be affected by the command. Refer to :ref:`CommunicationType<CommunicationType>` for more details. If an `integer` or a `bytes` is given, the value will be decoded to create the required :ref:`CommunicationType<CommunicationType>` object
-        :type communication_type: :ref:`CommunicationType<CommunicationType>`, bytes, int
-
-        :param node_id: DTC memory identifier (nodeIdentificationNumber). This value is user defined and introduced in 2013 version of ISO-14229-1. 
-            Possible only when control type is ``enableRxAndDisableTxWithEnhancedAddressInformation`` or ``enableRxAndTxWithEnhancedAddressInformation``
-            Only added to the request payload when different from None. Default : None
-        :type node_id: int
-
-        :return: The server response parsed by :meth:`CommunicationControl.interpret_response<udsoncan.services.CommunicationControl.interpret_response>`
-        :rtype: :ref:`Response<Response>`
-        """
-
-        communication_type = services.CommunicationControl.normalize_communication_type(communication_type)
-
-        request = services.CommunicationControl.make_request(
-            control_type, communication_type, node_id, standard_version=self.config['standard_version'])
-
-        self.logger.info('%s - ControlType=0x%02x (%s) - Sending request with a CommunicationType byte of 0x%02x (%s). nodeIdentificationNumber=%s ' % (
-            self.service_log_prefix(services.CommunicationControl),
-            control_type,
-            services.CommunicationControl.ControlType.get_name(control_type),
-            communication_type.get_byte_as_int(),
-            str(communication_type),
-            str(node_id)
-        )
-        )
+                              node_id: Optional[int] = None,
+                              ) -> Optional[services.CommunicationControl.InterpretedResponse]:
+        """
+        Switches the transmission or reception of certain messages on/off with :ref:`CommunicationControl<CommunicationControl>` service.
 
-        response = self.send_request(request)
-        if response is None:
-            return None
+        :Effective configuration: ``exception_on_<type>_response``
 
-        response = services.CommunicationControl.interpret_response(response)
+        :param control_type: The action to request such as enabling or disabling some messages. See :class:`CommunicationControl.ControlType<udsoncan.services.CommunicationControl.ControlType>`. This value can also be ECU manufacturer-specific
+        :type control_type: int
 
-        if control_type != response.service_data.control_type_echo:
-            raise UnexpectedResponseException(response, "Control type of response (0x%02x) does not match request control type (0x%02x)" % (
-                response.service_data.control_type_echo, control_type))
+        :param communication_type: Indicates what section of the network and the type of message that should be affected by the command. Refer to :ref:`CommunicationType<CommunicationType>` for more details. If an `integer` or a `bytes` is given, the value will be decoded to create the required :ref:`CommunicationType<CommunicationType>` object
+        :type communication_type: :ref:`CommunicationType<CommunicationType>`, bytes, int
 
-        return response
+        :param node_id: DTC memory identifier (nodeIdentificationNumber). This value is user defined and introduced in 2013 version of ISO-14229-1. 
+            Possible only when control type is ``enableRxAndDisableTxWithEnhancedAddressInformation`` or ``enableRxAndTxWithEnhancedAddressInformation``
+            Only added to the request payload when different from None. Default : None
+        :type node_id: int
+
+        :return: The server response parsed by :meth:`CommunicationControl.interpret_response<udsoncan.services.CommunicationControl.interpret_response>`
+        :rtype: :ref:`Response<Response>`
+        """
+        return self._call_service(self._communication_control_steps, control_type, communication_type, node_id)
 
     def request_download(self,
                          memory_location: MemoryLocation,
@@ -926,44 +2633,9 @@ class Client:
         return cast(Optional[services.RequestUpload.InterpretedResponse], response)
 
     # Common code for both RequestDownload and RequestUpload services
-    @standard_error_management
     def request_upload_download(self, service_cls, memory_location, dfi=None):
-        dfi = service_cls.normalize_data_format_identifier(dfi)
-
-        if service_cls not in [services.RequestDownload, services.RequestUpload]:
-            raise ValueError('Service must either be RequestDownload or RequestUpload')
-
-        if not isinstance(memory_location, MemoryLocation):
-            raise ValueError('memory_location must be an instance of MemoryLocation')
-
-        # If user does not specify a byte format, we apply the one in client configuration.
-        if 'server_address_format' in self.config:
-            memory_location.set_format_if_none(address_format=self.config['server_address_format'])
-
-        if 'server_memorysize_format' in self.config:
-            memory_location.set_format_if_none(memorysize_format=self.config['server_memorysize_format'])
-
-        request = service_cls.make_request(memory_location=memory_location, dfi=dfi)
-
-        action = ""
-        if service_cls == services.RequestDownload:
-            action = "Requesting a download (client to server)"
-        elif service_cls == services.RequestUpload:
-            action = "Requesting an upload (server to client)"
-        else:
-            raise ValueError("Bad service")
+        return self._call_service(self._request_upload_download_steps, service_cls, memory_location, dfi)
 
-        self.logger.info('%s - %s for memory location [%s] and DataFormatIdentifier 0x%02x (%s)' %
-                         (self.service_log_prefix(service_cls), action, str(memory_location), dfi.get_byte_as_int(), str(dfi)))
-
-        response = self.send_request(request)
-        if response is None:
-            return None
-        service_cls.interpret_response(response)
-
-        return response
-
-    @standard_error_management
     def transfer_data(self,
                       sequence_number: int,
                       data: Optional[bytes] = None
@@ -983,26 +2655,8 @@ class Client:
         :return: The server response parsed by :meth:`TransferData.interpret_response<udsoncan.services.TransferData.interpret_response>`
         :rtype: :ref:`Response<Response>`
         """
-        request = services.TransferData.make_request(sequence_number, data)
-
-        data_len = 0 if data is None else len(data)
-        self.logger.info('%s - Sending a block of data with SequenceNumber=%d that is %d bytes long .' %
-                         (self.service_log_prefix(services.TransferData), sequence_number, data_len))
-        if data is not None:
-            self.logger.debug('Data to transfer : %s' % binascii.hexlify(data).decode('ascii'))
+        return self._call_service(self._transfer_data_steps, sequence_number, data)
 
-        response = self.send_request(request)
-        if response is None:
-            return None
-        response = services.TransferData.interpret_response(response)
-
-        if sequence_number != response.service_data.sequence_number_echo:
-            raise UnexpectedResponseException(response, "Block sequence number of response (0x%02x) does not match request block sequence number (0x%02x)" % (
-                response.service_data.sequence_number_echo, sequence_number))
-
-        return response
-
-    @standard_error_management
     def request_transfer_exit(self, data: Optional[bytes] = None) -> Optional[services.RequestTransferExit.InterpretedResponse]:
         """
         Informs the server that the client wants to stop the data transfer by sending a :ref:`RequestTransferExit<RequestTransferExit>` service request.
@@ -1015,17 +2669,90 @@ class Client:
         :return: The server response parsed by :meth:`RequestTransferExit.interpret_response<udsoncan.services.RequestTransferExit.interpret_response>`
         :rtype: :ref:`Response<Response>`
         """
-        request = services.RequestTransferExit.make_request(data)
-        self.logger.info('%s - Sending exit request' % (self.service_log_prefix(services.RequestTransferExit)))
+        return self._call_service(self._request_transfer_exit_steps, data)
 
-        response = self.send_request(request)
-        if response is None:
-            return None
-        response = services.RequestTransferExit.interpret_response(response)
+    def download(self,
+                 memory_location: MemoryLocation,
+                 data_source: TransferDataSource,
+                 dfi: Optional[DataFormatIdentifier] = None,
+                 block_size: Optional[int] = None,
+                 progress_callback: Optional[TransferProgressCallbackType] = None,
+                 transfer_exit_data: Optional[bytes] = None
+                 ) -> Optional[services.RequestTransferExit.InterpretedResponse]:
+        """
+        Downloads a complete block of data from the client to the server. A :ref:`RequestDownload<RequestDownload>` service request is sent first, 
+        then the data is split in as many :ref:`TransferData<TransferData>` requests as needed and the transfer is ended 
+        with a :ref:`RequestTransferExit<RequestTransferExit>` request.
 
-        return response
+        The block size is taken from the ``max_length`` given by the server, minus the service ID and the block sequence counter. 
+        The block sequence counter starts at 1 and wraps from 0xFF to 0x00. 
+        Blocks are sliced from the data source without intermediate copies and are not logged individually.
+
+        :Effective configuration: ``exception_on_<type>_response`` ``server_address_format`` ``server_memorysize_format``
+
+        :param memory_location: The address and size of the memory block to be written.
+        :type memory_location: :ref:`MemoryLocation <MemoryLocation>`
+
+        :param data_source: The data to download. Can be a bytes-like object (``bytes``, ``bytearray``, ``memoryview``), the path of a file, 
+            a binary file object or an iterable of bytes-like chunks of any size
+        :type data_source: bytes, str, file or iterable
+
+        :param dfi: Optional :ref:`DataFormatIdentifier <DataFormatIdentifier>` defining the compression and encryption scheme of the data. 
+                If not specified, the default value of 00 will be used, specifying no encryption and no compression
+        :type dfi: :ref:`DataFormatIdentifier <DataFormatIdentifier>`
+
+        :param block_size: Optional maximum number of data bytes per TransferData request. The smallest value between this one and the server limit is used
+        :type block_size: int
+
+        :param progress_callback: Optional callable called with a :ref:`TransferProgress <TransferProgress>` after each block
+        :type progress_callback: callable
+
+        :param transfer_exit_data: Optional additional data to send to the server with the RequestTransferExit request
+        :type transfer_exit_data: bytes
+
+        :return: The server response to the RequestTransferExit request, parsed by :meth:`RequestTransferExit.interpret_response<udsoncan.services.RequestTransferExit.interpret_response>`
+        :rtype: :ref:`Response<Response>`
+        """
+        return self._call_service(self._download_steps, memory_location, data_source, dfi, block_size, progress_callback, transfer_exit_data)
+
+    def upload(self,
+               memory_location: MemoryLocation,
+               destination: TransferDataDestination,
+               dfi: Optional[DataFormatIdentifier] = None,
+               progress_callback: Optional[TransferProgressCallbackType] = None,
+               transfer_exit_data: Optional[bytes] = None
+               ) -> Optional[services.RequestTransferExit.InterpretedResponse]:
+        """
+        Uploads a complete block of data from the server to the client. A :ref:`RequestUpload<RequestUpload>` service request is sent first, 
+        then :ref:`TransferData<TransferData>` requests are sent until ``memory_location.memorysize`` bytes are received and the transfer is ended 
+        with a :ref:`RequestTransferExit<RequestTransferExit>` request.
+
+        The block sequence counter starts at 1 and wraps from 0xFF to 0x00.
+
+        :Effective configuration: ``exception_on_<type>_response`` ``server_address_format`` ``server_memorysize_format``
+
+        :param memory_location: The address and size of the memory block to be read.
+        :type memory_location: :ref:`MemoryLocation <MemoryLocation>`
+
+        :param destination: Where to write the received data. Can be a ``bytearray`` that will be extended, the path of a file or a binary file object.
+            A file created from a path is deleted if the transfer of the data fails
+        :type destination: bytearray, str or file
+
+        :param dfi: Optional :ref:`DataFormatIdentifier <DataFormatIdentifier>` defining the compression and encryption scheme of the data. 
+                If not specified, the default value of 00 will be used, specifying no encryption and no compression
+        :type dfi: :ref:`DataFormatIdentifier <DataFormatIdentifier>`
+
+        :param progress_callback: Optional callable called with a :ref:`TransferProgress <TransferProgress>` after each block
+        :type progress_callback: callable
+
+        :param transfer_exit_data: Optional additional data to send to the server with the RequestTransferExit request
+        :type transfer_exit_data: bytes
+
+        :return: The server response to the RequestTransferExit request, parsed by :meth:`RequestTransferExit.interpret_response<udsoncan.services.RequestTransferExit.interpret_response>`
+        :rtype: :ref:`Response<Response>`
+        """
+        return self._call_service(self._upload_steps, memory_location, destination, dfi, progress_callback, transfer_exit_data)
 
-    @standard_error_management
     def link_control(self, control_type: int, baudrate: Optional[Baudrate] = None) -> Optional[services.LinkControl.InterpretedResponse]:
         """
         Controls the communication baudrate by sending a :ref:`LinkControl<LinkControl>` service request.
@@ -1041,30 +2768,8 @@ class Client:
         :return: The server response parsed by :meth:`LinkControl.interpret_response<udsoncan.services.LinkControl.interpret_response>`
         :rtype: :ref:`Response<Response>`
         """
-        request = services.LinkControl.make_request(control_type, baudrate)
-        baudrate_str = 'No baudrate specified' if baudrate is None else 'Baudrate : ' + str(baudrate)
-
-        action = "Performing LinkControl request"
-        if control_type in [services.LinkControl.ControlType.verifyBaudrateTransitionWithFixedBaudrate, services.LinkControl.ControlType.verifyBaudrateTransitionWithSpecificBaudrate]:
-            action = "Verifiying support"
-        elif control_type == services.LinkControl.ControlType.transitionBaudrate:
-            action = "Switching"
-
-        self.logger.info('%s - ControlType=0x%02x (%s) - %s for baudrate %s ' % (self.service_log_prefix(services.LinkControl),
-                         control_type, services.LinkControl.ControlType.get_name(control_type), action, baudrate_str))
-
-        response = self.send_request(request)
-        if response is None:
-            return None
-        response = services.LinkControl.interpret_response(response)
-
-        if control_type != response.service_data.control_type_echo:
-            raise UnexpectedResponseException(response, "Control type of response (0x%02x) does not match request control type (0x%02x)" % (
-                response.service_data.control_type_echo, control_type))
-
-        return response
+        return self._call_service(self._link_control_steps, control_type, baudrate)
 
-    @standard_error_management
     def io_control(self,
                    did: int,
                    control_param: Optional[int] = None,
@@ -1103,45 +2808,8 @@ class Client:
         :return: The server response parsed by :meth:`InputOutputControlByIdentifier.interpret_response<udsoncan.services.InputOutputControlByIdentifier.interpret_response>`
         :rtype: :ref:`Response<Response>`
         """
-        if 'input_output' not in self.config:
-            raise ConfigError('input_output', msg='input_output must be defined in client configuration in order to use InputOutputControlByIdentifier service')
-
-        request = services.InputOutputControlByIdentifier.make_request(
-            did,
-            control_param=control_param,
-            values=values,
-            masks=masks,
-            ioconfig=self.config['input_output']
-        )
-
-        control_param_str = 'no control parameter' if control_param is None else 'control parameter 0x%02x (%s)' % (
-            control_param, services.InputOutputControlByIdentifier.ControlParam.get_name(control_param))
-        self.logger.info('%s - Sending request for DID=0x%04x, %s.' %
-                         (self.service_log_prefix(services.InputOutputControlByIdentifier), did, control_param_str))
-
-        response = self.send_request(request)
-        if response is None:
-            return None
-        response = services.InputOutputControlByIdentifier.interpret_response(
-            response,
-            control_param=control_param,
-            tolerate_zero_padding=self.config['tolerate_zero_padding'],
-            ioconfig=self.config['input_output']
-        )
+        return self._call_service(self._io_control_steps, did, control_param, values, masks)
 
-        if response.service_data.did_echo != did:
-            raise UnexpectedResponseException(
-                response, "Echo of the DID number (0x%04x) does not match the value in the request (0x%04x)" % (response.service_data.did_echo, did))
-
-        if control_param != response.service_data.control_param_echo:
-            control_param_str = '0x%02x' % control_param if control_param is not None else '<None>'
-            received_control_param_str = '0x%02x' % response.service_data.control_param_echo if response.service_data.control_param_echo is not None else '<None>'
-            raise UnexpectedResponseException(response, 'Echo of the InputOutputControlParameter (%s) does not match the value in the request (%s)' % (
-                received_control_param_str, control_param_str))
-
-        return response
-
-    @standard_error_management
     def control_dtc_setting(self, setting_type: int, data: Optional[bytes] = None) -> Optional[services.ControlDTCSetting.InterpretedResponse]:
         """
         Controls some settings related to the Diagnostic Trouble Codes by sending a :ref:`ControlDTCSetting<ControlDTCSetting>` service request. 
@@ -1158,32 +2826,8 @@ class Client:
         :return: The server response parsed by :meth:`ControlDTCSetting.interpret_response<udsoncan.services.ControlDTCSetting.interpret_response>`
         :rtype: :ref:`Response<Response>`
         """
-        request = services.ControlDTCSetting.make_request(setting_type, data)
-        data_len = 0 if data is None else len(data)
-        action = "Performing ControlDTCSetting request"
-        if setting_type == services.ControlDTCSetting.SettingType.on:
-            action = "Turning DTC On"
-        elif setting_type == services.ControlDTCSetting.SettingType.off:
-            action = "Turning DTC Off"
-
-        self.logger.info('%s - SettingType=0x%02x (%s) - %s with a payload of %d bytes' % (self.service_log_prefix(services.ControlDTCSetting),
-                         setting_type, services.ControlDTCSetting.SettingType.get_name(setting_type), action, data_len))
-        if data is not None:
-            self.logger.debug("Payload of data : %s" % binascii.hexlify(data).decode('ascii'))
-
-        response = self.send_request(request)
-        if response is None:
-            return None
-
-        response = services.ControlDTCSetting.interpret_response(response)
-
-        if response.service_data.setting_type_echo != setting_type:
-            raise UnexpectedResponseException(response, "Setting type of response (0x%02x) does not match request control type (0x%02x)" % (
-                response.service_data.setting_type_echo, setting_type))
-
-        return response
+        return self._call_service(self._control_dtc_setting_steps, setting_type, data)
 
-    @standard_error_management
     def read_memory_by_address(self, memory_location: MemoryLocation) -> Optional[services.ReadMemoryByAddress.InterpretedResponse]:
         """
         Reads a block of memory from the server by sending a :ref:`ReadMemoryByAddress<ReadMemoryByAddress>` service request. 
@@ -1193,96 +2837,27 @@ class Client:
         :param memory_location: The address and the size of the memory block to read.
         :type memory_location: :ref:`MemoryLocation <MemoryLocation>`
 
-        :return: The server response parsed by :meth:`ReadMemoryByAddress.interpret_response<udsoncan.services.ReadMemoryByAddress.interpret_response>`
-        :rtype: :ref:`Response<Response>`
-        """
-        if not isinstance(memory_location, MemoryLocation):
-            raise ValueError('memory_location must be an instance of MemoryLocation')
-
-        if 'server_address_format' in self.config:
-            memory_location.set_format_if_none(address_format=self.config['server_address_format'])
-
-        if 'server_memorysize_format' in self.config:
-            memory_location.set_format_if_none(memorysize_format=self.config['server_memorysize_format'])
-
-        request = services.ReadMemoryByAddress.make_request(memory_location)
-        self.logger.info('%s - Reading memory address at %s' % (self.service_log_prefix(services.ReadMemoryByAddress), str(memory_location)))
-
-        response = self.send_request(request)
-        if response is None:
-            return None
-        response = services.ReadMemoryByAddress.interpret_response(response)
-        memdata = response.service_data.memory_block
-
-        if len(memdata) < memory_location.memorysize:
-            raise UnexpectedResponseException(response, 'Data block given by the server is too short. Client requested for %d bytes but only received %s bytes' % (
-                memory_location.memorysize, str(len(response.data)) if response.data is not None else '<None>'))
-
-        if len(memdata) > memory_location.memorysize:
-            extra_bytes = len(memdata) - memory_location.memorysize
-            if memdata[memory_location.memorysize:] == b'\x00' * extra_bytes and self.config['tolerate_zero_padding']:
-                response.service_data.memory_block = memdata[0:memory_location.memorysize]  # trim exceeding zeros
-            else:
-                raise UnexpectedResponseException(response, 'Data block given by the server is too long. Client requested for %d bytes but received %s bytes' % (
-                    memory_location.memorysize, str(len(response.data)) if response.data is not None else '<None>'))
-
-        return response
-
-    @standard_error_management
-    def write_memory_by_address(self, memory_location: MemoryLocation, data: bytes) -> Optional[services.WriteMemoryByAddress.InterpretedResponse]:
-        """
-        Writes a block of memory in the server by sending a :ref:`WriteMemoryByAddress<WriteMemoryByAddress>` service request. 
-
-        :Effective configuration: ``exception_on_<type>_response`` ``server_address_format`` ``server_memorysize_format``
-
-        :param memory_location: The address and the size of the memory block to read. 
-        :type memory_location: :ref:`MemoryLocation <MemoryLocation>`
-
-        :param data: The data to write into memory.
-        :type data: bytes
-
-        :return: The server response parsed by :meth:`WriteMemoryByAddress.interpret_response<udsoncan.services.WriteMemoryByAddress.interpret_response>`
-        :rtype: :ref:`Response<Response>`
-        """
-
-        if not isinstance(memory_location, MemoryLocation):
-            raise ValueError('memory_location must be an instance of MemoryLocation')
-
-        if 'server_address_format' in self.config:
-            memory_location.set_format_if_none(address_format=self.config['server_address_format'])
-
-        if 'server_memorysize_format' in self.config:
-            memory_location.set_format_if_none(memorysize_format=self.config['server_memorysize_format'])
-
-        request = services.WriteMemoryByAddress.make_request(memory_location, data)
-        self.logger.info('%s - Writing %d bytes to memory address at %s' %
-                         (self.service_log_prefix(services.WriteMemoryByAddress), len(data), str(memory_location)))
-
-        if len(data) != memory_location.memorysize:
-            self.logger.warning('%s: Given data block length (%d bytes) does not match MemoryLocation size (%d bytes)' %
-                                (self.service_log_prefix(services.WriteMemoryByAddress), len(data), memory_location.memorysize))
-
-        response = self.send_request(request)
-        if response is None:
-            return None
-        response = services.WriteMemoryByAddress.interpret_response(response, memory_location)
+        :return: The server response parsed by :meth:`ReadMemoryByAddress.interpret_response<udsoncan.services.ReadMemoryByAddress.interpret_response>`
+        :rtype: :ref:`Response<Response>`
+        """
+        return self._call_service(self._read_memory_by_address_steps, memory_location)
 
-        alfid_byte = memory_location.alfid.get_byte_as_int()   # AddressAndLengthFormatIdentifier
+    def write_memory_by_address(self, memory_location: MemoryLocation, data: bytes) -> Optional[services.WriteMemoryByAddress.InterpretedResponse]:
+        """
+        Writes a block of memory in the server by sending a :ref:`WriteMemoryByAddress<WriteMemoryByAddress>` service request. 
 
-        # We make sure that the echo from the server matches the request we sent.
-        if response.service_data.alfid_echo != alfid_byte:
-            raise UnexpectedResponseException(response, 'AddressAndLengthFormatIdentifier echoed back by the server (0x%02X) does not match the one requested by the client (0x%02X)' % (
-                response.service_data.alfid_echo, int(alfid_byte)))
+        :Effective configuration: ``exception_on_<type>_response`` ``server_address_format`` ``server_memorysize_format``
 
-        if response.service_data.memory_location_echo.address != memory_location.address:
-            raise UnexpectedResponseException(response, 'Address echoed back by the server (0x%X) does not match the one requested by the client (0x%X)' % (
-                response.service_data.memory_location_echo.address, memory_location.address))
+        :param memory_location: The address and the size of the memory block to read. 
+        :type memory_location: :ref:`MemoryLocation <MemoryLocation>`
 
-        if response.service_data.memory_location_echo.memorysize != memory_location.memorysize:
-            raise UnexpectedResponseException(response, 'Memory size echoed back by the server (0x%X) does not match the one requested by the client (0x%X)' % (
-                response.service_data.memory_location_echo.memorysize, memory_location.memorysize))
+        :param data: The data to write into memory.
+        :type data: bytes
 
-        return response
+        :return: The server response parsed by :meth:`WriteMemoryByAddress.interpret_response<udsoncan.services.WriteMemoryByAddress.interpret_response>`
+        :rtype: :ref:`Response<Response>`
+        """
+        return self._call_service(self._write_memory_by_address_steps, memory_location, data)
 
 # ====  ReadDTCInformation
     def get_dtc_by_status_mask(self, status_mask: int) -> Optional[services.ReadDTCInformation.InterpretedResponse]:
@@ -1292,7 +2867,7 @@ class Client:
         Reads all the Diagnostic Trouble Codes that have a status matching the given mask. 
         The server will check all of its DTCs and if (Dtc.status & status_mask) != 0, then the DTCs match the filter and are sent back to the client.
 
-        :Effective configuration: ``exception_on_<type>_response`` ``tolerate_zero_padding`` ``ignore_all_zero_dtc``
+        :Effective configuration: ``exception_on_<type>_response`` ``tolerate_zero_padding`` ``ignore_all_zero_dtc`` ``use_dtc_table``
 
         :param status_mask: The status mask against which the DTCs are tested. 
         :type status_mask: int or :ref:`Dtc.Status<DTC_Status>`
@@ -1312,7 +2887,7 @@ class Client:
 
         Introduced in 2020 version of ISO-14229
 
-        :Effective configuration: ``exception_on_<type>_response`` ``tolerate_zero_padding`` ``ignore_all_zero_dtc`` ``standard_version``
+        :Effective configuration: ``exception_on_<type>_response`` ``tolerate_zero_padding`` ``ignore_all_zero_dtc`` ``use_dtc_table`` ``standard_version``
 
         :param status_mask: The status mask against which the DTCs are tested. 
         :type status_mask: int or :ref:`Dtc.Status<DTC_Status>`
@@ -1332,7 +2907,7 @@ class Client:
         Reads the emission-related Diagnostic Trouble Codes that have a status matching the given mask.
         The server will check its emission-related DTCs and if (Dtc.status & status_mask) != 0, then the DTCs match the filter and are sent back to the client.
 
-        :Effective configuration: ``exception_on_<type>_response`` ``tolerate_zero_padding`` ``ignore_all_zero_dtc``
+        :Effective configuration: ``exception_on_<type>_response`` ``tolerate_zero_padding`` ``ignore_all_zero_dtc`` ``use_dtc_table``
 
         :param status_mask: The status mask against which the DTCs are tested. 
         :type status_mask: int or :ref:`Dtc.Status<DTC_Status>`
@@ -1349,7 +2924,7 @@ class Client:
         Reads all the Diagnostic Trouble Codes stored in mirror memory that have a status matching the given mask. 
         The server will check all of its DTCs and if (Dtc.status & status_mask) != 0, then the DTCs match the filter and are sent back to the client.
 
-        :Effective configuration: ``exception_on_<type>_response`` ``tolerate_zero_padding`` ``ignore_all_zero_dtc``
+        :Effective configuration: ``exception_on_<type>_response`` ``tolerate_zero_padding`` ``ignore_all_zero_dtc`` ``use_dtc_table``
 
         :param status_mask: The status mask against which the DTCs are tested. 
         :type status_mask: int or :ref:`Dtc.Status<DTC_Status>`
@@ -1366,7 +2941,7 @@ class Client:
         Reads all the Diagnostic Trouble Codes that have a status and a severity matching the given masks. 
         The server will check all of its DTCs and if ( (Dtc.status & status_mask) != 0 && (Dtc.severity & severity) !=0), then the DTCs match the filter and are sent back to the client.
 
-        :Effective configuration: ``exception_on_<type>_response`` ``tolerate_zero_padding`` ``ignore_all_zero_dtc``
+        :Effective configuration: ``exception_on_<type>_response`` ``tolerate_zero_padding`` ``ignore_all_zero_dtc`` ``use_dtc_table``
 
         :param status_mask: The status mask against which the DTCs are tested. 
         :type status_mask: int or :ref:`Dtc.Status<DTC_Status>`
@@ -1411,7 +2986,7 @@ class Client:
         """
 
         return self.read_dtc_information(services.ReadDTCInformation.Subfunction.reportWWHOBDDTCByMaskRecord, status_mask=status_mask, severity_mask=severity_mask, dtc_class=dtc_class, functional_group_id=functional_group_id)
-    
+
     def get_wwh_obd_dtc_with_permanent_status(self, functional_group_id: int) -> Optional[services.ReadDTCInformation.InterpretedResponse]:
         """
         Performs a ``ReadDTCInformation`` service request with subfunction ``reportWWHOBDDTCWithPermanentStatus,``
@@ -1519,7 +3094,7 @@ class Client:
 
         Requests the list of supported DTCs by the server.
 
-        :Effective configuration: ``exception_on_<type>_response`` ``tolerate_zero_padding`` ``ignore_all_zero_dtc``
+        :Effective configuration: ``exception_on_<type>_response`` ``tolerate_zero_padding`` ``ignore_all_zero_dtc`` ``use_dtc_table``
 
         :return: The server response parsed by :meth:`ReadDTCInformation.interpret_response<udsoncan.services.ReadDTCInformation.interpret_response>`
         :rtype: :ref:`Response<Response>`
@@ -1532,7 +3107,7 @@ class Client:
 
         Reads a single DTC. Requests the server for the first DTC that set its ``Dtc.Status.test_failed`` bit.
 
-        :Effective configuration: ``exception_on_<type>_response`` ``tolerate_zero_padding`` ``ignore_all_zero_dtc``
+        :Effective configuration: ``exception_on_<type>_response`` ``tolerate_zero_padding`` ``ignore_all_zero_dtc`` ``use_dtc_table``
 
         :return: The server response parsed by :meth:`ReadDTCInformation.interpret_response<udsoncan.services.ReadDTCInformation.interpret_response>`
         :rtype: :ref:`Response<Response>`
@@ -1545,7 +3120,7 @@ class Client:
 
         Reads a single DTC. Requests the server for the first DTC that set its ``Dtc.Status.confirmed`` bit.
 
-        :Effective configuration: ``exception_on_<type>_response`` ``tolerate_zero_padding`` ``ignore_all_zero_dtc``
+        :Effective configuration: ``exception_on_<type>_response`` ``tolerate_zero_padding`` ``ignore_all_zero_dtc`` ``use_dtc_table``
 
         :return: The server response parsed by :meth:`ReadDTCInformation.interpret_response<udsoncan.services.ReadDTCInformation.interpret_response>`
         :rtype: :ref:`Response<Response>`
@@ -1558,7 +3133,7 @@ class Client:
 
         Reads a single DTC. Requests the server for the last DTC that set its ``Dtc.Status.test_failed`` bit.
 
-        :Effective configuration: ``exception_on_<type>_response`` ``tolerate_zero_padding`` ``ignore_all_zero_dtc``
+        :Effective configuration: ``exception_on_<type>_response`` ``tolerate_zero_padding`` ``ignore_all_zero_dtc`` ``use_dtc_table``
 
         :return: The server response parsed by :meth:`ReadDTCInformation.interpret_response<udsoncan.services.ReadDTCInformation.interpret_response>`
         :rtype: :ref:`Response<Response>`
@@ -1571,7 +3146,7 @@ class Client:
 
         Reads a single DTC. Requests the server for the last DTC that set its ``Dtc.Status.confirmed`` bit.
 
-        :Effective configuration: ``exception_on_<type>_response`` ``tolerate_zero_padding`` ``ignore_all_zero_dtc``
+        :Effective configuration: ``exception_on_<type>_response`` ``tolerate_zero_padding`` ``ignore_all_zero_dtc`` ``use_dtc_table``
 
         :return: The server response parsed by :meth:`ReadDTCInformation.interpret_response<udsoncan.services.ReadDTCInformation.interpret_response>`
         :rtype: :ref:`Response<Response>`
@@ -1586,7 +3161,7 @@ class Client:
 
         A permanent DTC is a DTC stored in Non-Volatile memory and that cannot be erased by test equipment or by power-cycling the ECU.
 
-        :Effective configuration: ``exception_on_<type>_response`` ``tolerate_zero_padding`` ``ignore_all_zero_dtc``
+        :Effective configuration: ``exception_on_<type>_response`` ``tolerate_zero_padding`` ``ignore_all_zero_dtc`` ``use_dtc_table``
 
         :return: The server response parsed by :meth:`ReadDTCInformation.interpret_response<udsoncan.services.ReadDTCInformation.interpret_response>`
         :rtype: :ref:`Response<Response>`
@@ -1790,10 +3365,6 @@ class Client:
         """
         return self.read_dtc_information(services.ReadDTCInformation.Subfunction.reportMirrorMemoryDTCExtendedDataRecordByDTCNumber, dtc=dtc, extended_data_record_number=record_number, extended_data_size=data_size)
 
-    # Performs a ReadDiagnsticInformation service request.
-    # Many requests are encoded the same way and many responses are encoded the same way. Request grouping and response grouping are independent.
-
-    @standard_error_management
     def read_dtc_information(self,
                              subfunction: int,
                              status_mask: Optional[Union[Dtc.Status, int]] = None,
@@ -1806,119 +3377,7 @@ class Client:
                              functional_group_id: Optional[int] = None,
                              dtc_class: Optional[Union[int, Dtc.DtcClass]] = None
                              ):
-        if dtc is not None and isinstance(dtc, Dtc):
-            dtc = dtc.id
-
-        request = services.ReadDTCInformation.make_request(subfunction=subfunction,
-                                                           status_mask=status_mask,
-                                                           severity_mask=severity_mask,
-                                                           dtc=dtc,
-                                                           snapshot_record_number=snapshot_record_number,
-                                                           extended_data_record_number=extended_data_record_number,
-                                                           memory_selection=memory_selection,
-                                                           standard_version=self.config['standard_version'],
-                                                           functional_group_id=functional_group_id,
-                                                           dtc_class=dtc_class)
-
-        self.logger.info('%s - Sending request with subfunction "%s" (0x%02X).' % (self.service_log_prefix(services.ReadDTCInformation),
-                         services.ReadDTCInformation.Subfunction.get_name(subfunction), subfunction))
-        response = self.send_request(request)
-        if response is None:
-            return None
-
-        extended_data_size2: Optional[Union[int, Dict[int, int]]] = None
-        if extended_data_size is None:
-            if 'extended_data_size' in self.config:
-                extended_data_size2 = self.config['extended_data_size']
-        else:
-            extended_data_size2 = extended_data_size
-
-        # So, if subfunction is a mismatch, chances are that the response won't be decoded properly because we use the
-        # request subfunction to select the decoding algorithm, not the received one.
-        # We want to report the subfunction mismatch as a primary cause.
-        error = None
-        try:
-            response = services.ReadDTCInformation.interpret_response(response, subfunction=subfunction,
-                                                                      tolerate_zero_padding=self.config['tolerate_zero_padding'],
-                                                                      ignore_all_zero_dtc=self.config['ignore_all_zero_dtc'],
-                                                                      dtc_snapshot_did_size=self.config['dtc_snapshot_did_size'],
-                                                                      didconfig=self.config['data_identifiers'] if 'data_identifiers' in self.config else None,
-                                                                      extended_data_size=extended_data_size2,
-                                                                      standard_version=self.config['standard_version'])
-        except Exception as e:
-            error = e
-
-        # If nothing can be checked, raise the error right away
-        if isinstance(error, InvalidResponseException):
-            if response.service_data is None:
-                raise error
-            response = cast(services.ReadDTCInformation.InterpretedResponse, response)
-            if cast(services.ReadDTCInformation.InterpretedResponse, response).service_data.subfunction_echo is None:
-                raise error
-
-        response = cast(services.ReadDTCInformation.InterpretedResponse, response)
-        # We can report a subfunction mismatch before decoding error.
-        if response.service_data.subfunction_echo != subfunction:
-            received_subfn_echo = 'None' if response.service_data.subfunction_echo is None else '%02x' % response.service_data.subfunction_echo
-            raise UnexpectedResponseException(
-                response, 'Echo of ReadDTCInformation subfunction gotten from server (%s) does not match the value in the request subfunction (0x%02x)' % (received_subfn_echo, subfunction))
-
-        # Nothing else to check, report the real error.
-        if error:
-            raise error
-
-        if subfunction in [services.ReadDTCInformation.Subfunction.reportDTCSnapshotRecordByDTCNumber, services.ReadDTCInformation.Subfunction.reportUserDefMemoryDTCSnapshotRecordByDTCNumber]:
-            if len(response.service_data.dtcs) == 1:
-                assert dtc is not None
-                if dtc != response.service_data.dtcs[0].id:
-                    raise UnexpectedResponseException(
-                        response, 'Server returned snapshot with DTC ID 0x%06x while client requested for 0x%06x' % (response.service_data.dtcs[0].id, dtc))
-
-        if subfunction in [services.ReadDTCInformation.Subfunction.reportDTCSnapshotRecordByRecordNumber, services.ReadDTCInformation.Subfunction.reportDTCSnapshotRecordByDTCNumber, services.ReadDTCInformation.Subfunction.reportUserDefMemoryDTCSnapshotRecordByDTCNumber]:
-            assert snapshot_record_number is not None
-            if len(response.service_data.dtcs) == 1 and snapshot_record_number != 0xFF:
-                for snapshot in response.service_data.dtcs[0].snapshots:
-                    gotten_record_number = snapshot if isinstance(snapshot, int) else snapshot.record_number
-                    if gotten_record_number != snapshot_record_number:
-                        raise UnexpectedResponseException(response, 'Server returned snapshot with record number %s while client requested for 0x%02x' % (
-                            '0x%02x' % gotten_record_number if gotten_record_number is not None else '<None>', snapshot_record_number))
-
-        if subfunction in [services.ReadDTCInformation.Subfunction.reportDTCExtendedDataRecordByDTCNumber, services.ReadDTCInformation.Subfunction.reportMirrorMemoryDTCExtendedDataRecordByDTCNumber, services.ReadDTCInformation.Subfunction.reportUserDefMemoryDTCExtDataRecordByDTCNumber]:
-            # Standard specifies that values between 0xF0 and 0xFF are for reporting groups (more than one record)
-            assert extended_data_record_number is not None
-            if len(response.service_data.dtcs) == 1 and extended_data_record_number < 0xF0:
-                for extended_data in response.service_data.dtcs[0].extended_data:
-                    assert extended_data.record_number is not None
-                    if extended_data.record_number != extended_data_record_number:
-                        raise UnexpectedResponseException(response, 'Extended data record number given by the server (0x%02x) does not match the record number requested by the client (0x%02x)' % (
-                            extended_data.record_number, extended_data_record_number))
-
-        if subfunction in [services.ReadDTCInformation.Subfunction.reportUserDefMemoryDTCByStatusMask, services.ReadDTCInformation.Subfunction.reportUserDefMemoryDTCSnapshotRecordByDTCNumber, services.ReadDTCInformation.Subfunction.reportUserDefMemoryDTCExtDataRecordByDTCNumber]:
-            if memory_selection is not None and memory_selection != response.service_data.memory_selection_echo:
-                received_ms_echo = 'None' if response.service_data.memory_selection_echo is None else '%02x' % response.service_data.memory_selection_echo
-                raise UnexpectedResponseException(
-                    response, 'Echo of ReadDTCInformation MemorySelection gotten from server (%s) does not match the value in the request (0x%02x)' % (received_ms_echo, memory_selection))
-
-        if subfunction == services.ReadDTCInformation.Subfunction.reportDTCExtDataRecordByRecordNumber:
-            if extended_data_record_number is not None:
-                for dtc_obj in response.service_data.dtcs:
-                    for extended_data in dtc_obj.extended_data:
-                        if extended_data.record_number != extended_data_record_number:
-                            raise UnexpectedResponseException(response, 'Extended data record number given by the server for DTC 0x%06X has a value of %d but requested record number was %d', (
-                                dtc_obj.id, extended_data.record_number, extended_data_record_number))
-
-        if subfunction in [services.ReadDTCInformation.Subfunction.reportWWHOBDDTCWithPermanentStatus, services.ReadDTCInformation.Subfunction.reportWWHOBDDTCByMaskRecord]:
-            assert response.service_data.functional_group_id is not None
-            assert functional_group_id is not None
-            if functional_group_id != response.service_data.functional_group_id:
-                raise UnexpectedResponseException(response, "FunctionalGroupIdentifier in the server response does not match the value in the request. Requested 0x%02x, got 0x%02x" % (functional_group_id, response.service_data.functional_group_id))
-
-        if Dtc.Format.get_name(response.service_data.dtc_format) is None:
-            self.logger.warning('Unknown DTC Format Identifier %s. Value should be between 0 and 4' %
-                                ('0x%02x' % response.service_data.dtc_format if response.service_data.dtc_format is not None else '<None>')
-                                )
-
-        return response
+        return self._call_service(self._read_dtc_information_steps, subfunction, status_mask, severity_mask, dtc, snapshot_record_number, extended_data_record_number, extended_data_size, memory_selection, functional_group_id, dtc_class)
 
     def add_file(self,
                  filename: str,
@@ -2053,7 +3512,6 @@ class Client:
         """
         return self.request_file_transfer(moop=services.RequestFileTransfer.ModeOfOperation.ReadDir, path=path)
 
-    @standard_error_management
     def request_file_transfer(self,
                               moop: int,
                               path: str,
@@ -2061,42 +3519,8 @@ class Client:
                               filesize: Optional[Union[int, Filesize]] = None
                               ) -> Optional[services.RequestFileTransfer.InterpretedResponse]:
 
-        request = services.RequestFileTransfer.make_request(moop=moop, path=path, dfi=dfi, filesize=filesize)
-        self.logger.info('%s - Sending a "%s"(0x%02x) request on "%s". ' % (self.service_log_prefix(services.RequestFileTransfer),
-                         services.RequestFileTransfer.ModeOfOperation.get_name(moop), moop, path))
-        self.logger.debug("%s - DataFormatIdentifier = %s. Filesize = %s" % (self.service_log_prefix(services.RequestFileTransfer), dfi, filesize))
-
-        response = self.send_request(request)
-        if response is None:
-            return None
-
-        try:
-            response = services.RequestFileTransfer.interpret_response(response, tolerate_zero_padding=self.config['tolerate_zero_padding'])
-        except InvalidResponseException as e:
-            if e.response.service_data is not None:
-                service_data = cast(services.RequestFileTransfer.ResponseData, e.response.service_data)
-                if service_data.moop_echo is not None and service_data.moop_echo != moop:
-                    raise UnexpectedResponseException(e.response, 'ModeOfOperation echo does not match request and caused the service to failed decoding the payload correctly. Received 0x%02x, Requested=0x%02x' % (
-                        service_data.moop_echo, moop))
-                else:
-                    raise e
-            else:
-                raise e
-
-        if response.service_data.moop_echo != moop:
-            raise UnexpectedResponseException(
-                response, 'ModeOfOperation echo does not match request. Received 0x%02x, Requested=0x%02x' % (response.service_data.moop_echo, moop))
-
-        if response.service_data.dfi is not None and dfi is not None:
-            received = response.service_data.dfi.get_byte_as_int()
-            expected = dfi.get_byte_as_int()
-            if received != expected:
-                raise UnexpectedResponseException(
-                    response, 'DataFormatIdentifier echo does not match request. Received 0x%02x, Requested=0x%02x' % (received, expected))
-
-        return response
+        return self._call_service(self._request_file_transfer_steps, moop, path, dfi, filesize)
 
-    @standard_error_management
     def dynamically_define_did(self,
                                did: int,
                                did_definition: Union[DynamicDidDefinition, MemoryLocation]
@@ -2109,79 +3533,17 @@ class Client:
         :param did: The data identifier to define.
         :type did: int
 
-        :param did_definition: The definition of the DID. Can be defined by source DID or memory address. 
-            If a :ref:`MemoryLocation<MemoryLocation>` object is given, definition will automatically be by memory address
-        :type did_definition: :ref:`DynamicDidDefinition<DynamicDidDefinition>` or :ref:`MemoryLocation<MemoryLocation>`
-
-        :return: The server response parsed by :meth:`DynamicallyDefineDataIdentifier.interpret_response<udsoncan.services.DynamicallyDefineDataIdentifier.interpret_response>`
-        :rtype: :ref:`Response<Response>`
-        """
-
-        self.logger.info('%s - Dynamically defining DID %s.' % (self.service_log_prefix(services.DynamicallyDefineDataIdentifier), did))
-
-        if isinstance(did_definition, MemoryLocation):
-            did_definition = DynamicDidDefinition(did_definition)
-
-        if did_definition.is_by_source_did():
-            subfunction = services.DynamicallyDefineDataIdentifier.Subfunction.defineByIdentifier
-        elif did_definition.is_by_memory_address():
-            subfunction = services.DynamicallyDefineDataIdentifier.Subfunction.defineByMemoryAddress
-            entries = cast(List[DynamicDidDefinition.ByMemloc], did_definition.get())
-            if 'server_address_format' in self.config:
-                for entry in entries:
-                    entry.memloc.set_format_if_none(address_format=self.config['server_address_format'])
-
-            if 'server_memorysize_format' in self.config:
-                for entry in entries:
-                    entry.memloc.set_format_if_none(memorysize_format=self.config['server_memorysize_format'])
-        else:
-            raise ValueError('Cannot determine the subfunction from DID Definition')
-
-        request = services.DynamicallyDefineDataIdentifier.make_request(subfunction, did, did_definition)
-
-        response = self.send_request(request)
-        if response is None:
-            return None
-
-        response = services.DynamicallyDefineDataIdentifier.interpret_response(response)
-
-        if subfunction != response.service_data.subfunction_echo:
-            raise UnexpectedResponseException(response, "Subfunction echo of response (0x%02x) does not match request subfunction (0x%02x)" % (
-                response.service_data.subfunction_echo, subfunction))
-
-        if response.service_data.did_echo is not None:
-            if did != response.service_data.did_echo:
-                raise UnexpectedResponseException(response, "DID echo of response (0x%02x) does not match requested DID (0x%02x)" %
-                                                  (response.service_data.did_echo, did))
-
-        return response
-
-    @standard_error_management
-    def do_clear_dynamically_defined_did(self, did: Optional[int] = None) -> Optional[services.DynamicallyDefineDataIdentifier.InterpretedResponse]:
-        subfunction = services.DynamicallyDefineDataIdentifier.Subfunction.clearDynamicallyDefinedDataIdentifier
-
-        didstr = 'all DIDs' if did is None else 'DID %s' % did
-        self.logger.info('%s - Sending a "%s"(0x%02x) for %s. ' % (self.service_log_prefix(services.DynamicallyDefineDataIdentifier),
-                         services.DynamicallyDefineDataIdentifier.Subfunction.get_name(subfunction), subfunction, didstr))
-
-        request = services.DynamicallyDefineDataIdentifier.make_request(subfunction, did=did)
-        response = self.send_request(request)
-        if response is None:
-            return None
-        response = services.DynamicallyDefineDataIdentifier.interpret_response(response)
-
-        if subfunction != response.service_data.subfunction_echo:
-            raise UnexpectedResponseException(response, "Subfunction echo of response (0x%02x) does not match request subfunction (0x%02x)" % (
-                response.service_data.subfunction_echo, subfunction))
-
-        if did is not None:
-            if did != response.service_data.did_echo:
-                raise UnexpectedResponseException(
-                    response, "DID echo of response (%s) does not match requested DID (0x%02x)" % (
-                        '0x%02x' % response.service_data.did_echo if response.service_data.did_echo is not None else '<None>',
-                        did))
-
-        return response
+        :param did_definition: The definition of the DID. Can be defined by source DID or memory address. 
+            If a :ref:`MemoryLocation<MemoryLocation>` object is given, definition will automatically be by memory address
+        :type did_definition: :ref:`DynamicDidDefinition<DynamicDidDefinition>` or :ref:`MemoryLocation<MemoryLocation>`
+
+        :return: The server response parsed by :meth:`DynamicallyDefineDataIdentifier.interpret_response<udsoncan.services.DynamicallyDefineDataIdentifier.interpret_response>`
+        :rtype: :ref:`Response<Response>`
+        """
+        return self._call_service(self._dynamically_define_did_steps, did, did_definition)
+
+    def do_clear_dynamically_defined_did(self, did: Optional[int] = None) -> Optional[services.DynamicallyDefineDataIdentifier.InterpretedResponse]:
+        return self._call_service(self._do_clear_dynamically_defined_did_steps, did)
 
     def clear_dynamically_defined_did(self, did: int) -> Optional[services.DynamicallyDefineDataIdentifier.InterpretedResponse]:
         """
@@ -2211,144 +3573,52 @@ class Client:
         """
         return self.do_clear_dynamically_defined_did()
 
-    # Basic transmission of requests. This will need to be improved
-
     def send_request(self, request: Request, timeout: int = -1) -> Optional[Response]:
-        if request.service is None:
-            raise ValueError("Request has no service")
-
-        if timeout < 0:
-            # Timeout not provided by user: defaults to Client request_timeout value
-            overall_timeout = self.config['request_timeout']
-            p2 = self.config['p2_timeout'] if self.session_timing.p2_server_max is None else self.session_timing.p2_server_max
-            if overall_timeout is not None:
-                single_request_timeout = min(overall_timeout, p2)
-            else:
-                single_request_timeout = p2
-        else:
-            overall_timeout = timeout
-            single_request_timeout = timeout
-        respect_overall_timeout = True
-        if overall_timeout is None:
-            respect_overall_timeout = False
-        using_p2_star = False  # Will switch to true when Nrc 0x78 will be received the first time.
-
-        self.conn.empty_rxqueue()
-        self.logger.debug("Sending request to server")
-        override_suppress_positive_response = False
-        if self.suppress_positive_response.enabled == True and request.service.use_subfunction():
-            payload = request.get_payload(suppress_positive_response=True)
-            override_suppress_positive_response = True
-        else:
-            payload = request.get_payload()
-
-        if self.payload_override.enabled:
-            payload = self.payload_override.get_overrided_payload(payload)
-
-        if self.suppress_positive_response.enabled and not request.service.use_subfunction():
-            self.logger.warning('SuppressPositiveResponse cannot be used for service %s. Ignoring' % (request.service.get_name()))
-
-        self.conn.send(payload)
-
-        spr_used = request.suppress_positive_response or override_suppress_positive_response
-        wait_nrc = self.suppress_positive_response.enabled and self.suppress_positive_response.wait_nrc
-
-        if spr_used and not wait_nrc:
-            return None
-
-        done_receiving = False
-        if respect_overall_timeout:
-            overall_timeout_time = time.monotonic() + overall_timeout
-
-        timed_out = False
-        while not done_receiving and not timed_out:
-            done_receiving = True
-            self.logger.debug("Waiting for server response")
-
-            if not respect_overall_timeout or (respect_overall_timeout and time.monotonic() + single_request_timeout < overall_timeout_time):
-                timeout_type_used = 'single_request'
-                timeout_value = single_request_timeout
-            else:
-                timeout_type_used = 'overall'
-                timeout_value = max(overall_timeout_time - time.monotonic(), 0)
-
-            try:
-                recv_payload = self.conn.wait_frame(timeout=timeout_value, exception=True)
-            except TimeoutException:
-                timed_out = True
-            except Exception as e:
-                raise e
+        return cast(Optional[Response], self._run_request_steps(self._send_request_steps(request, timeout)))
 
-            if timed_out or recv_payload is None:
-                if spr_used:
-                    return None
-                if timeout_type_used == 'single_request':
-                    timeout_name_to_report = 'P2* timeout' if using_p2_star else 'P2 timeout'
-                    timeout_value_to_report = single_request_timeout
-                elif timeout_type_used == 'overall':
-                    timeout_name_to_report = 'Global request timeout'
-                    timeout_value_to_report = overall_timeout
-                else:  # Shouldn't go here.
-                    timeout_name_to_report = 'Timeout'
-                    timeout_value_to_report = timeout_value
+    def try_request(self, request: Union[Request, PreparedRequest], timeout: float = -1) -> Outcome:
+        """
+        Sends a request and returns its :class:`Outcome<udsoncan.client.Outcome>`. No exception is raised and nothing is logged when the server gives a negative response, 
+        an invalid or unexpected response or no response at all. Meant for the workloads where most requests fail, such as probing the data identifiers supported by a server.
 
-                raise TimeoutException('Did not receive response in time. %s time has expired (timeout=%.3f sec)' %
-                                       (timeout_name_to_report, float(timeout_value_to_report)))
+        When a :class:`PreparedRequest<udsoncan.client.PreparedRequest>` is given, a positive response is interpreted like the prepared client method does
+        and ``outcome.response`` is the interpreted response. A response rejected by this interpretation gives an ``invalid`` or ``unexpected`` outcome.
 
-            response = Response.from_payload(recv_payload)
-            self.last_response = response
-            self.logger.debug("Received response from server")
+        Usage errors and connection errors are still raised.
 
-            if not response.valid:
-                raise InvalidResponseException(response)
+        :param request: The request to send
+        :type request: :ref:`Request<Request>` or :class:`PreparedRequest<udsoncan.client.PreparedRequest>`
 
-            assert response.service is not None
-            assert response.code is not None
+        :param timeout: Maximum time to wait for the response. When not given, the timeouts of the client configuration are used
+        :type timeout: float
 
-            if response.service.response_id() != request.service.response_id():
-                msg = "Response gotten from server has a service ID different than the request service ID. Received=0x%02x, Expected=0x%02x" % (
-                    response.service.response_id(), request.service.response_id())
-                raise UnexpectedResponseException(response, msg)
+        :return: The outcome of the request
+        :rtype: :class:`Outcome<udsoncan.client.Outcome>`
+        """
+        if isinstance(request, PreparedRequest):
+            outcome = cast(Outcome, self._run_request_steps(self._send_request_steps(request.request, timeout, request.payload, outcome=True)))
+            return self._interpret_prepared_outcome(request, outcome)
+        return cast(Outcome, self._run_request_steps(self._send_request_steps(request, timeout, outcome=True)))
 
-            if not response.positive:
+    def _run_request_steps(self, steps: RequestStepsGenerator[T]) -> T:
+        # Executes the operations yielded by _send_request_steps on the connection
+        try:
+            operation, arg = next(steps)
+            while True:
                 try:
-                    if not Response.Code.is_supported_by_standard(response.code, self.config['standard_version']):
-                        self.logger.warning('Given response code "%s" (0x%02x) is not supported byt the UDS standard version that the clients s enforcing (%s)' % (
-                            response.code_name,
-                            response.code,
-                            self.config['standard_version']))
-                except ValueError:
-                    self.logger.warning('Unkown response code "%s" (0x%02x)', response.code_name, response.code)
-
-                if not request.service.is_supported_negative_response(response.code):
-                    self.logger.warning('Given response code "%s" (0x%02x) is not a supported negative response code according to UDS standard.' % (
-                        response.code_name, response.code))
-
-                if response.code == Response.Code.RequestCorrectlyReceived_ResponsePending:
-                    if self.config['nrc78_callback'] is not None:
-                        self.config['nrc78_callback']()
-                    
-                    done_receiving = False
-                    if not using_p2_star:
-                        # Received a 0x78 NRC: timeout is now set to P2*
-                        p2_star = self.config['p2_star_timeout'] if self.session_timing.p2_star_server_max is None else self.session_timing.p2_star_server_max
-                        single_request_timeout = p2_star
-                        using_p2_star = True
-                        self.logger.debug("Server requested to wait with response code %s (0x%02x), single request timeout is now set to P2* (%.3f seconds)" %
-                                          (response.code_name, response.code, single_request_timeout))
+                    result = None
+                    if operation == self._IO_SEND:
+                        self.conn.send(arg)
+                    elif operation == self._IO_WAIT_FRAME:
+                        result = self.conn.wait_frame(timeout=arg, exception=True)
+                    else:
+                        self.conn.empty_rxqueue()
+                except Exception as e:
+                    operation, arg = steps.throw(e)
                 else:
-                    raise NegativeResponseException(response)
-
-        assert response.service is not None
-        self.logger.info('Received positive response for service %s (0x%02x) from server.' %
-                         (response.service.get_name(), response.service.request_id()))
-
-        response.original_request = request
-
-        if spr_used:
-            return None
-
-        return response
+                    operation, arg = steps.send(result)
+        except StopIteration as stop:
+            return stop.value
 
     # ====  Authentication Service Client Functions
     def deauthenticate(self) -> Optional[services.Authentication.InterpretedResponse]:
@@ -2590,7 +3860,6 @@ class Client:
             authentication_task=services.Authentication.AuthenticationTask.authenticationConfiguration
         )
 
-    @standard_error_management
     def authentication(self,
                        authentication_task: int,
                        communication_configuration: Optional[int] = None,
@@ -2648,28 +3917,640 @@ class Client:
         :return: The server response parsed by :meth:`Authentication.interpret_response<udsoncan.services.Authentication.interpret_response>`
         :rtype: :ref:`Response<Response>`
         """
+        return self._call_service(self._authentication_steps, authentication_task, communication_configuration, certificate_client, challenge_client, algorithm_indicator, certificate_evaluation_id, certificate_data, proof_of_ownership_client, ephemeral_public_key_client, additional_parameter)
 
-        request = services.Authentication.make_request(authentication_task,
-                                                       communication_configuration,
-                                                       certificate_client,
-                                                       challenge_client,
-                                                       algorithm_indicator,
-                                                       certificate_evaluation_id,
-                                                       certificate_data,
-                                                       proof_of_ownership_client,
-                                                       ephemeral_public_key_client,
-                                                       additional_parameter)
 
-        self.logger.info(f'{self.service_log_prefix(services.Authentication)} - Sending request with authentication'
-                         f' task "{services.Authentication.AuthenticationTask.get_name(authentication_task)}"'
-                         f' ({authentication_task:#02x}')
-        response = self.send_request(request)
-        if response is None:
-            return None
+class AsyncClient(BaseClient):
+    """
+    __init__(self, conn, config=default_client_config, request_timeout = None)
 
-        response = services.Authentication.interpret_response(response)
-        if authentication_task != response.service_data.authentication_task_echo:
-            raise UnexpectedResponseException(response, f'Authentication Task echo of response'
-                                              f' ({response.service_data.authentication_task_echo:#02x}) does not match'
-                                                        f' request Authentication Task ({authentication_task:#02x})')
-        return response
+    Asyncio version of the :class:`Client<udsoncan.client.Client>`. It exposes the same methods, but each method that talks to the server
+    is a coroutine instead of blocking the calling thread. Requests are encoded and responses are interpreted exactly like the :class:`Client<udsoncan.client.Client>` does,
+    including the P2/P2* timeout handling.
+
+    Many clients can be awaited concurrently within the same event loop. Requests made with the same client are sent one at a time, 
+    and a method that sends many requests (security access, download, upload, bulk reads) completes before another coroutine can use the client.
+
+    :param conn: The underlying protocol interface.
+    :type conn: :class:`AsyncBaseConnection<udsoncan.connections.AsyncBaseConnection>`
+
+    :param config: The :ref:`client configuration<client_config>`
+    :type config: dict
+
+    :param request_timeout: Maximum amount of time to wait for a response. This parameter exists for backward compatibility only. For detailed timeout handling, see :ref:`Client configuration<config_timeouts>`
+    :type request_timeout: int
+    """
+
+    conn: AsyncBaseConnection
+    _request_lock: Optional[asyncio.Lock]
+
+    def __init__(self, conn: AsyncBaseConnection, config: ClientConfig = default_client_config, request_timeout: Optional[float] = None):
+        BaseClient.__init__(self, conn, config=config, request_timeout=request_timeout)
+        self._request_lock = None
+
+    def __enter__(self):
+        raise TypeError('%s must be used with "async with"' % self.__class__.__name__)
+
+    async def __aenter__(self) -> "AsyncClient":
+        await self.open()
+        return self
+
+    async def __aexit__(self, type, value, traceback) -> None:
+        await self.close()
+
+    async def open(self) -> None:
+        if not self.conn.is_open():
+            await self.conn.open()
+
+    async def close(self) -> None:
+        await self.conn.close()
+
+    async def _call_service(self, steps: Callable[..., ServiceCallGenerator[T]], *args: Any, **kwargs: Any) -> Any:
+        # The lock is held for the whole service call, so that the requests of a multi-request service (seed and key, transfer loops, bulk reads)
+        # are not interleaved with the requests of another coroutine
+        async with self._get_request_lock():
+            try:
+                service_call = steps(*args, **kwargs)
+                try:
+                    request = self._start_service_call(service_call)
+                    while True:
+                        try:
+                            response = cast(Optional[Response], await self._run_request_steps_async(self._send_request_steps(request)))
+                        except Exception as e:
+                            request = service_call.throw(e)
+                        else:
+                            request = self._resume_service_call(service_call, request, response)
+                except StopIteration as stop:
+                    return stop.value
+            except Exception as e:
+                return self._manage_service_exception(e)
+
+    async def _call_prepared(self, prepared: PreparedRequest, timeout: float) -> Any:
+        try:
+            async with self._get_request_lock():
+                response = cast(Optional[Response], await self._run_request_steps_async(self._send_request_steps(prepared.request, timeout, prepared.payload)))
+            return self._interpret_prepared_response(prepared, response)
+        except Exception as e:
+            return self._manage_service_exception(e)
+
+    def _get_request_lock(self) -> asyncio.Lock:
+        # Serializes the use of the connection. Created lazily to be bound to the running loop
+        if self._request_lock is None:
+            self._request_lock = asyncio.Lock()
+        return self._request_lock
+
+    async def _receive_periodic_data_async(self, timeout: Optional[float]) -> bool:
+        async with self._get_request_lock():
+            try:
+                payload = await self.conn.wait_frame(timeout=timeout, exception=True)
+            except TimeoutException:
+                return False
+        if payload is None:
+            return False
+        if not self._dispatch_periodic_data(payload):
+            self.logger.warning('Ignoring unexpected message received while waiting for periodic data')
+        return True
+
+    async def send_request(self, request: Request, timeout: int = -1) -> Optional[Response]:
+        async with self._get_request_lock():
+            return cast(Optional[Response], await self._run_request_steps_async(self._send_request_steps(request, timeout)))
+
+    async def try_request(self, request: Union[Request, PreparedRequest], timeout: float = -1) -> Outcome:
+        async with self._get_request_lock():
+            if isinstance(request, PreparedRequest):
+                outcome = cast(Outcome, await self._run_request_steps_async(self._send_request_steps(request.request, timeout, request.payload, outcome=True)))
+                return self._interpret_prepared_outcome(request, outcome)
+            return cast(Outcome, await self._run_request_steps_async(self._send_request_steps(request, timeout, outcome=True)))
+
+    async def _run_request_steps_async(self, steps: RequestStepsGenerator[T]) -> T:
+        # Executes the operations yielded by _send_request_steps on the connection. The caller holds the request lock
+        try:
+            operation, arg = next(steps)
+            while True:
+                try:
+                    result = None
+                    if operation == self._IO_SEND:
+                        await self.conn.send(arg)
+                    elif operation == self._IO_WAIT_FRAME:
+                        result = await self.conn.wait_frame(timeout=arg, exception=True)
+                    else:
+                        self.conn.empty_rxqueue()
+                except Exception as e:
+                    operation, arg = steps.throw(e)
+                else:
+                    operation, arg = steps.send(result)
+        except StopIteration as stop:
+            return stop.value
+
+    async def change_session(self, newsession: int) -> Optional[services.DiagnosticSessionControl.InterpretedResponse]:
+        """Awaitable version of :meth:`Client.change_session<udsoncan.client.Client.change_session>`"""
+        return await self._call_service(self._change_session_steps, newsession)
+
+    async def request_seed(self, level: int, data=bytes()) -> Optional[services.SecurityAccess.InterpretedResponse]:
+        """Awaitable version of :meth:`Client.request_seed<udsoncan.client.Client.request_seed>`"""
+        return await self._call_service(self._request_seed_steps, level, data)
+
+    # Performs a SecurityAccess service request. Send key
+    async def send_key(self, level: int, key: bytes) -> Optional[services.SecurityAccess.InterpretedResponse]:
+        """Awaitable version of :meth:`Client.send_key<udsoncan.client.Client.send_key>`"""
+        return await self._call_service(self._send_key_steps, level, key)
+
+    async def unlock_security_access(self, level, seed_params=bytes()) -> Optional[services.SecurityAccess.InterpretedResponse]:
+        """Awaitable version of :meth:`Client.unlock_security_access<udsoncan.client.Client.unlock_security_access>`"""
+        return await self._call_service(self._unlock_security_access_steps, level, seed_params)
+
+    async def tester_present(self) -> Optional[services.TesterPresent.InterpretedResponse]:
+        """Awaitable version of :meth:`Client.tester_present<udsoncan.client.Client.tester_present>`"""
+        return await self._call_service(self._tester_present_steps)
+
+    async def read_data_by_identifier_first(self, didlist: Union[int, List[int]]) -> Optional[Any]:
+        """Awaitable version of :meth:`Client.read_data_by_identifier_first<udsoncan.client.Client.read_data_by_identifier_first>`"""
+        return await self._call_service(self._read_data_by_identifier_first_steps, didlist)
+
+    async def test_data_identifier(self, didlist: Union[int, List[int]]) -> Optional[Response]:
+        """Awaitable version of :meth:`Client.test_data_identifier<udsoncan.client.Client.test_data_identifier>`"""
+        return await self._call_service(self._test_data_identifier_steps, didlist)
+
+    async def read_data_by_identifier(self, didlist: Union[int, List[int]]) -> Optional[services.ReadDataByIdentifier.InterpretedResponse]:
+        """Awaitable version of :meth:`Client.read_data_by_identifier<udsoncan.client.Client.read_data_by_identifier>`"""
+        return await self._call_service(self._read_data_by_identifier_steps, didlist)
+
+    async def read_data_by_identifier_bulk(self,
+                                           didlist: Union[int, List[int]],
+                                           max_response_size: Optional[int] = None,
+                                           max_did_per_request: Optional[int] = None) -> Optional[Dict[int, Any]]:
+        """Awaitable version of :meth:`Client.read_data_by_identifier_bulk<udsoncan.client.Client.read_data_by_identifier_bulk>`"""
+        return await self._call_service(self._read_data_by_identifier_bulk_steps, didlist, max_response_size, max_did_per_request)
+
+    async def read_data_by_periodic_identifier(self, transmission_mode: int, didlist: Union[int, List[int]]) -> Optional[services.ReadDataByPeriodicIdentifier.InterpretedResponse]:
+        """Awaitable version of :meth:`Client.read_data_by_periodic_identifier<udsoncan.client.Client.read_data_by_periodic_identifier>`"""
+        return await self._call_service(self._read_data_by_periodic_identifier_steps, transmission_mode, didlist)
+
+    async def start_periodic_stream(self,
+                                    didlist: Union[int, List[int]],
+                                    transmission_mode: int = services.ReadDataByPeriodicIdentifier.TransmissionMode.sendAtFastRate,
+                                    callback: Optional[Callable[[PeriodicSample], None]] = None,
+                                    maxsize: int = 1000) -> PeriodicDataStream:
+        """Awaitable version of :meth:`Client.start_periodic_stream<udsoncan.client.Client.start_periodic_stream>`"""
+        return await self._call_service(self._start_periodic_stream_steps, didlist, transmission_mode, callback, maxsize)
+
+    async def stop_periodic_stream(self, stream: Optional[PeriodicDataStream] = None) -> Optional[services.ReadDataByPeriodicIdentifier.InterpretedResponse]:
+        """Awaitable version of :meth:`Client.stop_periodic_stream<udsoncan.client.Client.stop_periodic_stream>`"""
+        return await self._call_service(self._stop_periodic_stream_steps, stream)
+
+    async def write_data_by_identifier(self, did: int, value: Any) -> Optional[services.WriteDataByIdentifier.InterpretedResponse]:
+        """Awaitable version of :meth:`Client.write_data_by_identifier<udsoncan.client.Client.write_data_by_identifier>`"""
+        return await self._call_service(self._write_data_by_identifier_steps, did, value)
+
+    async def ecu_reset(self, reset_type: int) -> Optional[services.ECUReset.InterpretedResponse]:
+        """Awaitable version of :meth:`Client.ecu_reset<udsoncan.client.Client.ecu_reset>`"""
+        return await self._call_service(self._ecu_reset_steps, reset_type)
+
+    async def clear_dtc(self, group: int = 0xFFFFFF, memory_selection: Optional[int] = None) -> Optional[services.ClearDiagnosticInformation.InterpretedResponse]:
+        """Awaitable version of :meth:`Client.clear_dtc<udsoncan.client.Client.clear_dtc>`"""
+        return await self._call_service(self._clear_dtc_steps, group, memory_selection)
+
+    # Performs a RoutineControl Service request
+    async def start_routine(self, routine_id: int, data: Optional[bytes] = None) -> Optional[services.RoutineControl.InterpretedResponse]:
+        """Awaitable version of :meth:`Client.start_routine<udsoncan.client.Client.start_routine>`"""
+        return await self.routine_control(routine_id, services.RoutineControl.ControlType.startRoutine, data)
+
+    # Performs a RoutineControl Service request
+    async def stop_routine(self, routine_id: int, data: Optional[bytes] = None) -> Optional[services.RoutineControl.InterpretedResponse]:
+        """Awaitable version of :meth:`Client.stop_routine<udsoncan.client.Client.stop_routine>`"""
+        return await self.routine_control(routine_id, services.RoutineControl.ControlType.stopRoutine, data)
+
+    # Performs a RoutineControl Service request
+    async def get_routine_result(self, routine_id: int, data: Optional[bytes] = None) -> Optional[services.RoutineControl.InterpretedResponse]:
+        """Awaitable version of :meth:`Client.get_routine_result<udsoncan.client.Client.get_routine_result>`"""
+        return await self.routine_control(routine_id, services.RoutineControl.ControlType.requestRoutineResults, data)
+
+    # Performs a RoutineControl Service request
+    async def routine_control(self, routine_id: int, control_type: int, data: Optional[bytes] = None) -> Optional[services.RoutineControl.InterpretedResponse]:
+        """Awaitable version of :meth:`Client.routine_control<udsoncan.client.Client.routine_control>`"""
+        return await self._call_service(self._routine_control_steps, routine_id, control_type, data)
+
+    async def read_extended_timing_parameters(self) -> Optional[services.AccessTimingParameter.InterpretedResponse]:
+        """Awaitable version of :meth:`Client.read_extended_timing_parameters<udsoncan.client.Client.read_extended_timing_parameters>`"""
+        return await self.access_timing_parameter(access_type=services.AccessTimingParameter.AccessType.readExtendedTimingParameterSet)
+
+    async def reset_default_timing_parameters(self) -> Optional[services.AccessTimingParameter.InterpretedResponse]:
+        """Awaitable version of :meth:`Client.reset_default_timing_parameters<udsoncan.client.Client.reset_default_timing_parameters>`"""
+        return await self.access_timing_parameter(access_type=services.AccessTimingParameter.AccessType.setTimingParametersToDefaultValues)
+
+    async def read_active_timing_parameters(self) -> Optional[services.AccessTimingParameter.InterpretedResponse]:
+        """Awaitable version of :meth:`Client.read_active_timing_parameters<udsoncan.client.Client.read_active_timing_parameters>`"""
+        return await self.access_timing_parameter(access_type=services.AccessTimingParameter.AccessType.readCurrentlyActiveTimingParameters)
+
+    async def set_timing_parameters(self, params: bytes) -> Optional[services.AccessTimingParameter.InterpretedResponse]:
+        """Awaitable version of :meth:`Client.set_timing_parameters<udsoncan.client.Client.set_timing_parameters>`"""
+        return await self.access_timing_parameter(access_type=services.AccessTimingParameter.AccessType.setTimingParametersToGivenValues, timing_param_record=params)
+
+    async def access_timing_parameter(self,
+                                      access_type: int,
+                                      timing_param_record: Optional[bytes] = None
+                                      ) -> Optional[services.AccessTimingParameter.InterpretedResponse]:
+        """Awaitable version of :meth:`Client.access_timing_parameter<udsoncan.client.Client.access_timing_parameter>`"""
+        return await self._call_service(self._access_timing_parameter_steps, access_type, timing_param_record)
+
+    async def communication_control(self,
+                                    control_type: int,
+                                    communication_type: Union[int, bytes, CommunicationType],
+                                    node_id: Optional[int] = None,
+                                    ) -> Optional[services.CommunicationControl.InterpretedResponse]:
+        """Awaitable version of :meth:`Client.communication_control<udsoncan.client.Client.communication_control>`"""
+        return await self._call_service(self._communication_control_steps, control_type, communication_type, node_id)
+
+    async def request_download(self,
+                               memory_location: MemoryLocation,
+                               dfi: Optional[DataFormatIdentifier] = None
+                               ) -> Optional[services.RequestDownload.InterpretedResponse]:
+        """Awaitable version of :meth:`Client.request_download<udsoncan.client.Client.request_download>`"""
+        response = await self.request_upload_download(services.RequestDownload, memory_location, dfi)
+        return cast(Optional[services.RequestDownload.InterpretedResponse], response)
+
+    async def request_upload(self,
+                             memory_location: MemoryLocation,
+                             dfi: Optional[DataFormatIdentifier] = None
+                             ) -> Optional[services.RequestUpload.InterpretedResponse]:
+        """Awaitable version of :meth:`Client.request_upload<udsoncan.client.Client.request_upload>`"""
+        response = await self.request_upload_download(services.RequestUpload, memory_location, dfi)
+        return cast(Optional[services.RequestUpload.InterpretedResponse], response)
+
+    # Common code for both RequestDownload and RequestUpload services
+    async def request_upload_download(self, service_cls, memory_location, dfi=None):
+        return await self._call_service(self._request_upload_download_steps, service_cls, memory_location, dfi)
+
+    async def transfer_data(self,
+                            sequence_number: int,
+                            data: Optional[bytes] = None
+                            ) -> Optional[services.TransferData.InterpretedResponse]:
+        """Awaitable version of :meth:`Client.transfer_data<udsoncan.client.Client.transfer_data>`"""
+        return await self._call_service(self._transfer_data_steps, sequence_number, data)
+
+    async def request_transfer_exit(self, data: Optional[bytes] = None) -> Optional[services.RequestTransferExit.InterpretedResponse]:
+        """Awaitable version of :meth:`Client.request_transfer_exit<udsoncan.client.Client.request_transfer_exit>`"""
+        return await self._call_service(self._request_transfer_exit_steps, data)
+
+    async def download(self,
+                       memory_location: MemoryLocation,
+                       data_source: TransferDataSource,
+                       dfi: Optional[DataFormatIdentifier] = None,
+                       block_size: Optional[int] = None,
+                       progress_callback: Optional[TransferProgressCallbackType] = None,
+                       transfer_exit_data: Optional[bytes] = None
+                       ) -> Optional[services.RequestTransferExit.InterpretedResponse]:
+        """Awaitable version of :meth:`Client.download<udsoncan.client.Client.download>`"""
+        return await self._call_service(self._download_steps, memory_location, data_source, dfi, block_size, progress_callback, transfer_exit_data)
+
+    async def upload(self,
+                     memory_location: MemoryLocation,
+                     destination: TransferDataDestination,
+                     dfi: Optional[DataFormatIdentifier] = None,
+                     progress_callback: Optional[TransferProgressCallbackType] = None,
+                     transfer_exit_data: Optional[bytes] = None
+                     ) -> Optional[services.RequestTransferExit.InterpretedResponse]:
+        """Awaitable version of :meth:`Client.upload<udsoncan.client.Client.upload>`"""
+        return await self._call_service(self._upload_steps, memory_location, destination, dfi, progress_callback, transfer_exit_data)
+
+    async def link_control(self, control_type: int, baudrate: Optional[Baudrate] = None) -> Optional[services.LinkControl.InterpretedResponse]:
+        """Awaitable version of :meth:`Client.link_control<udsoncan.client.Client.link_control>`"""
+        return await self._call_service(self._link_control_steps, control_type, baudrate)
+
+    async def io_control(self,
+                         did: int,
+                         control_param: Optional[int] = None,
+                         values: Optional[Union[List[Any], Dict[str, Any], IOValues]] = None,
+                         masks: Optional[Union[List[str], Dict[str, bool], IOMasks, bool]] = None
+                         ) -> Optional[services.InputOutputControlByIdentifier.InterpretedResponse]:
+        """Awaitable version of :meth:`Client.io_control<udsoncan.client.Client.io_control>`"""
+        return await self._call_service(self._io_control_steps, did, control_param, values, masks)
+
+    async def control_dtc_setting(self, setting_type: int, data: Optional[bytes] = None) -> Optional[services.ControlDTCSetting.InterpretedResponse]:
+        """Awaitable version of :meth:`Client.control_dtc_setting<udsoncan.client.Client.control_dtc_setting>`"""
+        return await self._call_service(self._control_dtc_setting_steps, setting_type, data)
+
+    async def read_memory_by_address(self, memory_location: MemoryLocation) -> Optional[services.ReadMemoryByAddress.InterpretedResponse]:
+        """Awaitable version of :meth:`Client.read_memory_by_address<udsoncan.client.Client.read_memory_by_address>`"""
+        return await self._call_service(self._read_memory_by_address_steps, memory_location)
+
+    async def write_memory_by_address(self, memory_location: MemoryLocation, data: bytes) -> Optional[services.WriteMemoryByAddress.InterpretedResponse]:
+        """Awaitable version of :meth:`Client.write_memory_by_address<udsoncan.client.Client.write_memory_by_address>`"""
+        return await self._call_service(self._write_memory_by_address_steps, memory_location, data)
+
+# ====  ReadDTCInformation
+    async def get_dtc_by_status_mask(self, status_mask: int) -> Optional[services.ReadDTCInformation.InterpretedResponse]:
+        """Awaitable version of :meth:`Client.get_dtc_by_status_mask<udsoncan.client.Client.get_dtc_by_status_mask>`"""
+        return await self.read_dtc_information(services.ReadDTCInformation.Subfunction.reportDTCByStatusMask, status_mask=status_mask)
+
+    async def get_user_defined_memory_dtc_by_status_mask(self, status_mask: int, memory_selection: int) -> Optional[services.ReadDTCInformation.InterpretedResponse]:
+        """Awaitable version of :meth:`Client.get_user_defined_memory_dtc_by_status_mask<udsoncan.client.Client.get_user_defined_memory_dtc_by_status_mask>`"""
+        return await self.read_dtc_information(services.ReadDTCInformation.Subfunction.reportUserDefMemoryDTCByStatusMask, status_mask=status_mask, memory_selection=memory_selection)
+
+    async def get_emission_dtc_by_status_mask(self, status_mask: int) -> Optional[services.ReadDTCInformation.InterpretedResponse]:
+        """Awaitable version of :meth:`Client.get_emission_dtc_by_status_mask<udsoncan.client.Client.get_emission_dtc_by_status_mask>`"""
+        return await self.read_dtc_information(services.ReadDTCInformation.Subfunction.reportEmissionsRelatedOBDDTCByStatusMask, status_mask=status_mask)
+
+    async def get_mirrormemory_dtc_by_status_mask(self, status_mask: int) -> Optional[services.ReadDTCInformation.InterpretedResponse]:
+        """Awaitable version of :meth:`Client.get_mirrormemory_dtc_by_status_mask<udsoncan.client.Client.get_mirrormemory_dtc_by_status_mask>`"""
+        return await self.read_dtc_information(services.ReadDTCInformation.Subfunction.reportMirrorMemoryDTCByStatusMask, status_mask=status_mask)
+
+    async def get_dtc_by_status_severity_mask(self, status_mask: int, severity_mask: int) -> Optional[services.ReadDTCInformation.InterpretedResponse]:
+        """Awaitable version of :meth:`Client.get_dtc_by_status_severity_mask<udsoncan.client.Client.get_dtc_by_status_severity_mask>`"""
+        return await self.read_dtc_information(services.ReadDTCInformation.Subfunction.reportDTCBySeverityMaskRecord, status_mask=status_mask, severity_mask=severity_mask)
+
+    async def get_wwh_obd_dtc_by_status_mask(self, 
+                                             functional_group_id: int, 
+                                             status_mask: int, 
+                                             severity_mask: Union[int,Dtc.Severity], 
+                                             dtc_class: Union[int, Dtc.DtcClass]
+                                             ) -> Optional[services.ReadDTCInformation.InterpretedResponse]:
+        """Awaitable version of :meth:`Client.get_wwh_obd_dtc_by_status_mask<udsoncan.client.Client.get_wwh_obd_dtc_by_status_mask>`"""
+
+        return await self.read_dtc_information(services.ReadDTCInformation.Subfunction.reportWWHOBDDTCByMaskRecord, status_mask=status_mask, severity_mask=severity_mask, dtc_class=dtc_class, functional_group_id=functional_group_id)
+
+    async def get_wwh_obd_dtc_with_permanent_status(self, functional_group_id: int) -> Optional[services.ReadDTCInformation.InterpretedResponse]:
+        """Awaitable version of :meth:`Client.get_wwh_obd_dtc_with_permanent_status<udsoncan.client.Client.get_wwh_obd_dtc_with_permanent_status>`"""
+
+        return await self.read_dtc_information(services.ReadDTCInformation.Subfunction.reportWWHOBDDTCWithPermanentStatus, functional_group_id=functional_group_id)
+
+    async def get_number_of_dtc_by_status_mask(self, status_mask: Union[int, Dtc.Status]) -> Optional[services.ReadDTCInformation.InterpretedResponse]:
+        """Awaitable version of :meth:`Client.get_number_of_dtc_by_status_mask<udsoncan.client.Client.get_number_of_dtc_by_status_mask>`"""
+        return await self.read_dtc_information(services.ReadDTCInformation.Subfunction.reportNumberOfDTCByStatusMask, status_mask=status_mask)
+
+    async def get_mirrormemory_number_of_dtc_by_status_mask(self, status_mask: Union[int, Dtc.Status]) -> Optional[services.ReadDTCInformation.InterpretedResponse]:
+        """Awaitable version of :meth:`Client.get_mirrormemory_number_of_dtc_by_status_mask<udsoncan.client.Client.get_mirrormemory_number_of_dtc_by_status_mask>`"""
+        return await self.read_dtc_information(services.ReadDTCInformation.Subfunction.reportNumberOfMirrorMemoryDTCByStatusMask, status_mask=status_mask)
+
+    async def get_number_of_emission_dtc_by_status_mask(self, status_mask: Union[int, Dtc.Status]) -> Optional[services.ReadDTCInformation.InterpretedResponse]:
+        """Awaitable version of :meth:`Client.get_number_of_emission_dtc_by_status_mask<udsoncan.client.Client.get_number_of_emission_dtc_by_status_mask>`"""
+        return await self.read_dtc_information(services.ReadDTCInformation.Subfunction.reportNumberOfEmissionsRelatedOBDDTCByStatusMask, status_mask=status_mask)
+
+    async def get_number_of_dtc_by_status_severity_mask(self, status_mask: Union[int, Dtc.Status], severity_mask: Union[int, Dtc.Severity]) -> Optional[services.ReadDTCInformation.InterpretedResponse]:
+        """Awaitable version of :meth:`Client.get_number_of_dtc_by_status_severity_mask<udsoncan.client.Client.get_number_of_dtc_by_status_severity_mask>`"""
+        return await self.read_dtc_information(services.ReadDTCInformation.Subfunction.reportNumberOfDTCBySeverityMaskRecord, status_mask=status_mask, severity_mask=severity_mask)
+
+    async def get_dtc_severity(self, dtc: Union[int, Dtc]) -> Optional[services.ReadDTCInformation.InterpretedResponse]:
+        """Awaitable version of :meth:`Client.get_dtc_severity<udsoncan.client.Client.get_dtc_severity>`"""
+        return await self.read_dtc_information(services.ReadDTCInformation.Subfunction.reportSeverityInformationOfDTC, dtc=dtc)
+
+    async def get_supported_dtc(self) -> Optional[services.ReadDTCInformation.InterpretedResponse]:
+        """Awaitable version of :meth:`Client.get_supported_dtc<udsoncan.client.Client.get_supported_dtc>`"""
+        return await self.read_dtc_information(services.ReadDTCInformation.Subfunction.reportSupportedDTCs)
+
+    async def get_first_test_failed_dtc(self) -> Optional[services.ReadDTCInformation.InterpretedResponse]:
+        """Awaitable version of :meth:`Client.get_first_test_failed_dtc<udsoncan.client.Client.get_first_test_failed_dtc>`"""
+        return await self.read_dtc_information(services.ReadDTCInformation.Subfunction.reportFirstTestFailedDTC)
+
+    async def get_first_confirmed_dtc(self) -> Optional[services.ReadDTCInformation.InterpretedResponse]:
+        """Awaitable version of :meth:`Client.get_first_confirmed_dtc<udsoncan.client.Client.get_first_confirmed_dtc>`"""
+        return await self.read_dtc_information(services.ReadDTCInformation.Subfunction.reportFirstConfirmedDTC)
+
+    async def get_most_recent_test_failed_dtc(self) -> Optional[services.ReadDTCInformation.InterpretedResponse]:
+        """Awaitable version of :meth:`Client.get_most_recent_test_failed_dtc<udsoncan.client.Client.get_most_recent_test_failed_dtc>`"""
+        return await self.read_dtc_information(services.ReadDTCInformation.Subfunction.reportMostRecentTestFailedDTC)
+
+    async def get_most_recent_confirmed_dtc(self) -> Optional[services.ReadDTCInformation.InterpretedResponse]:
+        """Awaitable version of :meth:`Client.get_most_recent_confirmed_dtc<udsoncan.client.Client.get_most_recent_confirmed_dtc>`"""
+        return await self.read_dtc_information(services.ReadDTCInformation.Subfunction.reportMostRecentConfirmedDTC)
+
+    async def get_dtc_with_permanent_status(self) -> Optional[services.ReadDTCInformation.InterpretedResponse]:
+        """Awaitable version of :meth:`Client.get_dtc_with_permanent_status<udsoncan.client.Client.get_dtc_with_permanent_status>`"""
+        return await self.read_dtc_information(services.ReadDTCInformation.Subfunction.reportDTCWithPermanentStatus)
+
+    async def get_dtc_fault_counter(self) -> Optional[services.ReadDTCInformation.InterpretedResponse]:
+        """Awaitable version of :meth:`Client.get_dtc_fault_counter<udsoncan.client.Client.get_dtc_fault_counter>`"""
+        return await self.read_dtc_information(services.ReadDTCInformation.Subfunction.reportDTCFaultDetectionCounter)
+
+    async def get_dtc_snapshot_identification(self) -> Optional[services.ReadDTCInformation.InterpretedResponse]:
+        """Awaitable version of :meth:`Client.get_dtc_snapshot_identification<udsoncan.client.Client.get_dtc_snapshot_identification>`"""
+        return await self.read_dtc_information(services.ReadDTCInformation.Subfunction.reportDTCSnapshotIdentification)
+
+    async def get_dtc_snapshot_by_dtc_number(self, dtc, record_number=0xFF) -> Optional[services.ReadDTCInformation.InterpretedResponse]:
+        """Awaitable version of :meth:`Client.get_dtc_snapshot_by_dtc_number<udsoncan.client.Client.get_dtc_snapshot_by_dtc_number>`"""
+        return await self.read_dtc_information(services.ReadDTCInformation.Subfunction.reportDTCSnapshotRecordByDTCNumber, dtc=dtc, snapshot_record_number=record_number)
+
+    async def get_user_defined_dtc_snapshot_by_dtc_number(self, dtc: Union[Dtc, int], memory_selection: int, record_number: int = 0xFF) -> Optional[services.ReadDTCInformation.InterpretedResponse]:
+        """Awaitable version of :meth:`Client.get_user_defined_dtc_snapshot_by_dtc_number<udsoncan.client.Client.get_user_defined_dtc_snapshot_by_dtc_number>`"""
+        return await self.read_dtc_information(services.ReadDTCInformation.Subfunction.reportUserDefMemoryDTCSnapshotRecordByDTCNumber, dtc=dtc, snapshot_record_number=record_number, memory_selection=memory_selection)
+
+    async def get_dtc_snapshot_by_record_number(self, record_number: int = 0xFF) -> Optional[services.ReadDTCInformation.InterpretedResponse]:
+        """Awaitable version of :meth:`Client.get_dtc_snapshot_by_record_number<udsoncan.client.Client.get_dtc_snapshot_by_record_number>`"""
+        return await self.read_dtc_information(services.ReadDTCInformation.Subfunction.reportDTCSnapshotRecordByRecordNumber, snapshot_record_number=record_number)
+
+    async def get_dtc_extended_data_by_dtc_number(self, dtc: Union[int, Dtc], record_number: int = 0xFF, data_size: Optional[int] = None) -> Optional[services.ReadDTCInformation.InterpretedResponse]:
+        """Awaitable version of :meth:`Client.get_dtc_extended_data_by_dtc_number<udsoncan.client.Client.get_dtc_extended_data_by_dtc_number>`"""
+        return await self.read_dtc_information(services.ReadDTCInformation.Subfunction.reportDTCExtendedDataRecordByDTCNumber, dtc=dtc, extended_data_record_number=record_number, extended_data_size=data_size)
+
+    async def get_dtc_extended_data_by_record_number(self, record_number: int, data_size: Optional[int] = None) -> Optional[services.ReadDTCInformation.InterpretedResponse]:
+        """Awaitable version of :meth:`Client.get_dtc_extended_data_by_record_number<udsoncan.client.Client.get_dtc_extended_data_by_record_number>`"""
+
+        return await self.read_dtc_information(services.ReadDTCInformation.Subfunction.reportDTCExtDataRecordByRecordNumber, extended_data_record_number=record_number, extended_data_size=data_size)
+
+    async def get_user_defined_dtc_extended_data_by_dtc_number(self, dtc: Union[int, Dtc], memory_selection: int, record_number: int = 0xFF, data_size: Optional[int] = None) -> Optional[services.ReadDTCInformation.InterpretedResponse]:
+        """Awaitable version of :meth:`Client.get_user_defined_dtc_extended_data_by_dtc_number<udsoncan.client.Client.get_user_defined_dtc_extended_data_by_dtc_number>`"""
+        return await self.read_dtc_information(services.ReadDTCInformation.Subfunction.reportUserDefMemoryDTCExtDataRecordByDTCNumber, dtc=dtc, memory_selection=memory_selection, extended_data_record_number=record_number, extended_data_size=data_size)
+
+    async def get_mirrormemory_dtc_extended_data_by_dtc_number(self, dtc: Union[int, Dtc], record_number: int = 0xFF, data_size: Optional[int] = None) -> Optional[services.ReadDTCInformation.InterpretedResponse]:
+        """Awaitable version of :meth:`Client.get_mirrormemory_dtc_extended_data_by_dtc_number<udsoncan.client.Client.get_mirrormemory_dtc_extended_data_by_dtc_number>`"""
+        return await self.read_dtc_information(services.ReadDTCInformation.Subfunction.reportMirrorMemoryDTCExtendedDataRecordByDTCNumber, dtc=dtc, extended_data_record_number=record_number, extended_data_size=data_size)
+
+    async def read_dtc_information(self,
+                                   subfunction: int,
+                                   status_mask: Optional[Union[Dtc.Status, int]] = None,
+                                   severity_mask: Optional[Union[Dtc.Severity, int]] = None,
+                                   dtc: Optional[Union[int, Dtc]] = None,
+                                   snapshot_record_number: Optional[int] = None,
+                                   extended_data_record_number: Optional[int] = None,
+                                   extended_data_size: Optional[int] = None,
+                                   memory_selection: Optional[int] = None,
+                                   functional_group_id: Optional[int] = None,
+                                   dtc_class: Optional[Union[int, Dtc.DtcClass]] = None
+                                   ):
+        return await self._call_service(self._read_dtc_information_steps, subfunction, status_mask, severity_mask, dtc, snapshot_record_number, extended_data_record_number, extended_data_size, memory_selection, functional_group_id, dtc_class)
+
+    async def add_file(self,
+                       filename: str,
+                       dfi: Optional[DataFormatIdentifier] = None,
+                       filesize: Optional[Union[Filesize, int]] = None
+                       ) -> Optional[services.RequestFileTransfer.InterpretedResponse]:
+        """Awaitable version of :meth:`Client.add_file<udsoncan.client.Client.add_file>`"""
+        return await self.request_file_transfer(moop=services.RequestFileTransfer.ModeOfOperation.AddFile, path=filename, dfi=dfi, filesize=filesize)
+
+    async def resume_file(self,
+                          filename: str,
+                          dfi: Optional[DataFormatIdentifier] = None,
+                          filesize: Optional[Union[Filesize, int]] = None
+                          ) -> Optional[services.RequestFileTransfer.InterpretedResponse]:
+        """Awaitable version of :meth:`Client.resume_file<udsoncan.client.Client.resume_file>`"""
+        return await self.request_file_transfer(moop=services.RequestFileTransfer.ModeOfOperation.ResumeFile, path=filename, dfi=dfi, filesize=filesize)
+
+    async def delete_file(self, filename: str,) -> Optional[services.RequestFileTransfer.InterpretedResponse]:
+        """Awaitable version of :meth:`Client.delete_file<udsoncan.client.Client.delete_file>`"""
+        return await self.request_file_transfer(moop=services.RequestFileTransfer.ModeOfOperation.DeleteFile, path=filename)
+
+    async def replace_file(self,
+                           filename: str,
+                           dfi: Optional[DataFormatIdentifier] = None,
+                           filesize: Optional[Union[Filesize, int]] = None
+                           ) -> Optional[services.RequestFileTransfer.InterpretedResponse]:
+        """Awaitable version of :meth:`Client.replace_file<udsoncan.client.Client.replace_file>`"""
+        return await self.request_file_transfer(moop=services.RequestFileTransfer.ModeOfOperation.ReplaceFile, path=filename, dfi=dfi, filesize=filesize)
+
+    async def read_file(self,
+                        filename: str,
+                        dfi: Optional[DataFormatIdentifier] = None
+                        ) -> Optional[services.RequestFileTransfer.InterpretedResponse]:
+        """Awaitable version of :meth:`Client.read_file<udsoncan.client.Client.read_file>`"""
+        return await self.request_file_transfer(moop=services.RequestFileTransfer.ModeOfOperation.ReadFile, path=filename, dfi=dfi)
+
+    async def read_dir(self, path: str) -> Optional[services.RequestFileTransfer.InterpretedResponse]:
+        """Awaitable version of :meth:`Client.read_dir<udsoncan.client.Client.read_dir>`"""
+        return await self.request_file_transfer(moop=services.RequestFileTransfer.ModeOfOperation.ReadDir, path=path)
+
+    async def request_file_transfer(self,
+                                    moop: int,
+                                    path: str,
+                                    dfi: Optional[DataFormatIdentifier] = None,
+                                    filesize: Optional[Union[int, Filesize]] = None
+                                    ) -> Optional[services.RequestFileTransfer.InterpretedResponse]:
+
+        return await self._call_service(self._request_file_transfer_steps, moop, path, dfi, filesize)
+
+    async def dynamically_define_did(self,
+                                     did: int,
+                                     did_definition: Union[DynamicDidDefinition, MemoryLocation]
+                                     ) -> Optional[services.DynamicallyDefineDataIdentifier.InterpretedResponse]:
+        """Awaitable version of :meth:`Client.dynamically_define_did<udsoncan.client.Client.dynamically_define_did>`"""
+        return await self._call_service(self._dynamically_define_did_steps, did, did_definition)
+
+    async def do_clear_dynamically_defined_did(self, did: Optional[int] = None) -> Optional[services.DynamicallyDefineDataIdentifier.InterpretedResponse]:
+        return await self._call_service(self._do_clear_dynamically_defined_did_steps, did)
+
+    async def clear_dynamically_defined_did(self, did: int) -> Optional[services.DynamicallyDefineDataIdentifier.InterpretedResponse]:
+        """Awaitable version of :meth:`Client.clear_dynamically_defined_did<udsoncan.client.Client.clear_dynamically_defined_did>`"""
+        if did is None:
+            raise ValueError('Missing DID number')
+
+        return await self.do_clear_dynamically_defined_did(did)
+
+    async def clear_all_dynamically_defined_did(self) -> Optional[services.DynamicallyDefineDataIdentifier.InterpretedResponse]:
+        """Awaitable version of :meth:`Client.clear_all_dynamically_defined_did<udsoncan.client.Client.clear_all_dynamically_defined_did>`"""
+        return await self.do_clear_dynamically_defined_did()
+
+    # ====  Authentication Service Client Functions
+    async def deauthenticate(self) -> Optional[services.Authentication.InterpretedResponse]:
+        """Awaitable version of :meth:`Client.deauthenticate<udsoncan.client.Client.deauthenticate>`"""
+        return await self.authentication(
+            authentication_task=services.Authentication.AuthenticationTask.deAuthenticate
+        )
+
+    async def verify_certificate_unidirectional(self,
+                                                communication_configuration: int,
+                                                certificate_client: bytes,
+                                                challenge_client: Optional[bytes] = None) -> Optional[
+                  services.Authentication.InterpretedResponse]:
+        """Awaitable version of :meth:`Client.verify_certificate_unidirectional<udsoncan.client.Client.verify_certificate_unidirectional>`"""
+        return await self.authentication(
+            authentication_task=services.Authentication.AuthenticationTask.verifyCertificateUnidirectional,
+            communication_configuration=communication_configuration,
+            certificate_client=certificate_client,
+            challenge_client=challenge_client
+        )
+
+    async def verify_certificate_bidirectional(self,
+                                               communication_configuration: int,
+                                               certificate_client: bytes,
+                                               challenge_client: bytes) -> Optional[
+                  services.Authentication.InterpretedResponse]:
+        """Awaitable version of :meth:`Client.verify_certificate_bidirectional<udsoncan.client.Client.verify_certificate_bidirectional>`"""
+        return await self.authentication(
+            authentication_task=services.Authentication.AuthenticationTask.verifyCertificateBidirectional,
+            communication_configuration=communication_configuration,
+            certificate_client=certificate_client,
+            challenge_client=challenge_client
+        )
+
+    async def proof_of_ownership(self,
+                                 proof_of_ownership_client: bytes,
+                                 ephemeral_public_key_client: Optional[bytes] = None) -> Optional[
+                  services.Authentication.InterpretedResponse]:
+        """Awaitable version of :meth:`Client.proof_of_ownership<udsoncan.client.Client.proof_of_ownership>`"""
+
+        return await self.authentication(
+            authentication_task=services.Authentication.AuthenticationTask.proofOfOwnership,
+            proof_of_ownership_client=proof_of_ownership_client,
+            ephemeral_public_key_client=ephemeral_public_key_client
+        )
+
+    async def transmit_certificate(self,
+                                   certificate_evaluation_id: int,
+                                   certificate_data: bytes) -> Optional[services.Authentication.InterpretedResponse]:
+        """Awaitable version of :meth:`Client.transmit_certificate<udsoncan.client.Client.transmit_certificate>`"""
+        return await self.authentication(
+            authentication_task=services.Authentication.AuthenticationTask.transmitCertificate,
+            certificate_evaluation_id=certificate_evaluation_id,
+            certificate_data=certificate_data
+        )
+
+    async def request_challenge_for_authentication(self,
+                                                   communication_configuration: int,
+                                                   algorithm_indicator: bytes) -> Optional[
+                  services.Authentication.InterpretedResponse]:
+        """Awaitable version of :meth:`Client.request_challenge_for_authentication<udsoncan.client.Client.request_challenge_for_authentication>`"""
+        return await self.authentication(
+            authentication_task=services.Authentication.AuthenticationTask.requestChallengeForAuthentication,
+            communication_configuration=communication_configuration,
+            algorithm_indicator=algorithm_indicator
+        )
+
+    async def verify_proof_of_ownership_unidirectional(self,
+                                                       algorithm_indicator: bytes,
+                                                       proof_of_ownership_client: bytes,
+                                                       challenge_client: Optional[bytes] = None,
+                                                       additional_parameter: Optional[bytes] = None) -> Optional[
+                  services.Authentication.InterpretedResponse]:
+        """Awaitable version of :meth:`Client.verify_proof_of_ownership_unidirectional<udsoncan.client.Client.verify_proof_of_ownership_unidirectional>`"""
+        return await self.authentication(
+            authentication_task=services.Authentication.AuthenticationTask.verifyProofOfOwnershipUnidirectional,
+            algorithm_indicator=algorithm_indicator,
+            proof_of_ownership_client=proof_of_ownership_client,
+            challenge_client=challenge_client,
+            additional_parameter=additional_parameter
+        )
+
+    async def verify_proof_of_ownership_bidirectional(self,
+                                                      algorithm_indicator: bytes,
+                                                      proof_of_ownership_client: bytes,
+                                                      challenge_client: bytes,
+                                                      additional_parameter: Optional[bytes] = None) -> Optional[
+                  services.Authentication.InterpretedResponse]:
+        """Awaitable version of :meth:`Client.verify_proof_of_ownership_bidirectional<udsoncan.client.Client.verify_proof_of_ownership_bidirectional>`"""
+        return await self.authentication(
+            authentication_task=services.Authentication.AuthenticationTask.verifyProofOfOwnershipBidirectional,
+            algorithm_indicator=algorithm_indicator,
+            proof_of_ownership_client=proof_of_ownership_client,
+            challenge_client=challenge_client,
+            additional_parameter=additional_parameter
+        )
+
+    async def authentication_configuration(self) -> Optional[services.Authentication.InterpretedResponse]:
+        """Awaitable version of :meth:`Client.authentication_configuration<udsoncan.client.Client.authentication_configuration>`"""
+        return await self.authentication(
+            authentication_task=services.Authentication.AuthenticationTask.authenticationConfiguration
+        )
+
+    async def authentication(self,
+                             authentication_task: int,
+                             communication_configuration: Optional[int] = None,
+                             certificate_client: Optional[bytes] = None,
+                             challenge_client: Optional[bytes] = None,
+                             algorithm_indicator: Optional[bytes] = None,
+                             certificate_evaluation_id: Optional[int] = None,
+                             certificate_data: Optional[bytes] = None,
+                             proof_of_ownership_client: Optional[bytes] = None,
+                             ephemeral_public_key_client: Optional[bytes] = None,
+                             additional_parameter: Optional[bytes] = None) -> Optional[
+                  services.Authentication.InterpretedResponse]:
+        """Awaitable version of :meth:`Client.authentication<udsoncan.client.Client.authentication>`"""
+        return await self._call_service(self._authentication_steps, authentication_task, communication_configuration, certificate_client, challenge_client, algorithm_indicator, certificate_evaluation_id, certificate_data, proof_of_ownership_client, ephemeral_public_key_client, additional_parameter)
@@ -0,0 +1,272 @@
+__all__ = ['DtcTable']
+
+import array
+import itertools
+import operator
+import struct
+
+from udsoncan.common.dtc import Dtc
+
+from typing import Any, Iterable, Iterator, List, Optional, Union, overload
+
+_ID_TYPECODE = 'I' if array.array('I').itemsize >= 4 else 'L'
+
+
+class DtcTable:
+    """
+    Compact list of DTCs read with :ref:`ReadDTCInformation<ReadDtcInformation>`. The table is made of parallel columns of integers, one entry per DTC,
+    instead of one :ref:`Dtc<DTC>` object per record. A response containing thousands of DTCs is therefore parsed in a single pass and uses a few bytes per DTC.
+
+    :ref:`Dtc<DTC>` objects are created only when they are accessed, by indexing or iterating the table. They are new objects on each access : modifying them does not change the table.
+
+    The table is produced when the client configuration ``use_dtc_table`` is set to True. See :ref:`use_dtc_table<config_use_dtc_table>`
+
+    .. data:: ids
+
+        ``array.array`` of the 3-byte DTC IDs
+
+    .. data:: status
+
+        ``array.array`` of the DTC status bytes
+
+    .. data:: severity
+
+        ``array.array`` of the DTC severity bytes. ``None`` if the response does not contain the severity
+
+    .. data:: functional_unit
+
+        ``array.array`` of the DTC functional units. ``None`` if the response does not contain the severity
+    """
+
+    STATUS_FLAGS = {
+        'test_failed': 0x01,
+        'test_failed_this_operation_cycle': 0x02,
+        'pending': 0x04,
+        'confirmed': 0x08,
+        'test_not_completed_since_last_clear': 0x10,
+        'test_failed_since_last_clear': 0x20,
+        'test_not_completed_this_operation_cycle': 0x40,
+        'warning_indicator_requested': 0x80
+    }
+
+    SEVERITY_FLAGS = {
+        'maintenance_only': 0x20,
+        'check_at_next_exit': 0x40,
+        'check_immediately': 0x80
+    }
+
+    ids: "array.array[int]"
+    status: "array.array[int]"
+    severity: Optional["array.array[int]"]
+    functional_unit: Optional["array.array[int]"]
+
+    def __init__(self,
+                 ids: Iterable[int] = (),
+                 status: Iterable[int] = (),
+                 severity: Optional[Iterable[int]] = None,
+                 functional_unit: Optional[Iterable[int]] = None):
+        self.ids = array.array(_ID_TYPECODE, ids)
+        self.status = array.array('B', status)
+        self.severity = None if severity is None else array.array('B', severity)
+        self.functional_unit = None if functional_unit is None else array.array('B', functional_unit)
+
+        if len(self.status) != len(self.ids):
+            raise ValueError('ids and status must have the same length')
+
+        if (self.severity is None) != (self.functional_unit is None):
+            raise ValueError('severity and functional_unit must be given together')
+
+        if self.severity is not None and self.functional_unit is not None:
+            if len(self.severity) != len(self.ids) or len(self.functional_unit) != len(self.ids):
+                raise ValueError('severity and functional_unit must have the same length as ids')
+
+    @classmethod
+    def from_records(cls, data: bytes, with_severity: bool = False, ignore_all_zero_dtc: bool = True) -> "DtcTable":
+        """
+        Parses a sequence of DTC records as found in a ReadDTCInformation response.
+
+        :param data: The records. Either ``DTC (3 bytes) + status (1 byte)`` or, when ``with_severity`` is True, ``severity (1 byte) + functional unit (1 byte) + DTC (3 bytes) + status (1 byte)``.
+        :type data: bytes
+
+        :param with_severity: True if the records contain the severity and the functional unit
+        :type with_severity: bool
+
+        :param ignore_all_zero_dtc: Skip the records made only of zeros
+        :type ignore_all_zero_dtc: bool
+
+        :raises ValueError: If the data length is not a multiple of the record size
+        """
+        record_size = 6 if with_severity else 4
+        if len(data) % record_size != 0:
+            raise ValueError('Data length must be a multiple of %d bytes' % record_size)
+
+        table = cls()
+        if with_severity:
+            records = list(struct.iter_unpack('>BBL', data))   # The 3-byte DTC and its status are read as a single 32-bit integer
+            if ignore_all_zero_dtc:
+                records = [record for record in records if record != (0, 0, 0)]
+            table.severity = array.array('B', [record[0] for record in records])
+            table.functional_unit = array.array('B', [record[1] for record in records])
+            id_status = [record[2] for record in records]
+        else:
+            id_status = [record[0] for record in struct.iter_unpack('>L', data)]
+            if ignore_all_zero_dtc:
+                id_status = [value for value in id_status if value != 0]
+
+        table.ids = array.array(_ID_TYPECODE, [value >> 8 for value in id_status])
+        table.status = array.array('B', [value & 0xFF for value in id_status])
+        return table
+
+    @property
+    def has_severity(self) -> bool:
+        """True if the severity and the functional unit are available"""
+        return self.severity is not None
+
+    def where(self,
+              status_mask: Optional[Union[int, Dtc.Status]] = None,
+              severity_mask: Optional[Union[int, Dtc.Severity]] = None,
+              **flags: bool) -> "DtcTable":
+        """
+        Returns a new table with the DTCs matching all the given conditions. Example : ``table.where(confirmed=True, test_failed_this_operation_cycle=False)``
+
+        :param status_mask: Keeps the DTCs having at least one of the status bits of this mask set, the same way the server applies a status mask.
+        :type status_mask: int or :ref:`Dtc.Status<DTC_Status>`
+
+        :param severity_mask: Keeps the DTCs having at least one of the severity bits of this mask set.
+        :type severity_mask: int or :ref:`Dtc.Severity<DTC_Severity>`
+
+        :param flags: Name of a :ref:`Dtc.Status<DTC_Status>` or :ref:`Dtc.Severity<DTC_Severity>` flag mapped to the value it must have.
+
+        :raises ValueError: If a flag name is unknown or if a severity condition is given to a table without severity
+        """
+        status_set = status_clear = 0
+        severity_set = severity_clear = 0
+        for name, value in flags.items():
+            if name in self.STATUS_FLAGS:
+                if value:
+                    status_set |= self.STATUS_FLAGS[name]
+                else:
+                    status_clear |= self.STATUS_FLAGS[name]
+            elif name in self.SEVERITY_FLAGS:
+                if value:
+                    severity_set |= self.SEVERITY_FLAGS[name]
+                else:
+                    severity_clear |= self.SEVERITY_FLAGS[name]
+            else:
+                raise ValueError('Unknown DTC flag "%s"' % name)
+
+        if isinstance(status_mask, Dtc.Status):
+            status_mask = status_mask.get_byte_as_int()
+        if isinstance(severity_mask, Dtc.Severity):
+            severity_mask = severity_mask.get_byte_as_int()
+
+        selection: Optional[bytes] = None
+        if status_set or status_clear or status_mask is not None:
+            selection = self.status.tobytes().translate(self._make_byte_filter(status_set, status_clear, status_mask))
+
+        if severity_set or severity_clear or severity_mask is not None:
+            if self.severity is None:
+                raise ValueError('This table has no severity information')
+            severity_selection = self.severity.tobytes().translate(self._make_byte_filter(severity_set, severity_clear, severity_mask))
+            selection = severity_selection if selection is None else bytes(map(operator.and_, selection, severity_selection))
+
+        if selection is None:
+            return self.take(range(len(self.ids)))
+        return self._compress(selection)
+
+    @classmethod
+    def _make_byte_filter(cls, bits_set: int, bits_clear: int, bits_any: Optional[int]) -> bytes:
+        # Translation table mapping every possible byte value to 1 if it matches the condition, 0 otherwise.
+        # Applied with bytes.translate, the whole column is filtered in C.
+        return bytes([1 if (value & bits_set) == bits_set and not (value & bits_clear) and (bits_any is None or value & bits_any) else 0 for value in range(256)])
+
+    def _compress(self, selection: bytes) -> "DtcTable":
+        table = self.__class__()
+        table.ids = array.array(_ID_TYPECODE, itertools.compress(self.ids, selection))
+        table.status = array.array('B', itertools.compress(self.status, selection))
+        if self.severity is not None and self.functional_unit is not None:
+            table.severity = array.array('B', itertools.compress(self.severity, selection))
+            table.functional_unit = array.array('B', itertools.compress(self.functional_unit, selection))
+        return table
+
+    def take(self, indices: Iterable[int]) -> "DtcTable":
+        """Returns a new table with the DTCs at the given positions"""
+        indices = list(indices)
+        table = self.__class__()
+        table.ids = array.array(_ID_TYPECODE, [self.ids[i] for i in indices])
+        table.status = array.array('B', [self.status[i] for i in indices])
+        if self.severity is not None and self.functional_unit is not None:
+            table.severity = array.array('B', [self.severity[i] for i in indices])
+            table.functional_unit = array.array('B', [self.functional_unit[i] for i in indices])
+        return table
+
+    def index(self, dtcid: Union[int, Dtc]) -> int:
+        """Returns the position of a DTC in the table. Raises ``ValueError`` if it is not present"""
+        if isinstance(dtcid, Dtc):
+            dtcid = dtcid.id
+        return self.ids.index(dtcid)
+
+    def get(self, dtcid: Union[int, Dtc]) -> Optional[Dtc]:
+        """Returns the :ref:`Dtc<DTC>` with the given ID, ``None`` if it is not present"""
+        try:
+            return self.make_dtc(self.index(dtcid))
+        except ValueError:
+            return None
+
+    def make_dtc(self, index: int) -> Dtc:
+        """Creates the :ref:`Dtc<DTC>` object of the DTC at the given position"""
+        if self.severity is not None and self.functional_unit is not None:
+            dtc = Dtc(self.ids[index], status=self.status[index], severity=self.severity[index])
+            dtc.functional_unit = self.functional_unit[index]
+            return dtc
+        return Dtc(self.ids[index], status=self.status[index])
+
+    def to_list(self) -> List[Dtc]:
+        """Creates the :ref:`Dtc<DTC>` objects of all the DTCs in the table"""
+        return [self.make_dtc(i) for i in range(len(self.ids))]
+
+    def to_numpy(self) -> Any:
+        """
+        Returns the table as a NumPy structured array with the fields ``id``, ``status`` and, if available, ``severity`` and ``functional_unit``.
+        Requires NumPy to be installed.
+        """
+        try:
+            import numpy    # type: ignore[import-not-found]
+        except ImportError:
+            raise ImportError('numpy must be installed to use DtcTable.to_numpy()')
+
+        fields = [('id', numpy.uint32), ('status', numpy.uint8)]
+        columns = [self.ids, self.status]
+        if self.severity is not None and self.functional_unit is not None:
+            fields += [('severity', numpy.uint8), ('functional_unit', numpy.uint8)]
+            columns += [self.severity, self.functional_unit]
+
+        result = numpy.zeros(len(self.ids), dtype=fields)
+        for (name, _), column in zip(fields, columns):
+            result[name] = numpy.frombuffer(column, dtype=column.typecode)
+        return result
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @overload
+    def __getitem__(self, index: int) -> Dtc: ...
+    @overload
+    def __getitem__(self, index: slice) -> "DtcTable": ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Dtc, "DtcTable"]:
+        if isinstance(index, slice):
+            return self.take(range(len(self.ids))[index])
+        return self.make_dtc(range(len(self.ids))[index])    # Handles negative and out of range indices
+
+    def __iter__(self) -> Iterator[Dtc]:
+        for i in range(len(self.ids)):
+            yield self.make_dtc(i)
+
+    def __contains__(self, dtcid: Any) -> bool:
+        if isinstance(dtcid, Dtc):
+            dtcid = dtcid.id
+        return dtcid in self.ids
+
+    def __repr__(self) -> str:
+        return '<%s: %d DTCs%s at 0x%08x>' % (self.__class__.__name__, len(self.ids), ' with severity' if self.has_severity else '', id(self))
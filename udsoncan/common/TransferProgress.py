@@ -0,0 +1,88 @@
+__all__ = ['TransferProgress']
+
+import time
+
+from typing import Optional
+
+
+class TransferProgress:
+    """
+    Progress of a block transfer made with :meth:`Client.download<udsoncan.client.Client.download>` or :meth:`Client.upload<udsoncan.client.Client.upload>`.
+    The same instance is updated and given to the progress callback after each block.
+
+    .. data:: direction
+
+        Either ``'download'`` (client to server) or ``'upload'`` (server to client)
+
+    .. data:: total
+
+        Number of bytes to transfer. ``None`` if unknown, as with an iterator data source
+
+    .. data:: transferred
+
+        Number of bytes transferred so far
+
+    .. data:: block_count
+
+        Number of TransferData requests completed so far
+
+    .. data:: block_size
+
+        Maximum number of data bytes carried by a single TransferData request
+
+    .. data:: elapsed
+
+        Time in seconds since the beginning of the transfer
+    """
+
+    DOWNLOAD = 'download'
+    UPLOAD = 'upload'
+
+    direction: str
+    total: Optional[int]
+    transferred: int
+    block_count: int
+    block_size: int
+    elapsed: float
+    start_time: float
+
+    def __init__(self, direction: str, block_size: int, total: Optional[int] = None):
+        if direction not in [self.DOWNLOAD, self.UPLOAD]:
+            raise ValueError('direction must be "%s" or "%s"' % (self.DOWNLOAD, self.UPLOAD))
+
+        self.direction = direction
+        self.total = total
+        self.block_size = block_size
+        self.transferred = 0
+        self.block_count = 0
+        self.elapsed = 0
+        self.start_time = time.monotonic()
+
+    def update(self, nbytes: int) -> None:
+        """Records a completed block of ``nbytes`` bytes"""
+        self.transferred += nbytes
+        self.block_count += 1
+        self.elapsed = time.monotonic() - self.start_time
+
+    @property
+    def throughput(self) -> float:
+        """Average number of data bytes transferred per second"""
+        if self.elapsed <= 0:
+            return 0.0
+        return self.transferred / self.elapsed
+
+    @property
+    def ratio(self) -> Optional[float]:
+        """Fraction of the transfer completed, between 0 and 1. ``None`` if the total size is unknown"""
+        if self.total is None:
+            return None
+        if self.total == 0:
+            return 1.0
+        return min(self.transferred / self.total, 1.0)
+
+    def __str__(self) -> str:
+        total_str = '?' if self.total is None else '%d' % self.total
+        return 'TransferProgress<%s %d/%s bytes, %d blocks, %.1f bytes/sec>' % (self.direction, self.transferred, total_str, self.block_count, self.throughput)
+
+    def __repr__(self) -> str:
+        return '<%s at 0x%08x>' % (str(self), id(self))
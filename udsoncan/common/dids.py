@@ -3,16 +3,19 @@ __all__ = [
     'CodecDefinition',
     'check_did_config',
     'fetch_codec_definition_from_config',
-    'make_did_codec_from_definition'
+    'make_did_codec_from_definition',
+    'CompiledDid',
+    'CompiledDidConfig'
 ]
 
 import inspect
+import struct
 from copy import deepcopy
 from udsoncan.exceptions import ConfigError
 from udsoncan.typing import CodecDefinition, DIDConfig, IOConfigEntry
 from udsoncan.common.DidCodec import DidCodec
 
-from typing import Dict, List, Union, Optional, cast
+from typing import Dict, List, Union, Optional, Any, cast
 
 
 class DataIdentifier:
@@ -216,3 +219,80 @@ def make_did_codec_from_definition(didconfig: Union[CodecDefinition, IOConfigEnt
         return DidCodec(packstr=didconfig)
 
     raise ValueError('Given codec of type %s is not a valid DidCodec' % (type(didconfig)))
+
+
+class CompiledDid:
+    """
+    A DID codec definition resolved once and ready to be used for encoding/decoding.
+
+    .. data:: definition
+
+        The codec definition, as found in the configuration, from which this object was built
+
+    .. data:: codec
+
+        The :ref:`DidCodec<DidCodec>` instance made from the definition
+
+    .. data:: compiled_struct
+
+        A precompiled ``struct.Struct`` when the codec is a plain pack string. ``None`` otherwise
+
+    .. data:: length
+
+        The payload length of the DID. ``None`` if the codec reads all the remaining data (``DidCodec.ReadAllRemainingData``)
+    """
+    definition: CodecDefinition
+    codec: DidCodec
+    compiled_struct: Optional[struct.Struct]
+    length: Optional[int]
+
+    def __init__(self, definition: CodecDefinition):
+        self.definition = definition
+        self.codec = make_did_codec_from_definition(definition)
+        self.compiled_struct = None
+        if type(self.codec) is DidCodec and self.codec.packstr is not None:
+            self.compiled_struct = struct.Struct(self.codec.packstr)
+            self.length = self.compiled_struct.size
+        else:
+            try:
+                self.length = len(self.codec)   # May raise
+            except DidCodec.ReadAllRemainingData:
+                self.length = None
+
+    def decode(self, did_payload: bytes) -> Any:
+        if self.compiled_struct is not None:
+            return self.compiled_struct.unpack(did_payload)
+        return self.codec.decode(did_payload)
+
+
+class CompiledDidConfig:
+    """
+    Cache of :class:`CompiledDid<udsoncan.common.dids.CompiledDid>` built from a DID configuration (``config['data_identifiers']``).
+    Each DID is compiled the first time it is needed and reused afterward.
+    A DID is compiled again if its definition in the configuration is replaced.
+
+    :param didconfig: The DID configuration to compile. Dictionary mapping a DID (int) to a valid :ref:`DidCodec<DidCodec>` class, instance or pack/unpack string
+    :type didconfig: dict
+    """
+    didconfig: DIDConfig
+    _entries: Dict[int, CompiledDid]
+
+    def __init__(self, didconfig: Dict):
+        if didconfig is None:
+            raise ConfigError("didconfig is not set")
+        if 'data_identifiers' in didconfig:
+            didconfig = didconfig['data_identifiers']
+        self.didconfig = cast(DIDConfig, didconfig)
+        self._entries = {}
+
+    def get(self, did: int) -> CompiledDid:
+        """Returns the compiled codec of a DID, falling back on the ``'default'`` definition if the DID is not configured.
+
+        :raises ConfigError: If the DID is not defined in the configuration and no default is available
+        """
+        definition = fetch_codec_definition_from_config(did, self.didconfig)
+        entry = self._entries.get(did, None)
+        if entry is None or entry.definition is not definition:
+            entry = CompiledDid(definition)
+            self._entries[did] = entry
+        return entry
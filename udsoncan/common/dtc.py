@@ -1,9 +1,88 @@
 __all__ = ['Dtc']
 
 import struct
-import inspect
 
-from typing import Optional, List, Any, Union
+from typing import Optional, List, Any, Union, Dict, Type, TypeVar, ClassVar
+
+_ByteFlagsType = TypeVar('_ByteFlagsType', bound='_ByteFlags')
+
+
+class _Flag:
+    """A boolean flag stored in one bit of a :class:`_ByteFlags` byte"""
+    __slots__ = ('mask',)
+
+    def __init__(self, mask: int):
+        self.mask = mask
+
+    def __get__(self, instance: Any, owner: Any = None) -> Any:
+        if instance is None:
+            return self
+        return (instance._byte & self.mask) != 0
+
+    def __set__(self, instance: Any, value: Any) -> None:
+        if instance.is_shared():
+            raise AttributeError('Cannot modify a shared %s instance' % instance.__class__.__name__)
+        if value:
+            instance._byte |= self.mask
+        else:
+            instance._byte &= ~self.mask
+
+
+class _ByteFlags:
+    """
+    Base of the flag sets encoded in a single byte (DTC status, severity, class). The byte is the only thing stored in an instance.
+    A read-only instance for each of the 256 byte values is available through ``shared()``. These can be referenced by many objects
+    as long as they are copied before being modified.
+    """
+    __slots__ = ('_byte',)
+
+    _mask: ClassVar[int] = 0xFF
+    _shared_instances: ClassVar[Optional[List[Any]]] = None
+
+    _byte: int
+
+    def get_byte_as_int(self) -> int:  # Returns the byte as an integer
+        return self._byte
+
+    def get_byte(self) -> bytes:  # Returns the byte in "bytes" format for payload creation
+        return struct.pack('B', self._byte)
+
+    def set_byte(self, byte: Union[bytes, int]) -> None:  # Set all the flags from the byte
+        if not isinstance(byte, int) and not isinstance(byte, bytes):
+            raise ValueError('Given byte must be an integer or bytes object.')
+
+        if isinstance(byte, bytes):
+            if len(byte) != 1:
+                raise ValueError("Expected 1 byte to set the DTC Status")
+            byte = int(byte[0])
+
+        if self.is_shared():
+            raise AttributeError('Cannot modify a shared %s instance' % self.__class__.__name__)
+
+        self._byte = byte & self._mask
+
+    @classmethod
+    def from_byte(cls: Type[_ByteFlagsType], byte: Union[bytes, int]) -> _ByteFlagsType:
+        instance = cls()
+        instance.set_byte(byte)
+        return instance
+
+    @classmethod
+    def shared(cls: Type[_ByteFlagsType], byte: int) -> _ByteFlagsType:
+        """Returns the read-only instance interned for the given byte value"""
+        if not isinstance(byte, int) or byte < 0 or byte > 0xFF:
+            raise ValueError('byte must be an integer between 0 and 255')
+        instances = cls.__dict__.get('_shared_instances', None)
+        if instances is None:
+            instances = [cls.from_byte(i) for i in range(256)]
+            instances = [instances[i & cls._mask] for i in range(256)]  # Unused bits are ignored, one instance per value of the used bits
+            cls._shared_instances = instances   # Set after the creation so that from_byte() above makes modifiable instances
+        return instances[byte]
+
+    def is_shared(self) -> bool:
+        """Tells if this instance is one of the read-only interned instances"""
+        instances = self.__class__.__dict__.get('_shared_instances', None)
+        return instances is not None and instances[self._byte] is self
 
 
 class Dtc:
@@ -13,6 +92,12 @@ class Dtc:
     :param dtcid: The 3-byte ID of the DTC
     :type dtcid: int
 
+    :param status: The status byte of the DTC. 0 if not given
+    :type status: int
+
+    :param severity: The severity byte of the DTC. 0 if not given
+    :type severity: int
+
     """
     class Format:
         """
@@ -25,17 +110,23 @@ class Dtc:
         ISO11992_4 = 3
         SAE_J2012_DA_DTCFormat_04 = 4
 
+        _names: Dict[int, str]
+
+        # Builds the lookup table used by get_name. Called once, right after the class creation.
+        @classmethod
+        def _make_lookup_table(cls) -> None:
+            cls._names = {}
+            for name in sorted(dir(cls)):   # ISO15031_6 is given for 0, as inspect.getmembers() order would
+                value = getattr(cls, name)
+                if not name.startswith('__') and isinstance(value, int):
+                    cls._names.setdefault(value, name)
+
         @classmethod
         def get_name(cls, given_id: Optional[int]) -> Optional[str]:
             if given_id is None:
                 return ""
 
-            for member in inspect.getmembers(cls):
-                if isinstance(member[1], int):
-                    if member[1] == given_id:
-                        return member[0]
-
-            return None
+            return cls._names.get(given_id, None)
 
     class FunctionalGroupIdentifiers:
         """
@@ -47,7 +138,7 @@ class Dtc:
 
     # DTC Status byte
     # This byte is an 8-bit flag indicating how much we are sure that a DTC is active.
-    class Status:
+    class Status(_ByteFlags):
         """
         Represents a DTC status which consists of 8 boolean flags (a byte). All flags can be set after instantiation without problems. 
 
@@ -75,15 +166,16 @@ class Dtc:
         :param warning_indicator_requested: Server is not requesting warningIndicator to be active.
         :type warning_indicator_requested: bool
         """
+        __slots__ = ()
 
-        test_failed: bool
-        test_failed_this_operation_cycle: bool
-        pending: bool
-        confirmed: bool
-        test_not_completed_since_last_clear: bool
-        test_failed_since_last_clear: bool
-        test_not_completed_this_operation_cycle: bool
-        warning_indicator_requested: bool
+        test_failed = _Flag(0x01)
+        test_failed_this_operation_cycle = _Flag(0x02)
+        pending = _Flag(0x04)
+        confirmed = _Flag(0x08)
+        test_not_completed_since_last_clear = _Flag(0x10)
+        test_failed_since_last_clear = _Flag(0x20)
+        test_not_completed_this_operation_cycle = _Flag(0x40)
+        warning_indicator_requested = _Flag(0x80)
 
         def __init__(self,
                      test_failed: bool = False,
@@ -94,57 +186,19 @@ class Dtc:
                      test_failed_since_last_clear: bool = False,
                      test_not_completed_this_operation_cycle: bool = False,
                      warning_indicator_requested: bool = False):
-            self.test_failed = test_failed
-            self.test_failed_this_operation_cycle = test_failed_this_operation_cycle
-            self.pending = pending
-            self.confirmed = confirmed
-            self.test_not_completed_since_last_clear = test_not_completed_since_last_clear
-            self.test_failed_since_last_clear = test_failed_since_last_clear
-            self.test_not_completed_this_operation_cycle = test_not_completed_this_operation_cycle
-            self.warning_indicator_requested = warning_indicator_requested
-
-        def get_byte_as_int(self) -> int:  # Returns the status byte as an integer
             byte = 0
-            byte |= 0x1 if self.test_failed else 0
-            byte |= 0x2 if self.test_failed_this_operation_cycle else 0
-            byte |= 0x4 if self.pending else 0
-            byte |= 0x8 if self.confirmed else 0
-            byte |= 0x10 if self.test_not_completed_since_last_clear else 0
-            byte |= 0x20 if self.test_failed_since_last_clear else 0
-            byte |= 0x40 if self.test_not_completed_this_operation_cycle else 0
-            byte |= 0x80 if self.warning_indicator_requested else 0
-
-            return byte
-
-        def get_byte(self) -> bytes:  # Returns the status byte in "bytes" format for payload creation
-            return struct.pack('B', self.get_byte_as_int())
-
-        def set_byte(self, byte: Union[bytes, int]) -> None:  # Set all the status flags from the status byte
-            if not isinstance(byte, int) and not isinstance(byte, bytes):
-                raise ValueError('Given byte must be an integer or bytes object.')
-
-            if isinstance(byte, bytes):
-                if len(byte) != 1:
-                    raise ValueError("Expected 1 byte to set the DTC Status")
-                byte = int(byte[0])
-
-            self.test_failed = True if byte & 0x01 > 0 else False
-            self.test_failed_this_operation_cycle = True if byte & 0x02 > 0 else False
-            self.pending = True if byte & 0x04 > 0 else False
-            self.confirmed = True if byte & 0x08 > 0 else False
-            self.test_not_completed_since_last_clear = True if byte & 0x10 > 0 else False
-            self.test_failed_since_last_clear = True if byte & 0x20 > 0 else False
-            self.test_not_completed_this_operation_cycle = True if byte & 0x40 > 0 else False
-            self.warning_indicator_requested = True if byte & 0x80 > 0 else False
-
-        @classmethod
-        def from_byte(cls, byte: Union[bytes, int]) -> "Dtc.Status":
-            status = cls()
-            status.set_byte(byte)
-            return status
+            byte |= 0x1 if test_failed else 0
+            byte |= 0x2 if test_failed_this_operation_cycle else 0
+            byte |= 0x4 if pending else 0
+            byte |= 0x8 if confirmed else 0
+            byte |= 0x10 if test_not_completed_since_last_clear else 0
+            byte |= 0x20 if test_failed_since_last_clear else 0
+            byte |= 0x40 if test_not_completed_this_operation_cycle else 0
+            byte |= 0x80 if warning_indicator_requested else 0
+            self._byte = byte
 
     # DTC Severity byte, it's a 3-bit indicator telling how serious a trouble code is.
-    class Severity:
+    class Severity(_ByteFlags):
         """
         Represents a DTC severity which consists of 3 boolean flags. All flags can be set after instantiation without problems. 
 
@@ -157,45 +211,19 @@ class Dtc:
         :param check_immediately: This value indicates that the failure requires an immediate check of the vehicle.
         :type check_immediately: bool
         """
+        __slots__ = ()
+        _mask = 0xE0
 
-        maintenance_only: bool
-        check_at_next_exit: bool
-        check_immediately: bool
+        maintenance_only = _Flag(0x20)
+        check_at_next_exit = _Flag(0x40)
+        check_immediately = _Flag(0x80)
 
         def __init__(self, maintenance_only: bool = False, check_at_next_exit: bool = False, check_immediately: bool = False):
-            self.maintenance_only = maintenance_only
-            self.check_at_next_exit = check_at_next_exit
-            self.check_immediately = check_immediately
-
-        def get_byte_as_int(self) -> int:
             byte = 0
-            byte |= 0x20 if self.maintenance_only else 0
-            byte |= 0x40 if self.check_at_next_exit else 0
-            byte |= 0x80 if self.check_immediately else 0
-
-            return byte
-
-        def get_byte(self) -> bytes:
-            return struct.pack('B', self.get_byte_as_int())
-
-        def set_byte(self, byte: Union[bytes, int]) -> None:
-            if not isinstance(byte, int) and not isinstance(byte, bytes):
-                raise ValueError('Given byte must be an integer or bytes object.')
-
-            if isinstance(byte, bytes):
-                if len(byte) != 1:
-                    raise ValueError("Expected 1 byte to set the DTC Status")
-                byte = int(byte[0])
-
-            self.maintenance_only = True if byte & 0x20 > 0 else False
-            self.check_at_next_exit = True if byte & 0x40 > 0 else False
-            self.check_immediately = True if byte & 0x80 > 0 else False
-        
-        @classmethod
-        def from_byte(cls, byte: Union[bytes, int]) -> "Dtc.Severity":
-            severity = cls()
-            severity.set_byte(byte)
-            return severity
+            byte |= 0x20 if maintenance_only else 0
+            byte |= 0x40 if check_at_next_exit else 0
+            byte |= 0x80 if check_immediately else 0
+            self._byte = byte
 
         @property
         def available(self):
@@ -204,18 +232,32 @@ class Dtc:
         # A snapshot data. Not defined by ISO14229 and implementation specific.
     # To read this data, the client must have a DID codec set in its config.
     class Snapshot:
-        record_number: Optional[int] = None
-        did: Optional[int] = None
-        data: Optional[bytes] = None
-        raw_data: Optional[bytes] = b''
+        __slots__ = ('record_number', 'did', 'data', 'raw_data')
+
+        record_number: Optional[int]
+        did: Optional[int]
+        data: Optional[bytes]
+        raw_data: Optional[bytes]
+
+        def __init__(self) -> None:
+            self.record_number = None
+            self.did = None
+            self.data = None
+            self.raw_data = b''
 
     # Extended data. Not defined by ISO14229 and implementation specific
     # Only raw data can be given to user.
     class ExtendedData:
-        record_number: Optional[int] = None
-        raw_data: Optional[bytes] = b''
+        __slots__ = ('record_number', 'raw_data')
 
-    class DtcClass:
+        record_number: Optional[int]
+        raw_data: Optional[bytes]
+
+        def __init__(self) -> None:
+            self.record_number = None
+            self.raw_data = b''
+
+    class DtcClass(_ByteFlags):
         """
         Represents a DTC class information which consists of 5 boolean flags. All flags can be set after instantiation without problems. 
 
@@ -234,12 +276,14 @@ class Dtc:
         :param class4: Bit4: GTR module B Class C definition.
         :type class4: bool
         """
+        __slots__ = ()
+        _mask = 0x1F
 
-        class0: bool
-        class1: bool
-        class2: bool
-        class3: bool
-        class4: bool
+        class0 = _Flag(0x01)
+        class1 = _Flag(0x02)
+        class2 = _Flag(0x04)
+        class3 = _Flag(0x08)
+        class4 = _Flag(0x10)
 
         def __init__(self, 
                      class0: bool = False, 
@@ -248,76 +292,98 @@ class Dtc:
                      class3: bool = False,
                      class4: bool = False
                      ):
-            self.class0 = class0
-            self.class1 = class1
-            self.class2 = class2
-            self.class3 = class3
-            self.class4 = class4
-
-        def get_byte_as_int(self) -> int:
             byte = 0
-            byte |= 0x01 if self.class0 else 0
-            byte |= 0x02 if self.class1 else 0
-            byte |= 0x04 if self.class2 else 0
-            byte |= 0x08 if self.class3 else 0
-            byte |= 0x10 if self.class4 else 0
-
-            return byte
-
-        def get_byte(self) -> bytes:
-            return struct.pack('B', self.get_byte_as_int())
-
-        def set_byte(self, byte: Union[bytes, int]) -> None:
-            if not isinstance(byte, int) and not isinstance(byte, bytes):
-                raise ValueError('Given byte must be an integer or bytes object.')
-
-            if isinstance(byte, bytes):
-                if len(byte) != 1:
-                    raise ValueError("Expected 1 byte to set the DTC Status")
-                byte = int(byte[0])
-
-            self.class0 = True if byte & 0x01 > 0 else False
-            self.class1 = True if byte & 0x02 > 0 else False
-            self.class2 = True if byte & 0x04 > 0 else False
-            self.class3 = True if byte & 0x08 > 0 else False
-            self.class4 = True if byte & 0x10 > 0 else False
+            byte |= 0x01 if class0 else 0
+            byte |= 0x02 if class1 else 0
+            byte |= 0x04 if class2 else 0
+            byte |= 0x08 if class3 else 0
+            byte |= 0x10 if class4 else 0
+            self._byte = byte
 
         @property
         def available(self):
             return True if self.get_byte_as_int() > 0 else False
 
-        @classmethod
-        def from_byte(cls, byte: Union[bytes, int]) -> "Dtc.DtcClass":
-            dtc_class = cls()
-            dtc_class.set_byte(byte)
-            return dtc_class
+    # Status, severity and class start as shared read-only instances (see _ByteFlags.shared) and are copied the first time they are accessed,
+    # so that the DTCs that are never looked at cost a pointer for each of them. Snapshot and extended data lists are created on first access.
+    __slots__ = ('id', '_status', '_severity', '_dtc_class', '_snapshots', '_extended_data', 'functional_unit', 'fault_counter')
 
     id: int
-    status: "Dtc.Status"
-    snapshots: List[Union["Dtc.Snapshot", int]]
-    extended_data: List["Dtc.ExtendedData"]
-    severity: "Dtc.Severity"
-    dtc_class:"Dtc.DtcClass"
+    _status: "Dtc.Status"
+    _severity: "Dtc.Severity"
+    _dtc_class: "Dtc.DtcClass"
+    _snapshots: Optional[List[Union["Dtc.Snapshot", int]]]
+    _extended_data: Optional[List["Dtc.ExtendedData"]]
     functional_unit: Any
     fault_counter: Optional[int]
 
-    def __init__(self, dtcid: int):
+    def __init__(self, dtcid: int, status: Optional[int] = None, severity: Optional[int] = None):
         self.id = dtcid
-        self.status = Dtc.Status()
-        self.snapshots = []  		# . DID codec must be configured
-        self.extended_data = []
-        self.severity = Dtc.Severity()
-        self.dtc_class = Dtc.DtcClass()
+        self._status = Dtc.Status.shared(0 if status is None else status)
+        self._severity = Dtc.Severity.shared(0 if severity is None else severity)
+        self._dtc_class = Dtc.DtcClass.shared(0)
+        self._snapshots = None  		# . DID codec must be configured
+        self._extended_data = None
         self.functional_unit = None 	# Implementation specific (ISO 14229 D.4)
         # Common practice is to detect a specific failure many times before setting the DTC active. This counter should tell the actual count.
         self.fault_counter = None
 
+    @property
+    def status(self) -> "Dtc.Status":
+        if self._status.is_shared():
+            self._status = Dtc.Status.from_byte(self._status.get_byte_as_int())
+        return self._status
+
+    @status.setter
+    def status(self, status: "Dtc.Status") -> None:
+        self._status = status
+
+    @property
+    def severity(self) -> "Dtc.Severity":
+        if self._severity.is_shared():
+            self._severity = Dtc.Severity.from_byte(self._severity.get_byte_as_int())
+        return self._severity
+
+    @severity.setter
+    def severity(self, severity: "Dtc.Severity") -> None:
+        self._severity = severity
+
+    @property
+    def dtc_class(self) -> "Dtc.DtcClass":
+        if self._dtc_class.is_shared():
+            self._dtc_class = Dtc.DtcClass.from_byte(self._dtc_class.get_byte_as_int())
+        return self._dtc_class
+
+    @dtc_class.setter
+    def dtc_class(self, dtc_class: "Dtc.DtcClass") -> None:
+        self._dtc_class = dtc_class
+
+    @property
+    def snapshots(self) -> List[Union["Dtc.Snapshot", int]]:
+        if self._snapshots is None:
+            self._snapshots = []
+        return self._snapshots
+
+    @snapshots.setter
+    def snapshots(self, snapshots: List[Union["Dtc.Snapshot", int]]) -> None:
+        self._snapshots = snapshots
+
+    @property
+    def extended_data(self) -> List["Dtc.ExtendedData"]:
+        if self._extended_data is None:
+            self._extended_data = []
+        return self._extended_data
+
+    @extended_data.setter
+    def extended_data(self, extended_data: List["Dtc.ExtendedData"]) -> None:
+        self._extended_data = extended_data
+
     def __repr__(self) -> str:
         return '<DTC ID=0x%06x, Status=0x%02x, Severity=0x%02x, class=%02x at 0x%08x>' % (
             self.id, 
-            self.status.get_byte_as_int(), 
-            self.severity.get_byte_as_int(), 
-            self.dtc_class.get_byte_as_int(),  
+            self._status.get_byte_as_int(), 
+            self._severity.get_byte_as_int(), 
+            self._dtc_class.get_byte_as_int(),  
             id(self)
             )
 
@@ -328,3 +394,6 @@ class Dtc:
             (self.id >> 8) & 0xFFF,
             (self.id) & 0xFF
         )
+
+
+Dtc.Format._make_lookup_table()
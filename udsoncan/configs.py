@@ -10,6 +10,7 @@ default_client_config: ClientConfig = cast(ClientConfig, {
     'security_algo_params': None,
     'tolerate_zero_padding': True,
     'ignore_all_zero_dtc': True,
+    'use_dtc_table': False,
     'dtc_snapshot_did_size': 2,		# Not specified in standard. 2 bytes matches other services format.
     'server_address_format': None,		# 8,16,24,32,40
     'server_memorysize_format': None,		# 8,16,24,32,40
@@ -21,5 +22,8 @@ default_client_config: ClientConfig = cast(ClientConfig, {
     'standard_version': latest_standard,  # 2006, 2013, 2020
     'use_server_timing': True,
     'extended_data_size': None,
-    'nrc78_callback':None
+    'nrc78_callback':None,
+    'rdbi_max_response_size': None,    # None : Use the connection MTU if known, 4095 otherwise
+    'rdbi_max_did_per_request': None,
+    'did_cache': {}     # DID : time to live in seconds or 'static'
 })
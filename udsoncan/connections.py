@@ -1,5 +1,6 @@
 import socket
 import queue
+import asyncio
 import threading
 import logging
 import binascii
@@ -9,6 +10,8 @@ import time
 from typing import Union, Dict
 import ctypes
 import selectors
+import select
+import collections
 
 try:
     import can  # type:ignore
@@ -37,9 +40,11 @@ except Exception as e:
 from udsoncan.Request import Request
 from udsoncan.Response import Response
 from udsoncan.exceptions import TimeoutException
+from udsoncan.capture import CaptureReader, CaptureRecord, CaptureWriter
+from udsoncan.typing import BytesLike
 
 
-from typing import Optional, Tuple, cast
+from typing import Optional, Tuple, cast, Iterable, List, Deque, Any, Callable, Set
 
 
 class BaseConnection(ABC):
@@ -55,22 +60,26 @@ class BaseConnection(ABC):
 
         self.logger = logging.getLogger(self.name)
 
-    def send(self, data: Union[bytes, Request, Response], timeout: Optional[float] = None) -> None:
+    def send(self, data: Union[bytes, bytearray, memoryview, Request, Response], timeout: Optional[float] = None) -> None:
         """Sends data to the underlying transport protocol
 
         :param data: The data or object to send. If a Request or Response is given, the value returned by get_payload() will be sent.
-        :type data: bytes, Request, Response
+            A ``bytearray`` or a ``memoryview`` is given as is to the transport protocol, without copy. The connections that keep the data
+            after ``send`` returns, such as the :class:`QueueConnection<udsoncan.connections.QueueConnection>`, store a ``bytes`` copy.
+        :type data: bytes, bytearray, memoryview, Request, Response
 
         :returns: None
         """
         self.check_connection_opened()
 
+        payload: BytesLike
         if isinstance(data, Request) or isinstance(data, Response):
             payload = data.get_payload()
         else:
             payload = data
 
-        self.logger.debug('Sending %d bytes : [%s]' % (len(payload), binascii.hexlify(payload).decode('ascii')))
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug('Sending %d bytes : [%s]' % (len(payload), binascii.hexlify(payload).decode('ascii')))
 
         # backward compatibility
         if 'timeout' in self.specific_send.__code__.co_varnames:
@@ -82,7 +91,7 @@ class BaseConnection(ABC):
         if not self.is_open():
             raise RuntimeError(self.__class__.__name__ + ' is not opened')
 
-    def wait_frame(self, timeout: Optional[float] = None, exception: bool = False) -> Optional[bytes]:
+    def wait_frame(self, timeout: Optional[float] = None, exception: bool = False) -> Optional[BytesLike]:
         """Waits for the reception of a frame of data from the underlying transport protocol
 
         :param timeout: The maximum amount of time to wait before giving up in seconds
@@ -92,8 +101,9 @@ class BaseConnection(ABC):
                 When ``False``, all exceptions will be logged as ``DEBUG`` and ``None`` will be returned.
         :type exception: bool
 
-        :returns: Received data
-        :rtype: bytes or None
+        :returns: Received data. A connection reading in a reused buffer, such as a socket connection in direct mode, gives a ``memoryview`` 
+            valid until the next call
+        :rtype: bytes, memoryview or None
         """
         self.check_connection_opened()
 
@@ -107,7 +117,7 @@ class BaseConnection(ABC):
             else:
                 frame = None
 
-        if frame is not None:
+        if frame is not None and self.logger.isEnabledFor(logging.DEBUG):
             self.logger.debug('Received %d bytes : [%s]' % (len(frame), binascii.hexlify(frame).decode('ascii')))
         return frame
 
@@ -115,25 +125,25 @@ class BaseConnection(ABC):
         return self
 
     @abstractmethod
-    def specific_send(self, payload: bytes, timeout: Optional[float] = None) -> None:
+    def specific_send(self, payload: BytesLike, timeout: Optional[float] = None) -> None:
         """The implementation of the send method.
 
         :param payload: Data to send
-        :type payload: bytes
+        :type payload: bytes, bytearray or memoryview
 
         :returns: None
         """
         pass
 
     @abstractmethod
-    def specific_wait_frame(self, timeout: Optional[float] = None) -> Optional[bytes]:
+    def specific_wait_frame(self, timeout: Optional[float] = None) -> Optional[BytesLike]:
         """The implementation of the ``wait_frame`` method. 
 
         :param timeout: The maximum amount of time to wait before giving up
         :type timeout: float
 
         :returns: Received data
-        :rtype: bytes or None
+        :rtype: bytes, bytearray, memoryview or None
         """
         pass
 
@@ -173,6 +183,197 @@ class BaseConnection(ABC):
         pass
 
 
+class WakeupPipe:
+    """
+    Lets a thread blocked on a selector be woken up by another thread. 
+    Made of a connected pair of sockets, which can be registered in a selector on all platforms.
+    """
+
+    def __init__(self):
+        self.rsock, self.wsock = socket.socketpair()
+        self.rsock.setblocking(False)
+        self.wsock.setblocking(False)
+
+    def fileno(self) -> int:
+        return self.rsock.fileno()
+
+    def wakeup(self) -> None:
+        try:
+            self.wsock.send(b'\x00')
+        except OSError:
+            pass    # Buffer full. A wake-up is already pending
+
+    def drain(self) -> None:
+        try:
+            while self.rsock.recv(4096):
+                pass
+        except OSError:
+            pass
+
+    def close(self) -> None:
+        self.rsock.close()
+        self.wsock.close()
+
+
+class DirectSocketReader:
+    """
+    Receives the frames of a socket in the thread waiting for them, without a reading thread nor a queue. 
+    Frames are received in a preallocated buffer and returned as a ``memoryview`` on that buffer, valid until the next call to ``recv``.
+    The timeout of the socket is changed to the timeout given to ``recv``, unless it is zero. The original one is restored by ``close``.
+    """
+
+    def __init__(self, sock: socket.socket, bufsize: int):
+        self.sock = sock
+        self.buffer = bytearray(bufsize)
+        self.view = memoryview(self.buffer)
+        self.stream = sock.type == socket.SOCK_STREAM
+        self.original_timeout = sock.gettimeout()
+        self.timeout = self.original_timeout
+
+    def _set_timeout(self, timeout: Optional[float]) -> None:
+        # settimeout() makes system calls. Most calls use the same timeout as the previous one
+        if timeout != self.timeout:
+            self.sock.settimeout(timeout)
+            self.timeout = timeout
+
+    def recv(self, timeout: Optional[float]) -> Optional[memoryview]:
+        if timeout is not None and timeout <= 0:
+            # A zero timeout would make the socket non-blocking and a following send() could fail. select() polls it instead, as drain() does
+            if len(select.select([self.sock], [], [], 0)[0]) == 0:
+                return None
+        else:
+            self._set_timeout(timeout)
+        try:
+            size = self.sock.recv_into(self.buffer)
+        except (socket.timeout, BlockingIOError):
+            return None
+        if size == 0 and self.stream:
+            raise ConnectionError('Connection closed by peer')
+        return self.view[:size]
+
+    def drain(self) -> None:
+        # select() is used instead of a non-blocking socket so that a send() following the drain is not affected
+        while len(select.select([self.sock], [], [], 0)[0]) > 0:
+            if self.sock.recv_into(self.buffer) == 0 and self.stream:
+                break
+
+    def close(self) -> None:
+        self._set_timeout(self.original_timeout)
+
+
+class SocketReactor:
+    """
+    Reads the sockets of many :class:`SocketConnection<udsoncan.connections.SocketConnection>` and :class:`IsoTPSocketConnection<udsoncan.connections.IsoTPSocketConnection>`
+    with a single thread and a single selector (epoll on Linux) instead of a thread per connection. The data received is put in the queue of each connection,
+    so a connection behaves the same way with or without a reactor.
+
+    A connection uses the reactor given to its constructor. The thread starts when the first connection is opened and runs until
+    :meth:`close<udsoncan.connections.SocketReactor.close>` is called. Closing a connection removes its socket from the selector right away,
+    the thread is woken up and does not wait for a timeout.
+
+    :param name: This name is included in the logger name so that its output can be redirected. The logger name will be ``SocketReactor[<name>]``
+    :type name: string
+    """
+
+    logger: logging.Logger
+    rxthread: Optional[threading.Thread]
+    wakeup_pipe: Optional[WakeupPipe]
+    _fileobjs: Set[Any]
+    _pending: Deque[Tuple[Any, Optional[Callable[[], None]], Optional[threading.Event]]]
+
+    def __init__(self, name: Optional[str] = None):
+        self.logger = logging.getLogger('SocketReactor' if name is None else 'SocketReactor[%s]' % name)
+        self.rxthread = None
+        self.wakeup_pipe = None
+        self._fileobjs = set()
+        self._pending = collections.deque()
+        self._lock = threading.Lock()
+
+    @property
+    def connection_count(self) -> int:
+        """Number of sockets being read"""
+        return len(self._fileobjs)
+
+    def _register(self, fileobj: Any, callback: Callable[[], None]) -> None:
+        # The selector is only touched by the reactor thread. Registrations are queued and the thread is woken up to apply them.
+        with self._lock:
+            self._fileobjs.add(fileobj)
+            self._pending.append((fileobj, callback, None))
+            if self.rxthread is None:
+                self.wakeup_pipe = WakeupPipe()
+                self.rxthread = threading.Thread(target=self.rxthread_task, args=(self.wakeup_pipe, self._pending), daemon=True)
+                self.rxthread.start()
+                self.logger.info('Reactor thread started')
+            elif self.wakeup_pipe is not None:
+                self.wakeup_pipe.wakeup()
+
+    def _unregister(self, fileobj: Any) -> None:
+        # Returns once the callback of the socket can no longer be called, unless called from the reactor thread itself.
+        done = threading.Event()
+        with self._lock:
+            if fileobj not in self._fileobjs or self.rxthread is None:
+                return
+            self._fileobjs.discard(fileobj)
+            self._pending.append((fileobj, None, done))
+            if self.wakeup_pipe is not None:
+                self.wakeup_pipe.wakeup()
+            thread = self.rxthread
+        if thread is not threading.current_thread():
+            done.wait()
+
+    def close(self) -> None:
+        """Stops the thread. The connections using the reactor should be closed first, as their sockets are no longer read."""
+        with self._lock:
+            thread = self.rxthread
+            wakeup_pipe = self.wakeup_pipe
+            self.rxthread = None
+            self.wakeup_pipe = None
+            self._fileobjs = set()
+            self._pending = collections.deque()     # The stopping thread keeps the old one
+        if thread is not None and wakeup_pipe is not None:
+            wakeup_pipe.wakeup()
+            if thread is not threading.current_thread():
+                thread.join()
+            self.logger.info('Reactor thread stopped')
+
+    def _apply_pending(self, sel: selectors.BaseSelector, pending: Deque[Tuple[Any, Optional[Callable[[], None]], Optional[threading.Event]]]) -> None:
+        while len(pending) > 0:
+            fileobj, callback, done = pending.popleft()
+            try:
+                if callback is not None:
+                    sel.register(fileobj, selectors.EVENT_READ, callback)
+                else:
+                    sel.unregister(fileobj)
+            except (KeyError, ValueError, OSError) as e:
+                self.logger.debug('Cannot %s socket. %s: %s' % ('register' if callback is not None else 'unregister', e.__class__.__name__, str(e)))
+            if done is not None:
+                done.set()
+
+    def rxthread_task(self, wakeup_pipe: WakeupPipe, pending: Deque[Tuple[Any, Optional[Callable[[], None]], Optional[threading.Event]]]) -> None:
+        sel = selectors.DefaultSelector()
+        sel.register(wakeup_pipe, selectors.EVENT_READ)
+        while self.rxthread is threading.current_thread():
+            self._apply_pending(sel, pending)
+            # No timeout. Closing a connection or the reactor wakes up the thread through the wakeup pipe
+            for key, mask in sel.select():
+                if key.fileobj is wakeup_pipe:
+                    wakeup_pipe.drain()
+                    continue
+                try:
+                    key.data()
+                except Exception as e:
+                    # Stop reading that socket, like the thread of a connection would do, without affecting the other ones.
+                    self.logger.error('%s: %s' % (e.__class__.__name__, str(e)))
+                    sel.unregister(key.fileobj)
+
+        self._apply_pending(sel, pending)   # Releases the threads waiting in _unregister()
+        sel.close()
+        wakeup_pipe.close()
+
+    def __repr__(self) -> str:
+        return '<%s: %s with %d sockets at 0x%08x>' % (self.__class__.__name__, self.logger.name, len(self._fileobjs), id(self))
+
+
 class SocketConnection(BaseConnection):
     """
     Sends and receives data through a socket.
@@ -183,6 +384,12 @@ class SocketConnection(BaseConnection):
     :type bufsize: int
     :param name: This name is included in the logger name so that its output can be redirected. The logger name will be ``Connection[<name>]``
     :type name: string
+    :param reactor: A reactor that reads the socket instead of a thread of this connection. See :class:`SocketReactor<udsoncan.connections.SocketReactor>`
+    :type reactor: :class:`SocketReactor<udsoncan.connections.SocketReactor>`
+    :param direct: When ``True``, no thread reads the socket. ``wait_frame`` receives the frame itself with ``recv_into``, in a buffer allocated once, and returns a ``memoryview`` 
+        on that buffer that is valid until the next call to ``wait_frame``. This saves a thread switch per frame. The timeout of the socket is changed while the connection is opened.
+        The :ref:`Client<Client>` copies each frame it keeps in a response, so only the direct callers of ``wait_frame`` get the view.
+    :type direct: bool
 
     """
 
@@ -190,23 +397,39 @@ class SocketConnection(BaseConnection):
     exit_requested: bool
     opened: bool
     rxthread: Optional[threading.Thread]
+    wakeup_pipe: Optional[WakeupPipe]
+    reactor: Optional[SocketReactor]
+    direct: bool
+    direct_reader: Optional[DirectSocketReader]
     sock: socket.socket
     bufsize: int
 
-    def __init__(self, sock: socket.socket, bufsize: int = 4095, name: Optional[str] = None):
+    def __init__(self, sock: socket.socket, bufsize: int = 4095, name: Optional[str] = None, reactor: Optional[SocketReactor] = None, direct: bool = False):
         BaseConnection.__init__(self, name)
+        if direct and reactor is not None:
+            raise ValueError('A direct connection cannot use a reactor')
 
         self.rxqueue = queue.Queue()
         self.exit_requested = False
         self.opened = False
         self.rxthread = None
+        self.wakeup_pipe = None
+        self.reactor = reactor
+        self.direct = direct
+        self.direct_reader = None
         self.sock = sock
         self.bufsize = bufsize
 
     def open(self) -> "SocketConnection":
         self.exit_requested = False
-        self.rxthread = threading.Thread(target=self.rxthread_task, daemon=True)
-        self.rxthread.start()
+        if self.direct:
+            self.direct_reader = DirectSocketReader(self.sock, self.bufsize)
+        elif self.reactor is not None:
+            self.reactor._register(self.sock, self._read_ready)
+        else:
+            self.wakeup_pipe = WakeupPipe()
+            self.rxthread = threading.Thread(target=self.rxthread_task, daemon=True)
+            self.rxthread.start()
         self.opened = True
         self.logger.info('Connection opened')
         return self
@@ -223,36 +446,63 @@ class SocketConnection(BaseConnection):
     def rxthread_task(self) -> None:
         sel = selectors.DefaultSelector()
         sel.register(self.sock, selectors.EVENT_READ)
+        if self.wakeup_pipe is not None:
+            sel.register(self.wakeup_pipe, selectors.EVENT_READ)
         while not self.exit_requested:
             try:
-                events = sel.select(timeout=0.2)
-                if events:
-                    data = self.sock.recv(self.bufsize)
-                    if data is not None:
-                        self.rxqueue.put(data)
+                # No timeout. close() wakes up the thread through the wakeup pipe
+                for key, mask in sel.select():
+                    if key.fileobj is self.sock:
+                        self._read_ready()
             except Exception:
                 self.exit_requested = True
+        sel.close()
+
+    def _read_ready(self) -> None:
+        data = self.sock.recv(self.bufsize)
+        if not data and self.sock.type == socket.SOCK_STREAM:
+            raise ConnectionError('Connection closed by peer')   # The socket would stay readable forever
+        if data is not None:
+            self.rxqueue.put(data)
 
     def close(self) -> None:
         self.exit_requested = True
+        if self.reactor is not None:
+            self.reactor._unregister(self.sock)
+        if self.direct_reader is not None:
+            self.direct_reader.close()
+            self.direct_reader = None
+        if self.wakeup_pipe is not None:
+            self.wakeup_pipe.wakeup()
         if self.rxthread is not None:
             self.rxthread.join()
+        if self.wakeup_pipe is not None:
+            self.wakeup_pipe.close()
+            self.wakeup_pipe = None
         self.opened = False
         self.logger.info('Connection closed')
 
-    def specific_send(self, payload: bytes, timeout: Optional[float] = None) -> None:
+    def specific_send(self, payload: BytesLike, timeout: Optional[float] = None) -> None:
         # timeout not used for generic sockets
         self.sock.send(payload)
 
-    def specific_wait_frame(self, timeout: Optional[float] = None) -> Optional[bytes]:
+    def specific_wait_frame(self, timeout: Optional[float] = None) -> Optional[Union[bytes, memoryview]]:
         self.check_connection_opened()
 
+        if self.direct_reader is not None:
+            frame = self.direct_reader.recv(timeout)
+            if frame is None:
+                raise TimeoutException("Did not received frame in time (timeout=%s sec)" % timeout)
+            return frame
+
         try:
             return self.rxqueue.get(block=True, timeout=timeout)
         except queue.Empty:
             raise TimeoutException("Did not received frame in time (timeout=%s sec)" % timeout)
 
     def empty_rxqueue(self) -> None:
+        if self.direct_reader is not None:
+            self.direct_reader.drain()
         while not self.rxqueue.empty():
             self.rxqueue.get()
 
@@ -270,30 +520,51 @@ class IsoTPSocketConnection(BaseConnection):
     :type name: string
     :param tpsock: An optional ISO-TP socket to use instead of creating one.
     :type tpsock: isotp.socket
+    :param reactor: A reactor that reads the socket instead of a thread of this connection. See :class:`SocketReactor<udsoncan.connections.SocketReactor>`
+    :type reactor: :class:`SocketReactor<udsoncan.connections.SocketReactor>`
+    :param direct: When ``True``, no thread reads the socket. ``wait_frame`` receives the frame itself and returns a ``memoryview`` valid until the next call to ``wait_frame``.
+        See :class:`SocketConnection<udsoncan.connections.SocketConnection>`
+    :type direct: bool
 
     """
 
+    DIRECT_BUFFER_SIZE = 65536     # Larger than any ISO-TP frame the kernel module can be configured to receive
+
     interface: str
     address: Union["isotp.Address", "isotp.AsymmetricAddress"]
     rxqueue: "queue.Queue[bytes]"
     exit_requested: bool
     opened: bool
+    rxthread: Optional[threading.Thread]
+    wakeup_pipe: Optional[WakeupPipe]
+    reactor: Optional[SocketReactor]
+    direct: bool
+    direct_reader: Optional[DirectSocketReader]
 
     def __init__(self,
                  interface: str,
                  address: Union["isotp.Address", "isotp.AsymmetricAddress"],
                  name: Optional[str] = None,
                  tpsock: Optional["isotp.socket"] = None,
+                 reactor: Optional[SocketReactor] = None,
+                 direct: bool = False,
                  **kwargs
                  ):
 
         BaseConnection.__init__(self, name)
+        if direct and reactor is not None:
+            raise ValueError('A direct connection cannot use a reactor')
 
         self.interface = interface
         self.address = address
         self.rxqueue = queue.Queue()
         self.exit_requested = False
         self.opened = False
+        self.rxthread = None
+        self.wakeup_pipe = None
+        self.reactor = reactor
+        self.direct = direct
+        self.direct_reader = None
 
         # Lives with the past.
         if 'txid' in kwargs or 'rxid' in kwargs:
@@ -313,8 +584,14 @@ class IsoTPSocketConnection(BaseConnection):
     def open(self) -> "IsoTPSocketConnection":
         self.tpsock.bind(self.interface, address=self.address)
         self.exit_requested = False
-        self.rxthread = threading.Thread(target=self.rxthread_task, daemon=True)
-        self.rxthread.start()
+        if self.direct:
+            self.direct_reader = DirectSocketReader(self.tpsock._socket, self.DIRECT_BUFFER_SIZE)
+        elif self.reactor is not None:
+            self.reactor._register(self.tpsock._socket, self._read_ready)
+        else:
+            self.wakeup_pipe = WakeupPipe()
+            self.rxthread = threading.Thread(target=self.rxthread_task, daemon=True)
+            self.rxthread.start()
         self.opened = True
         self.logger.info('Connection opened')
         return self
@@ -331,36 +608,61 @@ class IsoTPSocketConnection(BaseConnection):
     def rxthread_task(self) -> None:
         sel = selectors.DefaultSelector()
         sel.register(self.tpsock._socket, selectors.EVENT_READ)
+        if self.wakeup_pipe is not None:
+            sel.register(self.wakeup_pipe, selectors.EVENT_READ)
         while not self.exit_requested:
             try:
-                events = sel.select(timeout=0.2)
-                if events:
-                    data = self.tpsock.recv()
-                    if data is not None:
-                        self.rxqueue.put(data)
+                # No timeout. close() wakes up the thread through the wakeup pipe
+                for key, mask in sel.select():
+                    if key.fileobj is self.tpsock._socket:
+                        self._read_ready()
             except Exception:
                 self.exit_requested = True
+        sel.close()
+
+    def _read_ready(self) -> None:
+        data = self.tpsock.recv()
+        if data is not None:
+            self.rxqueue.put(data)
 
     def close(self) -> None:
         self.exit_requested = True
+        if self.reactor is not None:
+            self.reactor._unregister(self.tpsock._socket)
+        if self.direct_reader is not None:
+            self.direct_reader.close()
+            self.direct_reader = None
+        if self.wakeup_pipe is not None:
+            self.wakeup_pipe.wakeup()
         if self.rxthread is not None:
             self.rxthread.join()
+        if self.wakeup_pipe is not None:
+            self.wakeup_pipe.close()
+            self.wakeup_pipe = None
         self.tpsock.close()
         self.opened = False
         self.logger.info('Connection closed')
 
-    def specific_send(self, payload: bytes, timeout: Optional[float] = None) -> None:
+    def specific_send(self, payload: BytesLike, timeout: Optional[float] = None) -> None:
         self.tpsock.send(payload)
 
-    def specific_wait_frame(self, timeout: Optional[float] = None) -> Optional[bytes]:
+    def specific_wait_frame(self, timeout: Optional[float] = None) -> Optional[Union[bytes, memoryview]]:
         self.check_connection_opened()
 
+        if self.direct_reader is not None:
+            frame = self.direct_reader.recv(timeout)
+            if frame is None:
+                raise TimeoutException("Did not received ISOTP frame in time (timeout=%s sec)" % timeout)
+            return frame
+
         try:
             return self.rxqueue.get(block=True, timeout=timeout)
         except queue.Empty:
             raise TimeoutException("Did not received ISOTP frame in time (timeout=%s sec)" % timeout)
 
     def empty_rxqueue(self) -> None:
+        if self.direct_reader is not None:
+            self.direct_reader.drain()
         while not self.rxqueue.empty():
             self.rxqueue.get()
 
@@ -377,7 +679,7 @@ class QueueConnection(BaseConnection):
     Sends and receives data using 2 Python native queues.
 
     - ``MyConnection.fromuserqueue`` : Data read from this queue when ``wait_frame`` is called
-    - ``MyConnection.touserqueue`` : Data written to this queue when ``send`` is called
+    - ``MyConnection.touserqueue`` : Data written to this queue when ``send`` is called, always as ``bytes``
 
     :param mtu: Optional maximum frame size. Messages will be truncated to this size
     :type mtu: int
@@ -418,13 +720,14 @@ class QueueConnection(BaseConnection):
         self.opened = False
         self.logger.info('Connection closed')
 
-    def specific_send(self, payload: bytes, timeout: Optional[float] = None) -> None:
+    def specific_send(self, payload: BytesLike, timeout: Optional[float] = None) -> None:
         if self.mtu is not None:
             if len(payload) > self.mtu:
                 self.logger.warning("Truncating payload to be set to a length of %d" % (self.mtu))
                 payload = payload[0:self.mtu]
 
-        self.touserqueue.put(payload, block=True, timeout=timeout)
+        # The other end reads the payload later. A mutable buffer could be reused by the sender in the meantime
+        self.touserqueue.put(bytes(payload), block=True, timeout=timeout)
 
     def specific_wait_frame(self, timeout: Optional[float] = None) -> Optional[bytes]:
         self.check_connection_opened()
@@ -451,6 +754,199 @@ class QueueConnection(BaseConnection):
             self.touserqueue.get()
 
 
+class RecorderConnection(BaseConnection):
+    """
+    Wraps another connection and records every payload sent and received in a binary capture file, with a timestamp and a direction.
+    Recording costs much less than the hexadecimal payloads logged by connections at the ``DEBUG`` level, and the capture is read back with
+    a :class:`CaptureReader<udsoncan.capture.CaptureReader>`.
+
+    :param conn: The connection used to talk to the server
+    :type conn: :ref:`Connection<Connection>`
+
+    :param capture: The capture writer or the name of the file to create. A writer created from a file name is closed with the connection
+    :type capture: :class:`CaptureWriter<udsoncan.capture.CaptureWriter>` or str
+
+    :param compress: Compress the capture file, when a file name is given
+    :type compress: bool
+
+    :param name: This name is included in the logger name so that its output can be redirected. The logger name will be ``Connection[<name>]``
+    :type name: string
+    """
+
+    conn: BaseConnection
+    capture: CaptureWriter
+    _owns_capture: bool
+
+    def __init__(self, conn: BaseConnection, capture: Union[CaptureWriter, str], compress: bool = False, name: Optional[str] = None):
+        BaseConnection.__init__(self, name)
+        self.conn = conn
+        if isinstance(capture, CaptureWriter):
+            self.capture = capture
+            self._owns_capture = False
+        else:
+            self.capture = CaptureWriter(capture, compress=compress)
+            self._owns_capture = True
+
+    def open(self) -> "RecorderConnection":
+        self.conn.open()
+        return self
+
+    def __enter__(self) -> "RecorderConnection":
+        return self
+
+    def __exit__(self, type, value, traceback) -> None:
+        self.close()
+
+    def is_open(self) -> bool:
+        return self.conn.is_open()
+
+    def close(self) -> None:
+        self.conn.close()
+        if self._owns_capture:
+            self.capture.close()
+        else:
+            self.capture.flush()
+
+    def specific_send(self, payload: BytesLike, timeout: Optional[float] = None) -> None:
+        self.capture.write(CaptureRecord.TX, payload)
+        self.conn.send(payload, timeout=timeout)
+
+    def specific_wait_frame(self, timeout: Optional[float] = None) -> Optional[BytesLike]:
+        frame = self.conn.wait_frame(timeout=timeout, exception=True)
+        if frame is not None:
+            self.capture.write(CaptureRecord.RX, frame)
+        return frame
+
+    def empty_rxqueue(self) -> None:
+        self.conn.empty_rxqueue()
+
+
+class ReplayConnection(BaseConnection):
+    """
+    Plays back a recorded trace in place of a server, for tests and benchmarks of the client without hardware.
+    Each payload sent must match the next request of the trace. The responses recorded after that request, including the NRC 0x78 (ResponsePending) 
+    responses, are then returned by ``wait_frame``.
+
+    When no recorded response is left for the current request, ``wait_frame`` raises a ``TimeoutException``, 
+    right away or after the timeout when the original timing is used.
+
+    :param trace: A capture file written by a :class:`RecorderConnection<udsoncan.connections.RecorderConnection>` or the records of the trace
+    :type trace: str or list of :class:`CaptureRecord<udsoncan.capture.CaptureRecord>`
+
+    :param realtime: When ``True``, each response is returned with the delay it had after the request in the trace. When ``False``, responses are returned without delay
+    :type realtime: bool
+
+    :param loop: Starts over at the beginning of the trace after the last request
+    :type loop: bool
+
+    :param check_requests: Raises a ``ValueError`` when a payload sent does not match the recorded request
+    :type check_requests: bool
+
+    :param name: This name is included in the logger name so that its output can be redirected. The logger name will be ``Connection[<name>]``
+    :type name: string
+    """
+
+    realtime: bool
+    loop: bool
+    check_requests: bool
+    position: int
+    opened: bool
+    _exchanges: List[Tuple[bytes, List[Tuple[float, bytes]]]]     # (request, [(delay after the request, response), ...])
+    _pending: Deque[Tuple[float, bytes]]
+
+    def __init__(self, trace: Union[str, Iterable[CaptureRecord]], realtime: bool = False, loop: bool = False, check_requests: bool = True, name: Optional[str] = None):
+        BaseConnection.__init__(self, name)
+        self.realtime = realtime
+        self.loop = loop
+        self.check_requests = check_requests
+        self.position = 0
+        self.opened = False
+        self._pending = collections.deque()
+
+        if isinstance(trace, str):
+            with CaptureReader(trace) as reader:
+                self._exchanges = self._make_exchanges(reader)
+        else:
+            self._exchanges = self._make_exchanges(trace)
+
+    @classmethod
+    def _make_exchanges(cls, records: Iterable[CaptureRecord]) -> List[Tuple[bytes, List[Tuple[float, bytes]]]]:
+        exchanges: List[Tuple[bytes, List[Tuple[float, bytes]]]] = []
+        request_timestamp = 0.0
+        for record in records:
+            if record.direction == CaptureRecord.TX:
+                exchanges.append((record.payload, []))
+                request_timestamp = record.timestamp
+            elif len(exchanges) > 0:    # Responses received before the first request are ignored
+                exchanges[-1][1].append((max(record.timestamp - request_timestamp, 0), record.payload))
+        return exchanges
+
+    @property
+    def request_count(self) -> int:
+        """Number of requests in the trace"""
+        return len(self._exchanges)
+
+    def open(self) -> "ReplayConnection":
+        self.opened = True
+        self.logger.info('Connection opened')
+        return self
+
+    def __enter__(self) -> "ReplayConnection":
+        return self
+
+    def __exit__(self, type, value, traceback) -> None:
+        self.close()
+
+    def is_open(self) -> bool:
+        return self.opened
+
+    def close(self) -> None:
+        self.empty_rxqueue()
+        self.opened = False
+        self.logger.info('Connection closed')
+
+    def rewind(self) -> None:
+        """Restarts the replay at the first request of the trace"""
+        self.position = 0
+        self.empty_rxqueue()
+
+    def specific_send(self, payload: BytesLike, timeout: Optional[float] = None) -> None:
+        if self.position >= len(self._exchanges):
+            if not self.loop or len(self._exchanges) == 0:
+                raise ValueError('No request left in the trace')
+            self.position = 0
+
+        request, responses = self._exchanges[self.position]
+        if self.check_requests and payload != request:
+            raise ValueError('Payload sent does not match request #%d of the trace. Expected [%s], got [%s]' % (self.position, request.hex(), bytes(payload).hex()))
+        self.position += 1
+
+        now = time.monotonic() if self.realtime else 0
+        self._pending.clear()
+        self._pending.extend([(now + delay, response) for delay, response in responses])
+
+    def specific_wait_frame(self, timeout: Optional[float] = None) -> Optional[bytes]:
+        if not self.realtime:
+            if len(self._pending) == 0:
+                raise TimeoutException("No response left in the trace for the last request")
+            return self._pending.popleft()[1]
+
+        now = time.monotonic()
+        deadline = None if timeout is None else now + timeout
+        if len(self._pending) == 0 or (deadline is not None and self._pending[0][0] > deadline):
+            if deadline is not None:
+                time.sleep(deadline - now)
+            raise TimeoutException("Did not receive frame from the trace in time (timeout=%s sec)" % timeout)
+
+        due_time, response = self._pending.popleft()
+        if due_time > now:
+            time.sleep(due_time - now)
+        return response
+
+    def empty_rxqueue(self) -> None:
+        self._pending.clear()
+
+
 class PythonIsoTpConnection(BaseConnection):
     """
     Sends and receives data using a `can-isotp <https://github.com/pylessard/python-can-isotp>`_ Python module which is a Python implementation of the IsoTp transport protocol
@@ -506,7 +1002,7 @@ class PythonIsoTpConnection(BaseConnection):
     def close(self) -> None:
         return self.subconn.close()
 
-    def specific_send(self, payload: bytes, timeout: Optional[float] = None) -> None:
+    def specific_send(self, payload: BytesLike, timeout: Optional[float] = None) -> None:
         self.subconn.specific_send(payload, timeout)
 
     def specific_wait_frame(self, timeout: Optional[float] = None) -> Optional[bytes]:
@@ -553,7 +1049,7 @@ class PythonIsoTpV2Connection(BaseConnection):
         self.opened = False
         self.logger.info('Connection closed')
 
-    def specific_send(self, payload: bytes, timeout: Optional[float] = None) -> None:
+    def specific_send(self, payload: BytesLike, timeout: Optional[float] = None) -> None:
         self.isotp_layer.send(payload, send_timeout=timeout)
 
     def specific_wait_frame(self, timeout: Optional[float] = None) -> Optional[bytes]:
@@ -563,7 +1059,7 @@ class PythonIsoTpV2Connection(BaseConnection):
         if frame is None:
             raise TimeoutException("Did not receive IsoTP frame from the Transport layer in time (timeout=%s sec)" % timeout)
 
-        return bytes(frame)
+        return frame if isinstance(frame, bytes) else bytes(frame)
 
     def empty_rxqueue(self) -> None:
         self.isotp_layer.stop_receiving()
@@ -575,12 +1071,13 @@ class PythonIsoTpV2Connection(BaseConnection):
 
 
 class PythonIsoTpV1Connection(BaseConnection):
-    toIsoTPQueue: "queue.Queue[bytes]"
+    toIsoTPQueue: "queue.Queue[Union[bytes, bytearray]]"
     fromIsoTPQueue: "queue.Queue[bytes]"
     rxthread: Optional[threading.Thread]
     exit_requested: bool
     opened: bool
     isotp_layer: "isotp.TransportLayerLogic"
+    wakeup_event: threading.Event
 
     def __init__(self, isotp_layer: "isotp.TransportLayerLogic", name: Optional[str] = None):
         BaseConnection.__init__(self, name)
@@ -590,6 +1087,7 @@ class PythonIsoTpV1Connection(BaseConnection):
         self.exit_requested = False
         self.opened = False
         self.isotp_layer = isotp_layer
+        self.wakeup_event = threading.Event()
 
         # isotp v1 TransportLayer == isotpv2.TransportLayerLogic
         if hasattr(isotp, 'TransportLayerLogic'):
@@ -618,14 +1116,19 @@ class PythonIsoTpV1Connection(BaseConnection):
         self.empty_rxqueue()
         self.empty_txqueue()
         self.exit_requested = True
+        self.wakeup_event.set()
         if self.rxthread is not None:
             self.rxthread.join()
         self.isotp_layer.reset()
         self.opened = False
         self.logger.info('Connection closed')
 
-    def specific_send(self, payload: bytes, timeout: Optional[float] = None):
-        self.toIsoTPQueue.put(bytearray(payload))  # isotp.protocol.TransportLayer uses byte array. udsoncan is strict on bytes format
+    def specific_send(self, payload: BytesLike, timeout: Optional[float] = None):
+        # isotp.protocol.TransportLayer accepts bytes and bytearray and copies the data in its own buffer. Only a memoryview needs a conversion
+        if isinstance(payload, memoryview):
+            payload = payload.tobytes()
+        self.toIsoTPQueue.put(payload)
+        self.wakeup_event.set()     # Do not wait for the end of the transport layer sleep time to start the transmission
 
     def specific_wait_frame(self, timeout: Optional[float] = None) -> Optional[bytes]:
         self.check_connection_opened()
@@ -633,7 +1136,7 @@ class PythonIsoTpV1Connection(BaseConnection):
         try:
             frame = self.fromIsoTPQueue.get(block=True, timeout=timeout)
             # isotp.protocol.TransportLayer uses bytearray. udsoncan is strict on bytes format
-            return bytes(frame)
+            return frame if isinstance(frame, bytes) else bytes(frame)
         except queue.Empty:
             raise TimeoutException("Did not receive IsoTP frame from the Transport layer in time (timeout=%s sec)" % timeout)
 
@@ -648,6 +1151,7 @@ class PythonIsoTpV1Connection(BaseConnection):
     def rxthread_task(self) -> None:
         while not self.exit_requested:
             try:
+                self.wakeup_event.clear()
                 while not self.toIsoTPQueue.empty():
                     self.isotp_layer.send(self.toIsoTPQueue.get())
 
@@ -656,13 +1160,254 @@ class PythonIsoTpV1Connection(BaseConnection):
                 while self.isotp_layer.available():
                     self.fromIsoTPQueue.put(self.isotp_layer.recv())
 
-                time.sleep(self.isotp_layer.sleep_time())
+                # Sleeps for the time requested by the transport layer, unless a payload is sent or the connection is closed
+                self.wakeup_event.wait(self.isotp_layer.sleep_time())
 
             except Exception as e:
                 self.exit_requested = True
                 self.logger.error(str(e))
 
 
+class SharedCanBus:
+    """
+    Shares a single `python-can <https://python-can.readthedocs.io>`_ bus between the IsoTP connections to many servers.
+    A single thread reads the bus and routes each CAN message, by arbitration ID, to the `can-isotp <https://github.com/pylessard/python-can-isotp>`_ stack of the connection it is addressed to.
+    The connections, created with :meth:`connection<udsoncan.connections.SharedCanBus.connection>`, have no thread of their own : the thread count stays the same
+    whatever the number of servers, and a CAN message is handled once instead of once per connection.
+
+    The reading thread starts when the first connection is opened and stops when the last one is closed.
+    The bus must not be read by anything else, but it may be used to send messages.
+
+    Both ``python-can`` and ``can-isotp`` must be installed in order to use this class.
+
+    :param bus: The python-can bus
+    :type bus: ``can.BusABC``
+
+    :param name: This name is included in the logger name so that its output can be redirected. The logger name will be ``SharedCanBus[<name>]``
+    :type name: string
+    """
+
+    IDLE_SLEEP_TIME = 0.05     # Sleep time of an isotp stack that is not sending nor receiving
+
+    bus: "can.BusABC"
+    logger: logging.Logger
+    rxthread: Optional[threading.Thread]
+    exit_requested: bool
+    _connections: List["SharedCanBusConnection"]
+    _routes: Dict[Tuple[int, bool, int], List["SharedCanBusConnection"]]     # (arbitration ID, extended ID, first data byte) : connections
+    _active: Dict["SharedCanBusConnection", None]   # Connections with a transmission or a reception in progress. Ordered set
+
+    def __init__(self, bus: "can.BusABC", name: Optional[str] = None):
+        for module_name, err in [('can', _import_can_err), ('isotp', _import_isotp_err)]:
+            if module_name not in sys.modules:
+                if err is None:
+                    raise ImportError('%s module is not loaded' % module_name)
+                else:
+                    raise err
+
+        self.bus = bus
+        self.logger = logging.getLogger('SharedCanBus' if name is None else 'SharedCanBus[%s]' % name)
+        self.rxthread = None
+        self.exit_requested = False
+        self._connections = []
+        self._routes = {}
+        self._active = {}
+        self._lock = threading.Lock()
+        self._tx_lock = threading.Lock()
+
+    def connection(self, address: "isotp.Address", params: Optional[Dict] = None, name: Optional[str] = None) -> "SharedCanBusConnection":
+        """
+        Creates a connection to a server of the bus.
+
+        :param address: The IsoTP address of the server
+        :type address: ``isotp.Address``
+
+        :param params: The parameters of the IsoTP stack, as given to ``isotp.TransportLayer``
+        :type params: dict
+
+        :param name: This name is included in the logger name so that its output can be redirected. The logger name will be ``Connection[<name>]``
+        :type name: string
+        """
+        return SharedCanBusConnection(self, address, params, name)
+
+    @property
+    def connection_count(self) -> int:
+        """Number of opened connections"""
+        return len(self._connections)
+
+    def _attach(self, conn: "SharedCanBusConnection") -> None:
+        with self._lock:
+            if conn not in self._connections:
+                self._connections.append(conn)
+            self._routes = {}
+            if self.rxthread is None:
+                self.exit_requested = False
+                self.rxthread = threading.Thread(target=self.rxthread_task, daemon=True)
+                self.rxthread.start()
+                self.logger.info('Reading thread started')
+
+    def _detach(self, conn: "SharedCanBusConnection") -> None:
+        thread = None
+        with self._lock:
+            if conn in self._connections:
+                self._connections.remove(conn)
+            self._active.pop(conn, None)
+            self._routes = {}
+            if len(self._connections) == 0 and self.rxthread is not None:
+                self.exit_requested = True
+                thread = self.rxthread
+                self.rxthread = None
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+            self.logger.info('Reading thread stopped')
+
+    def _activate(self, conn: "SharedCanBusConnection") -> None:
+        with self._lock:
+            self._active[conn] = None
+
+    def _send_can_message(self, msg: "isotp.CanMessage") -> None:
+        can_msg = can.Message(arbitration_id=msg.arbitration_id, data=msg.data, is_extended_id=msg.is_extended_id,
+                              is_fd=msg.is_fd, bitrate_switch=msg.bitrate_switch)
+        with self._tx_lock:
+            self.bus.send(can_msg)
+
+    def _route(self, msg: "isotp.CanMessage") -> List["SharedCanBusConnection"]:
+        # The connections a message is for only depend on its arbitration ID and, with the extended and mixed addressing modes, its first byte.
+        # The result of the first lookup is kept for the next messages with the same key.
+        key = (msg.arbitration_id, msg.is_extended_id, msg.data[0] if len(msg.data) > 0 else -1)
+        routes = self._routes.get(key, None)
+        if routes is None:
+            with self._lock:
+                routes = [conn for conn in self._connections if conn.address.is_for_me(msg)]
+                self._routes[key] = routes
+        return routes
+
+    def rxthread_task(self) -> None:
+        while not self.exit_requested:
+            try:
+                with self._lock:
+                    active = list(self._active)
+                timeout = self.IDLE_SLEEP_TIME
+                for conn in active:
+                    timeout = min(timeout, conn.isotp_layer.sleep_time())
+
+                msg = self.bus.recv(timeout)
+                if msg is not None and not msg.is_error_frame and not msg.is_remote_frame:
+                    isotp_msg = isotp.CanMessage(arbitration_id=msg.arbitration_id, data=msg.data, dlc=msg.dlc, extended_id=msg.is_extended_id,
+                                                 is_fd=msg.is_fd, bitrate_switch=msg.bitrate_switch)
+                    for conn in self._route(isotp_msg):
+                        conn._rx_frames.append(isotp_msg)
+                        if conn not in active:
+                            active.append(conn)
+
+                for conn in active:
+                    conn._process()
+                    with self._lock:    # A payload sent after _process() keeps the connection active
+                        if conn._is_idle():
+                            self._active.pop(conn, None)
+                        elif conn in self._connections:
+                            self._active[conn] = None
+            except Exception as e:
+                self.logger.error('%s: %s' % (e.__class__.__name__, str(e)))
+                time.sleep(self.IDLE_SLEEP_TIME)     # Do not spin on a bus that keeps failing
+
+    def __repr__(self) -> str:
+        return '<%s: %s with %d connections at 0x%08x>' % (self.__class__.__name__, self.logger.name, len(self._connections), id(self))
+
+
+class SharedCanBusConnection(BaseConnection):
+    """
+    A connection to one server of a :class:`SharedCanBus<udsoncan.connections.SharedCanBus>`. Created with :meth:`SharedCanBus.connection<udsoncan.connections.SharedCanBus.connection>`.
+    The IsoTP stack of the connection is run by the thread of the shared bus. A payload is sent right away from the thread calling ``send``.
+    """
+
+    shared_bus: SharedCanBus
+    address: "isotp.Address"
+    isotp_layer: "isotp.TransportLayerLogic"
+    rxqueue: "queue.Queue[bytes]"
+    opened: bool
+    _rx_frames: Deque["isotp.CanMessage"]
+
+    def __init__(self, shared_bus: SharedCanBus, address: "isotp.Address", params: Optional[Dict] = None, name: Optional[str] = None):
+        BaseConnection.__init__(self, name)
+        self.shared_bus = shared_bus
+        self.address = address
+        self.rxqueue = queue.Queue()
+        self.opened = False
+        self._rx_frames = collections.deque()
+        self._layer_lock = threading.Lock()
+
+        # isotp v1 TransportLayer == isotpv2.TransportLayerLogic
+        layer_class = isotp.TransportLayerLogic if hasattr(isotp, 'TransportLayerLogic') else isotp.TransportLayer
+        self.isotp_layer = layer_class(rxfn=self._rxfn, txfn=shared_bus._send_can_message, address=address,
+                                       error_handler=self._error_handler, params=params)
+
+    def _rxfn(self, timeout: Optional[float] = None) -> Optional["isotp.CanMessage"]:
+        try:
+            return self._rx_frames.popleft()
+        except IndexError:
+            return None
+
+    def _error_handler(self, error: Exception) -> None:
+        self.logger.warning('IsoTP error: %s - %s' % (error.__class__.__name__, str(error)))
+
+    def _process(self) -> None:
+        with self._layer_lock:
+            self.isotp_layer.process()
+            while self.isotp_layer.available():
+                frame = self.isotp_layer.recv()
+                if frame is not None and self.opened:
+                    self.rxqueue.put(frame if isinstance(frame, bytes) else bytes(frame))
+
+    def _is_idle(self) -> bool:
+        with self._layer_lock:
+            return len(self._rx_frames) == 0 and self.isotp_layer.sleep_time() >= SharedCanBus.IDLE_SLEEP_TIME
+
+    def open(self) -> "SharedCanBusConnection":
+        self.opened = True
+        self.shared_bus._attach(self)
+        self.logger.info('Connection opened')
+        return self
+
+    def __enter__(self) -> "SharedCanBusConnection":
+        return self
+
+    def __exit__(self, type, value, traceback) -> None:
+        self.close()
+
+    def is_open(self) -> bool:
+        return self.opened
+
+    def close(self) -> None:
+        self.opened = False
+        self.shared_bus._detach(self)
+        with self._layer_lock:
+            self.isotp_layer.reset()
+        self._rx_frames.clear()
+        self.empty_rxqueue()
+        self.logger.info('Connection closed')
+
+    def specific_send(self, payload: BytesLike, timeout: Optional[float] = None) -> None:
+        if isinstance(payload, memoryview):
+            payload = payload.tobytes()
+        with self._layer_lock:
+            self.isotp_layer.send(payload)
+        self._process()     # Sends the first frame without waiting for the thread of the bus
+        self.shared_bus._activate(self)
+
+    def specific_wait_frame(self, timeout: Optional[float] = None) -> Optional[bytes]:
+        self.check_connection_opened()
+
+        try:
+            return self.rxqueue.get(block=True, timeout=timeout)
+        except queue.Empty:
+            raise TimeoutException("Did not receive IsoTP frame from the shared CAN bus in time (timeout=%s sec)" % timeout)
+
+    def empty_rxqueue(self) -> None:
+        while not self.rxqueue.empty():
+            self.rxqueue.get()
+
+
 class J2534Connection(BaseConnection):
     """
     Sends and receives data through a J2534 Interface. 
@@ -682,6 +1427,10 @@ class J2534Connection(BaseConnection):
     :type protocol: Protocol_ID
     :param baudrate: Operation bauderate
     :type baudrate: int
+    :param rx_batch_size: Maximum number of messages read from the interface with a single ``PassThruReadMsgs`` call
+    :type rx_batch_size: int
+    :param rx_read_timeout: Time in seconds that the reception thread waits in the DLL for new messages. A transmission waits at most this long for the interface
+    :type rx_read_timeout: float
 
     """
 
@@ -695,6 +1444,10 @@ class J2534Connection(BaseConnection):
     rxqueue: "queue.Queue[bytes]"
     exit_requested: bool
     opened: bool
+    rx_batch_size: int
+    rx_read_timeout: float
+    tx_waiting: int
+    tx_condition: threading.Condition
 
     def __init__(self,
                  windll: str,
@@ -704,12 +1457,16 @@ class J2534Connection(BaseConnection):
                  debug: bool = False,
                  protocol = None,
                  baudrate = 500000,
+                 rx_batch_size: int = 16,
+                 rx_read_timeout: float = 0.02,
                  ):
         BaseConnection.__init__(self, name)
 
         self.protocol = protocol if protocol else Protocol_ID.ISO15765
         self.baudrate = baudrate
         self.debug = debug
+        self.rx_batch_size = rx_batch_size
+        self.rx_read_timeout = rx_read_timeout
 
         try:
             # Set up a J2534 interface using the DLL provided
@@ -787,6 +1544,8 @@ class J2534Connection(BaseConnection):
     def open(self) -> "J2534Connection":
         self.exit_requested = False
         self.interfaceSemaphore = threading.Semaphore()
+        self.tx_waiting = 0
+        self.tx_condition = threading.Condition()
         self.rxthread = threading.Thread(target=self.rxthread_task, daemon=True)
         self.rxthread.start()
         self.opened = True
@@ -803,17 +1562,30 @@ class J2534Connection(BaseConnection):
         return self.opened
 
     def rxthread_task(self) -> None:
+        read_timeout_ms = max(int(self.rx_read_timeout * 1000), 1)
         while not self.exit_requested:
+            # Transmissions have priority on the interface. Wait for them to complete before reading again.
+            with self.tx_condition:
+                while self.tx_waiting > 0 and not self.exit_requested:
+                    self.tx_condition.wait()
+
             self.interfaceSemaphore.acquire()
+            t1 = time.monotonic()
             try:
-                result, data, numMessages = self.interface.PassThruReadMsgs(self.channelID, self.protocol.value, pNumMsgs=1)
-                if data is not None:
+                # The DLL blocks until rx_batch_size messages are read or the timeout expires.
+                result, messages = self.interface.PassThruReadMsgsBatch(self.channelID, self.protocol.value,
+                                                                        pNumMsgs=self.rx_batch_size, Timeout=read_timeout_ms)
+                for data in messages:
                     self.rxqueue.put(data)
             except Exception:
                 self.logger.critical("Exiting J2534 rx thread")
                 self.exit_requested = True
-            self.interfaceSemaphore.release()
-            time.sleep(0.001)
+                messages = []
+            finally:
+                self.interfaceSemaphore.release()
+
+            if len(messages) == 0 and time.monotonic() - t1 < 0.001:
+                time.sleep(0.001)   # Some DLLs return immediately when their buffer is empty. Avoid spinning
 
     def log_last_operation(self, exec_method: str, with_raise = False) -> None:
         if self.result != Error_ID.ERR_SUCCESS:
@@ -830,6 +1602,8 @@ class J2534Connection(BaseConnection):
     def close(self) -> None:
         self.opened = False
         self.exit_requested = True
+        with self.tx_condition:
+            self.tx_condition.notify_all()
         self.rxthread.join()
 
         self.result = self.interface.PassThruDisconnect(self.channelID)
@@ -838,14 +1612,23 @@ class J2534Connection(BaseConnection):
         self.interface.PassThruClose(self.devID)
         self.log_last_operation('PassThruClose')
 
-    def specific_send(self, payload: bytes, timeout: Optional[float] = None):
+    def specific_send(self, payload: BytesLike, timeout: Optional[float] = None):
         timeout = 0 if timeout is None else timeout
 
         # Fix for avoid ERR_CONCURRENT_API_CALL. Stop reading
-        self.interfaceSemaphore.acquire()
-        self.result = self.interface.PassThruWriteMsgs(self.channelID, payload, self.protocol.value, Timeout=int(timeout * 1000))
-        self.log_last_operation('PassThruWriteMsgs', with_raise=True)
-        self.interfaceSemaphore.release()
+        with self.tx_condition:
+            self.tx_waiting += 1
+        try:
+            self.interfaceSemaphore.acquire()
+            try:
+                self.result = self.interface.PassThruWriteMsgs(self.channelID, payload, self.protocol.value, Timeout=int(timeout * 1000))
+                self.log_last_operation('PassThruWriteMsgs', with_raise=True)
+            finally:
+                self.interfaceSemaphore.release()
+        finally:
+            with self.tx_condition:
+                self.tx_waiting -= 1
+                self.tx_condition.notify_all()
 
     def specific_wait_frame(self, timeout: Optional[float] = None) -> Optional[bytes]:
         self.check_connection_opened()
@@ -912,8 +1695,8 @@ class FakeConnection(BaseConnection):
         self.opened = False
         self.logger.info('Fake Connection closed')
 
-    def specific_send(self, payload: bytes, timeout: Optional[float] = None):
-        self.rxqueue.put(self.ResponseData[payload])
+    def specific_send(self, payload: BytesLike, timeout: Optional[float] = None):
+        self.rxqueue.put(self.ResponseData[bytes(payload)])
 
     def specific_wait_frame(self, timeout: Optional[float] = None) -> Optional[bytes]:
         self.check_connection_opened()
@@ -967,7 +1750,7 @@ class SyncAioIsotpConnection(BaseConnection):
         self.conn = None
         self.opened = False
 
-    def specific_send(self, payload: bytes, timeout: Optional[float] = None) -> None:
+    def specific_send(self, payload: BytesLike, timeout: Optional[float] = None) -> None:
         self.check_connection_opened()
         assert self.conn is not None
 
@@ -1008,3 +1791,215 @@ class SyncAioIsotpConnection(BaseConnection):
 
     def __exit__(self, type, value, traceback) -> None:
         self.close()
+
+
+class AsyncBaseConnection(ABC):
+    """
+    Base class of the connections usable by the :class:`AsyncClient<udsoncan.client.AsyncClient>`.
+    Same as :class:`BaseConnection<udsoncan.connections.BaseConnection>`, except that ``send``, ``wait_frame``, ``open`` and ``close`` are coroutines.
+    """
+
+    name: str
+    logger: logging.Logger
+
+    def __init__(self, name: Optional[str] = None):
+        if name is None:
+            self.name = 'Connection'
+        else:
+            self.name = 'Connection[%s]' % (name)
+
+        self.logger = logging.getLogger(self.name)
+
+    async def send(self, data: Union[bytes, bytearray, memoryview, Request, Response], timeout: Optional[float] = None) -> None:
+        """Sends data to the underlying transport protocol
+
+        :param data: The data or object to send. If a Request or Response is given, the value returned by get_payload() will be sent.
+            A ``bytearray`` or a ``memoryview`` is given as is to the transport protocol, without copy.
+        :type data: bytes, bytearray, memoryview, Request, Response
+
+        :returns: None
+        """
+        self.check_connection_opened()
+
+        payload: BytesLike
+        if isinstance(data, Request) or isinstance(data, Response):
+            payload = data.get_payload()
+        else:
+            payload = data
+
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug('Sending %d bytes : [%s]' % (len(payload), binascii.hexlify(payload).decode('ascii')))
+        await self.specific_send(payload, timeout=timeout)
+
+    def check_connection_opened(self) -> None:
+        if not self.is_open():
+            raise RuntimeError(self.__class__.__name__ + ' is not opened')
+
+    async def wait_frame(self, timeout: Optional[float] = None, exception: bool = False) -> Optional[bytes]:
+        """Waits for the reception of a frame of data from the underlying transport protocol
+
+        :param timeout: The maximum amount of time to wait before giving up in seconds
+        :type timeout: float
+        :param exception: Boolean value indicating if this function may return exceptions.
+                When ``True``, all exceptions may be raised, including ``TimeoutException``
+                When ``False``, all exceptions will be logged as ``DEBUG`` and ``None`` will be returned.
+        :type exception: bool
+
+        :returns: Received data
+        :rtype: bytes or None
+        """
+        self.check_connection_opened()
+
+        try:
+            frame = await self.specific_wait_frame(timeout=timeout)
+        except Exception as e:
+            self.logger.debug('No data received: [%s] - %s ' % (e.__class__.__name__, str(e)))
+
+            if exception == True:
+                raise
+            else:
+                frame = None
+
+        if frame is not None and self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug('Received %d bytes : [%s]' % (len(frame), binascii.hexlify(frame).decode('ascii')))
+        return frame
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, type, value, traceback):
+        await self.close()
+
+    @abstractmethod
+    async def specific_send(self, payload: BytesLike, timeout: Optional[float] = None) -> None:
+        """The implementation of the send method.
+
+        :param payload: Data to send
+        :type payload: bytes, bytearray or memoryview
+
+        :returns: None
+        """
+        pass
+
+    @abstractmethod
+    async def specific_wait_frame(self, timeout: Optional[float] = None) -> Optional[bytes]:
+        """The implementation of the ``wait_frame`` method. Must raise a ``TimeoutException`` if nothing is received in time.
+
+        :param timeout: The maximum amount of time to wait before giving up
+        :type timeout: float
+
+        :returns: Received data
+        :rtype: bytes or None
+        """
+        pass
+
+    @abstractmethod
+    async def open(self) -> "AsyncBaseConnection":
+        """ Set up the connection object. 
+
+        :returns: None
+        """
+        pass
+
+    @abstractmethod
+    async def close(self) -> None:
+        """ Close the connection object
+
+        :returns: None
+        """
+        pass
+
+    @abstractmethod
+    def empty_rxqueue(self) -> None:
+        """ Empty all unread data in the reception buffer. Must not block.
+
+        :returns: None
+        """
+        pass
+
+    @abstractmethod
+    def is_open(self) -> bool:
+        """ Tells if the connection is open.
+
+        :returns: bool
+        """
+        pass
+
+
+class AsyncQueueConnection(AsyncBaseConnection):
+    """
+    Asyncio version of the :class:`QueueConnection<udsoncan.connections.QueueConnection>`. Sends and receives data using 2 ``asyncio.Queue``.
+    Must be opened from within the event loop that uses it.
+
+    - ``MyConnection.fromuserqueue`` : Data read from this queue when ``wait_frame`` is called
+    - ``MyConnection.touserqueue`` : Data written to this queue when ``send`` is called
+
+    :param mtu: Optional maximum frame size. Messages will be truncated to this size
+    :type mtu: int
+    :param name: This name is included in the logger name so that its output can be redirected. The logger name will be ``Connection[<name>]``
+    :type name: string
+    """
+
+    fromuserqueue: "asyncio.Queue[bytes]"
+    touserqueue: "asyncio.Queue[bytes]"
+    opened: bool
+    mtu: int
+
+    def __init__(self, name: Optional[str] = None, mtu: int = 4095):
+        AsyncBaseConnection.__init__(self, name)
+
+        self.opened = False
+        self.mtu = mtu
+
+    async def open(self) -> "AsyncQueueConnection":
+        # Queues are created here so that they belong to the running event loop.
+        self.fromuserqueue = asyncio.Queue()  # Client reads from this queue. Other end is simulated
+        self.touserqueue = asyncio.Queue()  # Client writes to this queue. Other end is simulated
+        self.opened = True
+        self.logger.info('Connection opened')
+        return self
+
+    def is_open(self) -> bool:
+        return self.opened
+
+    async def close(self) -> None:
+        if self.opened:     # The queues do not exist before open()
+            self.empty_rxqueue()
+            self.empty_txqueue()
+        self.opened = False
+        self.logger.info('Connection closed')
+
+    async def specific_send(self, payload: BytesLike, timeout: Optional[float] = None) -> None:
+        if self.mtu is not None:
+            if len(payload) > self.mtu:
+                self.logger.warning("Truncating payload to be set to a length of %d" % (self.mtu))
+                payload = payload[0:self.mtu]
+
+        try:
+            # The other end reads the payload later. A mutable buffer could be reused by the sender in the meantime
+            await asyncio.wait_for(self.touserqueue.put(bytes(payload)), timeout=timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutException("Did not send frame to user queue in time (timeout=%s sec)" % timeout)
+
+    async def specific_wait_frame(self, timeout: Optional[float] = None) -> Optional[bytes]:
+        self.check_connection_opened()
+
+        try:
+            frame = await asyncio.wait_for(self.fromuserqueue.get(), timeout=timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutException("Did not receive frame from user queue in time (timeout=%s sec)" % timeout)
+
+        if self.mtu is not None:
+            if frame is not None and len(frame) > self.mtu:
+                self.logger.warning("Truncating received payload to a length of %d" % (self.mtu))
+                frame = frame[0:self.mtu]
+
+        return frame
+
+    def empty_rxqueue(self) -> None:
+        while not self.fromuserqueue.empty():
+            self.fromuserqueue.get_nowait()
+
+    def empty_txqueue(self) -> None:
+        while not self.touserqueue.empty():
+            self.touserqueue.get_nowait()
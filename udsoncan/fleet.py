@@ -0,0 +1,340 @@
+import asyncio
+import concurrent.futures
+import logging
+import time
+
+from udsoncan.client import Client, AsyncClient
+from udsoncan.connections import BaseConnection, AsyncBaseConnection
+from udsoncan.configs import default_client_config
+from udsoncan.exceptions import TimeoutException
+from udsoncan.typing import ClientConfig
+
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple, Union
+
+FleetClient = Union[Client, AsyncClient]
+FleetMember = Union[FleetClient, Tuple[Union[BaseConnection, AsyncBaseConnection], ClientConfig]]
+
+
+class EcuResult:
+    """
+    Outcome of an operation executed on a single ECU by a :class:`ClientFleet<udsoncan.fleet.ClientFleet>`
+
+    .. data:: name
+
+        The name of the ECU
+
+    .. data:: value
+
+        The value returned by the operation. ``None`` if an exception has been raised
+
+    .. data:: exception
+
+        The exception raised by the operation, ``None`` if it succeeded. A ``TimeoutException`` is used when a deadline is reached
+
+    .. data:: duration
+
+        Time spent on the operation in seconds. ``None`` if the operation never started
+    """
+    name: str
+    value: Any
+    exception: Optional[BaseException]
+    duration: Optional[float]
+
+    def __init__(self, name: str, value: Any = None, exception: Optional[BaseException] = None, duration: Optional[float] = None):
+        self.name = name
+        self.value = value
+        self.exception = exception
+        self.duration = duration
+
+    @property
+    def success(self) -> bool:
+        """``True`` if the operation returned without raising"""
+        return self.exception is None
+
+    def get(self) -> Any:
+        """Returns the value of the operation or raises the exception it raised"""
+        if self.exception is not None:
+            raise self.exception
+        return self.value
+
+    def __repr__(self) -> str:
+        status = 'success' if self.success else self.exception.__class__.__name__
+        return '<%s: [%s] %s at 0x%08x>' % (self.__class__.__name__, self.name, status, id(self))
+
+
+class ClientFleet:
+    """
+    Runs the same operation on many ECUs at once. Each ECU is reached through its own client and the results are reported per ECU,
+    so the total time of an operation is about the time taken by the slowest ECU instead of the sum of all of them.
+
+    Synchronous clients are driven by a bounded thread pool with :meth:`run<udsoncan.fleet.ClientFleet.run>`.
+    :class:`AsyncClient<udsoncan.client.AsyncClient>` are driven by the event loop with :meth:`run_async<udsoncan.fleet.ClientFleet.run_async>`.
+
+    :param members: Dictionary mapping an ECU name to a client, or to a tuple ``(connection, config)`` from which a client is created.
+        An ``AsyncClient`` is created for connections extending ``AsyncBaseConnection``
+    :type members: dict
+
+    :param max_workers: Maximum number of threads used by :meth:`run<udsoncan.fleet.ClientFleet.run>`. Defaults to one thread per ECU, up to 32
+    :type max_workers: int
+    """
+
+    START_POLL_INTERVAL = 0.02     # How often the start of queued operations is checked when an ECU deadline is given
+
+    clients: Dict[str, FleetClient]
+    max_workers: int
+    logger: logging.Logger
+    _executor: Optional[concurrent.futures.ThreadPoolExecutor]
+    _running: Dict[str, concurrent.futures.Future]     # Last operation given to each synchronous client. May outlive its deadline
+
+    def __init__(self, members: Mapping[str, FleetMember], max_workers: Optional[int] = None):
+        self.clients = {}
+        for name, member in members.items():
+            self.clients[name] = self.make_client(member)
+
+        if max_workers is None:
+            max_workers = min(32, max(len(self.clients), 1))
+        if not isinstance(max_workers, int) or max_workers < 1:
+            raise ValueError('max_workers must be a positive integer')
+        self.max_workers = max_workers
+        self.logger = logging.getLogger('UdsClientFleet')
+        self._executor = None
+        self._running = {}
+
+    @classmethod
+    def make_client(cls, member: FleetMember) -> FleetClient:
+        if isinstance(member, (Client, AsyncClient)):
+            return member
+
+        if isinstance(member, tuple) and len(member) == 2:
+            conn, config = member
+            if config is None:
+                config = default_client_config
+            if isinstance(conn, AsyncBaseConnection):
+                return AsyncClient(conn, config=config)
+            if isinstance(conn, BaseConnection):
+                return Client(conn, config=config)
+
+        raise ValueError('Fleet members must be a Client, an AsyncClient or a tuple (connection, config)')
+
+    def __enter__(self) -> "ClientFleet":
+        self.open()
+        return self
+
+    def __exit__(self, type, value, traceback) -> None:
+        self.close()
+
+    async def __aenter__(self) -> "ClientFleet":
+        await self.open_async()
+        return self
+
+    async def __aexit__(self, type, value, traceback) -> None:
+        await self.close_async()
+
+    def open(self) -> None:
+        """Opens all the synchronous clients"""
+        for client in self.clients.values():
+            if isinstance(client, Client):
+                client.open()
+
+    def close(self) -> None:
+        """Closes all the synchronous clients and stops the thread pool"""
+        for client in self.clients.values():
+            if isinstance(client, Client):
+                client.close()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    async def open_async(self) -> None:
+        """Opens all the asynchronous clients"""
+        await asyncio.gather(*[client.open() for client in self.clients.values() if isinstance(client, AsyncClient)])
+
+    async def close_async(self) -> None:
+        """Closes all the asynchronous clients"""
+        await asyncio.gather(*[client.close() for client in self.clients.values() if isinstance(client, AsyncClient)])
+
+    @classmethod
+    def _make_call(cls, operation: Union[str, Callable], client: FleetClient, args: Tuple, kwargs: Dict) -> Any:
+        if isinstance(operation, str):
+            return getattr(client, operation)(*args, **kwargs)
+        elif callable(operation):
+            return operation(client, *args, **kwargs)
+        raise ValueError('operation must be the name of a client method or a callable')
+
+    def _get_executor(self) -> concurrent.futures.ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='UdsClientFleet')
+        return self._executor
+
+    def _busy_result(self, name: str) -> Optional[EcuResult]:
+        """Reports an ECU whose previous operation missed its deadline and is still running. A client cannot be used by two threads at once"""
+        future = self._running.get(name)
+        if future is None:
+            return None
+        if future.done():
+            del self._running[name]
+            return None
+        return EcuResult(name, exception=TimeoutException('ECU %s is still busy with a previous operation that reached its deadline' % name))
+
+    def run(self,
+            operation: Union[str, Callable],
+            *args: Any,
+            timeout: Optional[float] = None,
+            ecu_timeout: Optional[float] = None,
+            **kwargs: Any) -> Dict[str, EcuResult]:
+        """
+        Runs an operation on all the synchronous clients at once, using a thread pool.
+
+        :param operation: The name of a client method (``'read_data_by_identifier'``), or a callable receiving the client as first parameter.
+            Additional arguments are passed to the operation.
+        :type operation: str or callable
+
+        :param timeout: Overall deadline in seconds. ECUs that did not complete in time are reported with a ``TimeoutException``
+        :type timeout: float
+
+        :param ecu_timeout: Deadline in seconds given to each ECU, counted from the moment its operation starts.
+        :type ecu_timeout: float
+
+        :return: A dictionary mapping the ECU names to an :class:`EcuResult<udsoncan.fleet.EcuResult>`
+        :rtype: dict
+
+        .. note:: A thread cannot be interrupted. When a deadline is reached, the result is reported immediately but the client stays busy until its
+            own timeouts expire. The client timeouts should therefore be shorter than the deadlines. Until then, that ECU is not given new operations
+            and is reported with a ``TimeoutException``.
+        """
+        clients = {name: client for name, client in self.clients.items() if isinstance(client, Client)}
+        if len(clients) != len(self.clients):
+            raise ValueError('Fleet contains asynchronous clients. Use run_async()')
+
+        executor = self._get_executor()
+        start_times: Dict[str, float] = {}
+        results: Dict[str, EcuResult] = {}
+
+        def task(name: str, client: Client) -> Any:
+            start_times[name] = time.monotonic()
+            return self._make_call(operation, client, args, kwargs)
+
+        t1 = time.monotonic()
+        overall_deadline = None if timeout is None else t1 + timeout
+        pending: Dict[concurrent.futures.Future, str] = {}
+        for name, client in clients.items():
+            busy = self._busy_result(name)
+            if busy is not None:
+                results[name] = busy
+                continue
+            future = executor.submit(task, name, client)
+            self._running[name] = future
+            pending[future] = name
+
+        while len(pending) > 0:
+            now = time.monotonic()
+            deadlines = []
+            if overall_deadline is not None:
+                deadlines.append(overall_deadline)
+            if ecu_timeout is not None:
+                deadlines.extend([start_times[name] + ecu_timeout for name in pending.values() if name in start_times])
+                if any(name not in start_times for name in pending.values()):
+                    deadlines.append(now + self.START_POLL_INTERVAL)   # The deadline of a queued operation is only known once it starts
+            wait_time = None if len(deadlines) == 0 else max(min(deadlines) - now, 0)
+
+            done, _ = concurrent.futures.wait(pending, timeout=wait_time, return_when=concurrent.futures.FIRST_COMPLETED)
+            now = time.monotonic()
+            for future in done:
+                name = pending.pop(future)
+                duration = now - start_times.get(name, now)
+                if ecu_timeout is not None and duration > ecu_timeout:
+                    results[name] = EcuResult(name, exception=TimeoutException('ECU deadline reached before ECU %s completed' % name), duration=duration)
+                    continue
+                try:
+                    results[name] = EcuResult(name, value=future.result(), duration=duration)
+                except Exception as e:
+                    results[name] = EcuResult(name, exception=e, duration=duration)
+
+            for future, name in list(pending.items()):
+                started = name in start_times
+                ecu_expired = ecu_timeout is not None and started and now >= start_times[name] + ecu_timeout
+                overall_expired = overall_deadline is not None and now >= overall_deadline
+                if ecu_expired or overall_expired:
+                    future.cancel()     # Only effective if the operation has not started yet
+                    del pending[future]
+                    which = 'ECU' if ecu_expired else 'Overall'
+                    results[name] = EcuResult(name,
+                                              exception=TimeoutException('%s deadline reached before ECU %s completed' % (which, name)),
+                                              duration=(now - start_times[name]) if started else None)
+
+        self.logger.debug('Ran operation on %d ECUs in %.3f sec' % (len(results), time.monotonic() - t1))
+        return {name: results[name] for name in clients}
+
+    async def run_async(self,
+                        operation: Union[str, Callable],
+                        *args: Any,
+                        timeout: Optional[float] = None,
+                        ecu_timeout: Optional[float] = None,
+                        **kwargs: Any) -> Dict[str, EcuResult]:
+        """
+        Runs an operation on all the clients at once from the event loop. Meant for :class:`AsyncClient<udsoncan.client.AsyncClient>`.
+        Synchronous clients are run in the thread pool of the fleet, with the same limitations as :meth:`run<udsoncan.fleet.ClientFleet.run>`.
+
+        :param operation: The name of a client method (``'read_data_by_identifier'``), or a callable receiving the client as first parameter.
+            The callable may return an awaitable. Additional arguments are passed to the operation.
+        :type operation: str or callable
+
+        :param timeout: Overall deadline in seconds. ECUs that did not complete in time are cancelled and reported with a ``TimeoutException``
+        :type timeout: float
+
+        :param ecu_timeout: Deadline in seconds given to each ECU.
+        :type ecu_timeout: float
+
+        :return: A dictionary mapping the ECU names to an :class:`EcuResult<udsoncan.fleet.EcuResult>`
+        :rtype: dict
+        """
+        loop = asyncio.get_running_loop()
+        start_times: Dict[str, float] = {}
+
+        async def task(name: str, client: FleetClient) -> Any:
+            start_times[name] = time.monotonic()
+            if isinstance(client, AsyncClient):
+                value = self._make_call(operation, client, args, kwargs)
+            else:
+                future = self._get_executor().submit(self._make_call, operation, client, args, kwargs)
+                self._running[name] = future
+                value = asyncio.wrap_future(future, loop=loop)
+            if asyncio.iscoroutine(value) or asyncio.isfuture(value):
+                value = await value
+            return value
+
+        async def task_with_deadline(name: str, client: FleetClient) -> EcuResult:
+            try:
+                value = await asyncio.wait_for(task(name, client), timeout=ecu_timeout)
+                return EcuResult(name, value=value, duration=time.monotonic() - start_times[name])
+            except asyncio.TimeoutError:
+                return EcuResult(name,
+                                 exception=TimeoutException('ECU deadline reached before ECU %s completed' % name),
+                                 duration=time.monotonic() - start_times[name])
+            except Exception as e:
+                return EcuResult(name, exception=e, duration=time.monotonic() - start_times[name])
+
+        t1 = time.monotonic()
+        results: Dict[str, EcuResult] = {}
+        tasks = {}
+        for name, client in self.clients.items():
+            busy = self._busy_result(name)
+            if busy is not None:
+                results[name] = busy
+            else:
+                tasks[name] = asyncio.ensure_future(task_with_deadline(name, client))
+        if len(tasks) > 0:
+            await asyncio.wait(list(tasks.values()), timeout=timeout)
+
+        for name, future in tasks.items():
+            if future.done():
+                results[name] = future.result()
+            else:
+                future.cancel()
+                started = name in start_times
+                results[name] = EcuResult(name,
+                                          exception=TimeoutException('Overall deadline reached before ECU %s completed' % name),
+                                          duration=(time.monotonic() - start_times[name]) if started else None)
+
+        self.logger.debug('Ran operation on %d ECUs in %.3f sec' % (len(results), time.monotonic() - t1))
+        return {name: results[name] for name in self.clients}
@@ -223,6 +223,28 @@ class J2534():
 
             return Error_ID(hex(result)), bytes(pMsg.Data[4:pMsg.DataSize]), pNumMsgs
 
+    def PassThruReadMsgsBatch(self, ChannelID, protocol, pNumMsgs=16, Timeout=20):
+        # Reads up to pNumMsgs messages with a single call to the DLL. The call returns as soon as pNumMsgs messages are read or when Timeout (ms) expires.
+        # Returns the result and the list of received payloads. Transmit and start of message indications are dropped.
+        pMsgs = (PASSTHRU_MSG * pNumMsgs)()
+        for i in range(pNumMsgs):
+            pMsgs[i].ProtocolID = protocol
+
+        numMsgs = c_ulong(pNumMsgs)
+        result = dllPassThruReadMsgs(ChannelID, pMsgs, byref(numMsgs), c_ulong(Timeout))
+
+        data_offset = PASSTHRU_MSG.Data.offset + 4  # Skips the CAN ID
+        messages = []
+        for i in range(min(numMsgs.value, pNumMsgs)):
+            msg = pMsgs[i]
+            if msg.RxStatus & (RxStatus.TX_INDICATION.value | RxStatus.TX_MSG_TYPE.value | RxStatus.START_OF_MESSAGE.value):
+                continue
+            if msg.DataSize < 4:
+                continue
+            messages.append(ctypes.string_at(ctypes.addressof(msg) + data_offset, msg.DataSize - 4))
+
+        return Error_ID(hex(result)), messages
+
     def PassThruWriteMsgs(self, ChannelID, Data, protocol, pNumMsgs=1, Timeout=1000):
         txmsg = PASSTHRU_MSG()
         txmsg.TxFlags = self.txFlags
@@ -0,0 +1,653 @@
+"""
+Offline decoding of the UDS traffic contained in CAN bus logs (candump, Vector ASC, CSV).
+CAN frames are reassembled into ISO-TP messages, requests are paired with their responses and each exchange is decoded with the services of this package.
+Large logs are split in chunks decoded in parallel by a pool of processes.
+"""
+import heapq
+import json
+import multiprocessing
+import os
+
+from udsoncan import Request, Response, services, latest_standard
+from udsoncan.BaseService import BaseService
+from udsoncan.common.dids import CompiledDidConfig
+from udsoncan.common.dtc import Dtc
+
+from typing import Any, Callable, Dict, IO, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+CanFrame = Tuple[float, int, bytes]   # timestamp, arbitration ID, data
+
+FORMATS = ('candump', 'asc', 'csv')
+
+
+class IsoTpReassembler:
+    """
+    Rebuilds ISO-TP messages (ISO-15765-2, normal addressing) from CAN frames, one arbitration ID at a time.
+    Single frames, first frames and consecutive frames are supported, including the CAN FD escape sequences. Flow control frames are ignored.
+    A consecutive frame received out of sequence drops the message being received.
+    """
+
+    _partial: Dict[int, Tuple[bytearray, int, int, Any, Any]]     # ID : (data, total size, next sequence number, first frame timestamp, first frame position)
+
+    def __init__(self) -> None:
+        self._partial = {}
+
+    def feed(self, can_id: int, data: bytes, timestamp: Any = None, position: Any = None) -> Optional[Tuple[bytes, Any, Any]]:
+        """
+        Processes a CAN frame.
+
+        :return: ``None`` or, when a message is complete, a tuple ``(payload, timestamp, position)`` where ``timestamp`` and ``position`` are the ones of the first frame of the message
+        """
+        if len(data) == 0:
+            return None
+        pci = data[0] >> 4
+        if pci == 0:     # Single frame
+            length = data[0] & 0x0F
+            if length == 0 and len(data) > 1:     # CAN FD
+                length = data[1]
+                payload = data[2:2 + length]
+            else:
+                payload = data[1:1 + length]
+            self._partial.pop(can_id, None)
+            if length == 0 or len(payload) < length:
+                return None
+            return (bytes(payload), timestamp, position)
+
+        if pci == 1:     # First frame
+            if len(data) < 2:
+                return None
+            length = ((data[0] & 0x0F) << 8) | data[1]
+            start = 2
+            if length == 0:   # More than 4095 bytes
+                if len(data) < 6:
+                    return None
+                length = int.from_bytes(data[2:6], 'big')
+                start = 6
+            self._partial[can_id] = (bytearray(data[start:]), length, 1, timestamp, position)
+            return None
+
+        if pci == 2:     # Consecutive frame
+            partial = self._partial.get(can_id, None)
+            if partial is None:
+                return None
+            buffer, length, sequence, first_timestamp, first_position = partial
+            if data[0] & 0x0F != sequence:
+                del self._partial[can_id]
+                return None
+            buffer += data[1:]
+            if len(buffer) >= length:
+                del self._partial[can_id]
+                return (bytes(buffer[:length]), first_timestamp, first_position)
+            self._partial[can_id] = (buffer, length, (sequence + 1) & 0x0F, first_timestamp, first_position)
+        return None
+
+    def reset(self) -> None:
+        self._partial = {}
+
+
+class UdsTransaction:
+    """
+    A request sent to an ECU and the final response it gave, found in a log by :class:`UdsLogDecoder<udsoncan.logdecoder.UdsLogDecoder>`.
+
+    .. data:: timestamp
+
+        Time of the first frame of the request
+
+    .. data:: tester_id
+
+        CAN ID of the request
+
+    .. data:: ecu_id
+
+        CAN ID of the response. ``None`` if there is no response
+
+    .. data:: request
+
+        The request payload
+
+    .. data:: response
+
+        The payload of the final response. NRC 0x78 (ResponsePending) are not kept. ``None`` if the ECU did not respond
+
+    .. data:: response_timestamp
+
+        Time of the first frame of the final response
+
+    .. data:: pending_count
+
+        Number of NRC 0x78 (ResponsePending) received before the final response
+
+    .. data:: position
+
+        Position of the first frame of the request in the log
+    """
+    __slots__ = ('timestamp', 'tester_id', 'ecu_id', 'request', 'response', 'response_timestamp', 'pending_count', 'position')
+
+    timestamp: float
+    tester_id: int
+    ecu_id: Optional[int]
+    request: bytes
+    response: Optional[bytes]
+    response_timestamp: Optional[float]
+    pending_count: int
+    position: int
+
+    def __init__(self, timestamp: float, tester_id: int, request: bytes, position: int = 0):
+        self.timestamp = timestamp
+        self.tester_id = tester_id
+        self.ecu_id = None
+        self.request = request
+        self.response = None
+        self.response_timestamp = None
+        self.pending_count = 0
+        self.position = position
+
+    def copy(self) -> "UdsTransaction":
+        transaction = UdsTransaction(self.timestamp, self.tester_id, self.request, self.position)
+        transaction.pending_count = self.pending_count
+        return transaction
+
+    def __repr__(self) -> str:
+        return '<%s: 0x%x [%s] -> %s [%s] at 0x%08x>' % (self.__class__.__name__, self.tester_id, self.request.hex(),
+                                                       'None' if self.ecu_id is None else '0x%x' % self.ecu_id,
+                                                       '' if self.response is None else self.response.hex(), id(self))
+
+
+class UdsLogDecoder:
+    """
+    Pairs the UDS requests and responses found in a sequence of CAN frames. Frames are given one by one, in the order of the log, with :meth:`feed<udsoncan.logdecoder.UdsLogDecoder.feed>`.
+
+    Requests and responses are told apart by their service ID. A response is paired with the pending request sent on the CAN ID associated with its own CAN ID.
+    Without ``address_pairs``, the OBD convention is used : 11 bits IDs 0x7E8-0x7EF respond to 0x7E0-0x7E7 and 29 bits IDs 0x18DAxxyy respond to 0x18DAyyxx.
+    Functional requests (0x7DF, 0x18DBxxyy or the IDs in ``functional_ids``) are paired with the response of every ECU.
+
+    A request without response is completed when another request is sent on the same ID or when ``response_timeout`` expires.
+    The timeout starts over after each NRC 0x78 (ResponsePending).
+
+    :param address_pairs: List of ``(request ID, response ID)`` tuples
+    :type address_pairs: list
+
+    :param functional_ids: CAN IDs of the functional requests, when ``address_pairs`` is given
+    :type functional_ids: list of int
+
+    :param response_timeout: Maximum time between a request and its response, in seconds
+    :type response_timeout: float
+    """
+
+    response_timeout: float
+    _request_ids: Dict[int, int]    # Response ID : request ID
+    _functional_ids: Optional[List[int]]
+    _pending: Dict[int, Tuple[UdsTransaction, float]]   # Request ID : (transaction, deadline)
+    _answered: Set[int]     # Functional requests that got at least one response
+    _next_deadline: float
+
+    def __init__(self, address_pairs: Optional[Iterable[Tuple[int, int]]] = None, functional_ids: Optional[Iterable[int]] = None, response_timeout: float = 5.0):
+        self.response_timeout = response_timeout
+        self._auto_address = address_pairs is None
+        self._request_ids = {} if address_pairs is None else {response_id: request_id for request_id, response_id in address_pairs}
+        self._functional_ids = None if functional_ids is None else list(functional_ids)
+        self._reassembler = IsoTpReassembler()
+        self._pending = {}
+        self._answered = set()
+        self._next_deadline = float('inf')
+
+    def feed(self, timestamp: float, can_id: int, data: bytes, position: int = 0) -> List[UdsTransaction]:
+        """
+        Processes a CAN frame.
+
+        :param timestamp: Time of the frame
+        :param can_id: Arbitration ID
+        :param data: Data of the frame
+        :param position: Position of the frame in the log, kept in the transactions. Line number or file offset for example
+
+        :return: The transactions completed by this frame
+        """
+        completed: List[UdsTransaction] = []
+        if timestamp >= self._next_deadline:
+            self._expire(timestamp, completed)
+
+        message = self._reassembler.feed(can_id, data, timestamp, position)
+        if message is None:
+            return completed
+        payload, first_timestamp, first_position = message
+
+        if payload[0] & 0x40 == 0:    # Requests have bit 6 of the service ID cleared, responses have it set
+            if can_id in self._pending:
+                self._complete(can_id, completed)
+            transaction = UdsTransaction(first_timestamp, can_id, payload, first_position)
+            self._set_pending(can_id, transaction, timestamp + self.response_timeout)
+            return completed
+
+        request_id = self._get_request_id(can_id)
+        entry = None if request_id is None else self._pending.get(request_id, None)
+        if entry is None:
+            for functional_id in self._pending:
+                if self._is_functional(functional_id):
+                    entry = self._pending[functional_id]
+                    request_id = functional_id
+                    break
+            if entry is None:
+                return completed    # Unsolicited response, or response to a request older than the log
+        assert request_id is not None
+
+        transaction, deadline = entry
+        if len(payload) >= 3 and payload[0] == 0x7F and payload[2] == Response.Code.RequestCorrectlyReceived_ResponsePending:
+            transaction.pending_count += 1
+            self._set_pending(request_id, transaction, timestamp + self.response_timeout)
+            return completed
+
+        if self._is_functional(request_id):
+            self._answered.add(request_id)
+            transaction = transaction.copy()    # Other ECUs may respond to the same request
+        else:
+            del self._pending[request_id]
+        transaction.ecu_id = can_id
+        transaction.response = payload
+        transaction.response_timestamp = first_timestamp
+        completed.append(transaction)
+        return completed
+
+    def flush(self) -> List[UdsTransaction]:
+        """Completes all the pending requests, as if the log was over. Returns them"""
+        completed: List[UdsTransaction] = []
+        for request_id in list(self._pending.keys()):
+            self._complete(request_id, completed)
+        self._next_deadline = float('inf')
+        self._reassembler.reset()
+        return completed
+
+    def pending_positions(self) -> List[int]:
+        """Positions of the requests waiting for a response"""
+        return [entry[0].position for entry in self._pending.values()]
+
+    def _set_pending(self, request_id: int, transaction: UdsTransaction, deadline: float) -> None:
+        self._pending[request_id] = (transaction, deadline)
+        if deadline < self._next_deadline:
+            self._next_deadline = deadline
+
+    def _expire(self, timestamp: float, completed: List[UdsTransaction]) -> None:
+        self._next_deadline = float('inf')
+        for request_id in list(self._pending.keys()):
+            transaction, deadline = self._pending[request_id]
+            if deadline <= timestamp:
+                self._complete(request_id, completed)
+            elif deadline < self._next_deadline:
+                self._next_deadline = deadline
+
+    def _complete(self, request_id: int, completed: List[UdsTransaction]) -> None:
+        # Removes a request that will not get more responses. A functional request is only reported if no ECU responded
+        transaction, deadline = self._pending.pop(request_id)
+        if request_id in self._answered:
+            self._answered.remove(request_id)
+        else:
+            completed.append(transaction)
+
+    def _get_request_id(self, response_id: int) -> Optional[int]:
+        if not self._auto_address:
+            return self._request_ids.get(response_id, None)
+        if 0x7E8 <= response_id <= 0x7EF:
+            return response_id - 8
+        if (response_id >> 16) & 0x1FFF == 0x18DA:
+            return (response_id & 0xFFFF0000) | ((response_id & 0xFF) << 8) | ((response_id >> 8) & 0xFF)
+        return None
+
+    def _is_functional(self, request_id: int) -> bool:
+        if self._functional_ids is not None:
+            return request_id in self._functional_ids
+        if self._auto_address:
+            return request_id == 0x7DF or (request_id >> 16) & 0x1FFF == 0x18DB
+        return False
+
+
+# ==== Log formats
+# Each parser reads one line of text and returns a CAN frame, or None if the line is not a frame.
+
+def parse_candump_line(line: str) -> Optional[CanFrame]:
+    """
+    Parses a line written by candump, in the log format (``candump -l``) : ``(1436509052.249713) can0 7E0#0322F19000000000``
+    or in the default format, with or without timestamp : ``(1436509052.249713)  can0  7E0   [8]  03 22 F1 90 00 00 00 00``
+    """
+    tokens = line.split()
+    if len(tokens) < 2:
+        return None
+    timestamp = 0.0
+    if tokens[0].startswith('('):
+        try:
+            timestamp = float(tokens[0].strip('()'))
+        except ValueError:
+            return None
+        tokens = tokens[1:]
+
+    try:
+        if len(tokens) == 2 and '#' in tokens[1]:
+            can_id, data = tokens[1].split('#', 1)
+            if data.startswith('#'):   # CAN FD : flags follow ##
+                data = data[2:]
+            elif data.startswith('R'):  # Remote frame
+                return None
+            return (timestamp, int(can_id, 16), bytes.fromhex(data))
+
+        if len(tokens) >= 3 and tokens[2].startswith('['):
+            length = int(tokens[2].strip('[]'))
+            return (timestamp, int(tokens[1], 16), bytes.fromhex(''.join(tokens[3:3 + length])))
+    except ValueError:
+        pass
+    return None
+
+
+def parse_asc_line(line: str, base: int = 16) -> Optional[CanFrame]:
+    """
+    Parses a classic CAN frame line of a Vector ASC log : ``0.012345 1  7E0             Rx   d 8 03 22 F1 90 00 00 00 00``.
+    Extended IDs end with ``x``. CAN FD lines and events are ignored.
+
+    :param base: Base of the IDs, given by the ``base hex`` or ``base dec`` line of the header
+    """
+    tokens = line.split()
+    if len(tokens) < 6 or tokens[4] != 'd':
+        return None
+    try:
+        can_id = tokens[2]
+        if can_id.endswith('x'):
+            can_id = can_id[:-1]
+        length = int(tokens[5], 16)
+        return (float(tokens[0]), int(can_id, base), bytes(int(value, base) for value in tokens[6:6 + length]))
+    except ValueError:
+        return None
+
+
+def parse_csv_line(line: str) -> Optional[CanFrame]:
+    """
+    Parses a line of a CSV log made of 3 columns : timestamp, ID in hexadecimal and data in hexadecimal. Example : ``12.5,7E0,0322F190``.
+    The data bytes may be separated by spaces. Header lines are ignored.
+    """
+    fields = line.split(',')
+    if len(fields) < 3:
+        return None
+    try:
+        return (float(fields[0]), int(fields[1], 16), bytes.fromhex(fields[2].strip()))
+    except ValueError:
+        return None
+
+
+def detect_format(filename: str) -> str:
+    """Guesses the format of a log from the extension of its name : ``.asc``, ``.csv``, anything else is candump"""
+    extension = os.path.splitext(filename)[1].lower()
+    if extension == '.asc':
+        return 'asc'
+    if extension == '.csv':
+        return 'csv'
+    return 'candump'
+
+
+def _get_line_parser(fmt: str, filename: str) -> Callable[[str], Optional[CanFrame]]:
+    if fmt == 'candump':
+        return parse_candump_line
+    if fmt == 'csv':
+        return parse_csv_line
+    if fmt == 'asc':
+        base = 16
+        with open(filename, 'r', encoding='latin-1') as f:
+            for i, line in enumerate(f):
+                tokens = line.split()
+                if len(tokens) >= 2 and tokens[0] == 'base':
+                    base = 10 if tokens[1] == 'dec' else 16
+                    break
+                if i > 20:
+                    break
+        return lambda line: parse_asc_line(line, base)
+    raise ValueError('Unsupported log format "%s". Supported formats are : %s' % (fmt, ', '.join(FORMATS)))
+
+
+# ==== Decoding of the transactions
+
+def _to_json_value(value: Any) -> Any:
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, (bytes, bytearray)):
+        return value.hex()
+    if isinstance(value, dict):
+        return {k: _to_json_value(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_to_json_value(v) for v in value]
+    if isinstance(value, Dtc):
+        return {'id': value.id, 'status': value.status.get_byte_as_int(), 'severity': value.severity.get_byte_as_int()}
+    if hasattr(value, 'get_byte_as_int'):
+        return value.get_byte_as_int()
+    if hasattr(value, '__dict__'):
+        return {k: _to_json_value(v) for k, v in vars(value).items() if not k.startswith('_') and k != 'service_class'}
+    return str(value)
+
+
+def _interpret(service: Any, request: Request, response: Response, didconfig: Optional[CompiledDidConfig], standard_version: int) -> Response:
+    if service is services.ReadDataByIdentifier:
+        if didconfig is None:
+            raise ValueError('No DID configuration given')
+        data = request.data or b''
+        didlist = [int.from_bytes(data[i:i + 2], 'big') for i in range(0, len(data) - 1, 2)]
+        return service.interpret_response(response, didlist=didlist, didconfig=didconfig)
+    if service is services.ReadDTCInformation:
+        if request.subfunction is None:
+            raise ValueError('Request has no subfunction')
+        return service.interpret_response(response, subfunction=request.subfunction)
+    if service is services.SecurityAccess:
+        mode = services.SecurityAccess.Mode.RequestSeed if (request.subfunction or 0) % 2 == 1 else services.SecurityAccess.Mode.SendKey
+        return service.interpret_response(response, mode=mode)
+    if service is services.DiagnosticSessionControl:
+        return service.interpret_response(response, standard_version=standard_version)
+    return service.interpret_response(response)
+
+
+def decode_transaction(transaction: UdsTransaction,
+                       didconfig: Optional[Union[Dict, CompiledDidConfig]] = None,
+                       standard_version: int = latest_standard) -> Dict[str, Any]:
+    """
+    Decodes a transaction with the ``interpret_response`` method of its service.
+
+    :param transaction: The transaction to decode
+    :type transaction: :class:`UdsTransaction<udsoncan.logdecoder.UdsTransaction>`
+
+    :param didconfig: The DID configuration used to decode the ReadDataByIdentifier responses, as in the :ref:`client configuration<config_data_identifiers>`
+    :type didconfig: dict
+
+    :param standard_version: The version of the UDS standard
+    :type standard_version: int
+
+    :return: A dictionary that can be serialized in JSON. Keys are ``timestamp``, ``tester_id``, ``ecu_id``, ``service``, ``subfunction``, ``request``, ``response``,
+        ``status`` (``positive``, ``negative``, ``no_response``, ``invalid``), ``nrc``, ``pending_count``, ``latency``, ``data`` (the decoded response data) and ``error``
+        (why the response could not be decoded)
+    """
+    if isinstance(didconfig, dict):
+        didconfig = CompiledDidConfig(didconfig)
+
+    request = Request.from_payload(transaction.request)
+    result: Dict[str, Any] = {
+        'timestamp': transaction.timestamp,
+        'tester_id': transaction.tester_id,
+        'ecu_id': transaction.ecu_id,
+        'service': None if request.service is None else request.service.get_name(),
+        'subfunction': request.subfunction,
+        'request': transaction.request.hex(),
+        'response': None if transaction.response is None else transaction.response.hex(),
+        'status': 'no_response',
+        'nrc': None,
+        'pending_count': transaction.pending_count,
+        'latency': None if transaction.response_timestamp is None else transaction.response_timestamp - transaction.timestamp,
+        'data': None,
+        'error': None
+    }
+    if transaction.response is None:
+        return result
+
+    response = Response.from_payload(transaction.response)
+    if not response.valid or response.service is None:
+        result['status'] = 'invalid'
+        result['error'] = response.invalid_reason
+        return result
+
+    if not response.positive:
+        result['status'] = 'negative'
+        result['nrc'] = response.code
+        return result
+
+    result['status'] = 'positive'
+    if request.service is None or response.service is not request.service:
+        result['error'] = 'Response does not match the request service'
+        return result
+
+    try:
+        interpreted = _interpret(request.service, request, response, didconfig, standard_version)
+        result['data'] = _to_json_value(interpreted.service_data)
+    except Exception as e:
+        result['error'] = '%s: %s' % (e.__class__.__name__, str(e))
+    return result
+
+
+# ==== Log files
+
+def _decode_range(filename: str, fmt: str, start: int, end: Optional[int], options: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    # Decodes the transactions whose request starts within [start, end[ bytes of the file. The reading continues after end until these
+    # transactions are complete. The frames before start that belong to a message started earlier are ignored by the reassembler.
+    # Transactions are given in the order of their request in the file.
+    parser = _get_line_parser(fmt, filename)
+    decoder = UdsLogDecoder(address_pairs=options['address_pairs'], functional_ids=options['functional_ids'], response_timeout=options['response_timeout'])
+    didconfig = None if options['didconfig'] is None else CompiledDidConfig(options['didconfig'])
+    standard_version = options['standard_version']
+    completed: List[Tuple[int, int, UdsTransaction]] = []   # Heap ordered by position
+    counter = 0
+
+    def accept(transactions: List[UdsTransaction]) -> None:
+        nonlocal counter
+        for transaction in transactions:
+            if transaction.position >= start and (end is None or transaction.position < end):
+                heapq.heappush(completed, (transaction.position, counter, transaction))
+                counter += 1
+
+    with open(filename, 'rb') as f:
+        position = start
+        if start > 0:
+            f.seek(start - 1)
+            position = start - 1 + len(f.readline())    # First line starting at or after start
+
+        for raw_line in f:
+            line_position = position
+            position += len(raw_line)
+            if end is not None and line_position >= end and all(p >= end for p in decoder.pending_positions()):
+                break
+            frame = parser(raw_line.decode('latin-1'))
+            if frame is None:
+                continue
+            accept(decoder.feed(frame[0], frame[1], frame[2], line_position))
+
+            if len(completed) > 0:
+                pending = decoder.pending_positions()
+                limit = min(pending) if len(pending) > 0 else None
+                while len(completed) > 0 and (limit is None or completed[0][0] < limit):
+                    yield decode_transaction(heapq.heappop(completed)[2], didconfig, standard_version)
+
+    accept(decoder.flush())
+    while len(completed) > 0:
+        yield decode_transaction(heapq.heappop(completed)[2], didconfig, standard_version)
+
+
+def _decode_chunk(args: Tuple[str, str, int, Optional[int], Dict[str, Any]]) -> List[Dict[str, Any]]:
+    return list(_decode_range(*args))
+
+
+def decode_log(filename: str,
+               fmt: Optional[str] = None,
+               processes: Optional[int] = 1,
+               chunk_size: int = 16 * 1024 * 1024,
+               address_pairs: Optional[Iterable[Tuple[int, int]]] = None,
+               functional_ids: Optional[Iterable[int]] = None,
+               didconfig: Optional[Dict] = None,
+               response_timeout: float = 5.0,
+               standard_version: int = latest_standard) -> Iterator[Dict[str, Any]]:
+    """
+    Decodes the UDS transactions of a CAN log file. See :class:`UdsLogDecoder<udsoncan.logdecoder.UdsLogDecoder>` for how requests and responses are paired
+    and :func:`decode_transaction<udsoncan.logdecoder.decode_transaction>` for the content of each transaction. Transactions are given in the order of the requests in the log.
+
+    With more than one process, the file is split in chunks of ``chunk_size`` bytes decoded by a ``multiprocessing`` pool. The result is the same as with a single process.
+    The DID configuration must then be made of objects that can be pickled (codec classes defined at module level, pack strings, etc.).
+
+    :param filename: The log file
+    :type filename: str
+
+    :param fmt: The format of the log : ``candump``, ``asc`` or ``csv``. Guessed from the file name when ``None``
+    :type fmt: str
+
+    :param processes: Number of processes. ``None`` uses all the CPUs
+    :type processes: int
+
+    :param chunk_size: Size of the chunks given to each process, in bytes
+    :type chunk_size: int
+
+    :param address_pairs: See :class:`UdsLogDecoder<udsoncan.logdecoder.UdsLogDecoder>`
+    :param functional_ids: See :class:`UdsLogDecoder<udsoncan.logdecoder.UdsLogDecoder>`
+
+    :param didconfig: The DID configuration used to decode the ReadDataByIdentifier responses
+    :type didconfig: dict
+
+    :param response_timeout: Maximum time between a request and its response, in seconds
+    :type response_timeout: float
+
+    :param standard_version: The version of the UDS standard
+    :type standard_version: int
+    """
+    if fmt is None:
+        fmt = detect_format(filename)
+    if fmt not in FORMATS:
+        raise ValueError('Unsupported log format "%s". Supported formats are : %s' % (fmt, ', '.join(FORMATS)))
+    if chunk_size < 1:
+        raise ValueError('chunk_size must be a positive integer')
+
+    options = {
+        'address_pairs': None if address_pairs is None else list(address_pairs),
+        'functional_ids': None if functional_ids is None else list(functional_ids),
+        'didconfig': didconfig,
+        'response_timeout': response_timeout,
+        'standard_version': standard_version
+    }
+
+    if processes is None:
+        processes = os.cpu_count() or 1
+    size = os.path.getsize(filename)
+    if processes <= 1 or size <= chunk_size:
+        yield from _decode_range(filename, fmt, 0, None, options)
+        return
+
+    chunks = [(filename, fmt, start, start + chunk_size if start + chunk_size < size else None, options) for start in range(0, size, chunk_size)]
+    with multiprocessing.Pool(processes) as pool:
+        for results in pool.imap(_decode_chunk, chunks):
+            yield from results
+
+
+def write_jsonl(transactions: Iterable[Dict[str, Any]], f: IO[str]) -> int:
+    """Writes decoded transactions in a JSON lines file, one transaction per line. Returns the number of transactions written"""
+    count = 0
+    for transaction in transactions:
+        f.write(json.dumps(transaction, default=str))
+        f.write('\n')
+        count += 1
+    return count
+
+
+def to_columns(transactions: Iterable[Dict[str, Any]]) -> Dict[str, List[Any]]:
+    """
+    Converts decoded transactions in a dictionary of columns, one list per key, ready to be given to ``pandas.DataFrame`` or ``pyarrow.table``.
+    The ``data`` column contains the decoded response data serialized in JSON.
+    """
+    columns: Dict[str, List[Any]] = {}
+    for transaction in transactions:
+        if len(columns) == 0:
+            columns = {key: [] for key in transaction}
+        for key, column in columns.items():
+            value = transaction[key]
+            column.append(json.dumps(value, default=str) if key == 'data' and value is not None else value)
+    return columns
+
+
+def write_parquet(transactions: Iterable[Dict[str, Any]], filename: str) -> None:
+    """Writes decoded transactions in a Parquet file. Requires pyarrow to be installed"""
+    import pyarrow  # type: ignore
+    import pyarrow.parquet  # type: ignore
+    pyarrow.parquet.write_table(pyarrow.table(to_columns(transactions)), filename)
@@ -0,0 +1,292 @@
+import bisect
+import threading
+
+from udsoncan.BaseService import BaseService
+from udsoncan.Request import Request
+
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type
+
+DEFAULT_TIME_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+DEFAULT_PROCESSING_TIME_BUCKETS = (0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01)
+DEFAULT_SIZE_BUCKETS = (8, 16, 32, 64, 128, 256, 512, 1024, 4096, 16384, 65536)
+
+
+class Histogram:
+    """
+    Counts observed values in fixed buckets. Each bucket counts the values smaller or equal to its upper bound
+    and greater than the previous bound. Values greater than the last bound are counted in an overflow bucket.
+
+    :param bounds: The upper bounds of the buckets, in increasing order
+    :type bounds: list of float
+    """
+
+    bounds: Tuple[float, ...]
+    counts: List[int]
+    sum: float
+    count: int
+
+    def __init__(self, bounds: Sequence[float]):
+        if len(bounds) == 0:
+            raise ValueError('At least one bucket bound is required')
+        if any(bounds[i] >= bounds[i + 1] for i in range(len(bounds) - 1)):
+            raise ValueError('Bucket bounds must be in increasing order')
+        self.bounds = tuple(bounds)
+        self.reset()
+
+    def reset(self) -> None:
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.sum = 0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative_counts(self) -> List[int]:
+        """Returns the number of values smaller or equal to each bound, followed by the total count"""
+        counts = []
+        total = 0
+        for count in self.counts:
+            total += count
+            counts.append(total)
+        return counts
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            'bounds': list(self.bounds),
+            'counts': list(self.counts),
+            'sum': self.sum,
+            'count': self.count
+        }
+
+
+class ServiceMetrics:
+    """
+    Metrics of the requests sent for a single service and subfunction.
+
+    .. data:: requests
+
+        Number of requests sent
+
+    .. data:: timeouts
+
+        Number of requests that did not get a response in time
+
+    .. data:: negative_responses
+
+        Number of final negative responses received. Pending responses (NRC 0x78) are not included
+
+    .. data:: response_pending
+
+        Number of NRC 0x78 (RequestCorrectlyReceived-ResponsePending) responses received
+
+    .. data:: response_time
+
+        :class:`Histogram<udsoncan.metrics.Histogram>` of the time in seconds between the transmission of the request and the reception of the first response
+
+    .. data:: pending_time
+
+        :class:`Histogram<udsoncan.metrics.Histogram>` of the time in seconds spent waiting in P2* : from the first NRC 0x78 to the final response
+
+    .. data:: encode_time
+
+        :class:`Histogram<udsoncan.metrics.Histogram>` of the time in seconds spent in the client to build the request, before it is sent
+
+    .. data:: decode_time
+
+        :class:`Histogram<udsoncan.metrics.Histogram>` of the time in seconds spent in the client after the response is received, until the result or the next request is ready
+
+    .. data:: request_size
+
+        :class:`Histogram<udsoncan.metrics.Histogram>` of the request payload sizes in bytes
+
+    .. data:: response_size
+
+        :class:`Histogram<udsoncan.metrics.Histogram>` of the response payload sizes in bytes, including pending responses
+    """
+
+    service_name: str
+    subfunction: Optional[int]
+    requests: int
+    timeouts: int
+    negative_responses: int
+    response_pending: int
+    response_time: Histogram
+    pending_time: Histogram
+    encode_time: Histogram
+    decode_time: Histogram
+    request_size: Histogram
+    response_size: Histogram
+
+    def __init__(self,
+                 service_name: str,
+                 subfunction: Optional[int],
+                 time_buckets: Sequence[float] = DEFAULT_TIME_BUCKETS,
+                 processing_time_buckets: Sequence[float] = DEFAULT_PROCESSING_TIME_BUCKETS,
+                 size_buckets: Sequence[float] = DEFAULT_SIZE_BUCKETS):
+        self.service_name = service_name
+        self.subfunction = subfunction
+        self.requests = 0
+        self.timeouts = 0
+        self.negative_responses = 0
+        self.response_pending = 0
+        self.response_time = Histogram(time_buckets)
+        self.pending_time = Histogram(time_buckets)
+        self.encode_time = Histogram(processing_time_buckets)
+        self.decode_time = Histogram(processing_time_buckets)
+        self.request_size = Histogram(size_buckets)
+        self.response_size = Histogram(size_buckets)
+
+    def histograms(self) -> Dict[str, Histogram]:
+        return {
+            'response_time': self.response_time,
+            'pending_time': self.pending_time,
+            'encode_time': self.encode_time,
+            'decode_time': self.decode_time,
+            'request_size': self.request_size,
+            'response_size': self.response_size,
+        }
+
+    def snapshot(self) -> Dict[str, Any]:
+        d: Dict[str, Any] = {
+            'service': self.service_name,
+            'subfunction': self.subfunction,
+            'requests': self.requests,
+            'timeouts': self.timeouts,
+            'negative_responses': self.negative_responses,
+            'response_pending': self.response_pending,
+        }
+        for name, histogram in self.histograms().items():
+            d[name] = histogram.snapshot()
+        return d
+
+
+class ClientMetrics:
+    """
+    Collects metrics about the requests sent by a :ref:`Client<Client>`, per service and subfunction.
+    Metrics are collected only when an instance is attached to a client : ``client.metrics = ClientMetrics()``.
+
+    Values are stored in fixed-bucket histograms so that the memory used does not grow with the number of requests.
+    Updates are not locked; a single client should not be used by many threads at once anyway.
+
+    :param time_buckets: Upper bounds in seconds of the buckets used for the response time and the pending time
+    :type time_buckets: list of float
+
+    :param processing_time_buckets: Upper bounds in seconds of the buckets used for the encoding and decoding time
+    :type processing_time_buckets: list of float
+
+    :param size_buckets: Upper bounds in bytes of the buckets used for the payload sizes
+    :type size_buckets: list of int
+    """
+
+    PROMETHEUS_COUNTERS = [
+        ('requests', 'requests_total', 'Number of requests sent'),
+        ('timeouts', 'timeouts_total', 'Number of requests that did not get a response in time'),
+        ('negative_responses', 'negative_responses_total', 'Number of final negative responses'),
+        ('response_pending', 'response_pending_total', 'Number of NRC 0x78 responses received'),
+    ]
+
+    PROMETHEUS_HISTOGRAMS = [
+        ('response_time', 'response_time_seconds', 'Time between the transmission of a request and its first response'),
+        ('pending_time', 'pending_time_seconds', 'Time spent waiting for the final response after a NRC 0x78'),
+        ('encode_time', 'encode_time_seconds', 'Time spent building a request'),
+        ('decode_time', 'decode_time_seconds', 'Time spent processing a response'),
+        ('request_size', 'request_size_bytes', 'Size of the request payloads'),
+        ('response_size', 'response_size_bytes', 'Size of the response payloads'),
+    ]
+
+    services: Dict[Tuple[Type[BaseService], Optional[int]], ServiceMetrics]
+    time_buckets: Sequence[float]
+    processing_time_buckets: Sequence[float]
+    size_buckets: Sequence[float]
+
+    def __init__(self,
+                 time_buckets: Sequence[float] = DEFAULT_TIME_BUCKETS,
+                 processing_time_buckets: Sequence[float] = DEFAULT_PROCESSING_TIME_BUCKETS,
+                 size_buckets: Sequence[float] = DEFAULT_SIZE_BUCKETS):
+        self.time_buckets = time_buckets
+        self.processing_time_buckets = processing_time_buckets
+        self.size_buckets = size_buckets
+        self.services = {}
+        self._lock = threading.Lock()
+
+    def get(self, service: Type[BaseService], subfunction: Optional[int] = None) -> ServiceMetrics:
+        """Returns the :class:`ServiceMetrics<udsoncan.metrics.ServiceMetrics>` of a service and subfunction, created if needed"""
+        key = (service, subfunction)
+        entry = self.services.get(key, None)
+        if entry is None:
+            with self._lock:
+                entry = self.services.get(key, None)
+                if entry is None:
+                    entry = ServiceMetrics(service.get_name(), subfunction, self.time_buckets, self.processing_time_buckets, self.size_buckets)
+                    self.services[key] = entry
+        return entry
+
+    def for_request(self, request: Request) -> ServiceMetrics:
+        """Returns the :class:`ServiceMetrics<udsoncan.metrics.ServiceMetrics>` matching the service and subfunction of a request"""
+        if request.service is None:
+            raise ValueError('Request has no service')
+        subfunction = request.subfunction if request.service.use_subfunction() else None
+        return self.get(request.service, subfunction)
+
+    def reset(self) -> None:
+        """Removes all the collected metrics"""
+        with self._lock:
+            self.services = {}
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """
+        Returns a copy of the collected metrics as a list of dictionaries, one per service and subfunction.
+        Histograms are given as dictionaries with the keys ``bounds``, ``counts`` (one more than ``bounds``, for the overflow), ``sum`` and ``count``
+        """
+        return [entry.snapshot() for entry in list(self.services.values())]
+
+    def to_prometheus(self, prefix: str = 'udsoncan', labels: Optional[Dict[str, str]] = None) -> str:
+        """
+        Returns the collected metrics in the Prometheus text exposition format.
+
+        :param prefix: Prefix added to the name of every metric
+        :type prefix: str
+
+        :param labels: Optional additional labels added to every metric. Example: ``{'ecu' : 'engine'}``
+        :type labels: dict
+        """
+        entries = list(self.services.values())
+        extra_labels = [] if labels is None else [(k, str(v)) for k, v in labels.items()]
+        lines = []
+
+        def format_labels(label_list: List[Tuple[str, str]]) -> str:
+            return '{' + ','.join('%s="%s"' % (k, self._escape_label(v)) for k, v in label_list) + '}'
+
+        for attr, name, description in self.PROMETHEUS_COUNTERS:
+            fullname = '%s_%s' % (prefix, name)
+            lines.append('# HELP %s %s' % (fullname, description))
+            lines.append('# TYPE %s counter' % fullname)
+            for entry in entries:
+                lines.append('%s%s %d' % (fullname, format_labels(self._entry_labels(entry) + extra_labels), getattr(entry, attr)))
+
+        for attr, name, description in self.PROMETHEUS_HISTOGRAMS:
+            fullname = '%s_%s' % (prefix, name)
+            lines.append('# HELP %s %s' % (fullname, description))
+            lines.append('# TYPE %s histogram' % fullname)
+            for entry in entries:
+                histogram = getattr(entry, attr)
+                entry_labels = self._entry_labels(entry) + extra_labels
+                cumulative = histogram.cumulative_counts()
+                for bound, count in zip(list(histogram.bounds) + ['+Inf'], cumulative):
+                    le = bound if isinstance(bound, str) else '%g' % bound
+                    lines.append('%s_bucket%s %d' % (fullname, format_labels(entry_labels + [('le', le)]), count))
+                lines.append('%s_sum%s %.9g' % (fullname, format_labels(entry_labels), histogram.sum))
+                lines.append('%s_count%s %d' % (fullname, format_labels(entry_labels), histogram.count))
+
+        return '\n'.join(lines) + '\n'
+
+    @classmethod
+    def _entry_labels(cls, entry: ServiceMetrics) -> List[Tuple[str, str]]:
+        subfunction = '' if entry.subfunction is None else '0x%02x' % entry.subfunction
+        return [('service', entry.service_name), ('subfunction', subfunction)]
+
+    @classmethod
+    def _escape_label(cls, value: str) -> str:
+        return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
@@ -0,0 +1,271 @@
+import collections
+import concurrent.futures
+import logging
+import threading
+import time
+
+from udsoncan.client import Client
+from udsoncan.metrics import DEFAULT_TIME_BUCKETS, Histogram
+
+from typing import Any, Callable, Deque, Dict, Optional, Sequence, Tuple, Union
+
+
+class _Job:
+    __slots__ = ('operation', 'args', 'kwargs', 'priority', 'producer', 'future', 'submit_time')
+
+    def __init__(self, operation: Union[str, Callable], args: Tuple, kwargs: Dict, priority: int, producer: Any):
+        self.operation = operation
+        self.args = args
+        self.kwargs = kwargs
+        self.priority = priority
+        self.producer = producer
+        self.future: concurrent.futures.Future = concurrent.futures.Future()
+        self.submit_time = time.monotonic()
+
+
+class SharedClient:
+    """
+    Lets many threads use the same :ref:`Client<Client>`, which is not thread safe by itself : a thread waiting for a response could receive the response
+    to the request of another thread. Operations submitted from any thread are queued and executed one at a time by a worker thread.
+    Each submission returns a ``concurrent.futures.Future`` that gives the result of the operation or the exception it raised.
+
+    Operations are executed by priority, the lowest value first. Within a priority, the producers take turns : one operation of each producer having pending
+    operations is executed before a second one of the same producer, so a producer submitting many operations delays the others by at most one operation.
+    The producer defaults to the submitting thread.
+
+    The client is not opened nor closed by this class, and must not be used directly while it is shared.
+
+    :param client: The client to share
+    :type client: :ref:`Client<Client>`
+
+    :param name: This name is included in the logger name so that its output can be redirected. The logger name will be ``SharedClient[<name>]``
+    :type name: string
+
+    :param time_buckets: Upper bounds in seconds of the buckets of the ``wait_time`` histograms
+    :type time_buckets: list of float
+
+    .. data:: wait_time
+
+        Dictionary mapping a priority to a :class:`Histogram<udsoncan.metrics.Histogram>` of the time in seconds spent by the operations in the queue
+
+    .. data:: executed
+
+        Number of operations executed
+
+    .. data:: max_queue_depth
+
+        Largest number of operations waiting in the queue since the creation of the object
+    """
+
+    class Priority:
+        HIGH = 0        # User actions, TesterPresent
+        NORMAL = 1
+        LOW = 2         # Bulk polling
+
+    client: Client
+    logger: logging.Logger
+    wait_time: Dict[int, Histogram]
+    executed: int
+    max_queue_depth: int
+    time_buckets: Sequence[float]
+    worker: Optional[threading.Thread]
+    _queues: Dict[int, "collections.OrderedDict[Any, Deque[_Job]]"]
+    _queue_depth: int
+
+    def __init__(self, client: Client, name: Optional[str] = None, time_buckets: Sequence[float] = DEFAULT_TIME_BUCKETS):
+        self.client = client
+        self.logger = logging.getLogger('SharedClient' if name is None else 'SharedClient[%s]' % name)
+        self.time_buckets = time_buckets
+        self.wait_time = {}
+        self.executed = 0
+        self.max_queue_depth = 0
+        self.worker = None
+        self._queues = {}
+        self._queue_depth = 0
+        self._condition = threading.Condition()
+        self._stop_requested = False
+
+    def __enter__(self) -> "SharedClient":
+        self.start()
+        return self
+
+    def __exit__(self, type, value, traceback) -> None:
+        self.close()
+
+    def start(self) -> None:
+        """Starts the worker thread. Called by ``__enter__``"""
+        with self._condition:
+            if self.worker is not None:
+                raise RuntimeError('SharedClient is already started')
+            self._stop_requested = False
+            self.worker = threading.Thread(target=self._worker_task, daemon=True)
+            self.worker.start()
+
+    def close(self) -> None:
+        """Stops the worker thread once the operation being executed, if any, is completed. The operations still in the queue are cancelled"""
+        with self._condition:
+            self._stop_requested = True
+            worker = self.worker
+            self.worker = None
+            jobs = self._pop_all()
+            self._condition.notify_all()
+        for job in jobs:
+            job.future.cancel()
+        if worker is not None and worker is not threading.current_thread():
+            worker.join()
+
+    def submit(self, operation: Union[str, Callable], *args: Any, priority: int = Priority.NORMAL, producer: Any = None, **kwargs: Any) -> "concurrent.futures.Future[Any]":
+        """
+        Queues an operation to be executed with the client.
+
+        :param operation: The name of a client method (``'read_data_by_identifier'``), or a callable receiving the client as first parameter.
+            Additional arguments are passed to the operation.
+        :type operation: str or callable
+
+        :param priority: The priority of the operation. The lowest value is executed first. See ``SharedClient.Priority``
+        :type priority: int
+
+        :param producer: Any hashable value identifying the producer, used to share the worker fairly between producers of the same priority.
+            Defaults to the submitting thread
+        :type producer: hashable
+
+        :return: A future giving the result of the operation
+        :rtype: ``concurrent.futures.Future``
+        """
+        if not isinstance(operation, str) and not callable(operation):
+            raise ValueError('operation must be the name of a client method or a callable')
+        if not isinstance(priority, int):
+            raise ValueError('priority must be an integer')
+
+        job = _Job(operation, args, kwargs, priority, threading.get_ident() if producer is None else producer)
+        with self._condition:
+            if self.worker is None:
+                raise RuntimeError('SharedClient is not started')
+            producers = self._queues.get(priority, None)
+            if producers is None:
+                producers = collections.OrderedDict()
+                self._queues[priority] = producers
+            jobs = producers.get(job.producer, None)
+            if jobs is None:
+                jobs = collections.deque()
+                producers[job.producer] = jobs  # New producers take their turn after the ones already waiting
+            jobs.append(job)
+            self._queue_depth += 1
+            self.max_queue_depth = max(self.max_queue_depth, self._queue_depth)
+            self._condition.notify()
+        return job.future
+
+    def view(self, priority: int = Priority.NORMAL, producer: Any = None) -> "SharedClientView":
+        """
+        Returns an object with the methods of the client. Each call is submitted with the given priority and producer, and blocks until the result is available.
+
+        .. code-block:: python
+
+            ui = shared.view(SharedClient.Priority.HIGH)
+            ui.ecu_reset(1)     # Executed before the operations of lower priority already queued
+        """
+        return SharedClientView(self, priority, producer)
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of operations waiting in the queue"""
+        return self._queue_depth
+
+    def queue_depth_by_priority(self) -> Dict[int, int]:
+        """Number of operations waiting in the queue for each priority"""
+        with self._condition:
+            return {priority: sum(len(jobs) for jobs in producers.values()) for priority, producers in self._queues.items()}
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Returns a copy of the metrics as a dictionary"""
+        return {
+            'queue_depth': self._queue_depth,
+            'max_queue_depth': self.max_queue_depth,
+            'executed': self.executed,
+            'wait_time': {priority: histogram.snapshot() for priority, histogram in list(self.wait_time.items())}
+        }
+
+    def _pop(self) -> Optional[_Job]:
+        # Must be called with the condition acquired
+        if self._queue_depth == 0:
+            return None
+        priority = min(self._queues)
+        producers = self._queues[priority]
+        producer, jobs = next(iter(producers.items()))
+        job = jobs.popleft()
+        if len(jobs) > 0:
+            producers.move_to_end(producer)     # Round robin between the producers
+        else:
+            del producers[producer]
+            if len(producers) == 0:
+                del self._queues[priority]
+        self._queue_depth -= 1
+        return job
+
+    def _pop_all(self) -> Deque[_Job]:
+        jobs: Deque[_Job] = collections.deque()
+        job = self._pop()
+        while job is not None:
+            jobs.append(job)
+            job = self._pop()
+        return jobs
+
+    def _worker_task(self) -> None:
+        while True:
+            with self._condition:
+                while self._queue_depth == 0 and not self._stop_requested:
+                    self._condition.wait()
+                if self._stop_requested:
+                    break
+                job = self._pop()
+            if job is not None:
+                self._execute(job)
+
+    def _execute(self, job: _Job) -> None:
+        if not job.future.set_running_or_notify_cancel():
+            return  # Cancelled while waiting
+
+        histogram = self.wait_time.get(job.priority, None)
+        if histogram is None:
+            histogram = Histogram(self.time_buckets)
+            self.wait_time[job.priority] = histogram
+        histogram.observe(time.monotonic() - job.submit_time)
+        self.executed += 1
+
+        try:
+            if isinstance(job.operation, str):
+                result = getattr(self.client, job.operation)(*job.args, **job.kwargs)
+            else:
+                result = job.operation(self.client, *job.args, **job.kwargs)
+        except BaseException as e:
+            self.logger.debug('Operation failed. %s: %s' % (e.__class__.__name__, str(e)))
+            job.future.set_exception(e)
+        else:
+            job.future.set_result(result)
+
+    def __repr__(self) -> str:
+        return '<%s: %s %d queued at 0x%08x>' % (self.__class__.__name__, self.logger.name, self._queue_depth, id(self))
+
+
+class SharedClientView:
+    """
+    Calls the methods of the client of a :class:`SharedClient<udsoncan.scheduler.SharedClient>` through its queue, with a fixed priority and producer.
+    Created with :meth:`SharedClient.view<udsoncan.scheduler.SharedClient.view>`.
+    """
+
+    shared_client: SharedClient
+    priority: int
+    producer: Any
+
+    def __init__(self, shared_client: SharedClient, priority: int, producer: Any = None):
+        self.shared_client = shared_client
+        self.priority = priority
+        self.producer = producer
+
+    def __getattr__(self, name: str) -> Callable[..., Any]:
+        if name.startswith('_') or not callable(getattr(self.shared_client.client, name)):
+            raise AttributeError('%s has no method %s' % (self.__class__.__name__, name))
+
+        def call(*args: Any, **kwargs: Any) -> Any:
+            return self.shared_client.submit(name, *args, priority=self.priority, producer=self.producer, **kwargs).result()
+        return call
@@ -0,0 +1,493 @@
+import logging
+import os
+import queue
+import struct
+import threading
+
+from udsoncan import Request, Response, services
+from udsoncan.BaseService import BaseService
+from udsoncan.common.dids import CompiledDidConfig
+from udsoncan.common.dtc import Dtc
+from udsoncan.connections import BaseConnection, QueueConnection
+from udsoncan.typing import BytesLike
+from udsoncan.exceptions import TimeoutException
+
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union
+
+ServiceHandler = Callable[[Request], Optional[Response]]
+
+
+def default_security_algo(level: int, seed: bytes, params: Any = None) -> bytes:
+    """Key expected by a :class:`Server<udsoncan.server.Server>` when no security algorithm is given : the seed with all its bits inverted"""
+    return bytes([b ^ 0xFF for b in seed])
+
+
+class Server:
+    """
+    A simulated UDS server (ECU) running in the same process as the client. Each request payload is parsed with ``Request.from_payload``,
+    given to the handler of its service and the response is encoded back with ``Response.get_payload``.
+
+    Handlers are provided for the common services. They work on an in-memory state made of Data Identifiers, DTCs, a memory map, routines,
+    the active session and the security level. Any handler can be replaced or added with :meth:`register_handler<udsoncan.server.Server.register_handler>`.
+
+    - DiagnosticSessionControl : Sessions listed in ``sessions``. Changing session locks the security access
+    - ECUReset : Goes back to the default session, locked
+    - SecurityAccess : Not available in the default session. The key must be given by ``security_algo``
+    - TesterPresent
+    - ReadDataByIdentifier / WriteDataByIdentifier : Values in ``dids``, encoded with the codecs of ``didconfig``. A value given as ``bytes`` for a DID absent from ``didconfig`` is sent as is.
+      Writing requires the DID to be in ``didconfig``
+    - ReadDTCInformation : Subfunctions reportNumberOfDTCByStatusMask, reportDTCByStatusMask and reportSupportedDTCs, from ``dtcs``
+    - ClearDiagnosticInformation : Removes all the DTCs (group 0xFFFFFF) or a single one
+    - ReadMemoryByAddress / WriteMemoryByAddress : Regions of ``memory``
+    - RoutineControl : Routines in ``routines``
+
+    The server is given to a :class:`SimulatorConnection<udsoncan.server.SimulatorConnection>`, which calls it directly without thread,
+    or run in a thread in front of a connection with :meth:`start<udsoncan.server.Server.start>`.
+
+    :param didconfig: Codecs of the Data Identifiers, as in the :ref:`client configuration<config_data_identifiers>`
+    :type didconfig: dict
+
+    :param dids: Initial values of the Data Identifiers. Dictionary mapping a DID to a value given to the codec (a tuple for multiple values) or to a ``bytes`` payload
+    :type dids: dict
+
+    :param dtcs: The DTCs stored in the server
+    :type dtcs: list of :ref:`Dtc<DTC>`
+
+    :param memory: Memory map. Dictionary mapping the start address of a region to its content
+    :type memory: dict
+
+    :param routines: Dictionary mapping a routine ID to a callable receiving the control type and the option record (bytes), returning the status record (bytes)
+    :type routines: dict
+
+    :param sessions: Sessions accepted by DiagnosticSessionControl
+    :type sessions: list of int
+
+    :param security_algo: Computes the key expected for a seed, with the same signature as the :ref:`client security_algo<config_security_algo>`.
+        Defaults to :func:`default_security_algo<udsoncan.server.default_security_algo>`
+    :type security_algo: callable
+
+    :param security_algo_params: Value given to the ``params`` argument of ``security_algo``
+
+    :param p2_server_max: P2 timing sent in the DiagnosticSessionControl response, in seconds
+    :type p2_server_max: float
+
+    :param p2_star_server_max: P2* timing sent in the DiagnosticSessionControl response, in seconds
+    :type p2_star_server_max: float
+
+    :param name: This name is included in the logger name so that its output can be redirected. The logger name will be ``UdsServer[<name>]``
+    :type name: string
+    """
+
+    dids: Dict[int, Any]
+    dtcs: List[Dtc]
+    memory: Dict[int, bytearray]
+    routines: Dict[int, Callable[[int, bytes], bytes]]
+    sessions: List[int]
+    session: int
+    security_level: int
+    reset_count: int
+    request_count: int
+    handlers: Dict[int, ServiceHandler]
+    logger: logging.Logger
+    _seed: Optional[Tuple[int, bytes]]
+    _thread: Optional[threading.Thread]
+
+    def __init__(self,
+                 didconfig: Optional[Dict] = None,
+                 dids: Optional[Dict[int, Any]] = None,
+                 dtcs: Optional[List[Dtc]] = None,
+                 memory: Optional[Dict[int, Union[bytes, bytearray]]] = None,
+                 routines: Optional[Dict[int, Callable[[int, bytes], bytes]]] = None,
+                 sessions: Optional[List[int]] = None,
+                 security_algo: Optional[Callable[..., bytes]] = None,
+                 security_algo_params: Any = None,
+                 p2_server_max: float = 0.05,
+                 p2_star_server_max: float = 5,
+                 name: Optional[str] = None):
+
+        self.logger = logging.getLogger('UdsServer' if name is None else 'UdsServer[%s]' % name)
+        self.didconfig = CompiledDidConfig(didconfig if didconfig is not None else {})
+        self.dids = dict(dids) if dids is not None else {}
+        self.dtcs = list(dtcs) if dtcs is not None else []
+        self.memory = {address: bytearray(content) for address, content in memory.items()} if memory is not None else {}
+        self.routines = dict(routines) if routines is not None else {}
+        self.sessions = list(sessions) if sessions is not None else [1, 2, 3]
+        self.security_algo = security_algo if security_algo is not None else default_security_algo
+        self.security_algo_params = security_algo_params
+        self.p2_server_max = p2_server_max
+        self.p2_star_server_max = p2_star_server_max
+        self.reset_count = 0
+        self.request_count = 0
+        self._lock = threading.Lock()
+        self._thread = None
+        self._stop_requested = threading.Event()
+        self.reset()
+
+        self.handlers = {}
+        self.register_handler(services.DiagnosticSessionControl, self._handle_diagnostic_session_control)
+        self.register_handler(services.ECUReset, self._handle_ecu_reset)
+        self.register_handler(services.SecurityAccess, self._handle_security_access)
+        self.register_handler(services.TesterPresent, self._handle_tester_present)
+        self.register_handler(services.ReadDataByIdentifier, self._handle_read_data_by_identifier)
+        self.register_handler(services.WriteDataByIdentifier, self._handle_write_data_by_identifier)
+        self.register_handler(services.ReadDTCInformation, self._handle_read_dtc_information)
+        self.register_handler(services.ClearDiagnosticInformation, self._handle_clear_diagnostic_information)
+        self.register_handler(services.ReadMemoryByAddress, self._handle_read_memory_by_address)
+        self.register_handler(services.WriteMemoryByAddress, self._handle_write_memory_by_address)
+        self.register_handler(services.RoutineControl, self._handle_routine_control)
+
+    def reset(self) -> None:
+        """Goes back to the default session and locks the security access, as after a power up"""
+        self.session = 1
+        self.security_level = 0
+        self._seed = None
+
+    def register_handler(self, service: Union[Type[BaseService], int], handler: Optional[ServiceHandler]) -> None:
+        """
+        Sets the function called for the requests of a service, replacing the built-in handler if any.
+
+        :param service: The service or its request ID
+        :type service: :ref:`Service<Services>` class or int
+
+        :param handler: Callable receiving the :ref:`Request<Request>` and returning the :ref:`Response<Response>`, or ``None`` to send nothing.
+            ``None`` removes the handler, the server then responds with NRC ServiceNotSupported.
+        :type handler: callable
+        """
+        service_id = service if isinstance(service, int) else service.request_id()
+        if handler is None:
+            self.handlers.pop(service_id, None)
+        else:
+            self.handlers[service_id] = handler
+
+    def process(self, payload: bytes) -> Optional[bytes]:
+        """
+        Processes a request payload and returns the response payload, or ``None`` if no response must be sent (suppressed positive response).
+        Thread safe.
+
+        :param payload: The request payload
+        :type payload: bytes
+        """
+        if len(payload) == 0:
+            return None
+
+        with self._lock:
+            self.request_count += 1
+            handler = self.handlers.get(payload[0], None)
+            if handler is None:
+                return bytes([0x7F, payload[0], Response.Code.ServiceNotSupported])
+
+            request = Request.from_payload(payload)
+            if request.service is None:
+                return bytes([0x7F, payload[0], Response.Code.ServiceNotSupported])
+            if request.service.use_subfunction() and request.subfunction is None:
+                return bytes([0x7F, payload[0], Response.Code.IncorrectMessageLengthOrInvalidFormat])
+
+            try:
+                response = handler(request)
+            except Exception as e:
+                self.logger.error('Error in the handler of %s : [%s] %s' % (request.service.get_name(), e.__class__.__name__, str(e)))
+                response = Response(request.service, code=Response.Code.GeneralReject)
+
+        if response is None:
+            return None
+        if response.positive and request.suppress_positive_response:
+            return None
+        return response.get_payload()
+
+    def start(self, conn: BaseConnection) -> None:
+        """
+        Serves the requests received by a connection in a background thread, until :meth:`stop<udsoncan.server.Server.stop>` is called.
+        The connection is used from the server side : any connection that can both send and receive (``SocketConnection``, ``IsoTPSocketConnection``, etc.) is opened,
+        and a ``QueueConnection`` given to a client is served through its queues.
+
+        :param conn: The connection to serve
+        :type conn: :ref:`Connection<Connection>`
+        """
+        if self._thread is not None:
+            raise RuntimeError('Server is already started')
+        self._stop_requested.clear()
+        self._thread = threading.Thread(target=self._thread_task, args=(conn,), daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stops the thread started by :meth:`start<udsoncan.server.Server.start>`"""
+        if self._thread is not None:
+            self._stop_requested.set()
+            self._thread.join()
+            self._thread = None
+
+    def _thread_task(self, conn: BaseConnection) -> None:
+        receive: Callable[[], Optional[bytes]]
+        send: Callable[[bytes], None]
+        if isinstance(conn, QueueConnection):
+            def receive() -> Optional[bytes]:
+                try:
+                    return conn.touserqueue.get(timeout=0.2)
+                except queue.Empty:
+                    return None
+            send = conn.fromuserqueue.put
+        else:
+            if not conn.is_open():
+                conn.open()
+            def receive() -> Optional[bytes]:
+                frame = conn.wait_frame(timeout=0.2)
+                return None if frame is None else bytes(frame)
+            send = conn.send
+
+        while not self._stop_requested.is_set():
+            payload = receive()
+            if payload is not None:
+                response = self.process(payload)
+                if response is not None:
+                    send(response)
+
+    def __repr__(self) -> str:
+        return '<%s: %s session %d, security level %d at 0x%08x>' % (self.__class__.__name__, self.logger.name, self.session, self.security_level, id(self))
+
+    # ==== Built-in handlers
+
+    def _negative(self, request: Request, code: int) -> Response:
+        return Response(request.service, code=code)
+
+    def _positive(self, request: Request, data: bytes = b'') -> Response:
+        return Response(request.service, code=Response.Code.PositiveResponse, data=data)
+
+    def _handle_diagnostic_session_control(self, request: Request) -> Response:
+        assert request.subfunction is not None
+        if request.subfunction not in self.sessions:
+            return self._negative(request, Response.Code.SubFunctionNotSupported)
+        if request.subfunction != self.session:
+            self.security_level = 0
+            self._seed = None
+        self.session = request.subfunction
+        p2 = min(int(self.p2_server_max * 1000), 0xFFFF)
+        p2_star = min(int(self.p2_star_server_max * 100), 0xFFFF)
+        return self._positive(request, struct.pack('>BHH', request.subfunction, p2, p2_star))
+
+    def _handle_ecu_reset(self, request: Request) -> Response:
+        assert request.subfunction is not None
+        if request.subfunction not in (services.ECUReset.ResetType.hardReset, services.ECUReset.ResetType.keyOffOnReset, services.ECUReset.ResetType.softReset):
+            return self._negative(request, Response.Code.SubFunctionNotSupported)
+        self.reset_count += 1
+        self.reset()
+        return self._positive(request, bytes([request.subfunction]))
+
+    def _handle_security_access(self, request: Request) -> Response:
+        assert request.subfunction is not None
+        if self.session == 1:
+            return self._negative(request, Response.Code.ServiceNotSupportedInActiveSession)
+        if request.subfunction % 2 == 1:   # RequestSeed
+            level = request.subfunction
+            if self.security_level == level:
+                return self._positive(request, bytes([level, 0, 0, 0, 0]))  # Already unlocked
+            seed = os.urandom(4)
+            self._seed = (level, seed)
+            return self._positive(request, bytes([level]) + seed)
+
+        level = request.subfunction - 1
+        if self._seed is None or self._seed[0] != level:
+            return self._negative(request, Response.Code.RequestSequenceError)
+        expected_key = self.security_algo(level, self._seed[1], self.security_algo_params)
+        self._seed = None
+        if request.data != expected_key:
+            return self._negative(request, Response.Code.InvalidKey)
+        self.security_level = level
+        return self._positive(request, bytes([request.subfunction]))
+
+    def _handle_tester_present(self, request: Request) -> Response:
+        if request.subfunction != 0:
+            return self._negative(request, Response.Code.SubFunctionNotSupported)
+        return self._positive(request, b'\x00')
+
+    def _encode_did(self, did: int) -> Optional[bytes]:
+        if did not in self.dids:
+            return None
+        value = self.dids[did]
+        if did not in self.didconfig.didconfig:
+            return bytes(value) if isinstance(value, (bytes, bytearray)) else None
+        codec = self.didconfig.get(did).codec
+        return codec.encode(*value) if isinstance(value, tuple) else codec.encode(value)
+
+    def _handle_read_data_by_identifier(self, request: Request) -> Response:
+        data = request.data or b''
+        if len(data) == 0 or len(data) % 2 != 0:
+            return self._negative(request, Response.Code.IncorrectMessageLengthOrInvalidFormat)
+        response_data = bytearray()
+        for i in range(0, len(data), 2):
+            value = self._encode_did(int.from_bytes(data[i:i + 2], 'big'))
+            if value is None:
+                return self._negative(request, Response.Code.RequestOutOfRange)
+            response_data += data[i:i + 2]
+            response_data += value
+        return self._positive(request, bytes(response_data))
+
+    def _handle_write_data_by_identifier(self, request: Request) -> Response:
+        data = request.data or b''
+        if len(data) < 3:
+            return self._negative(request, Response.Code.IncorrectMessageLengthOrInvalidFormat)
+        did = int.from_bytes(data[0:2], 'big')
+        if did not in self.didconfig.didconfig:
+            return self._negative(request, Response.Code.RequestOutOfRange)
+        compiled_did = self.didconfig.get(did)
+        if compiled_did.length is not None and len(data) - 2 != compiled_did.length:
+            return self._negative(request, Response.Code.IncorrectMessageLengthOrInvalidFormat)
+        self.dids[did] = compiled_did.decode(data[2:])
+        return self._positive(request, data[0:2])
+
+    def _handle_read_dtc_information(self, request: Request) -> Response:
+        subfunction = request.subfunction
+        data = request.data or b''
+        ReportType = services.ReadDTCInformation.Subfunction
+        availability_mask = 0xFF
+
+        if subfunction in (ReportType.reportNumberOfDTCByStatusMask, ReportType.reportDTCByStatusMask):
+            if len(data) != 1:
+                return self._negative(request, Response.Code.IncorrectMessageLengthOrInvalidFormat)
+            mask = data[0]
+        elif subfunction == ReportType.reportSupportedDTCs:
+            if len(data) != 0:
+                return self._negative(request, Response.Code.IncorrectMessageLengthOrInvalidFormat)
+            mask = None
+        else:
+            return self._negative(request, Response.Code.SubFunctionNotSupported)
+
+        dtcs = [dtc for dtc in self.dtcs if mask is None or dtc.status.get_byte_as_int() & mask != 0]
+        if subfunction == ReportType.reportNumberOfDTCByStatusMask:
+            return self._positive(request, struct.pack('>BBBH', subfunction, availability_mask, Dtc.Format.ISO14229_1, len(dtcs)))
+
+        response_data = bytearray([subfunction, availability_mask])
+        for dtc in dtcs:
+            response_data += dtc.id.to_bytes(3, 'big')
+            response_data.append(dtc.status.get_byte_as_int())
+        return self._positive(request, bytes(response_data))
+
+    def _handle_clear_diagnostic_information(self, request: Request) -> Response:
+        data = request.data or b''
+        if len(data) not in (3, 4):    # Memory selection byte added in 2020
+            return self._negative(request, Response.Code.IncorrectMessageLengthOrInvalidFormat)
+        group = int.from_bytes(data[0:3], 'big')
+        if group == 0xFFFFFF:
+            self.dtcs = []
+        else:
+            dtcs = [dtc for dtc in self.dtcs if dtc.id != group]
+            if len(dtcs) == len(self.dtcs):
+                return self._negative(request, Response.Code.RequestOutOfRange)
+            self.dtcs = dtcs
+        return self._positive(request)
+
+    def _parse_memory_location(self, data: bytes) -> Optional[Tuple[int, int, int]]:
+        # Returns (address, size, length of the memory location in the request)
+        if len(data) < 1:
+            return None
+        address_length = data[0] & 0x0F
+        size_length = data[0] >> 4
+        length = 1 + address_length + size_length
+        if address_length == 0 or size_length == 0 or len(data) < length:
+            return None
+        address = int.from_bytes(data[1:1 + address_length], 'big')
+        size = int.from_bytes(data[1 + address_length:length], 'big')
+        return (address, size, length)
+
+    def _find_memory(self, address: int, size: int) -> Optional[Tuple[bytearray, int]]:
+        for start, region in self.memory.items():
+            if start <= address and address + size <= start + len(region):
+                return (region, address - start)
+        return None
+
+    def _handle_read_memory_by_address(self, request: Request) -> Response:
+        data = request.data or b''
+        location = self._parse_memory_location(data)
+        if location is None or location[2] != len(data):
+            return self._negative(request, Response.Code.IncorrectMessageLengthOrInvalidFormat)
+        address, size, length = location
+        found = self._find_memory(address, size)
+        if found is None:
+            return self._negative(request, Response.Code.RequestOutOfRange)
+        region, offset = found
+        return self._positive(request, bytes(region[offset:offset + size]))
+
+    def _handle_write_memory_by_address(self, request: Request) -> Response:
+        data = request.data or b''
+        location = self._parse_memory_location(data)
+        if location is None or location[2] + location[1] != len(data):
+            return self._negative(request, Response.Code.IncorrectMessageLengthOrInvalidFormat)
+        address, size, length = location
+        found = self._find_memory(address, size)
+        if found is None:
+            return self._negative(request, Response.Code.RequestOutOfRange)
+        region, offset = found
+        region[offset:offset + size] = data[length:]
+        return self._positive(request, data[:length])
+
+    def _handle_routine_control(self, request: Request) -> Response:
+        assert request.subfunction is not None
+        data = request.data or b''
+        if len(data) < 2:
+            return self._negative(request, Response.Code.IncorrectMessageLengthOrInvalidFormat)
+        routine_id = int.from_bytes(data[0:2], 'big')
+        routine = self.routines.get(routine_id, None)
+        if routine is None:
+            return self._negative(request, Response.Code.RequestOutOfRange)
+        if request.subfunction not in (services.RoutineControl.ControlType.startRoutine,
+                                       services.RoutineControl.ControlType.stopRoutine,
+                                       services.RoutineControl.ControlType.requestRoutineResults):
+            return self._negative(request, Response.Code.SubFunctionNotSupported)
+        status_record = routine(request.subfunction, data[2:])
+        return self._positive(request, bytes([request.subfunction]) + data[0:2] + status_record)
+
+
+class SimulatorConnection(BaseConnection):
+    """
+    Connects a client directly to a :class:`Server<udsoncan.server.Server>` of the same process. Each payload sent is processed right away by the server
+    and its response is returned by the next ``wait_frame``. No thread is involved, so hundreds of simulated servers can be used at once.
+
+    When the server gives no response, ``wait_frame`` raises a ``TimeoutException`` without waiting.
+
+    :param server: The simulated server
+    :type server: :class:`Server<udsoncan.server.Server>`
+
+    :param name: This name is included in the logger name so that its output can be redirected. The logger name will be ``Connection[<name>]``
+    :type name: string
+    """
+
+    server: Server
+    opened: bool
+    _response: Optional[bytes]
+
+    def __init__(self, server: Server, name: Optional[str] = None):
+        BaseConnection.__init__(self, name)
+        self.server = server
+        self.opened = False
+        self._response = None
+
+    def open(self) -> "SimulatorConnection":
+        self.opened = True
+        self.logger.info('Connection opened')
+        return self
+
+    def __enter__(self) -> "SimulatorConnection":
+        return self
+
+    def __exit__(self, type, value, traceback) -> None:
+        self.close()
+
+    def is_open(self) -> bool:
+        return self.opened
+
+    def close(self) -> None:
+        self.empty_rxqueue()
+        self.opened = False
+        self.logger.info('Connection closed')
+
+    def specific_send(self, payload: BytesLike, timeout: Optional[float] = None) -> None:
+        self._response = self.server.process(bytes(payload))
+
+    def specific_wait_frame(self, timeout: Optional[float] = None) -> Optional[bytes]:
+        response = self._response
+        if response is None:
+            raise TimeoutException('Server gave no response')
+        self._response = None
+        return response
+
+    def empty_rxqueue(self) -> None:
+        self._response = None
@@ -1,5 +1,5 @@
 import struct
-from udsoncan import Dtc, check_did_config, make_did_codec_from_definition, fetch_codec_definition_from_config, latest_standard, valid_standards, DIDConfig
+from udsoncan import Dtc, DtcTable, check_did_config, make_did_codec_from_definition, fetch_codec_definition_from_config, latest_standard, valid_standards, DIDConfig
 from udsoncan.Request import Request
 from udsoncan.Response import Response
 from udsoncan.exceptions import *
@@ -26,7 +26,12 @@ class ReadDTCInformation(BaseService):
 
         .. data:: dtcs
 
-                :ref:`DTC<DTC>` instances and their status read from the server.
+                :ref:`DTC<DTC>` instances and their status read from the server. Empty when ``dtc_table`` is used.
+
+        .. data:: dtc_table
+
+                :ref:`DtcTable<DtcTable>` of the DTCs read from the server. Only set when a compact table is requested with the ``dtc_table`` parameter
+                of :meth:`interpret_response<udsoncan.services.ReadDTCInformation.interpret_response>`, for the subfunctions returning a list of DTC records. ``None`` otherwise.
 
         .. data:: dtc_count
 
@@ -52,6 +57,7 @@ class ReadDTCInformation(BaseService):
 
         subfunction_echo: int
         dtcs: List[Dtc]
+        dtc_table: Optional[DtcTable]
         dtc_count: Optional[int]
         dtc_format: Optional[int]
         status_availability: Optional[Dtc.Status]
@@ -68,7 +74,8 @@ class ReadDTCInformation(BaseService):
                      extended_data: Optional[List[bytes]] = [],
                      memory_selection_echo: Optional[int] = None,
                      functional_group_id:Optional[int] = None,
-                     severity_availability: Optional[Dtc.Severity] = None
+                     severity_availability: Optional[Dtc.Severity] = None,
+                     dtc_table: Optional[DtcTable] = None
                      ):
             super().__init__(ReadDTCInformation)
             self.subfunction_echo = subfunction_echo
@@ -80,6 +87,7 @@ class ReadDTCInformation(BaseService):
             self.memory_selection_echo = memory_selection_echo
             self.functional_group_id = functional_group_id
             self.severity_availability=severity_availability
+            self.dtc_table = dtc_table
 
     class InterpretedResponse(Response):
         service_data: "ReadDTCInformation.ResponseData"
@@ -429,7 +437,8 @@ class ReadDTCInformation(BaseService):
                            ignore_all_zero_dtc: bool = True,
                            dtc_snapshot_did_size: int = 2,
                            didconfig: Optional[DIDConfig] = None,
-                           standard_version: int = latest_standard) -> InterpretedResponse:
+                           standard_version: int = latest_standard,
+                           dtc_table: bool = False) -> InterpretedResponse:
         """
         Populates the response ``service_data`` property with an instance of :class:`ReadDTCInformation.ResponseData<udsoncan.services.ReadDTCInformation.ResponseData>`
 
@@ -455,6 +464,10 @@ class ReadDTCInformation(BaseService):
         :param didconfig: Definition of DID codecs. Dictionary mapping a DID (int) to a valid :ref:`DidCodec<DidCodec>` class or pack/unpack string 
         :type didconfig: dict[int] = :ref:`DidCodec<DidCodec>`
 
+        :param dtc_table: When True, the subfunctions returning a list of DTC records (status mask, severity mask, supported, first/most recent, permanent) 
+                store their DTCs in ``service_data.dtc_table``, a compact :ref:`DtcTable<DtcTable>`, instead of creating one :ref:`Dtc<DTC>` object per record in ``service_data.dtcs``
+        :type dtc_table: bool
+
         :raises InvalidResponseException: If response length is wrong or does not match DID configuration
         :raises ValueError: If parameters are out of range, missing or wrong types
         :raises ConfigError: If the server returns a snapshot DID not defined in ``didconfig``
@@ -556,37 +569,47 @@ class ReadDTCInformation(BaseService):
             response.service_data.status_availability = Dtc.Status.from_byte(response.data[actual_byte])
             actual_byte += 1
 
-            while True:  # Loop until we have read all dtcs
-                if len(response.data) <= actual_byte:
-                    break  # done
+            if dtc_table:
+                end_byte = actual_byte + ((len(response.data) - actual_byte) // dtc_size) * dtc_size
+                partial_dtc_length = len(response.data) - end_byte
+                if partial_dtc_length > 0 and not (tolerate_zero_padding and response.data[end_byte:] == b'\x00' * partial_dtc_length):
+                    # Same rule as below, extra bytes are accepted for reportSeverityInformationOfDTC
+                    if subfunction != ReadDTCInformation.Subfunction.reportSeverityInformationOfDTC or end_byte == 2:
+                        raise InvalidResponseException(
+                            response, 'Incomplete DTC record. Missing %d bytes to response to complete the record' % (dtc_size - partial_dtc_length))
 
-                elif len(response.data) < actual_byte + dtc_size:
-                    partial_dtc_length = len(response.data) - actual_byte
-                    if tolerate_zero_padding and response.data[actual_byte:] == b'\x00' * partial_dtc_length:
-                        break
-                    else:
-                        # We purposely ignore extra byte for subfunction reportSeverityInformationOfDTC as it is supposed to return 0 or 1 DTC.
-                        if subfunction != ReadDTCInformation.Subfunction.reportSeverityInformationOfDTC or actual_byte == 2:
-                            raise InvalidResponseException(
-                                response, 'Incomplete DTC record. Missing %d bytes to response to complete the record' % (dtc_size - partial_dtc_length))
+                with_severity = subfunction in response_subfn_dtc_availability_mask_plus_dtc_record_with_severity
+                response.service_data.dtc_table = DtcTable.from_records(response.data[actual_byte:end_byte], with_severity=with_severity, ignore_all_zero_dtc=ignore_all_zero_dtc)
+                response.service_data.dtc_count = len(response.service_data.dtc_table)
+            else:
+                while True:  # Loop until we have read all dtcs
+                    if len(response.data) <= actual_byte:
+                        break  # done
+
+                    elif len(response.data) < actual_byte + dtc_size:
+                        partial_dtc_length = len(response.data) - actual_byte
+                        if tolerate_zero_padding and response.data[actual_byte:] == b'\x00' * partial_dtc_length:
+                            break
+                        else:
+                            # We purposely ignore extra byte for subfunction reportSeverityInformationOfDTC as it is supposed to return 0 or 1 DTC.
+                            if subfunction != ReadDTCInformation.Subfunction.reportSeverityInformationOfDTC or actual_byte == 2:
+                                raise InvalidResponseException(
+                                    response, 'Incomplete DTC record. Missing %d bytes to response to complete the record' % (dtc_size - partial_dtc_length))
 
-                else:
-                    dtc_bytes = response.data[actual_byte:actual_byte + dtc_size]
-                    if dtc_bytes == b'\x00' * dtc_size and ignore_all_zero_dtc:
-                        pass  # ignore
                     else:
-                        if subfunction in response_subfn_dtc_availability_mask_plus_dtc_record:
-                            dtc = Dtc(struct.unpack('>L', b'\x00' + dtc_bytes[0:3])[0])
-                            dtc.status.set_byte(dtc_bytes[3])
-                        elif subfunction in response_subfn_dtc_availability_mask_plus_dtc_record_with_severity:
-                            dtc = Dtc(struct.unpack('>L', b'\x00' + dtc_bytes[2:5])[0])
-                            dtc.severity.set_byte(dtc_bytes[0])
-                            dtc.functional_unit = dtc_bytes[1]
-                            dtc.status.set_byte(dtc_bytes[5])
-
-                        response.service_data.dtcs.append(dtc)
-                actual_byte += dtc_size
-            response.service_data.dtc_count = len(response.service_data.dtcs)
+                        dtc_bytes = response.data[actual_byte:actual_byte + dtc_size]
+                        if dtc_bytes == b'\x00' * dtc_size and ignore_all_zero_dtc:
+                            pass  # ignore
+                        else:
+                            if subfunction in response_subfn_dtc_availability_mask_plus_dtc_record:
+                                dtc = Dtc(struct.unpack('>L', b'\x00' + dtc_bytes[0:3])[0], status=dtc_bytes[3])
+                            elif subfunction in response_subfn_dtc_availability_mask_plus_dtc_record_with_severity:
+                                dtc = Dtc(struct.unpack('>L', b'\x00' + dtc_bytes[2:5])[0], status=dtc_bytes[5], severity=dtc_bytes[0])
+                                dtc.functional_unit = dtc_bytes[1]
+
+                            response.service_data.dtcs.append(dtc)
+                    actual_byte += dtc_size
+                response.service_data.dtc_count = len(response.service_data.dtcs)
 
         # The 2 following subfunction responses have different purposes but their constructions are very similar.
         elif subfunction in response_subfn_dtc_plus_fault_counter + response_subfn_dtc_plus_sapshot_record:
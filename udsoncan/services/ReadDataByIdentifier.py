@@ -1,6 +1,6 @@
 import struct
 
-from udsoncan import DidCodec, check_did_config, make_did_codec_from_definition, fetch_codec_definition_from_config, DIDConfig
+from udsoncan import check_did_config, CompiledDidConfig, DIDConfig
 from udsoncan.Request import Request
 from udsoncan.Response import Response
 from udsoncan.exceptions import *
@@ -16,6 +16,7 @@ class ReadDataByIdentifier(BaseService):
     _use_subfunction = False
 
     supported_negative_response = [ResponseCode.IncorrectMessageLengthOrInvalidFormat,
+                                   ResponseCode.ResponseTooLong,
                                    ResponseCode.ConditionsNotCorrect,
                                    ResponseCode.RequestOutOfRange,
                                    ResponseCode.SecurityAccessDenied
@@ -53,15 +54,111 @@ class ReadDataByIdentifier(BaseService):
         return [dids] if not isinstance(dids, list) else dids
 
     @classmethod
-    def make_request(cls, didlist: Union[int, List[int]], didconfig: Optional[DIDConfig]) -> Request:
+    def response_size(cls, didlist: Union[int, List[int]], didconfig: Union[DIDConfig, CompiledDidConfig]) -> Optional[int]:
+        """
+        Computes the size of the positive response payload expected for a list of DIDs, based on the codec lengths.
+
+        :param didlist: List of data identifier to read.
+        :type didlist: list[int]
+
+        :param didconfig: Definition of DID codecs. Dictionary mapping a DID (int) to a valid :ref:`DidCodec<DidCodec>` class or pack/unpack string.
+            A :class:`CompiledDidConfig<udsoncan.common.dids.CompiledDidConfig>` can be given to reuse codecs between calls
+        :type didconfig: dict[int] = :ref:`DidCodec<DidCodec>` or :class:`CompiledDidConfig<udsoncan.common.dids.CompiledDidConfig>`
+
+        :return: The response size in bytes, including the service ID. ``None`` if a DID codec reads all the remaining data
+        :rtype: int or None
+
+        :raises ConfigError: If didlist contains a DID not defined in didconfig
+        """
+        didlist = cls.validate_didlist_input(didlist)
+        compiled_didconfig = didconfig if isinstance(didconfig, CompiledDidConfig) else CompiledDidConfig(didconfig)
+        size = 1
+        for did in didlist:
+            length = compiled_didconfig.get(did).length
+            if length is None:
+                return None
+            size += 2 + length
+        return size
+
+    @classmethod
+    def pack_didlist(cls,
+                     didlist: Union[int, List[int]],
+                     didconfig: Union[DIDConfig, CompiledDidConfig],
+                     max_response_size: int,
+                     max_did_per_request: Optional[int] = None) -> List[List[int]]:
+        """
+        Splits a list of DIDs into groups that can each be read with a single request, using first-fit decreasing packing.
+        A group fits when the request and the expected response are not longer than ``max_response_size`` and when it has no more than ``max_did_per_request`` DIDs.
+        A DID with a codec reading all the remaining data, or with a response alone bigger than ``max_response_size``, is put alone in its group. 
+        Duplicate DIDs are read once.
+
+        :param didlist: List of data identifier to read.
+        :type didlist: list[int]
+
+        :param didconfig: Definition of DID codecs. Dictionary mapping a DID (int) to a valid :ref:`DidCodec<DidCodec>` class or pack/unpack string.
+            A :class:`CompiledDidConfig<udsoncan.common.dids.CompiledDidConfig>` can be given to reuse codecs between calls
+        :type didconfig: dict[int] = :ref:`DidCodec<DidCodec>` or :class:`CompiledDidConfig<udsoncan.common.dids.CompiledDidConfig>`
+
+        :param max_response_size: Maximum size in bytes of a request or a response payload, including the service ID
+        :type max_response_size: int
+
+        :param max_did_per_request: Maximum number of DIDs in a request. ``None`` for no limit
+        :type max_did_per_request: int
+
+        :return: The list of groups of DIDs, each group being a list of DIDs
+        :rtype: list[list[int]]
+
+        :raises ValueError: If parameters are out of range, missing or wrong type
+        :raises ConfigError: If didlist contains a DID not defined in didconfig
+        """
+        didlist = cls.validate_didlist_input(didlist)
+        tools.validate_int(max_response_size, min=3, max=0xFFFFFFFF, name='max_response_size')
+        if max_did_per_request is not None:
+            tools.validate_int(max_did_per_request, min=1, max=0xFFFF, name='max_did_per_request')
+        compiled_didconfig = didconfig if isinstance(didconfig, CompiledDidConfig) else CompiledDidConfig(didconfig)
+        check_did_config(didlist, compiled_didconfig.didconfig)
+
+        max_count = (max_response_size - 1) // 2     # Request is SID + 2 bytes per DID
+        if max_did_per_request is not None:
+            max_count = min(max_count, max_did_per_request)
+        max_count = max(max_count, 1)
+
+        single_groups: List[List[int]] = []
+        sized_dids = []
+        for did in dict.fromkeys(didlist):  # Removes duplicates, keeps order
+            length = compiled_didconfig.get(did).length
+            if length is None or 3 + length > max_response_size:
+                single_groups.append([did])
+            else:
+                sized_dids.append((2 + length, did))
+
+        # First fit decreasing. Python sort is stable, so DIDs of the same size keep the requested order.
+        sized_dids.sort(key=lambda x: x[0], reverse=True)
+        groups: List[List[int]] = []
+        group_sizes: List[int] = []
+        for size, did in sized_dids:
+            for i in range(len(groups)):
+                if len(groups[i]) < max_count and group_sizes[i] + size <= max_response_size:
+                    groups[i].append(did)
+                    group_sizes[i] += size
+                    break
+            else:
+                groups.append([did])
+                group_sizes.append(1 + size)
+
+        return groups + single_groups
+
+    @classmethod
+    def make_request(cls, didlist: Union[int, List[int]], didconfig: Optional[Union[DIDConfig, CompiledDidConfig]]) -> Request:
         """
         Generates a request for ReadDataByIdentifier
 
         :param didlist: List of data identifier to read.
         :type didlist: list[int]
 
-        :param didconfig: Optional definition of DID codecs for validation. Dictionary mapping a DID (int) to a valid :ref:`DidCodec<DidCodec>` class or pack/unpack string 
-        :type didconfig: dict[int] = :ref:`DidCodec<DidCodec>`
+        :param didconfig: Optional definition of DID codecs for validation. Dictionary mapping a DID (int) to a valid :ref:`DidCodec<DidCodec>` class or pack/unpack string.
+            A :class:`CompiledDidConfig<udsoncan.common.dids.CompiledDidConfig>` can be given to reuse codecs between calls
+        :type didconfig: dict[int] = :ref:`DidCodec<DidCodec>` or :class:`CompiledDidConfig<udsoncan.common.dids.CompiledDidConfig>`
 
         :raises ValueError: If parameters are out of range, missing or wrong type
         :raises ConfigError: If didlist contains a DID not defined in didconfig
@@ -71,21 +168,21 @@ class ReadDataByIdentifier(BaseService):
 
         req = Request(cls)
         if didconfig is not None:
+            compiled_didconfig = didconfig if isinstance(didconfig, CompiledDidConfig) else CompiledDidConfig(didconfig)
             # Return a validated did config. Format may change, entries might be added if default value is set.
-            check_did_config(didlist, didconfig)
+            check_did_config(didlist, compiled_didconfig.didconfig)
 
             did_reading_all_data = None
             for did in didlist:
                 # Make sure the config is good before sending the request. This method can raise.
-                codec_definition = fetch_codec_definition_from_config(did, didconfig)
-                codec = make_did_codec_from_definition(codec_definition)
+                # Compiling the codec validates the length function. May raise
+                compiled_did = compiled_didconfig.get(did)
 
-                try:
-                    len(codec)  # Validate the length function. May raise
+                if compiled_did.length is not None:
                     if did_reading_all_data is not None:
                         raise ValueError('Did 0x%04X is configured to read the rest of the payload (__len__ raisong ReadAllRemainingData), but a subsequent DID is requested (0x%04x)' % (
                             did_reading_all_data, did))
-                except DidCodec.ReadAllRemainingData:
+                else:
                     if did_reading_all_data is not None:
                         raise ValueError('It is impossible to read 2 DIDs configured to read the rest of the payload (__len__ raising ReadAllRemainingData). Dids are : 0x%04X and 0x%04X' % (
                             did_reading_all_data, did))
@@ -99,7 +196,7 @@ class ReadDataByIdentifier(BaseService):
     def interpret_response(cls,
                            response: Response,
                            didlist: Union[int, List[int]],
-                           didconfig: DIDConfig,
+                           didconfig: Union[DIDConfig, CompiledDidConfig],
                            tolerate_zero_padding: bool = True) -> InterpretedResponse:
         """
         Populates the response ``service_data`` property with an instance of :class:`ReadDataByIdentifier.ResponseData<udsoncan.services.ReadDataByIdentifier.ResponseData>`
@@ -110,8 +207,9 @@ class ReadDataByIdentifier(BaseService):
         :param didlist:  List of data identifiers used for the request.
         :type didlist: list[int]
 
-        :param didconfig: Definition of DID codecs. Dictionary mapping a DID (int) to a valid :ref:`DidCodec<DidCodec>` class or pack/unpack string 
-        :type didconfig: dict[int] = :ref:`DidCodec<DidCodec>`
+        :param didconfig: Definition of DID codecs. Dictionary mapping a DID (int) to a valid :ref:`DidCodec<DidCodec>` class or pack/unpack string.
+            A :class:`CompiledDidConfig<udsoncan.common.dids.CompiledDidConfig>` can be given to reuse codecs between calls
+        :type didconfig: dict[int] = :ref:`DidCodec<DidCodec>` or :class:`CompiledDidConfig<udsoncan.common.dids.CompiledDidConfig>`
 
         :param tolerate_zero_padding: Ignore trailing zeros in the response data avoiding raising false :class:`InvalidResponseException<udsoncan.exceptions.InvalidResponseException>`.
         :type tolerate_zero_padding: bool
@@ -124,7 +222,8 @@ class ReadDataByIdentifier(BaseService):
             raise InvalidResponseException(response, "No data in response")
 
         didlist = cls.validate_didlist_input(didlist)
-        didconfig_validated = check_did_config(didlist, didconfig)
+        compiled_didconfig = didconfig if isinstance(didconfig, CompiledDidConfig) else CompiledDidConfig(didconfig)
+        didconfig_validated = check_did_config(didlist, compiled_didconfig.didconfig)
 
         response.service_data = cls.ResponseData(
             values={}
@@ -146,13 +245,12 @@ class ReadDataByIdentifier(BaseService):
                 if response.data[offset:] == b'\x00' * (len(response.data) - offset):
                     break
 
-            codec_definition = fetch_codec_definition_from_config(did, didconfig_validated)
-            codec = make_did_codec_from_definition(codec_definition)
+            compiled_did = compiled_didconfig.get(did)
             offset += 2
 
-            try:
-                payload_size = len(codec)
-            except DidCodec.ReadAllRemainingData:
+            if compiled_did.length is not None:
+                payload_size = compiled_did.length
+            else:
                 payload_size = len(response.data) - offset
 
             if len(response.data) < offset + payload_size:
@@ -161,7 +259,7 @@ class ReadDataByIdentifier(BaseService):
 
             subpayload = response.data[offset:offset + payload_size]
             offset += payload_size  # Codec must define a __len__ function that matches the encoded payload length.
-            val = codec.decode(subpayload)
+            val = compiled_did.decode(subpayload)
             response.service_data.values[did] = val
 
         return cast(ReadDataByIdentifier.InterpretedResponse, response)
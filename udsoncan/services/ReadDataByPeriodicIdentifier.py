@@ -1,12 +1,19 @@
+from udsoncan import CompiledDidConfig, DIDConfig
 from udsoncan.Request import Request
 from udsoncan.Response import Response
 from udsoncan.exceptions import *
-from udsoncan.BaseService import BaseService, BaseResponseData
+from udsoncan.BaseService import BaseService, BaseSubfunction, BaseResponseData
 from udsoncan.ResponseCode import ResponseCode
+import udsoncan.tools as tools
+from udsoncan.typing import BytesLike
+
+from typing import Union, List, Any, Optional, cast
 
 
 class ReadDataByPeriodicIdentifier(BaseService):
     _sid = 0x2A
+    _use_subfunction = False
+    _no_response_data = True
 
     supported_negative_response = [ResponseCode.IncorrectMessageLengthOrInvalidFormat,
                                    ResponseCode.ConditionsNotCorrect,
@@ -14,17 +21,140 @@ class ReadDataByPeriodicIdentifier(BaseService):
                                    ResponseCode.SecurityAccessDenied
                                    ]
 
+    class TransmissionMode(BaseSubfunction):
+        """
+        ReadDataByPeriodicIdentifier defined transmission modes
+        """
+        __pretty_name__ = 'transmission mode'
+
+        sendAtSlowRate = 1
+        sendAtMediumRate = 2
+        sendAtFastRate = 3
+        stopSending = 4
+
     class ResponseData(BaseResponseData):
-        def __init__(self):
+        """
+        .. data:: did
+
+                The periodic data identifier (0xF200-0xF2FF) of a periodic data message. ``None`` for the response to a request
+
+        .. data:: value
+
+                The value returned by the associated :ref:`DidCodec<DidCodec>`.decode method. ``None`` for the response to a request
+        """
+
+        did: Optional[int]
+        value: Any
+
+        def __init__(self, did: Optional[int] = None, value: Any = None):
             super().__init__(ReadDataByPeriodicIdentifier)
+            self.did = did
+            self.value = value
 
     class InterpretedResponse(Response):
         service_data: "ReadDataByPeriodicIdentifier.ResponseData"
 
+    PERIODIC_DID_BASE = 0xF200
+
     @classmethod
-    def make_request(cls) -> Request:
-        raise NotImplementedError('Service is not implemented')
+    def validate_didlist_input(cls, dids: Union[int, List[int]]) -> List[int]:
+        """
+        Converts a periodic data identifier or a list of them to a list of full DIDs (0xF200-0xF2FF).
+        A periodic data identifier can be given as its full DID or as its last byte only (0x00-0xFF)
+        """
+        if not isinstance(dids, int) and not isinstance(dids, list):
+            raise ValueError("Periodic data identifier must either be an integer or a list of integer")
+
+        didlist = [dids] if isinstance(dids, int) else dids
+        output = []
+        for did in didlist:
+            if not isinstance(did, int):
+                raise ValueError("Periodic data identifier must be a valid integer")
+            if did >= cls.PERIODIC_DID_BASE and did <= cls.PERIODIC_DID_BASE + 0xFF:
+                output.append(did)
+            else:
+                tools.validate_int(did, min=0, max=0xFF, name='Periodic data identifier')
+                output.append(cls.PERIODIC_DID_BASE + did)
+        return output
+
+    @classmethod
+    def make_request(cls, transmission_mode: int, didlist: Union[int, List[int]]) -> Request:
+        """
+        Generates a request for ReadDataByPeriodicIdentifier
+
+        :param transmission_mode: The transmission rate requested, or the request to stop sending. Allowed values are from 1 to 4.
+            See :class:`ReadDataByPeriodicIdentifier.TransmissionMode<udsoncan.services.ReadDataByPeriodicIdentifier.TransmissionMode>`
+        :type transmission_mode: int
+
+        :param didlist: List of periodic data identifiers. Either the full DID (0xF200-0xF2FF) or its last byte (0x00-0xFF).
+            Can be empty with ``stopSending`` to stop all periodic transmissions
+        :type didlist: list[int]
+
+        :raises ValueError: If parameters are out of range, missing or wrong type
+        """
+        tools.validate_int(transmission_mode, min=1, max=4, name='Transmission mode')
+        didlist = cls.validate_didlist_input(didlist)
+        if len(didlist) == 0 and transmission_mode != cls.TransmissionMode.stopSending:
+            raise ValueError('At least one periodic data identifier must be given to start a periodic transmission')
+
+        req = Request(service=cls)
+        req.data = bytes([transmission_mode] + [did & 0xFF for did in didlist])
+        return req
 
     @classmethod
     def interpret_response(cls, response: Response) -> InterpretedResponse:
-        raise NotImplementedError('Service is not implemented')
+        """
+        Populates the response ``service_data`` property with an instance of :class:`ReadDataByPeriodicIdentifier.ResponseData<udsoncan.services.ReadDataByPeriodicIdentifier.ResponseData>`
+
+        :param response: The received response to interpret
+        :type response: :ref:`Response<Response>`
+        """
+        response.service_data = cls.ResponseData()
+        return cast(ReadDataByPeriodicIdentifier.InterpretedResponse, response)
+
+    @classmethod
+    def is_periodic_data(cls, payload: BytesLike) -> bool:
+        """Tells if a payload received from the server is a periodic data message. Periodic data messages have the same service ID as the positive response,
+        followed by the periodic data identifier and its data"""
+        return len(payload) > 1 and payload[0] == cls.response_id()
+
+    @classmethod
+    def interpret_periodic_data(cls,
+                                response: Response,
+                                didconfig: Union[DIDConfig, CompiledDidConfig],
+                                tolerate_zero_padding: bool = True) -> InterpretedResponse:
+        """
+        Decodes a periodic data message sent by the server after a request with a transmission rate.
+        Populates the response ``service_data`` property with an instance of :class:`ReadDataByPeriodicIdentifier.ResponseData<udsoncan.services.ReadDataByPeriodicIdentifier.ResponseData>`
+
+        :param response: The received periodic data message
+        :type response: :ref:`Response<Response>`
+
+        :param didconfig: Definition of DID codecs. Dictionary mapping a DID (int) to a valid :ref:`DidCodec<DidCodec>` class or pack/unpack string.
+            Periodic data identifiers are looked up with their full DID (0xF200-0xF2FF).
+            A :class:`CompiledDidConfig<udsoncan.common.dids.CompiledDidConfig>` can be given to reuse codecs between calls
+        :type didconfig: dict[int] = :ref:`DidCodec<DidCodec>` or :class:`CompiledDidConfig<udsoncan.common.dids.CompiledDidConfig>`
+
+        :param tolerate_zero_padding: Ignore trailing zeros after the DID data, as added by some transport layers
+        :type tolerate_zero_padding: bool
+
+        :raises ConfigError: If the periodic data identifier is not defined in ``didconfig``
+        :raises InvalidResponseException: If the message is incomplete or if its data does not match the codec length
+        """
+        if response.data is None or len(response.data) < 1:
+            raise InvalidResponseException(response, "Periodic data message has no periodic data identifier")
+
+        compiled_didconfig = didconfig if isinstance(didconfig, CompiledDidConfig) else CompiledDidConfig(didconfig)
+        did = cls.PERIODIC_DID_BASE + response.data[0]
+        compiled_did = compiled_didconfig.get(did)
+        payload = response.data[1:]
+        if compiled_did.length is not None:
+            if len(payload) < compiled_did.length:
+                raise InvalidResponseException(response, "Value for periodic data identifier 0x%04x was incomplete according to definition in configuration" % did)
+            extra = payload[compiled_did.length:]
+            if len(extra) > 0 and not (tolerate_zero_padding and extra == bytes(len(extra))):
+                raise InvalidResponseException(response, "Periodic data message for data identifier 0x%04x is longer than the definition in configuration" % did)
+            payload = payload[:compiled_did.length]
+
+        response.service_data = cls.ResponseData(did=did, value=compiled_did.decode(payload))
+        return cast(ReadDataByPeriodicIdentifier.InterpretedResponse, response)
@@ -1,5 +1,7 @@
 from udsoncan.common.DidCodec import DidCodec
-from typing import Dict, Optional, Any, Callable, Union, Type
+from udsoncan.common.TransferProgress import TransferProgress
+from typing import Dict, Optional, Any, Callable, Union, Type, Iterable, BinaryIO
+import os
 import sys
 
 if sys.version_info < (3, 8):
@@ -11,6 +13,11 @@ else:
 
 SecurityAlgoType = Callable[[int, bytes, Any], bytes]
 Nrc78CallbackType = Callable[[], None]
+TransferProgressCallbackType = Callable[[TransferProgress], None]
+
+BytesLike = Union[bytes, bytearray, memoryview]
+TransferDataSource = Union[BytesLike, str, "os.PathLike[str]", BinaryIO, Iterable[BytesLike]]
+TransferDataDestination = Union[bytearray, str, "os.PathLike[str]", BinaryIO]
 
 
 CodecDefinition = Union[str, DidCodec, Type[DidCodec]]
@@ -34,6 +41,7 @@ class ClientConfig(TypedDict, total=False):
     security_algo_params: Optional[Any]
     tolerate_zero_padding: bool
     ignore_all_zero_dtc: bool
+    use_dtc_table: bool
     dtc_snapshot_did_size: int
     server_address_format: Optional[int]
     server_memorysize_format: Optional[int]
@@ -47,3 +55,6 @@ class ClientConfig(TypedDict, total=False):
     logger_name: str
     extended_data_size: Optional[Union[int, Dict[int, int]]]
     nrc78_callback:Optional[Nrc78CallbackType]
+    rdbi_max_response_size: Optional[int]
+    rdbi_max_did_per_request: Optional[int]
+    did_cache: Dict[int, Union[float, str]]